@@ -48,9 +48,10 @@ __title__                           = "PLM"
 # -------------------------------------------------------------------------------------------------------------
 """ Import """
 # Python
-import os, sys
-from termcolor                      import cprint
-from subprocess                     import PIPE, Popen
+import os
+
+# PLM
+from .platforms                     import platformServices
 
 TRADE_MARK                          = '™'
 
@@ -76,40 +77,10 @@ def directory_name(path):
     return os.path.basename(path)
 
 
-# setting up environment variable
-
-cprint("{0} v{1}".format(__appName__, __version__), 'cyan')
-cwd                                 = current_directory()
-cfgable                             = False
-
-if not directory_name(cwd) == __envKey__:
-    cprint("Wrong root path. Current directory: {0}".format(cwd), 'red', attrs=['underline', 'blink'])
-    sys.exit()
-else:
-    if directory_name(parent_dir(cwd)) == __envKey__:
-        ROOT_APP                = parent_dir(cwd)
-        ROOT                    = cwd
-    else:
-        ROOT_APP                = cwd
-        ROOT                    = create_path(cwd, __envKey__)
-
-import PySide2
-qtPluginDir = create_path(parent_dir(PySide2.__file__), 'plugins/platforms')
-os.environ['QT_PLUGIN_PATH'] = qtPluginDir
-
-if __envKey__ not in os.environ:
-    p = Popen('SetX {0} {1}'.format(__envKey__, ROOT), stdout=PIPE)
-    txt = p.communicate()[0].decode('utf8')
-
-else:
-    if os.getenv(__envKey__).replace('\\', '/') != ROOT:
-        p = Popen('SetX {0} {1}'.format(__envKey__, ROOT), stdout=PIPE)
-        txt = p.communicate()[0].decode('utf8')
-        print(txt)
+# the package knows where it is, nothing depends on the current directory or on the environment anymore
 
-
-from pyPLM.settings import GlobalSettings
-glbSettings                             = GlobalSettings()
+ROOT                                    = os.path.dirname(os.path.abspath(__file__)).replace('\\', '/')
+ROOT_APP                                = parent_dir(ROOT)
 
 textProp                                = create_path(ROOT_APP, 'bin', 'text.properties')
 glbProp                                 = create_path(ROOT_APP, 'bin', 'global.properties')
@@ -118,7 +89,7 @@ glbProp                                 = create_path(ROOT_APP, 'bin', 'global.p
 
 SOUND_DIR                               = create_path(ROOT_APP, 'bin', 'data', 'sound')
 
-LOCALAPPDATA                            = os.getenv('LOCALAPPDATA')
+LOCALAPPDATA                            = platformServices().appDataDir()
 
 APPDATA_DAMG                            = create_path(LOCALAPPDATA, __organization__)
 APPDATA_PLM                             = create_path(APPDATA_DAMG, __appName__)
@@ -135,9 +106,14 @@ TEAM_DIR                                = create_path(CFG_DIR, 'team')
 PRJ_DIR                                 = create_path(CFG_DIR, 'project')
 ORG_DIR                                 = create_path(CFG_DIR, 'organisation')
 USER_LOCAL_DATA                         = create_path(CFG_DIR, 'userLocal')
-USER_DIR                                = parent_dir(os.getenv('HOME'))
+USER_DIR                                = parent_dir(os.path.expanduser('~'))
 LIBRARY_DIR                             = create_path(APPDATA_DAMG, 'libraries')
 
+# the folders written by the loggers, the settings and the databases, parents first
+APP_DATA_DIRS                           = [APPDATA_DAMG, APPDATA_PLM, CFG_DIR, TMP_DIR, CACHE_DIR, PREF_DIR,
+                                           SETTING_DIR, TASK_DIR, TEAM_DIR, PRJ_DIR, ORG_DIR, USER_LOCAL_DATA,
+                                           LIBRARY_DIR]
+
 # User
 USER_DOCUMENTS_DIR                      = os.path.expanduser('~/documents')
 PROJECTS_PATH                           = create_path(USER_DOCUMENTS_DIR, 'PLM/projects')
@@ -159,6 +135,65 @@ LOCAL_DB                                = create_path(DB_DIR, 'local.db')
 METADATA                                = create_path(ROOT, 'configs/metadatas.py')
 
 
+# -------------------------------------------------------------------------------------------------------------
+""" Bootstrap """
+
+_glbSettings                            = None
+
+
+def ensure_app_dirs():
+    """
+    Make the missing app data folders from the path constants only: it runs before PLM.configs or any logger is
+    imported, their modules open files in these folders.
+    :return: the folders made.
+    """
+    made                                = []
+    for folder in APP_DATA_DIRS:
+        if not os.path.isdir(folder):
+            os.makedirs(folder, exist_ok=True)
+            made.append(folder)
+    return made
+
+
+def __getattr__(name):
+    """ glbSettings is built on first use, pyPLM.settings pulls in Qt """
+    global _glbSettings
+    if name == 'glbSettings':
+        if _glbSettings is None:
+            from pyPLM.settings import GlobalSettings
+            _glbSettings                = GlobalSettings()
+        return _glbSettings
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def bootstrap(gui=True, persistEnv=True, makeDirs=True):
+    """
+    Prepare the machine for the application, call it once before building the UI. Importing PLM does none of
+    this, so headless tools only pay for what they use.
+
+    :param gui: point Qt to the platform plugins of PySide2.
+    :param persistEnv: keep the PLM variable for the next sessions (SetX on Windows), only when it changed.
+    :param makeDirs: make the missing app data folders, before anything opens a log file in them.
+    """
+    from termcolor import cprint
+    cprint("{0} v{1}".format(__appName__, __version__), 'cyan')
+
+    if gui:
+        import PySide2
+        os.environ['QT_PLUGIN_PATH']    = create_path(parent_dir(PySide2.__file__), 'plugins/platforms')
+
+    current                             = os.getenv(__envKey__)
+    if current is None or current.replace('\\', '/') != ROOT:
+        os.environ[__envKey__]          = ROOT
+        if persistEnv:
+            platformServices().setUserEnv(__envKey__, ROOT)
+
+    if makeDirs:
+        ensure_app_dirs()
+
+    return platformServices()
+
+
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by panda on 3/16/2020 - 2:15 AM
@@ -8,13 +8,12 @@ Description:
 
 """
 # -------------------------------------------------------------------------------------------------------------
-from app import PLM
 
 if __name__ == '__main__':
-    app = PLM()
-    app.run()
+    from app import main
+    main()
 
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by panda on 6/11/2019 - 6:55 AM
-# © 2017 - 2018 DAMGteam. All rights reserved
\ No newline at end of file
+# © 2017 - 2018 DAMGteam. All rights reserved
@@ -15,21 +15,24 @@ Description:
 
 from .ConfigVersion import ConfiguredFile, DiscardDefaultIfSpecifiedAppendAction
 
-import os, winshell
+import os, threading
+from functools                          import partial
+from collections.abc                    import Mapping
+from types                              import MappingProxyType
 from termcolor                          import cprint
 
 # PLM
 from .baseConfigs                       import Cmds, Cfg, TrackKeys
 from .baseScan                          import BaseScan
+from .baseCatalogue                     import FolderCatalogue, icon_folders, folder_icons
 from PLM                                import (create_path, ROOT, ROOT_APP, APPDATA_DAMG, APPDATA_PLM,
                                                 CFG_DIR, TMP_DIR, CACHE_DIR, PREF_DIR, SETTING_DIR, DB_DIR, LOG_DIR,
                                                 TASK_DIR, TEAM_DIR, PRJ_DIR, ORG_DIR, USER_LOCAL_DATA, LIBRARY_DIR,
-                                                LOCAL_DB)
+                                                LOCAL_DB, APP_DATA_DIRS)
+from PLM.platforms                      import platformServices
 
 
 iconMissing                             = []
-toolTips                                = {}
-statusTips                              = {}
 
 
 actionTypes                             = ['DAMGACTION', 'DAMGShowLayoutAction', 'DAMGStartFileAction',
@@ -222,15 +225,22 @@ VERSION                             = read_file('VERSION')
 REFERENCES                          = read_file('REFERENCES')
 
 
-def configPropText():
+def loadPropText():
+    """ Parse bin/text.properties, :return: read only {key: text} """
     from pyjavaproperties               import Properties
     propText                            = Properties()
-    propText.load(open(create_path(BIN_DIR, 'text.properties')))
-    return propText
+    with open(create_path(BIN_DIR, 'text.properties')) as f:
+        propText.load(f)
+    return MappingProxyType(dict(propText.getPropertyDict()))
+
 
+def configPropText():
+    """ The texts of the UI, parsed once per process, see configContext """
+    return configContext.proxy('propText')
 
-appDataSpot = [APPDATA_DAMG, APPDATA_PLM, CFG_DIR, TMP_DIR, CACHE_DIR, PREF_DIR, SETTING_DIR, DB_DIR,
-               LOG_DIR, TASK_DIR, TEAM_DIR, PRJ_DIR, ORG_DIR, USER_LOCAL_DATA, LIBRARY_DIR]
+
+# made by PLM.bootstrap() before this module is imported, they stay in the scan to be reported
+appDataSpot = list(APP_DATA_DIRS)
 
 binSpot = [BIN_DIR, BIN_DATA_DIR, DESIGN_DIR, FONT_DIR, JSON_DIR, LANGUAGE_DIR, PROFILE_DIR, RESOURCES_DIR, ]
 
@@ -264,6 +274,23 @@ class DirScanner(BaseScan):
         pass
 
 
+DIRS_STAMP                              = create_path(APPDATA_PLM, '.dirs')
+_appDirsReady                           = False
+
+
+def ensureAppDirs(force=False):
+    """
+    Check the whole folder tree of PLM: once per process, and skipped by the next launches (DIRS_STAMP). The app
+    data folders are made earlier by PLM.ensure_app_dirs(), this only has to run when the pipeline is built.
+    """
+    global _appDirsReady
+    if _appDirsReady and not force:
+        return []
+    made                                = DirScanner().bootstrap(DIRS_STAMP, force)
+    _appDirsReady                       = True
+    return made
+
+
 class PthScanner(BaseScan):
 
     key = 'PthScanner'
@@ -290,6 +317,27 @@ class CfgUrls(Cfg):
         self.add('PLM wiki'         , "https://github.com/vtta2008/PipelineTool/wiki")
 
 
+_catalogues                             = dict()
+_cataloguesLock                         = threading.Lock()
+
+
+def catalogues():
+    """
+    The folder catalogues of the process: 'apps' for the installed programs and one per icon kind (ks). They are
+    scanned once, the CatalogueService keeps them up to date and every ConfigPipeline is built from them.
+    """
+    with _cataloguesLock:
+        if not _catalogues:
+            services                    = platformServices()
+            _catalogues['apps']         = FolderCatalogue('apps', services.shortcutDirs, services.folderShortcuts)
+            for kind, folder in zip(ks, ds):
+                _catalogues[kind]       = FolderCatalogue(kind, partial(icon_folders, folder), folder_icons)
+        for catalogue in _catalogues.values():
+            if not catalogue.scanned:
+                catalogue.scan()
+    return _catalogues
+
+
 class CfgApps(Cfg):
 
     key                         = 'CfgApps'
@@ -297,17 +345,8 @@ class CfgApps(Cfg):
     def __init__(self):
         super(CfgApps, self).__init__()
 
-        shortcuts = {}
-        programs = winshell.programs(common=1)
-
-        for paths, dirs, names in os.walk(programs):
-            relpath = paths[len(programs) + 1:]
-            shortcuts.setdefault(relpath, []).extend([winshell.shortcut(create_path(paths, n)) for n in names])
-
-        for relpath, lnks in sorted(shortcuts.items()):
-            for lnk in lnks:
-                name, _ = os.path.splitext(os.path.basename(lnk.lnk_filepath))
-                self[str(name)] = lnk.path
+        for name, path in catalogues()['apps'].table.items():
+            self[name] = path
 
 
 class CfgIcons(Cfg):
@@ -317,24 +356,9 @@ class CfgIcons(Cfg):
     def __init__(self):
         super(CfgIcons, self).__init__()
 
-        for i in range(len(ks)):
-            k = ks[i]
-            d = ds[i]
-            self.add(k, self.get_icons(d))
-
-    def get_icons(self, dir):
-        icons = dict()
-
-        for root, dirs, names in os.walk(dir, topdown=False):
-            for name in names:
-                if '.icon.png' in name:
-                    icons[name.split('.icon')[0]] = os.path.join(root, name).replace('\\', '/')
-                elif '.tag.png' in name:
-                    icons[name.split('.tag')[0]] = os.path.join(root, name).replace('\\', '/')
-                else:
-                    icons[name.split('.png')[0]] = os.path.join(root, name).replace('\\', '/')
-
-        return icons
+        tables                          = catalogues()
+        for k in ks:
+            self.add(k, dict(tables[k].table))
 
 
 class ConfigUiKeys(Cfg):
@@ -351,9 +375,9 @@ class ConfigUiKeys(Cfg):
     SYS_CMD_KEYS        = ['Command Prompt', 'cmd', ]
     SHORTCUT_KEYS       = ['Copy', 'Cut', 'Paste', 'Delete', 'Find', 'Rename']
 
-    APP_FUNCS_KEYS      = ['ReConfig', 'CleanPyc', 'Debug', 'Maximize', 'Minimize', 'Restore', ] + FACTOR_KEYS + \
-                          APP_EVENT_KEYS + STYLESHEET_KEYS + STYLE_KEYS + OPEN_DIR_KEYS + OPEN_URL_KEYS + SYS_CMD_KEYS + \
-                          SHORTCUT_KEYS
+    APP_FUNCS_KEYS      = ['ReConfig', 'CleanPyc', 'Debug', 'CommandLatency', 'Maximize', 'Minimize', 'Restore', ] + \
+                          FACTOR_KEYS + APP_EVENT_KEYS + STYLESHEET_KEYS + STYLE_KEYS + OPEN_DIR_KEYS + OPEN_URL_KEYS + \
+                          SYS_CMD_KEYS + SHORTCUT_KEYS
 
     UI_ELEMENT_KEYS     = ['BotTab', 'ConnectStatus', 'GridLayout', 'MainMenuSection', 'MainToolBar', 'MainToolBarSection',
                            'Notification', 'StatusBar', 'TopTab', 'TopTab1', 'TopTab2', 'TopTab3', 'UserSetting', ]
@@ -370,8 +394,8 @@ class ConfigUiKeys(Cfg):
     SETTING_UI_KEYS     = ['Configurations', 'Preferences', 'SettingUI', 'glbSettings', 'UserSetting', 'BrowserSetting',
                            'ProjSetting', 'OrgSetting', 'TaskSetting', 'TeamSetting']
     LIBRARY_UI_KEYS     = ['UserLibrary', 'HDRILibrary', 'TextureLibrary', 'AlphaLibrary', ]
-    TOOL_UI_KEYS        = ['Calculator', 'Calendar', 'EnglishDictionary', 'FindFiles', 'ImageViewer', 'NoteReminder',
-                           'ScreenShot', 'TextEditor', ]
+    TOOL_UI_KEYS        = ['Calculator', 'Calendar', 'EnglishDictionary', 'FindFiles', 'ImageViewer', 'JobsPanel',
+                           'LogViewer', 'NoteReminder', 'ScreenShot', 'TextEditor', ]
     PLUGIN_UI_KEY       = ['PluginManager', 'NodeGraph', 'Browser', 'Messenger', 'QtDesigner']
     FORM_KEY            = ['ContactUs', 'InviteFriend', 'ReportBug', ]
     KEYDETECT           = ["Non-commercial", "Uninstall", "Verbose", "License", "Skype", ".url", "Changelog", "Settings"]
@@ -424,26 +448,26 @@ class ConfigPipeline(Cfg):
 
     key                         = 'ConfigPipeline'
 
-    appInfo                     = CfgApps()
-    uiKeyInfo                   = ConfigUiKeys()
-    iconInfo                    = CfgIcons()
-    urlInfo                     = CfgUrls()
     dirInfo                     = {'ConfigFolder': CFG_DIR, 'IconFolder': ICON_DIR, 'SettingFolder': SETTING_DIR,
                                     'AppDataFolder': APPDATA_PLM, 'PreferenceFolder': PREF_DIR, }
 
-    scanDir                     = DirScanner()
-    scanPth                     = PthScanner()
-
     def __init__(self):
         super(ConfigPipeline, self).__init__()
 
-        self.scanDir.scanAndFix()
+        # built per pipeline: the app paths are edited below, a reload must start from the scanned values
+        self.appInfo            = CfgApps()
+        self.uiKeyInfo          = ConfigUiKeys()
+        self.iconInfo           = CfgIcons()
+        self.urlInfo            = CfgUrls()
+        self.scanDir            = DirScanner()
+        self.scanPth            = PthScanner()
+
+        ensureAppDirs()
 
-        removeKeys              = []
         launchAppKeys           = []
+        # the records are collected here and put in the pipeline at once
+        commands                = dict()
 
-        KEYDETECT               = self.uiKeyInfo.KEYDETECT
-        KEYPACKAGE              = self.uiKeyInfo.KEYPACKAGE
         OPEN_URL_KEYS           = self.uiKeyInfo.OPEN_URL_KEYS
         SYS_CMD_KEYS            = self.uiKeyInfo.SYS_CMD_KEYS
         OPEN_DIR_KEYS           = self.uiKeyInfo.OPEN_DIR_KEYS
@@ -455,64 +479,30 @@ class ConfigPipeline(Cfg):
         layoutKeys              = self.uiKeyInfo.APP_UI_KEYS
 
 
-        for key in self.appInfo:
-            if 'NukeX' in key:
-                self.appInfo[key] = '"' + self.appInfo[key] + '"' + " --nukex"
-            elif 'Hiero' in key:
-                self.appInfo[key] = '"' + self.appInfo[key] + '"' + " --hiero"
-            elif 'UVLayout' in key:
-                self.appInfo[key] = '"' + self.appInfo[key] + '"' + " -launch"
-
-        for key in KEYDETECT:
-            for k in self.appInfo:
-                if key in k:
-                    removeKeys.append(k)
-
-        for k in removeKeys:
-            self.appInfo.removeKey(k)
+        for key in list(self.appInfo):
+            if self.isIgnoredApp(key):
+                self.appInfo.removeKey(key)
+            else:
+                self.appInfo[key] = self.appCommandLine(key, self.appInfo[key])
 
         self.appInfo.update()
 
-        for k in KEYPACKAGE:
-            for key in self.appInfo.keys():
-                if k in key:
-                    launchAppKeys.append(key)
-
-        qtDesigner = create_path(os.getenv('PROGRAMDATA'), 'Anaconda3', 'Library', 'bin', 'designer.exe')
-        davinciPth = create_path(os.getenv('PROGRAMFILES'), 'Blackmagic Design', 'DaVinci Resolve', 'resolve.exe')
+        for key in self.appInfo.keys():
+            if self.isLaunchKey(key):
+                launchAppKeys.append(key)
 
-        eVal       = [qtDesigner, davinciPth]
-        eKeys      = ['QtDesigner', 'Davinci Resolve']
-
-        for i in range(len(eVal)):
-            if os.path.exists(eVal[i]):
-                self.appInfo[eKeys[i]] = eVal[i]
-                launchAppKeys.append(eKeys[i])
+        # the platform knows where they are, none of them on Linux
+        for key, path in platformServices().knownPrograms().items():
+            if os.path.exists(path):
+                self.appInfo[key] = path.replace('\\', '/')
+                launchAppKeys.append(key)
 
         for key in launchAppKeys:
-            try:
-                icon = self.iconInfo['icon32'][key]
-            except KeyError:
-                icon = key
-                iconMissing.append(key)
-            finally:
-                toolTips[key] = 'Launch {0}'.format(key)
-                statusTips[key] = 'Launch {0}: {1}'.format(key, self.appInfo[key])
-                value = self.appInfo[key]
-                valueType = CMD_VALUE_TYPE['pth']
-                arg = value
-                if 'NukeX' in key:
-                    code = 'os.system'
-                elif 'Hiero' in key:
-                    code = 'os.system'
-                elif 'UVLayout' in key:
-                    code = 'os.system'
-                else:
-                    code = 'os.startfile'
+            record = self.launchCmds(key)
+            commands[record.key] = record
 
-            tooltip = toolTips[key]
-            statustip = statusTips[key]
-            self.add(key, Cmds(key, icon, tooltip, statustip, value, valueType, arg, code))
+        self.launchKeys         = set(launchAppKeys)
+        self.functionKeys       = set(functionKeys)
 
         for key in functionKeys:
 
@@ -526,58 +516,57 @@ class ConfigPipeline(Cfg):
                     iconMissing.append(key)
             finally:
                 if key in OPEN_URL_KEYS:
-                    toolTips[key] = 'Go to {0} website'.format(key)
-                    statusTips[key] = 'Open URL: {0}'.format(self.urlInfo[key])
+                    tooltip = 'Go to {0} website'.format(key)
+                    statustip = 'Open URL: {0}'.format(self.urlInfo[key])
                     value = self.urlInfo[key]
                     valueType = CMD_VALUE_TYPE['url']
                     arg = value
                     code = 'openURL'
                 elif key in SYS_CMD_KEYS:
-                    toolTips[key] = 'Open command prompt'
-                    statusTips[key] = 'Open command prompt'
+                    tooltip = 'Open command prompt'
+                    statustip = 'Open command prompt'
                     value = 'start /wait cmd'
                     valueType = CMD_VALUE_TYPE['cmd']
                     arg = value
                     code = 'os.system'
                 elif key in OPEN_DIR_KEYS:
-                    toolTips[key] = 'Open {0} folder'.format(key.replace('Folder', ''))
-                    statusTips[key] = 'Open {0} folder'.format(key.replace('Folder', ''))
+                    tooltip = 'Open {0} folder'.format(key.replace('Folder', ''))
+                    statustip = 'Open {0} folder'.format(key.replace('Folder', ''))
                     value = self.dirInfo[key]
                     valueType = CMD_VALUE_TYPE['dir']
                     arg = value
                     code = 'os.startfile'
                 elif key in APP_EVENT_KEYS:
-                    toolTips[key] = 'Release PLM Event: {0}'.format(key)
-                    statusTips[key] = 'Activate Event: {0}'.format(key)
+                    tooltip = 'Release PLM Event: {0}'.format(key)
+                    statustip = 'Activate Event: {0}'.format(key)
                     value = key
                     valueType = CMD_VALUE_TYPE['event']
                     arg = key
                     code = 'appEvent'
                 elif key in STYLESHEET_KEYS:
-                    toolTips[key] = 'Load stylesheet: {0}'.format(key)
-                    statusTips[key] = 'Load stylesheet: {0}'.format(key)
+                    tooltip = 'Load stylesheet: {0}'.format(key)
+                    statustip = 'Load stylesheet: {0}'.format(key)
                     value = key
                     valueType = CMD_VALUE_TYPE['stylesheet']
                     arg = value
                     code = 'stylesheet'
                 elif key in SHORTCUT_KEYS:
-                    toolTips[key] = key
-                    statusTips[key] = key
+                    tooltip = key
+                    statustip = key
                     value = key
                     valueType = CMD_VALUE_TYPE['shortcut']
                     arg = value
                     code = 'shortcut'
                 else:
-                    toolTips[key] = 'Execute function: {0}'.format(key)
-                    statusTips[key] = 'Execute function: {0}'.format(key)
+                    tooltip = 'Execute function: {0}'.format(key)
+                    statustip = 'Execute function: {0}'.format(key)
                     value = key
                     valueType = CMD_VALUE_TYPE['func']
                     arg = value
                     code = 'function'
 
-            tooltip = toolTips[key]
-            statustip = statusTips[key]
-            self.add(key, Cmds(key, icon, tooltip, statustip, value, valueType, arg, code))
+            record = Cmds(key, icon, tooltip, statustip, value, valueType, arg, code)
+            commands[record.key] = record
 
         for key in layoutKeys:
             if not key in launchAppKeys:
@@ -587,17 +576,255 @@ class ConfigPipeline(Cfg):
                     icon = key
                     iconMissing.append(key)
                 finally:
-                    toolTips[key] = 'Show: {0}'.format(key)
-                    statusTips[key] = 'Show: {0}'.format(key)
+                    tooltip = 'Show: {0}'.format(key)
+                    statustip = 'Show: {0}'.format(key)
                     value = key
                     valueType = CMD_VALUE_TYPE['uiKey']
                     arg = value
                     code = 'showUI'
 
-                tooltip = toolTips[key]
-                statustip = statusTips[key]
-                self.add(key, Cmds(key, icon, tooltip, statustip, value, valueType, arg, code))
+                record = Cmds(key, icon, tooltip, statustip, value, valueType, arg, code)
+                commands[record.key] = record
+
+        self.update(commands)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Applications """
+
+    def isIgnoredApp(self, name):
+        """ Uninstallers, licences, web links... of the start menu are not programs """
+        return any(k in name for k in self.uiKeyInfo.KEYDETECT)
+
+    def isLaunchKey(self, name):
+        """ Only the programs of the tracked packages (TrackKeys) become commands """
+        return any(k in name for k in self.uiKeyInfo.KEYPACKAGE)
+
+    def appCommandLine(self, name, path):
+        if 'NukeX' in name:
+            return '"' + path + '"' + " --nukex"
+        elif 'Hiero' in name:
+            return '"' + path + '"' + " --hiero"
+        elif 'UVLayout' in name:
+            return '"' + path + '"' + " -launch"
+        return path
+
+    def commandIcon(self, key, kinds=('icon32', )):
+        """ The first icon of key in the icon kinds, the key itself when there is none """
+        for kind in kinds:
+            if key in self.iconInfo[kind]:
+                if key in iconMissing:
+                    iconMissing.remove(key)
+                return self.iconInfo[kind][key]
+        if key not in iconMissing:
+            iconMissing.append(key)
+        return key
+
+    def launchCmds(self, key):
+        value                   = self.appInfo[key]
+        code                    = 'os.system' if any(k in key for k in ['NukeX', 'Hiero', 'UVLayout']) else 'os.startfile'
+        return Cmds(key, self.commandIcon(key), 'Launch {0}'.format(key), 'Launch {0}: {1}'.format(key, value), value,
+                    CMD_VALUE_TYPE['pth'], value, code)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Catalogue updates """
+
+    def updateApps(self, shortcuts, names):
+        """
+        Programs were installed, removed or moved: only their entries are made again.
+        :param shortcuts: the program table of the catalogue, names: the programs which changed in it.
+        :return: (added, removed, changed) command keys.
+        """
+        added, removed, changed = [], [], []
+        for name in names:
+            path                = shortcuts.get(name)
+            if path is None or self.isIgnoredApp(name):
+                self.appInfo.removeKey(name)
+                if name in self.launchKeys:
+                    self.launchKeys.discard(name)
+                    self.removeKey(name)
+                    removed.append(name)
+                continue
+
+            self.appInfo[name]  = self.appCommandLine(name, path)
+            if not self.isLaunchKey(name):
+                continue
+            (changed if name in self.launchKeys else added).append(name)
+            self.launchKeys.add(name)
+            record              = self.launchCmds(name)
+            self[record.key]    = record
+        return added, removed, changed
+
+    def updateIcons(self, kind, icons, names):
+        """
+        Icons of 'kind' were added, removed or replaced.
+        :return: the command keys whose icon changed.
+        """
+        self.iconInfo[kind]     = dict(icons)
+        if kind not in ['tag', 'icon32']:
+            return []
+
+        changed                 = []
+        for key in names:
+            if key not in self:
+                continue
+            # function commands look for a tag first, see __init__
+            cmd                 = self[key]
+            icon                = self.commandIcon(key, ['tag', 'icon32'] if key in self.functionKeys else ['icon32'])
+            if icon != cmd['icon']:
+                self[key]       = cmd._replace(icon=icon)
+                changed.append(key)
+        return changed
+
+
+class ConfigContext(object):
+
+    """
+    The configurations shared by the whole process. Each one is built on first use only, then every module gets
+    the same object. reload() drops a configuration and the ones built from it, they are built again on next use,
+    and the listeners (onReload) are told which names changed so they can rebuild what they made from them.
+    """
+
+    key                         = 'ConfigContext'
+
+    def __init__(self):
+        super(ConfigContext, self).__init__()
+
+        self._lock              = threading.RLock()
+        self._factories         = dict()
+        self._dependsOn         = dict()
+        self._values            = dict()
+        self._proxies           = dict()
+        self._listeners         = []
+
+    def register(self, name, factory, dependsOn=()):
+        with self._lock:
+            self._factories[name]   = factory
+            self._dependsOn[name]   = tuple(dependsOn)
+            self._values.pop(name, None)
+
+    def get(self, name):
+        with self._lock:
+            if name not in self._values:
+                for dependency in self._dependsOn[name]:
+                    self.get(dependency)
+                self._values[name]  = self._factories[name]()
+            return self._values[name]
+
+    def loaded(self, name):
+        return name in self._values
+
+    def proxy(self, name):
+        """ A mapping which always reads the current value, safe to keep at module level across reloads """
+        with self._lock:
+            if name not in self._proxies:
+                self._proxies[name] = ConfigProxy(self, name)
+            return self._proxies[name]
+
+    def dependents(self, name):
+        """ :return: the names built from 'name', directly or not """
+        found                   = set()
+        todo                    = [name]
+        while todo:
+            current             = todo.pop()
+            for other, dependsOn in self._dependsOn.items():
+                if current in dependsOn and other not in found:
+                    found.add(other)
+                    todo.append(other)
+        return found
+
+    def reload(self, name=None):
+        """ Drop 'name' (everything when None) and its dependents, :return: the names dropped """
+        with self._lock:
+            names               = set(self._factories) if name is None else {name} | self.dependents(name)
+            for n in names:
+                self._values.pop(n, None)
+        for listener in list(self._listeners):
+            listener(names)
+        return names
+
+    def onReload(self, callback):
+        """ callback(names) is called after every reload """
+        self._listeners.append(callback)
+
+    @property
+    def propText(self):
+        return self.get('propText')
+
+    @property
+    def pipeline(self):
+        return self.get('pipeline')
+
+
+class ConfigProxy(Mapping):
+
+    """ Read through view of a configuration of the ConfigContext: items and attributes of its current value """
+
+    def __init__(self, context, name):
+        self._context           = context
+        self._name              = name
+
+    @property
+    def value(self):
+        return self._context.get(self._name)
+
+    def __getitem__(self, key):
+        return self.value[key]
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __contains__(self, key):
+        return key in self.value
+
+    def keys(self):
+        return self.value.keys()
+
+    def items(self):
+        return self.value.items()
+
+    def values(self):
+        return self.value.values()
+
+    def __getattr__(self, name):
+        return getattr(self.value, name)
+
+    def __repr__(self):
+        return '<ConfigProxy {0}>'.format(self._name)
+
+
+configContext                   = ConfigContext()
+configContext.register('propText', loadPropText)
+configContext.register('pipeline', ConfigPipeline)
+
+
+def configPipeline():
+    """ The ConfigPipeline of the process, built once, see configContext """
+    return configContext.proxy('pipeline')
+
+
+class CmdsFieldView(Mapping):
+
+    """ {command key: one field} of the pipeline commands, read from the records: the strings are not copied """
+
+    def __init__(self, context, field):
+        self._context           = context
+        self._field             = field
+
+    def __getitem__(self, key):
+        return getattr(self._context.get('pipeline')[key], self._field)
+
+    def __iter__(self):
+        return iter(self._context.get('pipeline'))
+
+    def __len__(self):
+        return len(self._context.get('pipeline'))
+
 
+toolTips                        = CmdsFieldView(configContext, 'toolTip')
+statusTips                      = CmdsFieldView(configContext, 'statusTip')
 
 
 
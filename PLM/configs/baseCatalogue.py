@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: baseCatalogue.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Tables built from the files of a list of folders (installed programs, icons). Every folder is read on its own
+    and kept with its entries, the table merges them in the folder order: a later folder wins. rescan() reads the
+    given folders only and tells which names were added, removed or changed, a new program or icon does not need
+    the other folders to be read again.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os
+
+
+ICON_SUFFIXES                           = ['.icon.png', '.tag.png', '.png']
+
+
+def icon_name(fileName):
+    """ Key of an icon file: 'Maya.icon.png' -> 'Maya' """
+    for suffix in ICON_SUFFIXES:
+        if suffix in fileName:
+            return fileName.split(suffix)[0]
+    return fileName
+
+
+def icon_folders(root):
+    """ root and its sub folders, deepest first: the icons of root win over the ones of its sub folders """
+    folders                             = [path.replace('\\', '/') for path, dirs, names in os.walk(root, topdown=False)]
+    return sorted(folders, key=lambda f: (-f.count('/'), f))
+
+
+def folder_icons(folder):
+    """ :return: {name: path} of the icon files directly in folder """
+    icons                               = dict()
+    try:
+        entries                         = os.scandir(folder)
+    except OSError:
+        return icons
+    with entries:
+        for entry in entries:
+            if entry.is_file():
+                icons[icon_name(entry.name)] = '{0}/{1}'.format(folder, entry.name)
+    return icons
+
+
+def norm_folder(folder):
+    return os.path.abspath(folder).replace('\\', '/')
+
+
+class FolderCatalogue(object):
+
+    """
+    :param lister: callable returning the folders of the catalogue, in merge order. It is called again on every
+                   rescan, new sub folders are found this way.
+    :param reader: callable(folder) returning the {name: value} of one folder.
+    """
+
+    key                                 = 'FolderCatalogue'
+
+    def __init__(self, name, lister, reader):
+        super(FolderCatalogue, self).__init__()
+
+        self.name                       = name
+        self.lister                     = lister
+        self.reader                     = reader
+
+        self.folders                    = []
+        self.entries                    = dict()
+        self.table                      = dict()
+        self.scanned                    = False
+
+    def listFolders(self):
+        return [norm_folder(f) for f in self.lister()]
+
+    def merge(self):
+        table                           = dict()
+        for folder in self.folders:
+            table.update(self.entries.get(folder, {}))
+        return table
+
+    def scan(self):
+        """ Read every folder, :return: the table """
+        self.folders                    = self.listFolders()
+        self.entries                    = {folder: self.reader(folder) for folder in self.folders}
+        self.table                      = self.merge()
+        self.scanned                    = True
+        return self.table
+
+    def owns(self, path):
+        """ True when path is one of the folders or under one of them """
+        path                            = norm_folder(path)
+        return any(path == f or path.startswith(f + '/') for f in self.folders)
+
+    def rescan(self, folders):
+        """
+        Read again the folders which changed. Folders which appeared are read, the ones which are gone are dropped.
+        :return: (added, removed, changed) names of the table.
+        """
+        if not self.scanned:
+            self.scan()
+            return sorted(self.table), [], []
+
+        dirty                           = {norm_folder(f) for f in folders}
+        current                         = self.listFolders()
+        for folder in current:
+            if folder in dirty or folder not in self.entries:
+                self.entries[folder]    = self.reader(folder)
+        for folder in set(self.entries) - set(current):
+            del self.entries[folder]
+        self.folders                    = current
+
+        old, self.table                 = self.table, self.merge()
+        added                           = [n for n in self.table if n not in old]
+        removed                         = [n for n in old if n not in self.table]
+        changed                         = [n for n in self.table if n in old and old[n] != self.table[n]]
+        return added, removed, changed
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 9:45 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
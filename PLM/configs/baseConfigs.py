@@ -12,7 +12,8 @@ Description:
 """ Import """
 
 # Python
-import pprint, json
+import sys, pprint, json
+from collections import namedtuple
 from pyPLM.damg import DAMGDICT
 
 
@@ -29,8 +30,10 @@ class Cfg(DAMGDICT):
 
 
     def saveConfigData(self, filePth):
+        # command records are written as the dicts they read as
+        data = {k: v.asDict() if isinstance(v, Cmds) else v for k, v in self.items()}
         with open(filePth, 'w+') as f:
-            json.dump(self, f, indent=4)
+            json.dump(data, f, indent=4)
 
         print('data saved: {0}'.format(filePth))
 
@@ -41,30 +44,60 @@ class Cfg(DAMGDICT):
             self.pop(key, None)
 
 
-class Cmds(Cfg):
+# attribute names of a command record, and the keys it reads with as a dict
+CMDS_FIELDS                         = ('key', 'icon', 'toolTip', 'statusTip', 'value', 'valueType', 'arg', 'code')
+CMDS_KEYS                           = ('key', 'icon', 'tooltip', 'statustip', 'value', 'valueType', 'arg', 'code')
+CMDS_INDEX                          = dict(list(zip(CMDS_KEYS, range(8))) + list(zip(CMDS_FIELDS, range(8))))
 
-    key                             = 'Cmds'
 
-    def __init__(self, key=None, icon=None, tooltip=None, statustip=None,
-                       value=None, valueType=None, arg=None, code=None):
-        super(Cmds, self).__init__()
+def intern_str(value):
+    return sys.intern(value) if type(value) is str else value
 
-        self.key                    = key
-        self.icon                   = icon
-        self.toolTip                = tooltip
-        self.statusTip              = statustip
-        self.value                  = value
-        self.valueType              = valueType
-        self.arg                    = arg
-        self.code                   = code
 
-        ks = ['key', 'icon', 'tooltip', 'statustip', 'value', 'valueType', 'arg', 'code']
-        vs = [key, icon, tooltip, statustip, value, valueType, arg, code]
+class Cmds(namedtuple('Cmds', CMDS_FIELDS)):
 
-        for i in range(len(ks)):
-            self.add(ks[i], vs[i])
+    """
+    A command of the ConfigPipeline. An immutable record: the pipeline has hundreds of them, they are not DAMG
+    objects and are not registered. The key, value type and code are interned, the pipeline and the widgets
+    share one string per key.
 
-        self.update()
+    Existing code reads it as the dict it was: cmd['statustip'], cmd.get('icon'), 'code' in cmd, cmd.items().
+    Iterating gives the values like any tuple, use keys() for the dict keys.
+    """
+
+    __slots__                       = ()
+
+    def __new__(cls, key=None, icon=None, tooltip=None, statustip=None, value=None, valueType=None, arg=None,
+                code=None):
+        return tuple.__new__(cls, (intern_str(key), icon, tooltip, statustip, value, intern_str(valueType), arg,
+                                   intern_str(code)))
+
+    def __getitem__(self, item):
+        if type(item) is str:
+            try:
+                item                = CMDS_INDEX[item]
+            except KeyError:
+                raise KeyError(item)
+        return tuple.__getitem__(self, item)
+
+    def __contains__(self, item):
+        return item in CMDS_INDEX
+
+    def get(self, item, default=None):
+        index                       = CMDS_INDEX.get(item)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self):
+        return CMDS_KEYS
+
+    def values(self):
+        return tuple(self)
+
+    def items(self):
+        return tuple(zip(CMDS_KEYS, self))
+
+    def asDict(self):
+        return dict(zip(CMDS_KEYS, self))
 
 
 class TrackKeys(Cfg):
@@ -85,9 +118,9 @@ class TrackKeys(Cfg):
                     Office          = ['Word', 'Excel', 'PowerPoint', 'Wordpad'],
                     Dev             = ['Sublime Text', 'QtDesigner', 'Git Bash', 'Command Prompt'],
                     Tools           = ['Calculator', 'Calendar', 'ContactUs', 'EnglishDictionary', 'FeedBack',
-                                       'ReportBug', 'FindFiles', 'ImageViewer', 'InviteFriend', 'Messenger',
-                                       'NoteReminder', 'ScreenShot', 'TextEditor', 'PluginManager', 'NodeGraph',
-                                       'Browser', ],
+                                       'ReportBug', 'FindFiles', 'ImageViewer', 'InviteFriend', 'JobsPanel', 'LogViewer',
+                                       'Messenger', 'NoteReminder', 'ScreenShot', 'TextEditor', 'PluginManager',
+                                       'NodeGraph', 'Browser', ],
                     Extra           = ['ReConfig', 'CleanPyc', 'Debug', 'Snipping Tool'],
                     sysTray         = ['Snipping Tool', 'ScreenShot', 'Maximize', 'Minimize', 'Restore', 'Exit', ], )
 
@@ -120,8 +153,8 @@ class TrackKeys(Cfg):
     windowApps = ['Sublime Text 2', 'Sublime Text 3', 'Wordpad', 'Headus UVLayout',
                   'Snipping Tool', ] + pPACKAGE['anaconda'] + pPACKAGE['office']
 
-    TOOL_UI_KEYS = ['Calculator', 'Calendar', 'EnglishDictionary', 'FindFiles', 'ImageViewer',
-                    'NoteReminder', 'ScreenShot', 'TextEditor', ]
+    TOOL_UI_KEYS = ['Calculator', 'Calendar', 'EnglishDictionary', 'FindFiles', 'ImageViewer', 'JobsPanel',
+                    'LogViewer', 'NoteReminder', 'ScreenShot', 'TextEditor', ]
 
     def __init__(self):
         super(TrackKeys, self).__init__()
@@ -11,18 +11,34 @@ Description:
 # -------------------------------------------------------------------------------------------------------------
 """ Import """
 
-import os
+import os, hashlib
 
 from pyPLM.damg import DAMGLIST, DAMG
 
 
+def required_dirs(dirs):
+    """
+    The folders to check for dirs: duplicates are removed and so are the parents of other folders of the list,
+    a folder which exists has its parents, makedirs makes them.
+    """
+    paths = sorted(set(os.path.abspath(d).replace('\\', '/').rstrip('/') for d in dirs if d))
+    leaves = []
+    for i, path in enumerate(paths):
+        # sorted: the children of a folder follow it
+        if i + 1 < len(paths) and paths[i + 1].startswith(path + '/'):
+            continue
+        leaves.append(path)
+    return leaves
+
+
+def dirs_digest(dirs):
+    return hashlib.sha1('\n'.join(dirs).encode('utf-8')).hexdigest()
+
+
 class BaseScan(DAMG):
 
     key                 = 'AutoScanner'
 
-    _missing            = DAMGLIST()
-    _findout            = DAMGLIST()
-
     alldirs             = None
     allpths             = None
 
@@ -30,45 +46,68 @@ class BaseScan(DAMG):
     def __init__(self, parent=None):
         super(BaseScan, self).__init__(parent)
 
+        self._missing   = DAMGLIST()
+        self._findout   = DAMGLIST()
+
 
     def scanAndFix(self):
-        self.scan(self.alldirs, True)
-        # if 'Dir' in self.key:
-        #     return print('finish scanning directories')
-        # elif 'Pth' in self.key:
-        #     return print('finish scanning paths')
-        # else:
-        #     return print('finish scanning')
-
-
-    def scan(self, dirs=[], fix=False):
-        for d in dirs:
-            if not os.path.exists(d):
-                if fix:
-                    return self.fixDir()
-                else:
-                    self._missing.append(d)
-                    print('Detect path not exists: {0}'.format(d.replace('\\', '/')))
+        return self.scan(self.alldirs, True)
 
-    def fixDir(self):
-        for d in self.missing:
-            self.makeDir(d)
+    def scan(self, dirs=None, fix=False):
+        """ Find every missing folder in one pass, with fix they are all made. :return: the missing folders """
+        missing = [d for d in required_dirs(dirs or self.alldirs or []) if not os.path.isdir(d)]
+        self._missing.clear()
+        self._missing.extend(missing)
 
-    def makeDir(self, pth, mode=0o770):
+        if fix:
+            self.fixDir()
+        else:
+            for d in missing:
+                print('Detect path not exists: {0}'.format(d))
+        return missing
 
-        if not pth or os.path.exists(pth):
-            return []
+    def fixDir(self):
+        """ Make the missing folders, the ones which can not be made stay in missing """
+        failed = [d for d in self.missing if not self.makeDir(d)]
+        self._findout.extend(d for d in self.missing if d not in failed)
+        self._missing.clear()
+        self._missing.extend(failed)
+        return not failed
 
-        (head, tail) = os.path.split(pth)
-        res = self.makeDir(head, mode)
+    def makeDir(self, pth, mode=0o770):
+        if not pth:
+            return False
         try:
-            original_umask = os.umask(0)
-            os.makedirs(pth, mode)
-        except:
-            os.chmod(pth, mode)
-        finally:
-            os.umask(original_umask)
-        res += [pth]
+            os.makedirs(pth, mode, exist_ok=True)
+        except OSError as err:
+            print('Can not make folder: {0} ({1})'.format(pth, err))
+            return False
+        return True
+
+    def bootstrap(self, stampFile, force=False):
+        """
+        Make the missing folders of alldirs once: the list is remembered in stampFile when they all exist, the
+        next launches with the same list skip the check.
+        :return: the folders made.
+        """
+        digest = dirs_digest(required_dirs(self.alldirs or []))
+        if not force:
+            try:
+                with open(stampFile) as f:
+                    if f.read().strip() == digest:
+                        return []
+            except (IOError, OSError):
+                pass
+
+        self._findout.clear()
+        self.scan(self.alldirs, True)
+        if not self.missing:
+            try:
+                with open(stampFile, 'w') as f:
+                    f.write(digest)
+            except (IOError, OSError):
+                pass
+        return list(self.findout)
 
     def clear(self):
         return self._missing.clear(), self._findout.clear()
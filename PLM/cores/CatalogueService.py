@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: CatalogueService.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Keeps the program and icon catalogues (PLM.configs.catalogues) up to date while PLM runs: a program installed
+    or an icon added shows up without restarting.
+
+    Every folder of the catalogues is watched (QFileSystemWatcher), a folder the watcher can not take (network
+    drive, no more inotify watches) is polled on its modification time. An installer writes hundreds of files:
+    the changed folders are collected until nothing happened for SETTLE_TIME, then only these folders are read
+    again. The ConfigPipeline gets the entries which changed and commandsChanged tells the views which command
+    keys to update, the other actions are left as they are.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, time
+
+# PySide2
+from PySide2.QtCore                     import QFileSystemWatcher
+
+# PLM
+from pyPLM.Core                         import Signal, Timer
+from pyPLM.damg                         import DAMG
+from PLM.configs.baseCatalogue          import norm_folder
+
+
+# quiet time after the last change before the folders are read
+SETTLE_TIME                             = 500
+# a long install is still read every MAX_SETTLE
+MAX_SETTLE                              = 5000
+POLL_INTERVAL                           = 3000
+
+
+def folder_mtime(folder):
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return None
+
+
+def unique(keys):
+    return list(dict.fromkeys(keys))
+
+
+class CatalogueService(DAMG):
+
+    key                                 = 'CatalogueService'
+
+    # catalogue name ('apps', 'icon32'...), names added, removed or changed in it
+    catalogueChanged                    = Signal(str, list)
+    # command keys of the pipeline: added, removed, changed
+    commandsChanged                     = Signal(list, list, list)
+
+    def __init__(self, tables=None, poll=False, parent=None):
+        super(CatalogueService, self).__init__(parent)
+
+        self.tables                     = tables
+        self.pollOnly                   = poll
+        self.running                    = False
+
+        self.watcher                    = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.onFolderChanged)
+        # folder: last modification time, for the folders the watcher does not take
+        self.polled                     = dict()
+
+        self._dirty                     = set()
+        self._firstDirty                = None
+
+        self.settleTimer                = Timer(self)
+        self.settleTimer.setSingleShot(True)
+        self.settleTimer.setInterval(SETTLE_TIME)
+        self.settleTimer.timeout.connect(self.applyChanges)
+
+        self.pollTimer                  = Timer(self)
+        self.pollTimer.setInterval(POLL_INTERVAL)
+        self.pollTimer.timeout.connect(self.poll)
+
+    def start(self):
+        if self.tables is None:
+            # imported here: PLM.configs imports PLM.cores, a module level import would make a cycle
+            from PLM.configs            import catalogues
+            self.tables                 = catalogues()
+        self.running                    = True
+        self.watchFolders()
+
+    def stop(self):
+        self.running                    = False
+        self.settleTimer.stop()
+        self.pollTimer.stop()
+        if self.watcher.directories():
+            self.watcher.removePaths(self.watcher.directories())
+        self.polled.clear()
+
+    def watchFolders(self):
+        """ Watch the folders of the catalogues, the ones which are gone are forgotten """
+        wanted                          = {f for catalogue in self.tables.values() for f in catalogue.folders}
+        watched                         = set(self.watcher.directories())
+
+        for folder in watched - wanted:
+            self.watcher.removePath(folder)
+        for folder in set(self.polled) - wanted:
+            del self.polled[folder]
+        for folder in wanted - watched - set(self.polled):
+            if self.pollOnly or not self.watcher.addPath(folder):
+                self.polled[folder]     = folder_mtime(folder)
+
+        if self.polled:
+            self.pollTimer.start()
+        else:
+            self.pollTimer.stop()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Changes """
+
+    def poll(self):
+        for folder, mtime in list(self.polled.items()):
+            current                     = folder_mtime(folder)
+            if current != mtime:
+                self.polled[folder]     = current
+                self.onFolderChanged(folder)
+
+    def onFolderChanged(self, path):
+        self._dirty.add(norm_folder(path))
+        if self._firstDirty is None:
+            self._firstDirty            = time.time()
+        # every change pushes the read back, unless the first one waits for too long already
+        if not self.settleTimer.isActive() or (time.time() - self._firstDirty) * 1000 < MAX_SETTLE:
+            self.settleTimer.start()
+
+    def applyChanges(self):
+        """ Read the changed folders again, update the pipeline and tell which commands changed """
+        dirty, self._dirty              = self._dirty, set()
+        self._firstDirty                = None
+        if not self.running or not dirty:
+            return
+
+        from PLM.configs                import configContext
+        pipeline                        = configContext.get('pipeline') if configContext.loaded('pipeline') else None
+        added, removed, changed         = [], [], []
+
+        for name, catalogue in self.tables.items():
+            folders                     = [f for f in dirty if catalogue.owns(f)]
+            if not folders:
+                continue
+            new, gone, edited           = catalogue.rescan(folders)
+            names                       = new + gone + edited
+            if not names:
+                continue
+            self.catalogueChanged.emit(name, names)
+
+            # a pipeline built later reads the catalogues, it is already up to date
+            if pipeline is None:
+                continue
+            if name == 'apps':
+                keys                    = pipeline.updateApps(catalogue.table, names)
+            else:
+                keys                    = [], [], pipeline.updateIcons(name, catalogue.table, names)
+            added.extend(keys[0])
+            removed.extend(keys[1])
+            changed.extend(keys[2])
+
+        self.watchFolders()
+
+        added, removed                  = unique(added), unique(removed)
+        changed                         = [k for k in unique(changed) if k not in added and k not in removed]
+        if added or removed or changed:
+            self.commandsChanged.emit(added, removed, changed)
+
+
+_catalogueService                       = None
+
+
+def catalogueService():
+    global _catalogueService
+    if _catalogueService is None:
+        _catalogueService               = CatalogueService()
+    return _catalogueService
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 9:45 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: JobQueue.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Local job queue of PLM: applications launched from the pipeline (NukeX, Hiero, UVLayout, Command Prompt...) and
+    headless script runs (conversions, cache exports, renders with mayapy, nuke -t, hython...).
+
+    Batch jobs wait for one of the 'concurrency' slots and are killed when PLM quits. Launched applications start
+    at once, detached: they stay open when PLM quits. Every job writes its stdout and stderr to its own log files
+    (LOG_DIR/jobs) and is kept in the local database (JobStore) with its start, end, exit code and CPU time.
+    With psutil installed, CPU time is sampled and the end of launched applications is noticed (their exit code
+    can not be known).
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sys, time
+
+# PLM
+from PLM                                import LOG_DIR
+from PLM.platforms                      import platformServices
+from pyPLM.Core                         import Signal, Timer
+from pyPLM.damg                         import DAMG
+from PLM.cores.data.JobStore            import JobStore
+from PLM.cores.ProcessRunner            import (ProcessRunner, split_line, start_detached, JOB_QUEUED, JOB_RUNNING,
+                                                JOB_FAILED, MAX_JOBS)
+
+try:
+    import psutil
+except ImportError:
+    psutil                              = None
+
+
+JOB_LOG_DIR                             = os.path.join(LOG_DIR, 'jobs')
+JOB_LAUNCHED                            = 'Launched'
+JOB_CLOSED                              = 'Closed'
+JOB_INTERRUPTED                         = 'Interrupted'
+SAMPLE_INTERVAL                         = 1000
+
+KIND_LAUNCH                             = 'launch'
+KIND_BATCH                              = 'batch'
+
+
+def cpu_seconds(pid):
+    """ CPU time of a process and its children, None if it can not be read """
+    try:
+        process                         = psutil.Process(pid)
+        times                           = process.cpu_times()
+        total                           = times.user + times.system
+        for child in process.children(recursive=True):
+            try:
+                childTimes              = child.cpu_times()
+                total                   += childTimes.user + childTimes.system
+            except psutil.Error:
+                pass
+        return total
+    except psutil.Error:
+        return None
+
+
+def pid_alive(pid):
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
+
+class JobQueue(DAMG):
+
+    key                                 = 'JobQueue'
+
+    jobChanged                          = Signal(int)
+
+    def __init__(self, concurrency=MAX_JOBS, store=None, logDir=JOB_LOG_DIR, parent=None):
+        super(JobQueue, self).__init__(parent)
+
+        self.store                      = store or JobStore.instance()
+        self.logDir                     = logDir
+        self.runner                     = ProcessRunner(concurrency, self)
+        # job id: ProcessJob of the batch jobs queued or running
+        self.jobs                       = dict()
+        # job id: pid of the launched applications still open (followed with psutil)
+        self.launched                   = dict()
+        self.cpuTimes                   = dict()
+
+        self.sampleTimer                = Timer(self)
+        self.sampleTimer.setInterval(SAMPLE_INTERVAL)
+        self.sampleTimer.timeout.connect(self.sample)
+
+        # a batch job can not be running or queued when PLM starts, the session which had it ended
+        self.store.interrupt([JOB_QUEUED, JOB_RUNNING], JOB_INTERRUPTED)
+
+    @property
+    def concurrency(self):
+        return self.runner.maxJobs
+
+    def setConcurrency(self, concurrency):
+        self.runner.maxJobs             = max(1, int(concurrency))
+        self.runner.startNext()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Submit """
+
+    def submit(self, program, arguments=None, env=None, cwd=None, title=None, kind=KIND_BATCH, timeout=None):
+        """
+        Queue a job.
+        :param env: variables added to the environment of PLM.
+        :param kind: KIND_BATCH waits for a slot and ends with PLM, KIND_LAUNCH starts at once and outlives it.
+        :return: id of the job in the JobStore.
+        """
+        arguments                       = [str(a) for a in (arguments or [])]
+        title                           = title or ' '.join([os.path.basename(program)] + arguments)
+        id                              = self.store.add(kind, program, arguments, cwd, env, title)
+        logPath                         = os.path.join(self.logDir, '{0}.out.log'.format(id))
+        errPath                         = os.path.join(self.logDir, '{0}.err.log'.format(id))
+        self.store.update(id, logPath=logPath, errPath=errPath)
+
+        if kind == KIND_LAUNCH:
+            self.startLaunch(id, program, arguments, cwd, env, logPath, errPath)
+        else:
+            # connected before the job is queued: it may start, or fail to start, inside enqueue()
+            job                         = self.runner.createJob(program, arguments, cwd, env, title, timeout,
+                                                                logPath, errPath)
+            self.jobs[id]               = job
+            job.started.connect(lambda: self.onStarted(id))
+            job.done.connect(lambda code, status, elapsed: self.onDone(id, code, status))
+            self.runner.enqueue(job)
+        self.jobChanged.emit(id)
+        return id
+
+    def runScript(self, interpreter, script, arguments=None, env=None, cwd=None, title=None, timeout=None):
+        """ Headless script run: 'mayapy export.py', 'nuke -t convert.py', python by default """
+        program, options                = split_line(interpreter) if interpreter else (sys.executable, [])
+        return self.submit(program, options + [script] + list(arguments or []), env,
+                           cwd or os.path.dirname(script), title or os.path.basename(script), KIND_BATCH, timeout)
+
+    def launchLine(self, line, title=None, env=None, cwd=None):
+        """ An application command line of the pipeline config ('"...Nuke12.2.exe" --nukex') """
+        program, arguments              = split_line(line)
+        return self.submit(program, arguments, env, cwd, title, KIND_LAUNCH)
+
+    def launchFile(self, path, title=None, env=None):
+        """ A program or a shortcut, shortcuts are opened by the shell """
+        if sys.platform == 'win32' and not path.lower().endswith('.exe'):
+            return self.openFile(path, title)
+        return self.submit(path, None, env, None, title, KIND_LAUNCH)
+
+    def openFile(self, path, title=None):
+        """
+        A shortcut or a document, handed to the shell (os.startfile on Windows): no command line is built, so the
+        quotes of the path can not be mangled by cmd. The shell gives no process to follow, nor a way to pass env.
+        """
+        id                              = self.store.add(KIND_LAUNCH, path, [], None, None,
+                                                         title or os.path.basename(path))
+        now                             = time.time()
+        if platformServices().openPath(path):
+            self.store.update(id, status=JOB_LAUNCHED, started=now)
+        else:
+            self.store.update(id, status=JOB_FAILED, started=now, ended=now, exitCode=-1)
+        self.jobChanged.emit(id)
+        return id
+
+    def startLaunch(self, id, program, arguments, cwd, env, logPath, errPath):
+        now                             = time.time()
+        pid                             = start_detached(program, arguments, cwd, env, logPath, errPath)
+        if pid is None:
+            self.store.update(id, status=JOB_FAILED, started=now, ended=now, exitCode=-1)
+            return
+        self.store.update(id, status=JOB_LAUNCHED, started=now)
+        if psutil is not None and pid > 0:
+            self.launched[id]           = pid
+            self.sampleTimer.start()
+
+    def kill(self, id):
+        job                             = self.jobs.get(id)
+        if job is not None:
+            job.kill()
+
+    def killAll(self):
+        """ Batch jobs only, the applications of the artist are left open """
+        self.runner.killAll()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Track """
+
+    def onStarted(self, id):
+        job                             = self.jobs.get(id)
+        self.store.update(id, status=JOB_RUNNING, started=job.startTime if job else time.time())
+        if psutil is not None:
+            self.sampleTimer.start()
+        self.jobChanged.emit(id)
+
+    def onDone(self, id, exitCode, status):
+        job                             = self.jobs.pop(id, None)
+        self.store.update(id, status=status, started=job.startTime if job else None, ended=time.time(),
+                          exitCode=exitCode, cpuTime=self.cpuTimes.pop(id, None))
+        # the store keeps the job, the runner forgets it
+        if job is not None:
+            self.runner.remove(job)
+        self.jobChanged.emit(id)
+
+    def sample(self):
+        """ CPU times of the running jobs, an ended process can not be read: its CPU time is the last sample """
+        for id, job in self.jobs.items():
+            if job.isRunning() and job.pid:
+                self.addCpuSample(id, cpu_seconds(job.pid))
+
+        for id, pid in list(self.launched.items()):
+            if pid_alive(pid):
+                self.addCpuSample(id, cpu_seconds(pid))
+            else:
+                del self.launched[id]
+                self.store.update(id, status=JOB_CLOSED, ended=time.time(), cpuTime=self.cpuTimes.pop(id, None))
+                self.jobChanged.emit(id)
+
+        if not self.launched and not any(job.isRunning() for job in self.jobs.values()):
+            self.sampleTimer.stop()
+
+    def addCpuSample(self, id, seconds):
+        if seconds is not None:
+            self.cpuTimes[id]           = max(seconds, self.cpuTimes.get(id, 0.0))
+
+    def job(self, id):
+        """ :return: the ProcessJob of a queued or running batch job, None otherwise """
+        return self.jobs.get(id)
+
+    def logText(self, id, channel='out', limit=256 * 1024):
+        """ The end of a job log, limit bytes at most """
+        record                          = self.store.job(id)
+        path                            = record and record['logPath' if channel == 'out' else 'errPath']
+        if not path or not os.path.exists(path):
+            return ''
+        with open(path, 'rb') as f:
+            f.seek(max(0, os.path.getsize(path) - limit))
+            return f.read().decode('utf-8', errors='replace')
+
+
+_jobQueue                               = None
+
+
+def jobQueue():
+    global _jobQueue
+    if _jobQueue is None:
+        _jobQueue                       = JobQueue()
+    return _jobQueue
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 9:00 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -17,7 +17,7 @@ import sys
 
 from pyPLM.Widgets import MessageBox
 from pyPLM.Network import NetworkAccessManager
-from PLM.cores import DownloadChannel
+from PLM.cores import DownloadChannel, ChunkedDownloadChannel, DownloadQueue
 from PLM.configs import propText as p
 
 
@@ -33,20 +33,24 @@ class NetworkManger(NetworkAccessManager):
             sys.exit()
 
         self.app                            = app
+        self.downloadQueue                  = DownloadQueue(self)
+        self.app.aboutToQuit.connect(self.downloadQueue.shutdown)
+        self.downloadQueue.schedule()
 
     def max_bandwid(self):
         """
-        Measure the maximum bandwidth of the network
+        Measure the maximum bandwidth of the network (highest throughput seen by the download queue, or the
+        configured limit if one is set)
         :return: int
         """
-        pass
+        return int(self.downloadQueue.bandwidthLimit or self.downloadQueue.peakThroughput)
 
     def isDownloading(self):
         """
         Check if network is in downloading or not
         :return: bool
         """
-        pass
+        return len(self.downloadQueue.active()) > 0
 
     def serverStatus(self):
         """
@@ -63,6 +67,24 @@ class NetworkManger(NetworkAccessManager):
         """
         return DownloadChannel(url, self)
 
+    def createChunkedDownload(self, url, filePath, connections=4, checksum=None):
+        """
+        Create a resumable channel which downloads the file with several range requests.
+        :param url: download link.
+        :param filePath: destination, a '<filePath>.part.json' manifest is kept next to it until the download ends.
+        :param connections: parallel range requests for this file (the global limit still applies).
+        :param checksum: optional 'algorithm:hexdigest', ie: 'sha256:9f86d0...'
+        :return: ChunkedDownloadChannel object, call start() to begin or resume.
+        """
+        return ChunkedDownloadChannel(url, self, filePath, connections, checksum)
+
+    def queueDownload(self, url, filePath, priority=1, connections=4, checksum=None):
+        """
+        Add a download to the queue, it starts when the priority, connection and bandwidth limits allow it.
+        :return: id of the queue item.
+        """
+        return self.downloadQueue.enqueue(url, filePath, priority, connections, checksum)
+
 
 
 
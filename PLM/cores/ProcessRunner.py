@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: ProcessRunner.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Runs external commands (cache exports, conversions, tools of the console) without blocking the GUI: every
+    job is a QProcess driven by the event loop, the runner starts up to maxJobs of them at once and queues the
+    others.
+
+    A job never sends its output per read: it is decoded as it comes, kept until it makes whole lines and sent
+    in one 'output' signal per flush interval. 'done' gives the exit code, the exit status and the run time.
+    With log files, the raw output is written to them as it is read (stderr to its own file when errPath is given).
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sys, time, shlex, codecs
+from collections                        import deque
+
+# PySide2
+from PySide2.QtCore                     import QProcess, QProcessEnvironment, QIODevice
+
+# PLM
+from pyPLM.Core                         import Signal, Timer, Process
+from pyPLM.damg                         import DAMG
+
+
+FLUSH_INTERVAL                          = 100
+MAX_JOBS                                = max(1, (os.cpu_count() or 2) // 2)
+
+JOB_QUEUED                              = 'Queued'
+JOB_RUNNING                             = 'Running'
+JOB_DONE                                = 'Done'
+JOB_FAILED                              = 'Failed'
+JOB_KILLED                              = 'Killed'
+
+SHELL_CHARS                             = set('|<>&;')
+# commands of the shell itself, they have no executable
+SHELL_BUILTINS                          = {'start', 'echo', 'dir', 'type', 'set', 'copy', 'move', 'del', 'mkdir'}
+
+
+def shell_command(line):
+    """ :return: (program, arguments) running line in the system shell, for pipes and redirections """
+    if sys.platform == 'win32':
+        return 'cmd', ['/c', line]
+    return 'sh', ['-c', line]
+
+
+def split_line(line):
+    """
+    :return: (program, arguments) of a command line, the shell runs it for pipes, redirections, builtins.
+    ValueError is raised for an empty line or unbalanced quotes.
+    """
+    if SHELL_CHARS & set(line):
+        return shell_command(line)
+    parts                               = shlex.split(line, posix=sys.platform != 'win32')
+    # windows paths keep their backslashes, only the quotes around them are removed
+    parts                               = [p[1:-1] if len(p) > 1 and p[0] == p[-1] == '"' else p for p in parts]
+    if not parts:
+        raise ValueError('empty command line')
+    if parts[0].lower() in SHELL_BUILTINS and sys.platform == 'win32':
+        return shell_command(line)
+    return parts[0], parts[1:]
+
+
+def process_environment(env):
+    """ The environment of PLM with the variables of env added """
+    environment                         = QProcessEnvironment.systemEnvironment()
+    for key, value in env.items():
+        environment.insert(key, str(value))
+    return environment
+
+
+def start_detached(program, arguments=None, cwd=None, env=None, logPath=None, errPath=None):
+    """
+    Start a program which outlives PLM (an application launched by the artist), its output goes to the log files.
+    :return: pid, None if it did not start.
+    """
+    process                             = QProcess()
+    process.setProgram(program)
+    process.setArguments(list(arguments or []))
+    process.setWorkingDirectory(cwd or os.getcwd())
+    if env is not None:
+        process.setProcessEnvironment(process_environment(env))
+    for path, setFile in [(logPath, process.setStandardOutputFile), (errPath, process.setStandardErrorFile)]:
+        if path:
+            folder                      = os.path.dirname(path)
+            if folder and not os.path.exists(folder):
+                os.makedirs(folder, exist_ok=True)
+            setFile(path, QIODevice.Append)
+
+    result                              = process.startDetached()
+    ok, pid                             = result if isinstance(result, tuple) else (result, None)
+    return (pid or -1) if ok else None
+
+
+class ProcessJob(DAMG):
+
+    key                                 = 'ProcessJob'
+
+    started                             = Signal()
+    output                              = Signal(str)
+    done                                = Signal(int, str, float)
+
+    _count                              = 0
+
+    def __init__(self, program, arguments=None, cwd=None, env=None, title=None, timeout=None, logPath=None,
+                 errPath=None, parent=None):
+        super(ProcessJob, self).__init__(parent)
+
+        ProcessJob._count               += 1
+        self.id                         = ProcessJob._count
+        self.program                    = program
+        self.arguments                  = list(arguments or [])
+        self.cwd                        = cwd or os.getcwd()
+        self.env                        = env
+        self.title                      = title or ' '.join([program] + self.arguments)
+        self.timeout                    = timeout
+        self.logPath                    = logPath
+        self.errPath                    = errPath
+
+        self.status                     = JOB_QUEUED
+        self.exitCode                   = None
+        self.startTime                  = None
+        self.endTime                    = None
+
+        self.process                    = None
+        self._decoder                   = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._errDecoder                = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._logs                      = dict()
+        self._chunks                    = []
+        self._tail                      = ''
+
+        self.flushTimer                 = Timer(self)
+        self.flushTimer.setInterval(FLUSH_INTERVAL)
+        self.flushTimer.timeout.connect(self.flush)
+
+        self.timeoutTimer               = Timer(self)
+        self.timeoutTimer.setSingleShot(True)
+        self.timeoutTimer.timeout.connect(self.onTimeout)
+
+    @property
+    def elapsed(self):
+        if self.startTime is None:
+            return 0.0
+        return (self.endTime or time.time()) - self.startTime
+
+    @property
+    def pid(self):
+        return self.process.processId() if self.process is not None else None
+
+    def isRunning(self):
+        return self.status == JOB_RUNNING
+
+    def openLogs(self):
+        for channel, path in [('out', self.logPath), ('err', self.errPath)]:
+            if path:
+                folder                  = os.path.dirname(path)
+                if folder and not os.path.exists(folder):
+                    os.makedirs(folder, exist_ok=True)
+                self._logs[channel]     = open(path, 'ab')
+
+    def closeLogs(self):
+        for log in self._logs.values():
+            log.close()
+        self._logs                      = dict()
+
+    def start(self):
+        self.process                    = Process(parent=self)
+        self.process.setWorkingDirectory(self.cwd)
+        if self.env is not None:
+            self.process.setProcessEnvironment(process_environment(self.env))
+
+        self.process.readyReadStandardOutput.connect(self.onReadyRead)
+        if self.errPath:
+            self.process.setProcessChannelMode(QProcess.SeparateChannels)
+            self.process.readyReadStandardError.connect(self.onReadyReadError)
+        self.openLogs()
+        self.process.finished.connect(self.onFinished)
+        self.process.errorOccurred.connect(self.onError)
+
+        self.status                     = JOB_RUNNING
+        self.startTime                  = time.time()
+        self.flushTimer.start()
+        if self.timeout:
+            self.timeoutTimer.start(int(self.timeout * 1000))
+        self.process.start(self.program, self.arguments)
+        # a program which can not be found may fail inside start(), the job is done already
+        if self.endTime is None:
+            self.started.emit()
+
+    def kill(self):
+        if self.status == JOB_QUEUED:
+            self.finish(-1, JOB_KILLED)
+        elif self.status == JOB_RUNNING:
+            self.status                 = JOB_KILLED
+            self.process.kill()
+
+    def onTimeout(self):
+        if self.status == JOB_RUNNING:
+            self._chunks.append('\ntimed out after {0:.0f}s\n'.format(self.timeout))
+            self.kill()
+
+    def onReadyRead(self):
+        # read everything now, it is only sent to the views by flush()
+        data                            = self.process.readAllStandardOutput().data()
+        if data:
+            if 'out' in self._logs:
+                self._logs['out'].write(data)
+            self._chunks.append(self._decoder.decode(data))
+
+    def onReadyReadError(self):
+        data                            = self.process.readAllStandardError().data()
+        if data:
+            self._logs['err'].write(data)
+            self._chunks.append(self._errDecoder.decode(data))
+
+    def flush(self, final=False):
+        if not self._chunks and not (final and self._tail):
+            return
+        text                            = self._tail + ''.join(self._chunks)
+        self._chunks                    = []
+        if final:
+            self._tail                  = ''
+            text                        = text.rstrip('\n')
+        else:
+            # a line cut between two reads is sent when it is complete
+            cut                         = text.rfind('\n')
+            self._tail                  = text[cut + 1:]
+            text                        = text[:cut]
+        if text:
+            self.output.emit(text.replace('\r\n', '\n'))
+
+    def fail(self, message):
+        """ End the job without running it (or when it could not start), message goes to its output """
+        self._chunks.append('{0}\n'.format(message))
+        self.finish(-1, JOB_FAILED)
+
+    def onError(self, error):
+        if error == QProcess.FailedToStart:
+            self.fail('failed to start: {0}'.format(self.program))
+
+    def onFinished(self, exitCode, exitStatus):
+        if self.status == JOB_RUNNING:
+            ok                          = exitStatus == QProcess.NormalExit and exitCode == 0
+            self.finish(exitCode, JOB_DONE if ok else JOB_FAILED)
+        else:
+            self.finish(exitCode, self.status)
+
+    def finish(self, exitCode, status):
+        if self.endTime is not None:
+            return
+        if self.process is not None:
+            self.onReadyRead()
+            if self.errPath:
+                self.onReadyReadError()
+        self._chunks.append(self._decoder.decode(b'', final=True) + self._errDecoder.decode(b'', final=True))
+        self.closeLogs()
+        self.flushTimer.stop()
+        self.timeoutTimer.stop()
+        self.flush(final=True)
+
+        self.exitCode                   = exitCode
+        self.status                     = status
+        self.endTime                    = time.time()
+        if self.startTime is None:
+            self.startTime              = self.endTime
+        self.done.emit(exitCode, status, self.elapsed)
+
+
+class ProcessRunner(DAMG):
+
+    key                                 = 'ProcessRunner'
+
+    jobAdded                            = Signal(object)
+    jobStarted                          = Signal(object)
+    jobDone                             = Signal(object)
+
+    def __init__(self, maxJobs=MAX_JOBS, parent=None):
+        super(ProcessRunner, self).__init__(parent)
+
+        self.maxJobs                    = maxJobs
+        self.queue                      = deque()
+        self.running                    = []
+        self.jobs                       = []
+
+    def submit(self, program, arguments=None, cwd=None, env=None, title=None, timeout=None, logPath=None,
+               errPath=None):
+        """ :return: the ProcessJob, started at once when a slot is free """
+        return self.enqueue(self.createJob(program, arguments, cwd, env, title, timeout, logPath, errPath))
+
+    def createJob(self, program, arguments=None, cwd=None, env=None, title=None, timeout=None, logPath=None,
+                  errPath=None):
+        """ :return: a ProcessJob of the runner, not queued yet: its signals can be connected before it starts """
+        job                             = ProcessJob(program, arguments, cwd, env, title, timeout, logPath, errPath,
+                                                     self)
+        job.done.connect(lambda *args: self.onJobDone(job))
+        self.jobs.append(job)
+        return job
+
+    def enqueue(self, job):
+        """ Queue a job of createJob, it starts at once when a slot is free """
+        self.queue.append(job)
+        self.jobAdded.emit(job)
+        self.startNext()
+        return job
+
+    def submitLine(self, line, cwd=None, env=None, timeout=None, title=None, logPath=None, errPath=None):
+        """ A command line as typed: through the shell when it has pipes or redirections """
+        try:
+            program, arguments          = split_line(line)
+        except ValueError as error:
+            # empty line or unbalanced quotes: a failed job shows why, like a program which does not start
+            job                         = self.createJob(line, None, cwd, env, title or line, timeout, logPath,
+                                                         errPath)
+            self.jobAdded.emit(job)
+            job.fail('can not read the command line: {0}'.format(error))
+            return job
+        return self.submit(program, arguments, cwd, env, title or line, timeout, logPath, errPath)
+
+    def startNext(self):
+        while self.queue and len(self.running) < self.maxJobs:
+            job                         = self.queue.popleft()
+            if job.status != JOB_QUEUED:
+                continue
+            self.running.append(job)
+            job.start()
+            if job.endTime is None:
+                self.jobStarted.emit(job)
+
+    def onJobDone(self, job):
+        if job in self.running:
+            self.running.remove(job)
+        self.jobDone.emit(job)
+        self.startNext()
+
+    def kill(self, job):
+        job.kill()
+
+    def killAll(self):
+        for job in list(self.queue) + list(self.running):
+            job.kill()
+
+    def remove(self, job):
+        """ Forget a finished job """
+        if job.status in [JOB_QUEUED, JOB_RUNNING]:
+            return False
+        self.jobs.remove(job)
+        job.deleteLater()
+        return True
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 8:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -35,18 +35,10 @@ class StyleSheet(DAMG):
         self.app                        = app
 
     def getStyleSheet(self, style):
-        if style == 'dark':
-            # self.logger.info("Loading darkstyle_rc")
-            from PLM.ui.rcs import darkstyle_rc
-        elif style == 'PyQt5':
-            # self.logger.info("Loading pyqt5_style_rc")
-            from PLM.ui.rcs import pyqt5_style_rc
-        elif style == 'PySide2':
-            # self.logger.info("Loading pyside2_style_rc")
-            from PLM.ui.rcs import pyside2_style_rc
-        elif style == 'pyqtgraph':
-            # self.logger.info("Loading pyqtgraph_style_rc")
-            from PLM.ui.rcs import pyqtgraph_style_rc
+        if style in ['dark', 'PyQt5', 'PySide2', 'pyqtgraph']:
+            # imported here: PLM.ui imports PLM.cores, a module level import would make a cycle
+            from PLM.ui.rcs.ResourceLoader import registerResource
+            registerResource(style)
         else:
             style = None
 
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: ThumbnailService.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Thumbnails for every widget of PLM (avatars, snapshots, image browsing, asset libraries).
+
+    request() answers at once: the pixmap from memory (LRU), from the disk cache (CACHE_DIR/thumbnails), or a
+    placeholder while the thumbnail is made in a process pool. thumbnailReady is emitted in the GUI thread when
+    it is done, the callback given to request() is called too. The disk cache is keyed by (path, mtime, file size,
+    size class): an edited image gets a new thumbnail, old ones are removed by prune().
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, time
+from collections                        import OrderedDict
+from concurrent.futures                 import ProcessPoolExecutor
+
+# PySide2
+from PySide2.QtGui                      import QPixmap, QColor
+
+# PLM
+from PLM                                import CACHE_DIR
+from PLM.imaging                        import SIZE_CLASSES, thumbnail_key, thumbnail_path, make_thumbnail
+from pyPLM.Core                         import Signal
+from pyPLM.damg                         import DAMG
+
+
+THUMBNAIL_DIR                           = '{0}/thumbnails'.format(CACHE_DIR)
+LRU_SIZE                                = 512
+PLACEHOLDER_COLOR                       = QColor(60, 60, 60)
+
+
+class ThumbnailService(DAMG):
+
+    key                                 = 'ThumbnailService'
+
+    thumbnailReady                      = Signal(str, str, QPixmap)
+    thumbnailFailed                     = Signal(str, str)
+
+    # emitted from the pool's callback thread, received in the GUI thread (queued)
+    _done                               = Signal(str, object, str)
+
+    def __init__(self, cacheDir=THUMBNAIL_DIR, workers=None, lruSize=LRU_SIZE, parent=None):
+        super(ThumbnailService, self).__init__(parent)
+
+        self.cacheDir                   = cacheDir
+        self.workers                    = workers
+        self.lruSize                    = lruSize
+
+        self._pool                      = None
+        self._lru                       = OrderedDict()
+        self._placeholders              = dict()
+        # key: (path, sizeClass, future, [callbacks], [owners])
+        self._pending                   = dict()
+        self._failed                    = set()
+
+        self._done.connect(self.onDone)
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool                  = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Request """
+
+    def keyOf(self, path, sizeClass):
+        """ :return: cache key, None if the file is missing """
+        try:
+            stat                        = os.stat(path)
+        except OSError:
+            return None
+        return thumbnail_key(path, stat.st_mtime_ns, stat.st_size, sizeClass)
+
+    def request(self, path, sizeClass='medium', callback=None, owner=None):
+        """
+        :param callback: called with the pixmap when it has to be made, not called when it is returned now.
+        :param owner: object asking (ie: a view model), cancel(owner=...) only drops its own requests.
+        :return: the thumbnail if it is ready, a placeholder otherwise.
+        """
+        if sizeClass not in SIZE_CLASSES:
+            raise KeyError('Unknown thumbnail size: {0}, use one of {1}'.format(sizeClass, sorted(SIZE_CLASSES)))
+
+        key                             = self.keyOf(path, sizeClass)
+        if key is None or key in self._failed:
+            return self.placeholder(sizeClass)
+
+        pixmap                          = self.cached(key, sizeClass)
+        if pixmap is not None:
+            return pixmap
+
+        pending                         = self._pending.get(key)
+        if pending is not None:
+            if callback is not None:
+                pending[3].append(callback)
+            pending[4].append(owner)
+        else:
+            dst                         = thumbnail_path(self.cacheDir, key, sizeClass)
+            future                      = self.pool.submit(make_thumbnail, path, dst, SIZE_CLASSES[sizeClass])
+            self._pending[key]          = (path, sizeClass, future, [callback] if callback else [], [owner])
+            future.add_done_callback(lambda f, k=key: self.finished(k, f))
+
+        return self.placeholder(sizeClass)
+
+    def get(self, path, sizeClass='medium'):
+        """ Blocking version, for scripts and tools without an event loop """
+        key                             = self.keyOf(path, sizeClass)
+        if key is None:
+            return None
+        pixmap                          = self.cached(key, sizeClass)
+        if pixmap is None:
+            dst                         = make_thumbnail(path, thumbnail_path(self.cacheDir, key, sizeClass),
+                                                         SIZE_CLASSES[sizeClass])
+            pixmap                      = self.remember(key, QPixmap(dst))
+        return pixmap
+
+    def cancel(self, path=None, owner=None):
+        """
+        Forget the requests not started yet (of one path, of one owner, or all), ie: items scrolled out of the view.
+        A thumbnail asked by several owners is only cancelled once none of them wants it.
+        """
+        for key, (src, sizeClass, future, callbacks, owners) in list(self._pending.items()):
+            if path is not None and src != path:
+                continue
+            if owner is not None:
+                if not any(o is owner for o in owners):
+                    continue
+                owners[:]               = [o for o in owners if o is not owner]
+                if owners:
+                    continue
+            if future.cancel():
+                self._pending.pop(key, None)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Cache """
+
+    def cached(self, key, sizeClass):
+        pixmap                          = self._lru.get(key)
+        if pixmap is not None:
+            self._lru.move_to_end(key)
+            return pixmap
+
+        dst                             = thumbnail_path(self.cacheDir, key, sizeClass)
+        if os.path.exists(dst):
+            pixmap                      = QPixmap(dst)
+            if not pixmap.isNull():
+                return self.remember(key, pixmap)
+        return None
+
+    def remember(self, key, pixmap):
+        self._lru[key]                  = pixmap
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lruSize:
+            self._lru.popitem(last=False)
+        return pixmap
+
+    def placeholder(self, sizeClass):
+        pixmap                          = self._placeholders.get(sizeClass)
+        if pixmap is None:
+            size                        = SIZE_CLASSES[sizeClass]
+            pixmap                      = QPixmap(size, size)
+            pixmap.fill(PLACEHOLDER_COLOR)
+            self._placeholders[sizeClass] = pixmap
+        return pixmap
+
+    def prune(self, olderThan=30 * 24 * 3600):
+        """ Remove the cached thumbnails not used for 'olderThan' seconds, :return: number of files removed """
+        limit                           = time.time() - olderThan
+        removed                         = 0
+        for root, dirs, names in os.walk(self.cacheDir):
+            for name in names:
+                filePth                 = os.path.join(root, name)
+                try:
+                    stat                = os.stat(filePth)
+                    if max(stat.st_atime, stat.st_mtime) < limit:
+                        os.remove(filePth)
+                        removed         += 1
+                except OSError:
+                    pass
+        return removed
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Results """
+
+    def finished(self, key, future):
+        """ Pool callback thread: only hand over to the GUI thread, pixmaps can not be made here """
+        if future.cancelled():
+            return
+        error                           = future.exception()
+        self._done.emit(key, None if error else future.result(), str(error) if error else '')
+
+    def onDone(self, key, dst, error):
+        pending                         = self._pending.pop(key, None)
+        if pending is None:
+            return
+        path, sizeClass, future, callbacks, owners = pending
+
+        pixmap                          = QPixmap(dst) if dst else None
+        if pixmap is None or pixmap.isNull():
+            # not an image PIL can read, do not ask again for this version of the file
+            self._failed.add(key)
+            self.thumbnailFailed.emit(path, error or 'Can not read the thumbnail')
+            return
+
+        self.remember(key, pixmap)
+        self.thumbnailReady.emit(path, sizeClass, pixmap)
+        for callback in callbacks:
+            callback(pixmap)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self.cancel()
+            self._pool.shutdown(wait=False)
+            self._pool                  = None
+
+
+thumbnailService                        = ThumbnailService()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 5:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -13,11 +13,15 @@ Description:
 
 from .data                      import sqlUtils
 from .handlers                  import EnvHandler, FileHandler
-from .models                    import (DownloadChannel, Organisation, Project, ServerProfile, Task, Team, Temporary,
-                                        Worker, PcMonitor)
+from .models                    import (ChunkedDownloadChannel, DownloadChannel, DownloadQueue, Organisation, Project,
+                                        ServerProfile, Task, Team, Temporary, Worker, PcMonitor)
+from .CatalogueService          import CatalogueService, catalogueService
 from .EventManager              import EventManager
+from .JobQueue                  import JobQueue, jobQueue
 from .StyleSheet                import StyleSheet
+from .ProcessRunner             import ProcessRunner, ProcessJob
 from .ThreadManager             import ThreadManager
+from .ThumbnailService          import ThumbnailService, thumbnailService
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by panda on 3/16/2020 - 4:41 AM
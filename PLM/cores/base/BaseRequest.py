@@ -31,7 +31,7 @@ class HTTPrequest(NetworkRequest):
         self.urlInfo                        = self.networkManager.app.urlInfo
 
         # start request
-        start = time.time()
+        self._startTime                     = time.time()
         self.logger.info('start recording time')
 
         if not is_url(url):
@@ -45,17 +45,15 @@ class HTTPrequest(NetworkRequest):
         if self.header:
             self.setHeader(self.ContentTypeHeader, self.header)
 
-        self.networkManager.finished.connect(self.response)
-        self.networkManager.get(self)
+        self.reply                          = self.networkManager.get(self)
+        self.reply.finished.connect(lambda: self.response(self.reply))
 
-        end = time.time()
-        self.duration = end - start
 
-        # finish dowload
+    def response(self, reply):
+        # duration covers the whole round trip, from submission until the reply is finished
+        self.duration                       = time.time() - self._startTime
         self.logger.info('stop recording time: {0}'.format(self.duration))
 
-
-    def response(self, reply):
         err = reply.error()
         if err == NetworkReply.NoError:
             output = reply.readAll()
@@ -84,7 +82,7 @@ class CookieRequest(NetworkRequest):
     def __init__(self, manager=None, server=None, verify=None, header=None, cookie=None):
         super(CookieRequest, self).__init__(server)
 
-        self.logger                         = test_logger(self)
+        self.logger                         = DamgLogger(self)
         self.networkManager                 = manager
         self.serverInfo                     = self.networkManager.app.serverInfo
         self._server                        = server
@@ -93,7 +91,7 @@ class CookieRequest(NetworkRequest):
         self.cookie                         = cookie
 
         # start request
-        start                               = time.time()
+        self._startTime                     = time.time()
         self.logger.info('start recording time')
         self.setUrl(Url(self.server))
         if self.header:
@@ -105,13 +103,12 @@ class CookieRequest(NetworkRequest):
             cookieJar.insertCookie(cookie)
             self.networkManager.setCookieJar(cookieJar)
 
-        self.networkManager.finished.connect(self.response)
-        self.networkManager.get(self)
-        # End request
-        end                                 = time.time()
-        self.duration                       = end - start
+        self.reply                          = self.networkManager.get(self)
+        self.reply.finished.connect(lambda: self.response(self.reply))
 
     def response(self, reply):
+        self.duration                       = time.time() - self._startTime
+        self.logger.info('stop recording time: {0}'.format(self.duration))
 
         err = reply.error()
         if err == NetworkReply.NoError:
@@ -143,7 +140,7 @@ class AuthRequest(NetworkRequest):
         super(AuthRequest, self).__init__(server)
 
         self.auth                           = 0
-        self.logger                         = test_logger(self)
+        self.logger                         = DamgLogger(self)
         self.networkManager                 = manager
         self.serverInfo                     = self.networkManager.app.serverInfo
         self.username                       = username
@@ -151,21 +148,20 @@ class AuthRequest(NetworkRequest):
         self._server                        = server
 
         # start request
-        start                               = time.time()
+        self._startTime                     = time.time()
         self.logger.info('start recording time')
         self.setUrl(Url(self.server))
         self.setHeader(self.ContentTypeHeader)
 
         self.networkManager.setCookieJar(NetworkCookieJar())
         self.networkManager.authenticationRequired.connect(self.authenticate)
-        self.networkManager.finished.connect(self.response)
-        self.networkManager.get(self)
-
-        # End request
-        end                                 = time.time()
-        self.duration                       = end - start
+        self.reply                          = self.networkManager.get(self)
+        self.reply.finished.connect(lambda: self.response(self.reply))
 
     def authenticate(self, reply, auth):
+        # the manager signal is shared, only answer for our own reply
+        if reply is not self.reply:
+            return
 
         self.logger.info("Authenticating")
 
@@ -182,6 +178,9 @@ class AuthRequest(NetworkRequest):
 
 
     def response(self, reply):
+        self.duration                       = time.time() - self._startTime
+        self.logger.info('stop recording time: {0}'.format(self.duration))
+        self.networkManager.authenticationRequired.disconnect(self.authenticate)
 
         err = reply.error()
         if err == NetworkReply.NoError:
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: HttpClient.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Shared HTTP client for every server interaction which does not go through Qt. One requests.Session keeps
+    persistent (keep-alive) connection pools per host, so a request does not pay a new TCP/TLS handshake.
+
+    - timeouts and retries (with backoff) are configured once for the whole application
+    - identical GET requests running at the same time are coalesced: one goes to the network, the others wait for
+      its response
+    - GET responses carrying an ETag or Last-Modified header are cached, the next request is conditional and a 304
+      answer is served from the cache
+    - every request is timed from submission to the end of the response body, per host
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import time, threading
+from collections                        import OrderedDict, deque
+from concurrent.futures                 import Future
+from urllib.parse                       import urlparse
+
+import requests
+from requests.adapters                  import HTTPAdapter
+from urllib3.util.retry                 import Retry
+
+
+DEFAULT_TIMEOUT                         = (3.05, 15)        # (connect, read) seconds
+DEFAULT_RETRIES                         = 2
+DEFAULT_BACKOFF                         = 0.3
+DEFAULT_POOL_SIZE                       = 10
+DEFAULT_CACHE_SIZE                      = 256
+LATENCY_SAMPLES                         = 200
+
+
+def create_retry(retries, backoff):
+    kwargs = dict(total=retries, connect=retries, read=retries, backoff_factor=backoff,
+                  status_forcelist=(502, 503, 504), raise_on_status=False)
+    try:
+        return Retry(allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']), **kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return Retry(method_whitelist=frozenset(['GET', 'HEAD', 'OPTIONS']), **kwargs)
+
+
+class LatencyMetrics(object):
+
+    """ Rolling latency samples per host """
+
+    key                                 = 'LatencyMetrics'
+
+    def __init__(self, size=LATENCY_SAMPLES):
+        super(LatencyMetrics, self).__init__()
+
+        self._lock                      = threading.Lock()
+        self._size                      = size
+        self._samples                   = dict()
+        self._counts                    = dict()
+        self._errors                    = dict()
+        self._cacheHits                 = dict()
+
+    def record(self, host, seconds, error=False):
+        with self._lock:
+            self._samples.setdefault(host, deque(maxlen=self._size)).append(seconds)
+            self._counts[host]          = self._counts.get(host, 0) + 1
+            if error:
+                self._errors[host]      = self._errors.get(host, 0) + 1
+
+    def recordCacheHit(self, host):
+        with self._lock:
+            self._cacheHits[host]       = self._cacheHits.get(host, 0) + 1
+
+    def report(self):
+        """ :return: dict of host: dict(count, errors, cacheHits, avg, p50, p95, max) in seconds """
+        info                            = dict()
+        with self._lock:
+            for host, samples in self._samples.items():
+                ordered                 = sorted(samples)
+                n                       = len(ordered)
+                info[host]              = dict(count=self._counts.get(host, 0), errors=self._errors.get(host, 0),
+                                               cacheHits=self._cacheHits.get(host, 0), avg=sum(ordered) / n,
+                                               p50=ordered[int(0.50 * (n - 1))], p95=ordered[int(0.95 * (n - 1))],
+                                               max=ordered[-1])
+        return info
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._errors.clear()
+            self._cacheHits.clear()
+
+
+class HttpClient(object):
+
+    key                                 = 'HttpClient'
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                       poolSize=DEFAULT_POOL_SIZE, cacheSize=DEFAULT_CACHE_SIZE):
+        super(HttpClient, self).__init__()
+
+        self.timeout                    = timeout
+        self.cacheSize                  = cacheSize
+        self.metrics                    = LatencyMetrics()
+
+        self._lock                      = threading.Lock()
+        self._inflight                  = dict()
+        self._cache                     = OrderedDict()
+
+        self.session                    = requests.Session()
+        self.configure(retries, backoff, poolSize)
+
+    def configure(self, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, poolSize=DEFAULT_POOL_SIZE, timeout=None):
+        adapter                         = HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize,
+                                                      max_retries=create_retry(retries, backoff))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if timeout is not None:
+            self.timeout                = timeout
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Requests """
+
+    def request(self, method, url, **kwargs):
+        """ Timed request through the shared session, same arguments as requests.request """
+        kwargs.setdefault('timeout', self.timeout)
+        host                            = urlparse(url).netloc
+        start                           = time.perf_counter()
+
+        try:
+            response                    = self.session.request(method, url, **kwargs)
+            # the body is read inside the measurement so the latency covers the whole transfer
+            response.content
+        except requests.exceptions.RequestException:
+            self.metrics.record(host, time.perf_counter() - start, error=True)
+            raise
+
+        response.latency                = time.perf_counter() - start
+        response.fromCache              = False
+        self.metrics.record(host, response.latency, error=response.status_code >= 400)
+        return response
+
+    def get(self, url, params=None, headers=None, cookies=None, cache=True, **kwargs):
+        """
+        GET with coalescing and conditional caching.
+        :param cache: use/refresh the ETag/Last-Modified cache for this url.
+        :return: requests.Response, response.fromCache tells if the body came from the cache.
+        """
+        key                             = self.requestKey(url, params, headers, cookies, kwargs)
+
+        with self._lock:
+            future                      = self._inflight.get(key)
+            leader                      = future is None
+            if leader:
+                future                  = Future()
+                self._inflight[key]     = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            response                    = self._get(key, url, params, headers, cookies, cache, **kwargs)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _get(self, key, url, params, headers, cookies, cache, **kwargs):
+        headers                         = dict(headers or {})
+        cached                          = self._cache.get(key) if cache else None
+
+        if cached is not None:
+            if cached.headers.get('ETag'):
+                headers['If-None-Match'] = cached.headers['ETag']
+            if cached.headers.get('Last-Modified'):
+                headers['If-Modified-Since'] = cached.headers['Last-Modified']
+
+        response                        = self.request('GET', url, params=params, headers=headers, cookies=cookies,
+                                                       **kwargs)
+
+        if cached is not None and response.status_code == 304:
+            with self._lock:
+                self._cache.move_to_end(key)
+            cached.latency              = response.latency
+            cached.fromCache            = True
+            self.metrics.recordCacheHit(urlparse(url).netloc)
+            return cached
+
+        if cache and response.status_code == 200 and (response.headers.get('ETag') or
+                                                     response.headers.get('Last-Modified')):
+            with self._lock:
+                self._cache[key]        = response
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cacheSize:
+                    self._cache.popitem(last=False)
+
+        return response
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def isReachable(self, url, timeout=None):
+        """ True if the server answers at all (any status code) """
+        try:
+            self.request('HEAD', url, timeout=timeout or self.timeout)
+        except requests.exceptions.RequestException:
+            return False
+        return True
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Cache """
+
+    @staticmethod
+    def requestKey(url, params, headers, cookies, kwargs):
+        def freeze(d):
+            items = d.items() if isinstance(d, dict) else (d or [])
+            return tuple(sorted((str(k), str(v)) for k, v in items))
+        return (url, freeze(params), freeze(headers), freeze(cookies), freeze(kwargs))
+
+    def clearCache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def close(self):
+        self.session.close()
+
+
+httpClient = HttpClient()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 1:20 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: TokenBucket.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Token bucket used to cap network throughput. The bucket refills at 'rate' bytes per second up to 'capacity'
+    bytes, a transfer takes as many tokens as it is allowed to read right now. A rate of 0 means unlimited.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import time, threading
+
+
+class TokenBucket(object):
+
+    key                                     = 'TokenBucket'
+
+    def __init__(self, rate=0, capacity=None):
+        super(TokenBucket, self).__init__()
+
+        self._lock                          = threading.Lock()
+        self._rate                          = 0
+        self._capacity                      = 0
+        self._tokens                        = 0.0
+        self._stamp                         = time.monotonic()
+
+        self.setRate(rate, capacity)
+
+    def setRate(self, rate, capacity=None):
+        """
+        :param rate: bytes per second, 0 for unlimited
+        :param capacity: burst size in bytes, one second worth of data by default
+        """
+        with self._lock:
+            self._rate                      = max(0, int(rate or 0))
+            self._capacity                  = int(capacity or self._rate)
+            self._tokens                    = min(self._tokens, self._capacity)
+            self._stamp                     = time.monotonic()
+
+    def _refill(self):
+        now                                 = time.monotonic()
+        self._tokens                        = min(self._capacity, self._tokens + (now - self._stamp) * self._rate)
+        self._stamp                         = now
+
+    def consume(self, amount):
+        """
+        Take up to 'amount' tokens.
+        :return: number of bytes the caller is allowed to transfer now (may be 0)
+        """
+        if self.unlimited:
+            return amount
+
+        with self._lock:
+            self._refill()
+            allowed                         = int(min(amount, self._tokens))
+            self._tokens                   -= allowed
+            return allowed
+
+    def refund(self, amount):
+        """ Give back tokens which were taken but not used """
+        if self.unlimited:
+            return
+
+        with self._lock:
+            self._tokens                    = min(self._capacity, self._tokens + amount)
+
+    def delay(self, amount):
+        """ Seconds to wait before 'amount' tokens are available """
+        if self.unlimited:
+            return 0.0
+
+        with self._lock:
+            self._refill()
+            missing                         = min(amount, self._capacity) - self._tokens
+            return max(0.0, missing / float(self._rate))
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def unlimited(self):
+        return self._rate == 0
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 11:02 AM
+# © 2017 - 2020 DAMGteam. All rights reserved
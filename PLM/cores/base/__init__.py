@@ -12,7 +12,9 @@ Description:
 from .BaseRequest       import HTTPrequest, CookieRequest, AuthRequest
 from .BaseType          import BaseType
 from .BaseStorage       import BaseStorage
+from .HttpClient        import HttpClient, httpClient
 from .Channel           import Channel
+from .TokenBucket       import TokenBucket
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by panda on 2/12/2019 - 10:17 AM
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: HashCache.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Content hashes of files kept between runs (hashes.db in the cache folder). An entry is used while the file has
+    the same size and modification time, so a project tree is only read again where it changed.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sqlite3, threading
+from contextlib                         import contextmanager
+
+# PLM
+from PLM                                import CACHE_DIR
+
+
+CACHE_NAME                              = 'hashes.db'
+WRITE_SIZE                              = 500
+
+SCHEMA                                  = ("CREATE TABLE IF NOT EXISTS hashes (path TEXT PRIMARY KEY, "
+                                           "size INTEGER NOT NULL, mtime INTEGER NOT NULL, algorithm TEXT NOT NULL, "
+                                           "hash TEXT NOT NULL) WITHOUT ROWID", )
+
+
+class HashCache(object):
+
+    key                                 = 'HashCache'
+
+    _caches                             = dict()
+    _cachesLock                         = threading.Lock()
+
+    def __init__(self, dbPath):
+        super(HashCache, self).__init__()
+
+        self.dbPath                     = dbPath
+        self._lock                      = threading.RLock()
+        self._buffer                    = []
+        self._batches                   = 0
+
+        folder                          = os.path.dirname(dbPath)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        self.conn                       = sqlite3.connect(dbPath, check_same_thread=False, timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+
+    @classmethod
+    def instance(cls, dbPath=None):
+        dbPath                          = os.path.abspath(dbPath or os.path.join(CACHE_DIR, CACHE_NAME))
+        with cls._cachesLock:
+            cache                       = cls._caches.get(dbPath)
+            if cache is None:
+                cache                   = cls._caches[dbPath] = cls(dbPath)
+        return cache
+
+    def get(self, path, size, mtime, algorithm):
+        """ :return: the hash of path if it was computed for this size, mtime (ns) and algorithm, else None """
+        with self._lock:
+            row                         = self.conn.execute("SELECT size, mtime, algorithm, hash FROM hashes "
+                                                            "WHERE path = ?", (path, )).fetchone()
+        if row and row[0] == size and row[1] == mtime and row[2] == algorithm:
+            return row[3]
+        return None
+
+    def put(self, path, size, mtime, algorithm, hash):
+        """ Written at once, or by WRITE_SIZE rows inside a batch() """
+        with self._lock:
+            self._buffer.append((path, size, mtime, algorithm, hash))
+            if not self._batches or len(self._buffer) >= WRITE_SIZE:
+                self.flush()
+
+    @contextmanager
+    def batch(self):
+        """ Keep the puts (of any thread) in the buffer while it is open, they are written when the last one ends """
+        with self._lock:
+            self._batches              += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batches          -= 1
+                if not self._batches:
+                    self.flush()
+
+    def flush(self):
+        with self._lock:
+            if not self._buffer:
+                return
+            rows, self._buffer          = self._buffer, []
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO hashes (path, size, mtime, algorithm, hash) "
+                                      "VALUES (?, ?, ?, ?, ?)", rows)
+
+    def prune(self):
+        """ Remove the entries of files which do not exist anymore, :return: number removed """
+        self.flush()
+        with self._lock:
+            paths                       = [r[0] for r in self.conn.execute("SELECT path FROM hashes")]
+        gone                            = [(p, ) for p in paths if not os.path.exists(p)]
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM hashes WHERE path = ?", gone)
+        return len(gone)
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 6:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
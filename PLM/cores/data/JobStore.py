@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: JobStore.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    History of the jobs of the JobQueue (launched applications, batch conversions, renders) in the local database:
+    what ran, with which arguments and environment, when it started and ended, its exit code, CPU time and logs.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, json, time, sqlite3, threading
+
+# PLM
+from PLM                                import LOCAL_DB
+
+
+PAGE_SIZE                               = 200
+
+SCHEMA                                  = ("CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY, title TEXT, "
+                                           "kind TEXT NOT NULL, program TEXT NOT NULL, arguments TEXT, cwd TEXT, "
+                                           "env TEXT, status TEXT NOT NULL, submitted REAL NOT NULL, started REAL, "
+                                           "ended REAL, exitCode INTEGER, cpuTime REAL, logPath TEXT, errPath TEXT)",
+                                           "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, submitted)",
+                                           "CREATE INDEX IF NOT EXISTS jobs_submitted ON jobs (submitted)", )
+
+COLUMNS                                 = ['id', 'title', 'kind', 'program', 'arguments', 'cwd', 'env', 'status',
+                                           'submitted', 'started', 'ended', 'exitCode', 'cpuTime', 'logPath',
+                                           'errPath']
+UPDATABLE                               = set(COLUMNS) - {'id', 'submitted'}
+
+
+def row_dict(row):
+    job                                 = dict(zip(COLUMNS, row))
+    job['arguments']                    = json.loads(job['arguments']) if job['arguments'] else []
+    job['env']                          = json.loads(job['env']) if job['env'] else None
+    return job
+
+
+class JobStore(object):
+
+    key                                 = 'JobStore'
+
+    _stores                             = dict()
+    _storesLock                         = threading.Lock()
+
+    def __init__(self, dbPath):
+        super(JobStore, self).__init__()
+
+        self.dbPath                     = dbPath
+        self._lock                      = threading.RLock()
+
+        folder                          = os.path.dirname(dbPath)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        self.conn                       = sqlite3.connect(dbPath, check_same_thread=False, timeout=10)
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+
+    @classmethod
+    def instance(cls, dbPath=None):
+        dbPath                          = os.path.abspath(dbPath or LOCAL_DB)
+        with cls._storesLock:
+            store                       = cls._stores.get(dbPath)
+            if store is None:
+                store                   = cls._stores[dbPath] = cls(dbPath)
+        return store
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Write """
+
+    def add(self, kind, program, arguments=None, cwd=None, env=None, title=None, status='Queued'):
+        """ :return: id of the new job """
+        with self._lock, self.conn:
+            return self.conn.execute("INSERT INTO jobs (title, kind, program, arguments, cwd, env, status, submitted) "
+                                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                     (title, kind, program, json.dumps(list(arguments or [])), cwd,
+                                      json.dumps(env) if env else None, status, time.time())).lastrowid
+
+    def update(self, id, **values):
+        columns                         = [c for c in values if c in UPDATABLE]
+        if not columns:
+            return
+        sql                             = "UPDATE jobs SET {0} WHERE id = ?".format(
+                                          ', '.join('{0} = ?'.format(c) for c in columns))
+        with self._lock, self.conn:
+            self.conn.execute(sql, [values[c] for c in columns] + [id])
+
+    def interrupt(self, statuses, status):
+        """ Jobs left in 'statuses' by a session which ended are set to 'status', :return: number changed """
+        with self._lock, self.conn:
+            return self.conn.execute("UPDATE jobs SET status = ? WHERE status IN ({0})".format(
+                                     ', '.join('?' * len(statuses))), [status] + list(statuses)).rowcount
+
+    def prune(self, before):
+        """ Remove the jobs submitted before 'before' (timestamp) """
+        with self._lock, self.conn:
+            return self.conn.execute("DELETE FROM jobs WHERE submitted < ?", (before, )).rowcount
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Read """
+
+    def job(self, id):
+        with self._lock:
+            row                         = self.conn.execute("SELECT {0} FROM jobs WHERE id = ?".format(
+                                                            ', '.join(COLUMNS)), (id, )).fetchone()
+        return row_dict(row) if row else None
+
+    def query(self, statuses=None, kind=None, pageSize=PAGE_SIZE):
+        """ Generator of pages (lists of dicts), newest first. Each page continues after the last id read """
+        clauses, params                 = [], []
+        if statuses:
+            clauses.append('status IN ({0})'.format(', '.join('?' * len(statuses))))
+            params.extend(statuses)
+        if kind:
+            clauses.append('kind = ?')
+            params.append(kind)
+
+        lastID                          = None
+        while True:
+            where                       = list(clauses)
+            values                      = list(params)
+            if lastID is not None:
+                where.append('id < ?')
+                values.append(lastID)
+            sql                         = "SELECT {0} FROM jobs {1} ORDER BY id DESC LIMIT ?".format(
+                                          ', '.join(COLUMNS), 'WHERE ' + ' AND '.join(where) if where else '')
+            with self._lock:
+                rows                    = self.conn.execute(sql, values + [pageSize]).fetchall()
+            if not rows:
+                return
+            yield [row_dict(r) for r in rows]
+            if len(rows) < pageSize:
+                return
+            lastID                      = rows[-1][0]
+
+    def stats(self):
+        """ :return: {status: (count, total run seconds, total cpu seconds)} """
+        with self._lock:
+            rows                        = self.conn.execute("SELECT status, COUNT(*), SUM(ended - started), "
+                                                            "SUM(cpuTime) FROM jobs GROUP BY status").fetchall()
+        return {status: (count, run or 0.0, cpu or 0.0) for status, count, run, cpu in rows}
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 9:00 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: LibraryIndex.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Index of the asset libraries (UserLibrary, HDRILibrary, TextureLibrary, AlphaLibrary): one SQLite row per
+    image with its size, channels, bit depth, file size and content hash, plus tags. The library views filter and
+    page through the index, they never walk the library folders.
+
+    scan() is incremental: the roots are listed (a stat per file), only new or modified files are read again, in
+    worker processes, and files gone from disk are removed. A root which can not be reached (offline drive) is
+    left as it is instead of being emptied, and so is a folder which can not be listed.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sqlite3, threading
+from concurrent.futures                 import ProcessPoolExecutor
+
+# PLM
+from PLM                                import LIBRARY_DIR
+from PLM.imaging                        import IMAGE_EXTS, image_info
+
+
+INDEX_NAME                              = 'library.db'
+LIBRARIES                               = ['UserLibrary', 'HDRILibrary', 'TextureLibrary', 'AlphaLibrary']
+PAGE_SIZE                               = 200
+WRITE_SIZE                              = 500
+
+# columns which can be filtered with a value or a (min, max) range
+ATTRIBUTES                              = ['width', 'height', 'channels', 'bitDepth', 'fileSize', 'mtime']
+COLUMNS                                 = ['id', 'library', 'path', 'name', 'ext', 'folder', 'mtime', 'fileSize',
+                                           'hash', 'width', 'height', 'channels', 'bitDepth', 'error']
+
+SCHEMA                                  = ("CREATE TABLE IF NOT EXISTS assets (id INTEGER PRIMARY KEY, "
+                                           "library TEXT NOT NULL, path TEXT NOT NULL UNIQUE, name TEXT, ext TEXT, "
+                                           "folder TEXT, mtime REAL, fileSize INTEGER, hash TEXT, width INTEGER, "
+                                           "height INTEGER, channels INTEGER, bitDepth INTEGER, error TEXT)",
+                                           "CREATE INDEX IF NOT EXISTS assets_name ON assets (library, name)",
+                                           "CREATE INDEX IF NOT EXISTS assets_ext ON assets (library, ext, name)",
+                                           "CREATE INDEX IF NOT EXISTS assets_width ON assets (library, width)",
+                                           "CREATE INDEX IF NOT EXISTS assets_hash ON assets (hash)",
+                                           "CREATE TABLE IF NOT EXISTS tags (tag TEXT NOT NULL, "
+                                           "assetId INTEGER NOT NULL, PRIMARY KEY (tag, assetId)) WITHOUT ROWID",
+                                           "CREATE INDEX IF NOT EXISTS tags_asset ON tags (assetId)",
+                                           "CREATE TABLE IF NOT EXISTS roots (library TEXT NOT NULL, "
+                                           "path TEXT NOT NULL, PRIMARY KEY (library, path))", )
+
+
+def normpath(path):
+    return os.path.abspath(path).replace('\\', '/')
+
+
+def list_images(root):
+    """
+    :return: ({path: (mtime, fileSize)} of the images under root, a stat per file and nothing else, [folders which
+             could not be listed]). The files under these folders are unknown, not gone.
+    """
+    found                               = dict()
+    unreadable                          = []
+    folders                             = [root]
+    while folders:
+        folder                          = folders.pop()
+        try:
+            entries                     = list(os.scandir(folder))
+        except OSError:
+            unreadable.append(folder.replace('\\', '/'))
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                folders.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTS:
+                try:
+                    stat                = entry.stat()
+                except OSError:
+                    continue
+                found[entry.path.replace('\\', '/')] = (stat.st_mtime, stat.st_size)
+    return found, unreadable
+
+
+class LibraryIndex(object):
+
+    key                                 = 'LibraryIndex'
+
+    _indexes                            = dict()
+    _indexesLock                        = threading.Lock()
+
+    def __init__(self, dbPath):
+        super(LibraryIndex, self).__init__()
+
+        self.dbPath                     = dbPath
+        self._lock                      = threading.RLock()
+
+        folder                          = os.path.dirname(dbPath)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        self.conn                       = sqlite3.connect(dbPath, check_same_thread=False, timeout=10)
+        # a scan writes while the views read
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+
+    @classmethod
+    def instance(cls, dbPath=None):
+        """ One index per database file, shared by the scanner and every library view """
+        dbPath                          = os.path.abspath(dbPath or os.path.join(LIBRARY_DIR, INDEX_NAME))
+        with cls._indexesLock:
+            index                       = cls._indexes.get(dbPath)
+            if index is None:
+                index                   = cls._indexes[dbPath] = cls(dbPath)
+        return index
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Roots """
+
+    def roots(self, library):
+        """ Folders of a library, LIBRARY_DIR/<library> when none has been added """
+        with self._lock:
+            rows                        = self.conn.execute("SELECT path FROM roots WHERE library = ? ORDER BY path",
+                                                            (library, )).fetchall()
+        return [r[0] for r in rows] or [normpath(os.path.join(LIBRARY_DIR, library))]
+
+    def addRoot(self, library, path):
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO roots (library, path) VALUES (?, ?)", (library, normpath(path)))
+
+    def removeRoot(self, library, path):
+        """ Forget a folder and everything indexed under it """
+        path                            = normpath(path)
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM roots WHERE library = ? AND path = ?", (library, path))
+            ids                         = [r[0] for r in self.conn.execute(
+                                           "SELECT id FROM assets WHERE library = ? AND (path = ? OR path LIKE ? "
+                                           "ESCAPE '\\')", (library, path, _like_prefix(path)))]
+            self._delete(ids)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Scan """
+
+    def scan(self, libraries=None, workers=None, progress=None, cancel=None):
+        """
+        Bring the index up to date with the library folders.
+        :param progress: called with (done, total) while the changed files are read.
+        :param cancel: called between files, stop when it returns True. What has been read is kept.
+        :return: dict of the numbers of added, updated, removed and unreadable files.
+        """
+        result                          = dict(added=0, updated=0, removed=0, failed=0)
+        changed                         = []
+
+        for library in libraries or LIBRARIES:
+            with self._lock:
+                known                   = {r[0]: (r[1], r[2], r[3]) for r in self.conn.execute(
+                                           "SELECT path, id, mtime, fileSize FROM assets WHERE library = ?",
+                                           (library, ))}
+            gone                        = []
+            for root in self.roots(library):
+                if not os.path.isdir(root):
+                    continue
+                found, unreadable       = list_images(root)
+                prefix                  = root.rstrip('/') + '/'
+                # a folder which could not be listed (permissions, network error) keeps its rows and tags
+                kept                    = tuple(folder.rstrip('/') + '/' for folder in unreadable)
+                gone.extend(known[p][0] for p in known if p.startswith(prefix) and p not in found
+                            and not p.startswith(kept))
+                for path, (mtime, fileSize) in found.items():
+                    old                 = known.get(path)
+                    if old is None or old[1] != mtime or old[2] != fileSize:
+                        changed.append((library, root, path, old is None))
+
+            with self._lock, self.conn:
+                self._delete(gone)
+            result['removed']           += len(gone)
+
+        if not changed:
+            return result
+
+        rows                            = []
+        total                           = len(changed)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            infos                       = pool.map(image_info, [c[2] for c in changed], chunksize=16)
+            for done, ((library, root, path, new), info) in enumerate(zip(changed, infos), 1):
+                if cancel is not None and cancel():
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    break
+                if info is None:
+                    # removed or locked while the scan was running, the next scan will see it again
+                    continue
+                rows.append((library, root, path, new, info))
+                result['added' if new else 'updated'] += 1
+                result['failed']        += 1 if info['error'] else 0
+                if len(rows) >= WRITE_SIZE:
+                    self._write(rows)
+                    rows                = []
+                if progress is not None:
+                    progress(done, total)
+
+        self._write(rows)
+        return result
+
+    def _write(self, rows):
+        if not rows:
+            return
+        with self._lock, self.conn:
+            for library, root, path, new, info in rows:
+                folder, name            = os.path.split(path)
+                values                  = (library, path, name, os.path.splitext(name)[1].lower(), folder,
+                                           info['mtime'], info['fileSize'], info['hash'], info['width'],
+                                           info['height'], info['channels'], info['bitDepth'], info['error'])
+                self.conn.execute("INSERT INTO assets (library, path, name, ext, folder, mtime, fileSize, hash, "
+                                  "width, height, channels, bitDepth, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, "
+                                  "?, ?, ?) ON CONFLICT (path) DO UPDATE SET mtime = excluded.mtime, "
+                                  "fileSize = excluded.fileSize, hash = excluded.hash, width = excluded.width, "
+                                  "height = excluded.height, channels = excluded.channels, "
+                                  "bitDepth = excluded.bitDepth, error = excluded.error", values)
+                if new:
+                    # the sub folders of a new file are its first tags: textures/wood/oak.jpg -> wood
+                    assetId             = self.conn.execute("SELECT id FROM assets WHERE path = ?",
+                                                            (path, )).fetchone()[0]
+                    relative            = os.path.relpath(folder, root).replace('\\', '/')
+                    tags                = [t.lower() for t in relative.split('/') if t not in ['.', '']]
+                    self.conn.executemany("INSERT OR IGNORE INTO tags (tag, assetId) VALUES (?, ?)",
+                                          [(t, assetId) for t in tags])
+
+    def _delete(self, ids):
+        """ Caller holds the lock and the transaction """
+        for start in range(0, len(ids), WRITE_SIZE):
+            chunk                       = [(i, ) for i in ids[start:start + WRITE_SIZE]]
+            self.conn.executemany("DELETE FROM tags WHERE assetId = ?", chunk)
+            self.conn.executemany("DELETE FROM assets WHERE id = ?", chunk)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Tags """
+
+    def tags(self, library=None):
+        """ :return: [(tag, number of assets)] """
+        sql                             = "SELECT tag, COUNT(*) FROM tags"
+        params                          = []
+        if library:
+            sql                         += " JOIN assets ON assets.id = tags.assetId WHERE assets.library = ?"
+            params.append(library)
+        with self._lock:
+            return self.conn.execute(sql + " GROUP BY tag ORDER BY tag", params).fetchall()
+
+    def tagsOf(self, assetId):
+        with self._lock:
+            return [r[0] for r in self.conn.execute("SELECT tag FROM tags WHERE assetId = ? ORDER BY tag",
+                                                    (assetId, ))]
+
+    def addTags(self, assetIds, tags):
+        with self._lock, self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO tags (tag, assetId) VALUES (?, ?)",
+                                  [(t.lower(), i) for i in assetIds for t in tags])
+
+    def removeTags(self, assetIds, tags):
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM tags WHERE tag = ? AND assetId = ?",
+                                  [(t.lower(), i) for i in assetIds for t in tags])
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Query """
+
+    @staticmethod
+    def where(library=None, text=None, tags=None, exts=None, **attributes):
+        """
+        :param tags: assets having all these tags.
+        :param attributes: width=2048, or a (min, max) range: width=(1024, None), fileSize=(None, 10 * 1024 ** 2).
+        """
+        clauses, params                 = [], []
+        if library:
+            clauses.append('library = ?')
+            params.append(library)
+        if text:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            params.append('%{0}%'.format(_escape(text)))
+        if exts:
+            clauses.append('ext IN ({0})'.format(', '.join('?' * len(exts))))
+            params.extend(e.lower() if e.startswith('.') else '.' + e.lower() for e in exts)
+        if tags:
+            tags                        = sorted(set(t.lower() for t in tags))
+            clauses.append('id IN (SELECT assetId FROM tags WHERE tag IN ({0}) GROUP BY assetId '
+                           'HAVING COUNT(*) = ?)'.format(', '.join('?' * len(tags))))
+            params.extend(tags + [len(tags)])
+
+        for name, value in attributes.items():
+            if name not in ATTRIBUTES:
+                raise KeyError('Can not filter by {0}, use one of {1}'.format(name, ATTRIBUTES))
+            if isinstance(value, (tuple, list)):
+                low, high               = value
+                if low is not None:
+                    clauses.append('{0} >= ?'.format(name))
+                    params.append(low)
+                if high is not None:
+                    clauses.append('{0} <= ?'.format(name))
+                    params.append(high)
+            elif value is not None:
+                clauses.append('{0} = ?'.format(name))
+                params.append(value)
+        return clauses, params
+
+    def query(self, library=None, text=None, tags=None, exts=None, pageSize=PAGE_SIZE, **attributes):
+        """
+        Generator of pages (lists of dicts) matching the filters, ordered by name. Each page continues after the
+        last row of the previous one, the 100th page is as fast as the first.
+        """
+        clauses, params                 = self.where(library, text, tags, exts, **attributes)
+        last                            = None
+
+        while True:
+            pageClauses                 = list(clauses)
+            pageParams                  = list(params)
+            if last is not None:
+                pageClauses.append('(name, id) > (?, ?)')
+                pageParams.extend([last['name'], last['id']])
+
+            sql                         = 'SELECT {0} FROM assets'.format(', '.join(COLUMNS))
+            if pageClauses:
+                sql                     += ' WHERE ' + ' AND '.join(pageClauses)
+            sql                         += ' ORDER BY name, id LIMIT {0}'.format(int(pageSize))
+
+            with self._lock:
+                rows                    = self.conn.execute(sql, pageParams).fetchall()
+            if not rows:
+                return
+            page                        = [dict(zip(COLUMNS, row)) for row in rows]
+            yield page
+            if len(rows) < pageSize:
+                return
+            last                        = page[-1]
+
+    def count(self, library=None, text=None, tags=None, exts=None, **attributes):
+        clauses, params                 = self.where(library, text, tags, exts, **attributes)
+        sql                             = 'SELECT COUNT(*) FROM assets'
+        if clauses:
+            sql                         += ' WHERE ' + ' AND '.join(clauses)
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()[0]
+
+    def asset(self, path):
+        with self._lock:
+            row                         = self.conn.execute('SELECT {0} FROM assets WHERE path = ?'.format(
+                                                            ', '.join(COLUMNS)), (normpath(path), )).fetchone()
+        return dict(zip(COLUMNS, row)) if row else None
+
+    def duplicates(self, library=None):
+        """ :return: {hash: [paths]} of the files indexed more than once """
+        sql                             = 'SELECT hash, path FROM assets WHERE hash IN (SELECT hash FROM assets ' \
+                                          'WHERE hash IS NOT NULL GROUP BY hash HAVING COUNT(*) > 1)'
+        params                          = []
+        if library:
+            sql                         += ' AND library = ?'
+            params.append(library)
+        found                           = dict()
+        with self._lock:
+            for hash, path in self.conn.execute(sql + ' ORDER BY hash, path', params):
+                found.setdefault(hash, []).append(path)
+        return found
+
+
+def _escape(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _like_prefix(path):
+    return _escape(path.rstrip('/') + '/') + '%'
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 6:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
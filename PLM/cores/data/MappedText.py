@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: MappedText.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Read only access to big text files (logs, EDLs, .ma scenes) without loading them. The file is memory mapped,
+    the start offset of every line is kept in an array (8 bytes per line), lines are only decoded when asked.
+
+    The index is built by chunks so it can run in a thread and report its progress, a growing file (a log being
+    written) is indexed again only from where the last build stopped. Lines are split on b'\\n', the encoding
+    has to be ascii compatible (utf-8, latin-1, cp1252...), a trailing '\\r' is dropped.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, re, mmap, bisect, threading
+from array                              import array
+from itertools                          import accumulate, chain
+
+
+CHUNK_SIZE                              = 8 * 1024 * 1024
+SEARCH_WINDOW                           = 4 * 1024 * 1024
+
+
+class MappedText(object):
+
+    key                                 = 'MappedText'
+
+    def __init__(self, filePath, encoding='utf-8'):
+        super(MappedText, self).__init__()
+
+        self.filePath                   = filePath
+        self.encoding                   = encoding
+
+        self._lock                      = threading.RLock()
+        self._file                      = None
+        self._map                       = None
+        self._size                      = 0
+        # start offset of every line, a new line starts after each b'\n'
+        self._starts                    = array('Q', [0])
+        # bytes already scanned for line breaks
+        self._scanned                   = 0
+
+        self.open()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ File """
+
+    def open(self):
+        with self._lock:
+            self._file                  = open(self.filePath, 'rb')
+            self.remap()
+            if self._map is not None and self._map[:3] == b'\xef\xbb\xbf':
+                self.encoding           = 'utf-8-sig'
+
+    def remap(self):
+        """ Map the file again at its current size, an empty file can not be mapped """
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map               = None
+            self._size                  = os.fstat(self._file.fileno()).st_size
+            if self._size:
+                self._map               = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map               = None
+            if self._file is not None:
+                self._file.close()
+                self._file              = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def size(self):
+        return self._size
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Index """
+
+    @property
+    def indexed(self):
+        return self._scanned >= self._size
+
+    def build(self, chunkSize=CHUNK_SIZE, progress=None, cancel=None):
+        """
+        Scan the file for line breaks, from where the last build stopped.
+        :param progress: called with the percentage done after each chunk.
+        :param cancel: called before each chunk, the build stops when it returns True.
+        :return: True if the whole file is indexed.
+        """
+        while self._scanned < self._size:
+            if cancel is not None and cancel():
+                return False
+
+            with self._lock:
+                base                    = self._scanned
+                pieces                  = self._map[base:base + chunkSize].split(b'\n')
+                # every piece but the last one ends with a line break
+                starts                  = accumulate(chain([base], (len(p) + 1 for p in pieces[:-1])))
+                next(starts)
+                self._starts.extend(starts)
+                self._scanned           = min(base + chunkSize, self._size)
+
+            if progress is not None:
+                progress(int(self._scanned * 100 / self._size))
+
+        return True
+
+    def refresh(self):
+        """
+        Follow a growing file: map the new size and index the new part. A file which got shorter (log rotated,
+        truncated) is indexed again from the start.
+        :return: number of lines added, -1 when the index has been reset.
+        """
+        with self._lock:
+            size                        = os.fstat(self._file.fileno()).st_size
+            if size == self._size:
+                return 0
+
+            before                      = self.lineCount()
+            self.remap()
+            if size < self._scanned:
+                self._starts            = array('Q', [0])
+                self._scanned           = 0
+                self.build()
+                return -1
+
+            self.build()
+            return self.lineCount() - before
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Lines """
+
+    def lineCount(self):
+        """ Lines indexed so far, a line break at the end of the file does not open an empty line """
+        count                           = len(self._starts)
+        if self._starts[-1] >= min(self._scanned, self._size):
+            count                       -= 1
+        return count
+
+    def lineSpan(self, index):
+        """ :return: (start, end) byte offsets of the line, without its line break """
+        start                           = self._starts[index]
+        if index + 1 < len(self._starts):
+            end                         = self._starts[index + 1] - 1
+        else:
+            end                         = self._size
+        return start, end
+
+    def rawLine(self, index):
+        with self._lock:
+            start, end                  = self.lineSpan(index)
+            data                        = self._map[start:end]
+        return data[:-1] if data.endswith(b'\r') else data
+
+    def line(self, index):
+        return self.rawLine(index).decode(self.encoding, 'replace')
+
+    def lines(self, first, count):
+        """ Decode the lines shown in a view: first to first + count, clamped to the index """
+        last                            = min(first + count, self.lineCount())
+        return [self.line(i) for i in range(max(first, 0), last)]
+
+    def lineAt(self, offset):
+        """ :return: index of the line containing the byte offset """
+        return bisect.bisect_right(self._starts, offset) - 1
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Search """
+
+    def pattern(self, text, caseSensitive=False, regex=False):
+        """ Bytes pattern of the search, ignoring the case only works for ascii letters """
+        data                            = text.encode(self.encoding.replace('-sig', ''))
+        flags                           = 0 if caseSensitive else re.IGNORECASE
+        return re.compile(data if regex else re.escape(data), flags)
+
+    def find(self, text, fromLine=0, backwards=False, caseSensitive=False, regex=False):
+        """
+        Search the mapped bytes directly, nothing is decoded. Forwards starts at the beginning of 'fromLine',
+        backwards looks before it.
+        :return: (line, column, length) of the match, None if not found. column/length are counted in bytes,
+                 the same as characters for ascii text.
+        """
+        if not text or not self.lineCount():
+            return None
+
+        pattern                         = self.pattern(text, caseSensitive, regex)
+        fromLine                        = max(0, min(fromLine, self.lineCount()))
+        with self._lock:
+            end                         = min(self._scanned, self._size)
+            start                       = self._starts[fromLine] if fromLine < len(self._starts) else end
+            if backwards:
+                match                   = self.searchBackwards(pattern, start)
+            else:
+                match                   = pattern.search(self._map, start, end)
+
+        if match is None:
+            return None
+        line                            = self.lineAt(match.start())
+        return line, match.start() - self._starts[line], match.end() - match.start()
+
+    def searchBackwards(self, pattern, end):
+        """ Last match before 'end', the file is searched by windows going up, each one ends on a line start """
+        while end > 0:
+            first                       = self.lineAt(max(0, end - SEARCH_WINDOW))
+            start                       = self._starts[first]
+            last                        = None
+            for last in pattern.finditer(self._map, start, end):
+                pass
+            if last is not None:
+                return last
+            # the window starts on a line, a line longer than the window is searched in one go
+            end                         = start
+        return None
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 4:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
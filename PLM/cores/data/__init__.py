@@ -12,6 +12,10 @@ Description:
 
 
 from .sqlUtils          import sqlUtils
+from .MappedText        import MappedText
+from .LibraryIndex      import LibraryIndex
+from .HashCache         import HashCache
+from .JobStore          import JobStore
 
 
 # -------------------------------------------------------------------------------------------------------------
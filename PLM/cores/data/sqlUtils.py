@@ -15,7 +15,7 @@ import time, datetime, os
 import sqlite3 as lite
 
 # PLM
-# from PLM                            import LOCAL_DB
+from PLM                            import LOCAL_DB
 # from PLM.Core                       import Timer, Date
 # from PLM.damg                       import DAMG, DAMGLIST, DAMGDICT
 
@@ -46,10 +46,9 @@ DB_ATTRIBUTE_TYPE                       = { 'int_auto_increment'    : 'INTERGER
 class sqlUtils:
 
     key                                 = 'LocalDatabase'
-    _dbPath                             = os.path.join(os.getenv('LOCALAPPDATA'), 'DAMGTEAM', 'Pipeline Manager (PLM)', 'local.db')
-    conn                                = lite.connect(_dbPath)
-    conn.text_factory                   = str
-    cur                                 = conn.cursor()
+    _dbPath                             = LOCAL_DB
+    _conn                               = None
+    _cur                                = None
     tableNames                          = list()
     tables                              = dict()
     db_types                            = DB_ATTRIBUTE_TYPE
@@ -62,6 +61,25 @@ class sqlUtils:
         # self.time                       = Timer()
         # self.update()
 
+    @classmethod
+    def connect(cls):
+        """ One connection shared by every instance, opened the first time the database is used """
+        if cls._conn is None:
+            os.makedirs(os.path.dirname(cls._dbPath), exist_ok=True)
+            cls._conn                   = lite.connect(cls._dbPath)
+            cls._conn.text_factory      = str
+            cls._cur                    = cls._conn.cursor()
+        return cls._conn
+
+    @property
+    def conn(self):
+        return self.connect()
+
+    @property
+    def cur(self):
+        self.connect()
+        return self._cur
+
     def update(self):
         self.tableNames = self.tableList()
         for table in self.tableNames:
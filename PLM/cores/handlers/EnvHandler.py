@@ -13,10 +13,11 @@ from pyPLM import settings
 """ Import """
 
 # Python
-import os, sys, subprocess
+import os, sys
 
 # PLM
 from pyPLM.damg import DAMG
+from PLM.platforms import platformServices
 
 
 class EnvHandler(DAMG):
@@ -32,7 +33,7 @@ class EnvHandler(DAMG):
     def __init__(self):
         super(EnvHandler, self).__init__()
 
-        pths = [p.replace('\\', '/') for p in self.PATH.split(';')[0:]]
+        pths = [p.replace('\\', '/') for p in self.PATH.split(os.pathsep)[0:]]
 
         for p in pths:
             if os.path.exists(p):
@@ -47,17 +48,17 @@ class EnvHandler(DAMG):
         except KeyError:
             if settings.checks.report:
                 print('{0} is not existed, create new environment configKey.'.format(key))
-            subprocess.Popen('SetX {0} {1}'.format(key, value), shell=True).wait()
+            platformServices().setUserEnv(key, value)
         else:
             if os.getenv(key) is None:
                 if settings.checks.report:
                     print('{0} has value as None, assign showLayout_new value {1}'.format(key, value))
-                subprocess.Popen('SetX {0} {1}'.format(key, value), shell=True).wait()
+                platformServices().setUserEnv(key, value)
             else:
                 if os.getenv(key) != value:
                     if settings.checks.report:
                         print('{0} has different value, edit to: {1}'.format(key, value))
-                    subprocess.Popen('SetX {0} {1}'.format(key, value), shell=True).wait()
+                    platformServices().setUserEnv(key, value)
                 else:
                     if settings.checks.report:
                         print('{0} has already been set to {1}'.format(key, value))
@@ -73,7 +74,7 @@ class EnvHandler(DAMG):
         else:
             if settings.checks.report:
                 print('Delete environment configKey: {0}'.format(envKey))
-            subprocess.Popen('REG delete HKCU\Environment /F /V {0}'.format(envKey), shell=True).wait()
+            platformServices().removeUserEnv(envKey)
 
         self.update()
 
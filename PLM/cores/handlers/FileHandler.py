@@ -1,24 +1,65 @@
 # -*- coding: utf-8 -*-
 """
 
-Script Name: 
+Script Name: FileHandler.py
 Author: Do Trinh/Jimmy - 3D artist.
 
 Description:
 
+    File operations of PLM, and file identity: content hashes (xxhash when it is installed, blake2b otherwise)
+    read by chunks in a thread pool and kept in the HashCache, so a tree is only read again where files changed.
+    On top of it: duplicates across publish/snapshot folders, the space they waste, verified copies.
 
 """
 # -------------------------------------------------------------------------------------------------------------
-from pyPLM.damg import DAMG
+""" Import """
+
+# Python
+import os, shutil, hashlib
+from concurrent.futures                 import ThreadPoolExecutor
+
+# PLM
+from pyPLM.damg                         import DAMG
+from PLM.cores.data.HashCache           import HashCache
+
+try:
+    import xxhash
+except ImportError:
+    xxhash                              = None
+
+
+CHUNK_SIZE                              = 4 * 1024 * 1024
+HASH_WORKERS                            = 4
+
+
+def new_hasher(algorithm):
+    if algorithm == 'xxh3_128':
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=20)
+
+
+def size_text(size):
+    if size < 1024:
+        return '{0} B'.format(size)
+    for unit in ['KB', 'MB', 'GB', 'TB']:
+        size                            /= 1024.0
+        if size < 1024 or unit == 'TB':
+            return '{0:.1f} {1}'.format(size, unit)
 
 
 class FileHandler(DAMG):
 
-    key                         = 'FileHandler'
+    key                                 = 'FileHandler'
 
-    def __init__(self):
+    # xxhash is several times faster than blake2b on multi GB scenes, both release the GIL while hashing
+    algorithm                           = 'xxh3_128' if xxhash is not None else 'blake2b'
+
+    def __init__(self, cache=None, workers=HASH_WORKERS):
         super(FileHandler, self).__init__()
 
+        self.cache                      = cache or HashCache.instance()
+        self.workers                    = workers
+
     def find(self, name, path):
         """ find/search """
         pass
@@ -45,22 +86,186 @@ class FileHandler(DAMG):
     def setPermission(self, path):
         pass
 
-    def copy(self, source, destination):
-        pass
+    def copy(self, source, destination, verify=True):
+        """
+        Copy a file or a folder with its times. With verify, the copy is read back and compared with the source,
+        a bad copy is removed and raises IOError.
+        """
+        if os.path.isdir(source):
+            shutil.copytree(source, destination)
+            problems                    = self.verifyTree(source, destination) if verify else []
+        else:
+            if os.path.isdir(destination):
+                destination             = os.path.join(destination, os.path.basename(source))
+            shutil.copy2(source, destination)
+            problems                    = []
+            if verify and not self.verify(source, destination):
+                problems.append((os.path.basename(source), 'different'))
+
+        if problems:
+            self.remove(destination)
+            raise IOError('Copy of {0} is not valid: {1}'.format(source, ', '.join(
+                          '{0} ({1})'.format(*p) for p in problems[:10])))
+        return destination
 
     def remove(self, path):
-        pass
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
 
     def profile(self, path):
         """ check profile of a file (size, date created etc.) """
-        pass
+        stat                            = os.stat(path)
+        isDir                           = os.path.isdir(path)
+        return dict(path=path, size=stat.st_size, created=stat.st_ctime, modified=stat.st_mtime,
+                    accessed=stat.st_atime, isDir=isDir, hash=None if isDir else self.hash(path))
 
     def zip(self, path):
-        pass
+        """ :return: path of the zip file made next to path """
+        folder, name                    = os.path.split(os.path.abspath(path).rstrip('/\\'))
+        return shutil.make_archive(os.path.join(folder, name), 'zip', folder, name)
 
-    def unzip(self, path):
-        pass
+    def unzip(self, path, destination=None):
+        destination                     = destination or os.path.dirname(os.path.abspath(path))
+        shutil.unpack_archive(path, destination)
+        return destination
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Hash """
+
+    def hash(self, path, useCache=True):
+        """ Content hash of a file, from the cache while its size and mtime did not change """
+        stat                            = os.stat(path)
+        if useCache:
+            cached                      = self.cache.get(path, stat.st_size, stat.st_mtime_ns, self.algorithm)
+            if cached is not None:
+                return cached
+
+        hasher                          = new_hasher(self.algorithm)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        digest                          = hasher.hexdigest()
+        self.cache.put(path, stat.st_size, stat.st_mtime_ns, self.algorithm, digest)
+        return digest
+
+    def hashFiles(self, paths, progress=None):
+        """
+        Hash files in parallel.
+        :param progress: called with (done, total).
+        :return: {path: hash}, files which can not be read are left out.
+        """
+        paths                           = list(paths)
+        hashes                          = dict()
+
+        def work(path):
+            try:
+                return path, self.hash(path)
+            except (IOError, OSError):
+                return path, None
+
+        with self.cache.batch(), ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for done, (path, digest) in enumerate(pool.map(work, paths), 1):
+                if digest is not None:
+                    hashes[path]        = digest
+                if progress is not None:
+                    progress(done, len(paths))
+
+        return hashes
+
+    @staticmethod
+    def listFiles(roots, minSize=0):
+        """ :return: {path: size} of the files under the roots, at least minSize bytes, links are skipped """
+        files                           = dict()
+        for root in roots:
+            for folder, dirs, names in os.walk(root):
+                for name in names:
+                    path                = os.path.join(folder, name).replace('\\', '/')
+                    try:
+                        if os.path.islink(path):
+                            continue
+                        size            = os.path.getsize(path)
+                    except OSError:
+                        continue
+                    if size >= minSize:
+                        files[path]     = size
+        return files
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Integrity """
+
+    def duplicates(self, roots, minSize=1, progress=None):
+        """
+        Files with the same content under the roots (publish, snapshot folders...). Only the files sharing their
+        size with another one are hashed.
+        :return: list of dicts (hash, size, paths, reclaimable), the most space first.
+        """
+        bySize                          = dict()
+        for path, size in self.listFiles(roots, minSize).items():
+            bySize.setdefault(size, []).append(path)
+
+        candidates                      = [p for paths in bySize.values() if len(paths) > 1 for p in paths]
+        byHash                          = dict()
+        for path, digest in self.hashFiles(candidates, progress).items():
+            byHash.setdefault(digest, []).append(path)
+
+        groups                          = []
+        for digest, paths in byHash.items():
+            if len(paths) > 1:
+                size                    = os.path.getsize(paths[0])
+                groups.append(dict(hash=digest, size=size, paths=sorted(paths), reclaimable=size * (len(paths) - 1)))
+        return sorted(groups, key=lambda g: g['reclaimable'], reverse=True)
+
+    @staticmethod
+    def reclaimable(groups):
+        """ :return: dict of the numbers of duplicate groups, extra copies and bytes which could be freed """
+        return dict(groups=len(groups), files=sum(len(g['paths']) - 1 for g in groups),
+                    bytes=sum(g['reclaimable'] for g in groups))
+
+    def report(self, groups, limit=20):
+        total                           = self.reclaimable(groups)
+        lines                           = ['{0} duplicate groups, {1} extra copies, {2} reclaimable'.format(
+                                           total['groups'], total['files'], size_text(total['bytes']))]
+        for group in groups[:limit]:
+            lines.append('')
+            lines.append('{0} x {1} ({2} reclaimable)'.format(len(group['paths']), size_text(group['size']),
+                                                              size_text(group['reclaimable'])))
+            lines.extend('    {0}'.format(p) for p in group['paths'])
+        if len(groups) > limit:
+            lines.append('')
+            lines.append('... and {0} more groups'.format(len(groups) - limit))
+        return '\n'.join(lines)
+
+    def verify(self, source, destination):
+        """ True if destination has the content of source, the copy is always read, never taken from the cache """
+        if os.path.getsize(source) != os.path.getsize(destination):
+            return False
+        return self.hash(source) == self.hash(destination, useCache=False)
+
+    def verifyTree(self, source, destination):
+        """ :return: [(relative path, 'missing' or 'different')] of the files of source not copied right """
+        problems                        = []
+        pairs                           = []
+        for path in self.listFiles([source]):
+            relative                    = os.path.relpath(path, source).replace('\\', '/')
+            copy                        = os.path.join(destination, relative)
+            if os.path.isfile(copy):
+                pairs.append((relative, path, copy))
+            else:
+                problems.append((relative, 'missing'))
+
+        def work(pair):
+            try:
+                return pair[0], self.verify(pair[1], pair[2])
+            except (IOError, OSError):
+                return pair[0], False
+
+        with self.cache.batch(), ThreadPoolExecutor(max_workers=self.workers) as pool:
+            problems.extend((relative, 'different') for relative, ok in pool.map(work, pairs) if not ok)
+
+        return sorted(problems)
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by Trinh Do on 5/6/2020 - 3:13 AM
-# © 2017 - 2020 DAMGteam. All rights reserved
\ No newline at end of file
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: ChunkedDownloadChannel.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Resumable, multi connection download channel. A large file is split into byte ranges which are downloaded in
+    parallel and written straight into a preallocated file at their offsets (the file stays open for the whole
+    download instead of being reopened on every flush).
+
+    Progress is kept in a sidecar manifest (<file>.part.json) so a crashed or cancelled download resumes from where
+    it stopped. The whole file can be verified against a checksum once every chunk is complete.
+
+    Concurrency and bandwidth are limited globally for every chunked channel of the session.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, json, time, hashlib
+
+# PLM
+from PLM.cores.base                         import Channel, TokenBucket
+from PLM.cores.models.Worker                import Worker
+from pyPLM.Core                             import File, Url, Timer, ThreadPool, Signal
+from pyPLM.Network                          import NetworkRequest, NetworkReply
+
+
+CHUNK_SIZE                                  = 8 * 1024 * 1024           # bytes per range request
+READ_BUFFER_SIZE                            = 512 * 1024                # bytes Qt may buffer per reply
+MANIFEST_INTERVAL                           = 4 * 1024 * 1024           # bytes written between manifest saves
+HASH_BLOCK_SIZE                             = 1024 * 1024
+MANIFEST_EXT                                = '.part.json'
+
+
+def file_checksum(filePth, algorithm='sha256', blockSize=HASH_BLOCK_SIZE):
+    """ Hash a file by blocks, return the hex digest """
+    h = hashlib.new(algorithm)
+    with open(filePth, 'rb') as f:
+        for block in iter(lambda: f.read(blockSize), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class DownloadManifest(object):
+
+    """
+    Sidecar file describing a partial download. Each chunk is [start, end, written] where end is inclusive and
+    written is the number of bytes already flushed to disk from start.
+    """
+
+    key                                     = 'DownloadManifest'
+
+    def __init__(self, filePath, url=None, size=0, etag=None, checksum=None, chunks=None):
+        super(DownloadManifest, self).__init__()
+
+        self.filePath                       = filePath
+        self.url                            = url
+        self.size                           = size
+        self.etag                           = etag
+        self.checksum                       = checksum
+        self.chunks                         = chunks or []
+
+    @staticmethod
+    def manifestPath(filePath):
+        return '{0}{1}'.format(filePath, MANIFEST_EXT)
+
+    @classmethod
+    def load(cls, filePath):
+        pth = cls.manifestPath(filePath)
+
+        if not os.path.exists(pth) or not os.path.exists(filePath):
+            return None
+
+        try:
+            with open(pth, 'r') as f:
+                data = json.load(f)
+        except (ValueError, OSError):
+            return None
+
+        return cls(filePath, data.get('url'), data.get('size', 0), data.get('etag'), data.get('checksum'),
+                   [list(c) for c in data.get('chunks', [])])
+
+    def save(self):
+        """ Write to a temporary file then swap it in, a crash never leaves a half written manifest """
+        pth                                 = self.manifestPath(self.filePath)
+        tmp                                 = '{0}.tmp'.format(pth)
+        data                                = dict(url=self.url, size=self.size, etag=self.etag,
+                                                   checksum=self.checksum, chunks=self.chunks)
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, pth)
+
+    def remove(self):
+        pth = self.manifestPath(self.filePath)
+        if os.path.exists(pth):
+            os.remove(pth)
+
+    def split(self, chunkSize=CHUNK_SIZE):
+        if self.size <= 0:
+            # unknown size, one open ended range
+            self.chunks                     = [[0, -1, 0]]
+        else:
+            self.chunks                     = [[start, min(start + chunkSize, self.size) - 1, 0]
+                                               for start in range(0, self.size, chunkSize)]
+        return self.chunks
+
+    def isChunkDone(self, index):
+        start, end, written = self.chunks[index]
+        return end >= 0 and written >= end - start + 1
+
+    def pending(self):
+        return [i for i in range(len(self.chunks)) if not self.isChunkDone(i)]
+
+    @property
+    def loaded(self):
+        return sum(c[2] for c in self.chunks)
+
+    def isComplete(self):
+        return len(self.chunks) > 0 and not self.pending()
+
+    def verify(self):
+        """ :return: True if there is no checksum to check or the file matches it """
+        if not self.checksum:
+            return True
+
+        algorithm, _, expected = self.checksum.partition(':')
+        return file_checksum(self.filePath, algorithm).lower() == expected.lower()
+
+
+class ChunkedDownloadChannel(Channel):
+
+    """ Download a file with several range requests, resumable after a crash """
+
+    key                                     = 'ChunkedDownloadChannel'
+
+    downloadProgress                        = Signal(int, int, name='downloadProgress')
+    downloadFinished                        = Signal(str, name='downloadFinished')
+    downloadFailed                          = Signal(str, name='downloadFailed')
+
+    # Limits shared by every chunked channel
+    maxConnections                          = 8
+    bandwidth                               = TokenBucket()
+
+    _activeConnections                      = 0
+    _waitingChannels                        = []
+
+    def __init__(self, url=None, manager=None, filePath=None, connections=4, checksum=None, chunkSize=CHUNK_SIZE,
+                       retries=3):
+        super(ChunkedDownloadChannel, self).__init__(url, manager)
+
+        self.sourceUrl                      = url
+        self.filePath                       = filePath
+        self.connections                    = connections
+        self.chunkSize                      = chunkSize
+        self.retries                        = retries
+
+        self.manifest                       = None
+        self.checksum                       = checksum
+        self.file                           = None
+        self.state                          = 'idle'
+
+        self._replies                       = dict()
+        # reply: first byte its Range asked for, until its status is checked on its first read
+        self._rangeStarts                   = dict()
+        self._failures                      = dict()
+        self._unsaved                       = 0
+        self._startTime                     = None
+
+        self.throttle                       = Timer(self)
+        self.throttle.setSingleShot(True)
+        self.throttle.timeout.connect(self.drainAll)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Global limits """
+
+    @classmethod
+    def setBandwidthLimit(cls, rate):
+        """ :param rate: bytes per second shared by every chunked download, 0 for unlimited """
+        cls.bandwidth.setRate(rate)
+
+    @classmethod
+    def setMaxConnections(cls, value):
+        cls.maxConnections                  = max(1, int(value))
+        cls.wakeWaitingChannels()
+
+    @classmethod
+    def acquireConnection(cls):
+        if cls._activeConnections >= cls.maxConnections:
+            return False
+        cls._activeConnections             += 1
+        return True
+
+    @classmethod
+    def releaseConnection(cls):
+        cls._activeConnections              = max(0, cls._activeConnections - 1)
+        cls.wakeWaitingChannels()
+
+    @classmethod
+    def wakeWaitingChannels(cls):
+        waiting                             = list(cls._waitingChannels)
+        cls._waitingChannels                = []
+        for channel in waiting:
+            channel.schedule()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Download flow """
+
+    def start(self):
+        """ Resume from the manifest if there is one for the same url, otherwise probe the server first """
+        self._startTime                     = time.time()
+        manifest                            = DownloadManifest.load(self.filePath)
+
+        if manifest and manifest.url == self.sourceUrl:
+            self.manifest                   = manifest
+            self.manifest.checksum          = self.checksum or manifest.checksum
+            return self.openFile(resize=False)
+
+        self.state                          = 'probing'
+        reply                               = self.networkManager.head(self.createRequest())
+        reply.finished.connect(lambda: self.probed(reply))
+
+    def probed(self, reply):
+        size                                = reply.header(NetworkRequest.ContentLengthHeader)
+        acceptRanges                        = bytes(reply.rawHeader(b'Accept-Ranges')).decode('ascii', 'ignore')
+        etag                                = bytes(reply.rawHeader(b'ETag')).decode('ascii', 'ignore') or None
+        error                               = reply.error()
+        reply.deleteLater()
+
+        if error != NetworkReply.NoError:
+            return self.fail('Probe failed: {0}'.format(reply.errorString()))
+
+        size                                = int(size or 0)
+        self.manifest                       = DownloadManifest(self.filePath, self.sourceUrl, size, etag, self.checksum)
+
+        if acceptRanges.lower() == 'bytes' and size > 0:
+            self.manifest.split(self.chunkSize)
+        else:
+            self.manifest.split(max(size, 1))
+            self.connections                = 1
+
+        self.manifest.save()
+        self.openFile(resize=True)
+
+    def openFile(self, resize=True):
+        folder = os.path.dirname(self.filePath)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        self.file                           = File(self.filePath)
+        if not self.file.open(File.ReadWrite):
+            return self.fail('Can not open file: {0}'.format(self.filePath))
+
+        if resize and self.manifest.size > 0:
+            # preallocate so every chunk can be written at its offset
+            self.file.resize(self.manifest.size)
+
+        self.state                          = 'downloading'
+        self.schedule()
+
+    def schedule(self):
+        """ Start as many pending chunks as the channel and the global limits allow """
+        if self.state != 'downloading':
+            return
+
+        busy                                = set(self._replies.values())
+        for index in self.manifest.pending():
+            if len(self._replies) >= self.connections:
+                break
+            if index in busy:
+                continue
+            if not self.acquireConnection():
+                if self not in self._waitingChannels:
+                    self._waitingChannels.append(self)
+                break
+            self.requestChunk(index)
+
+        if not self._replies and self.manifest.isComplete():
+            self.complete()
+
+    def createRequest(self):
+        request                             = NetworkRequest(Url(self.sourceUrl))
+        request.setAttribute(NetworkRequest.FollowRedirectsAttribute, True)
+        return request
+
+    def requestChunk(self, index):
+        start, end, written                 = self.manifest.chunks[index]
+        request                             = self.createRequest()
+        rangeStart                          = 0
+
+        if end < 0:
+            # unknown size, can not resume in the middle
+            self.manifest.chunks[index][2]  = 0
+            if self.file.size():
+                self.file.resize(0)
+        else:
+            rangeStart                      = start + written
+            request.setRawHeader(b'Range', 'bytes={0}-{1}'.format(rangeStart, end).encode('ascii'))
+            if self.manifest.etag:
+                # the server answers 200 with the whole file if it changed since the manifest was written
+                request.setRawHeader(b'If-Range', self.manifest.etag.encode('ascii'))
+
+        reply                               = self.networkManager.get(request)
+        reply.setReadBufferSize(READ_BUFFER_SIZE)
+        self._replies[reply]                = index
+        self._rangeStarts[reply]            = rangeStart
+
+        reply.readyRead.connect(lambda: self.drain(reply))
+        reply.finished.connect(lambda: self.drain(reply))
+
+    def drainAll(self):
+        for reply in list(self._replies):
+            self.drain(reply)
+
+    def drain(self, reply):
+        """ Move what the bandwidth limit allows from the reply buffer to the file """
+        if reply not in self._replies:
+            return
+
+        rangeStart                          = self._rangeStarts.pop(reply, None)
+        if rangeStart is not None:
+            status                          = reply.attribute(NetworkRequest.HttpStatusCodeAttribute)
+            if status == 200 and (rangeStart > 0 or len(self.manifest.chunks) > 1):
+                # range ignored or file changed on the server: the reply has the whole file from its first byte,
+                # even for chunk 0 of several, so it goes on as a single download and the other chunks are dropped
+                self.restart(reply)
+
+        index                               = self._replies[reply]
+        start, end, written                 = self.manifest.chunks[index]
+
+        available                           = reply.bytesAvailable()
+        if available > 0:
+            allowed                         = self.bandwidth.consume(available)
+            if allowed > 0:
+                data                        = bytes(reply.read(allowed))
+                self.file.seek(start + written)
+                self.file.write(data)
+                self.manifest.chunks[index][2] += len(data)
+                self._unsaved              += len(data)
+                self.bandwidth.refund(allowed - len(data))
+
+                if self._unsaved >= MANIFEST_INTERVAL:
+                    self.saveManifest()
+
+                self.downloadProgress.emit(self.manifest.loaded, self.manifest.size)
+
+            if reply.bytesAvailable() > 0 and not self.throttle.isActive():
+                self.throttle.start(max(10, int(self.bandwidth.delay(READ_BUFFER_SIZE) * 1000)))
+
+        if reply.isFinished() and reply.bytesAvailable() == 0:
+            self.chunkFinished(reply)
+
+    def chunkFinished(self, reply):
+        index                               = self._replies.pop(reply)
+        error                               = reply.error()
+        errorString                         = reply.errorString()
+        reply.deleteLater()
+        self.releaseConnection()
+
+        if error == NetworkReply.OperationCanceledError and self.state != 'downloading':
+            return
+
+        if error != NetworkReply.NoError:
+            self._failures[index]           = self._failures.get(index, 0) + 1
+            if self._failures[index] > self.retries:
+                return self.fail('Chunk {0} failed: {1}'.format(index, errorString))
+        elif self.manifest.chunks[index][1] < 0:
+            # open ended chunk is done when the server closes the reply
+            self.manifest.chunks[index][1]  = self.manifest.chunks[index][2] - 1
+            self.manifest.size              = self.manifest.chunks[index][2]
+
+        self.saveManifest()
+        self.schedule()
+
+    def restart(self, reply):
+        """ Drop the other connections and keep reply as the download of the whole file, from offset 0 """
+        self.abortReplies(keep=reply)
+        self.manifest.size                  = 0
+        self.manifest.etag                  = None
+        self.manifest.split()
+        self.connections                    = 1
+        self._replies[reply]                = 0
+        self.file.resize(0)
+        self.saveManifest()
+
+    def saveManifest(self):
+        self.file.flush()
+        self.manifest.save()
+        self._unsaved                       = 0
+
+    def complete(self):
+        self.state                          = 'verifying'
+        self.file.close()
+
+        worker                              = Worker(self.manifest.verify)
+        worker.grabber.result.connect(self.verified)
+        ThreadPool.globalInstance().start(worker)
+
+    def verified(self, result):
+        if self.state != 'verifying':
+            return
+
+        if not result:
+            self.state                      = 'failed'
+            os.remove(self.filePath)
+            self.manifest.remove()
+            return self.downloadFailed.emit('Checksum mismatch: {0}'.format(self.filePath))
+
+        self.state                          = 'finished'
+        self.manifest.remove()
+        self.totalSize                      = self.manifest.size
+        self.loadedSize                     = self.manifest.size
+        self.downloadFinished.emit(self.filePath)
+
+    def abortReplies(self, keep=None):
+        state                               = self.state
+        self.state                          = 'aborting'
+        for reply in list(self._replies):
+            if reply is keep:
+                continue
+            self._replies.pop(reply)
+            self._rangeStarts.pop(reply, None)
+            reply.abort()
+            reply.deleteLater()
+            self.releaseConnection()
+        self.state                          = state
+
+    def pause(self):
+        """ Stop every connection, the manifest keeps what has been written """
+        self.abortReplies()
+        self.state                          = 'paused'
+        if self.file:
+            self.saveManifest()
+            self.file.close()
+        if self in self._waitingChannels:
+            self._waitingChannels.remove(self)
+
+    def resume(self):
+        if self.state == 'paused':
+            self.start()
+
+    def fail(self, message):
+        self.pause()
+        self.state                          = 'failed'
+        self.downloadFailed.emit(message)
+
+    @property
+    def speed(self):
+        """ Average bytes per second since start """
+        if not self._startTime or not self.manifest:
+            return 0
+        return self.manifest.loaded / max(time.time() - self._startTime, 1e-3)
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 11:02 AM
+# © 2017 - 2020 DAMGteam. All rights reserved
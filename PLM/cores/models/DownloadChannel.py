@@ -10,10 +10,7 @@ Description:
 """
 # -------------------------------------------------------------------------------------------------------------
 
-import time, os
-from PLM import ROOT_APP
-from pyjavaproperties               import Properties
-p                                   = Properties().load(open(os.path.join(ROOT_APP, 'bin', 'text.properties')))
+import time
 
 from PLM.cores.base                         import Channel
 from pyPLM.Core import File, FileInfo, DownloadFile, IODevice
@@ -57,8 +54,10 @@ class DownloadChannel(Channel):
 
         if self.file.exists():
 
+            # looked up here: PLM.configs imports PLM.cores, a module level import would make a cycle
+            from PLM.configs                import configContext
             msgBox                          = MessageBox(self.networkManager.app.desktop(), 'File Existsed', 'warning',
-                                                         p['ASK_OVERWRITE'], ['Overwrite', 'Rename'])
+                                                         configContext.get('propText')['ASK_OVERWRITE'], ['Overwrite', 'Rename'])
             if self.resumable:
                 msgBox.setDefaultButton(msgBox.addBtn('Resume'))
 
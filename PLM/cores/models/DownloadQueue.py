@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: DownloadQueue.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Download queue for the NetworkManger. Downloads are started by priority (then by order of arrival) while
+    respecting a global limit of active downloads and a limit of connections per host. Bulk transfers share a token
+    bucket which keeps part of the bandwidth free for interactive traffic (sign in, server checks, browser...).
+
+    The queue keeps live throughput/ETA statistics and is saved to disk after every change, unfinished downloads are
+    put back in the queue on the next start and resume from their chunk manifest.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, json, time, itertools
+from collections                            import deque
+from urllib.parse                           import urlparse
+
+# PLM
+from PLM                                    import CFG_DIR, create_path
+from PLM.cores.models.ChunkedDownloadChannel import ChunkedDownloadChannel
+from pyPLM.damg                             import DAMG
+from pyPLM.Core                             import Signal, Timer
+
+
+DOWNLOAD_QUEUE                              = create_path(CFG_DIR, 'downloadQueue.json')
+
+PRIORITY_LOW                                = 0
+PRIORITY_NORMAL                             = 1
+PRIORITY_HIGH                               = 2
+
+STATS_WINDOW                                = 5.0               # seconds of samples used for the throughput
+
+
+class DownloadItem(object):
+
+    key                                     = 'DownloadItem'
+
+    _ids                                    = itertools.count(1)
+
+    def __init__(self, url, filePath, priority=PRIORITY_NORMAL, connections=4, checksum=None, state='queued',
+                       added=None, loaded=0, total=0, id=None):
+        super(DownloadItem, self).__init__()
+
+        self.id                             = id or next(self._ids)
+        self.url                            = url
+        self.filePath                       = filePath
+        self.priority                       = priority
+        self.connections                    = connections
+        self.checksum                       = checksum
+        self.state                          = state
+        self.added                          = added or time.time()
+        self.loaded                         = loaded
+        self.total                          = total
+        self.error                          = None
+
+        self.channel                        = None
+        self.usedConnections                = 0
+        self.samples                        = deque()
+
+    @property
+    def host(self):
+        return urlparse(self.url).netloc.lower()
+
+    @property
+    def sortKey(self):
+        return (-self.priority, self.added, self.id)
+
+    def addSample(self, loaded):
+        now                                 = time.monotonic()
+        self.samples.append((now, loaded))
+        while self.samples and now - self.samples[0][0] > STATS_WINDOW:
+            self.samples.popleft()
+
+    @property
+    def throughput(self):
+        """ bytes per second over the last few seconds """
+        if len(self.samples) < 2:
+            return 0.0
+        (t0, b0), (t1, b1)                  = self.samples[0], self.samples[-1]
+        return (b1 - b0) / max(t1 - t0, 1e-3)
+
+    @property
+    def eta(self):
+        """ seconds left, None if it can not be estimated """
+        speed                               = self.throughput
+        if not self.total or speed <= 0:
+            return None
+        return max(0.0, (self.total - self.loaded) / speed)
+
+    def toDict(self):
+        return dict(id=self.id, url=self.url, filePath=self.filePath, priority=self.priority,
+                    connections=self.connections, checksum=self.checksum, state=self.state, added=self.added,
+                    loaded=self.loaded, total=self.total)
+
+    @classmethod
+    def fromDict(cls, data):
+        return cls(**data)
+
+
+class DownloadQueue(DAMG):
+
+    key                                     = 'DownloadQueue'
+
+    itemChanged                             = Signal(int, name='itemChanged')
+    itemFinished                            = Signal(int, str, name='itemFinished')
+    itemFailed                              = Signal(int, str, name='itemFailed')
+    statsChanged                            = Signal(float, name='statsChanged')
+
+    maxActive                               = 3
+    perHostLimit                            = 4
+    interactiveShare                        = 0.2               # part of the bandwidth kept for interactive traffic
+
+    def __init__(self, manager=None, queueFile=DOWNLOAD_QUEUE):
+        super(DownloadQueue, self).__init__(manager)
+
+        self.networkManager                 = manager
+        self.queueFile                      = queueFile
+        self.items                          = dict()
+        self._bandwidthLimit                = 0
+        self._peakThroughput                = 0.0
+
+        self.statsTimer                     = Timer(self)
+        self.statsTimer.timeout.connect(self.updateStats)
+        self.statsTimer.start(1000)
+
+        self.load()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Queue """
+
+    def enqueue(self, url, filePath, priority=PRIORITY_NORMAL, connections=4, checksum=None):
+        item                                = DownloadItem(url, filePath, priority, connections, checksum)
+        self.items[item.id]                 = item
+        self.save()
+        self.itemChanged.emit(item.id)
+        self.schedule()
+        return item.id
+
+    def setPriority(self, itemID, priority):
+        self.items[itemID].priority         = priority
+        self.save()
+        self.schedule()
+
+    def pause(self, itemID):
+        item                                = self.items[itemID]
+        if item.channel:
+            item.channel.pause()
+            self.releaseItem(item)
+        item.state                          = 'paused'
+        self.save()
+        self.itemChanged.emit(itemID)
+        self.schedule()
+
+    def resume(self, itemID):
+        item                                = self.items[itemID]
+        if item.state in ['paused', 'failed']:
+            item.state                      = 'queued'
+            item.error                      = None
+            self.save()
+            self.itemChanged.emit(itemID)
+            self.schedule()
+
+    def remove(self, itemID):
+        item                                = self.items.get(itemID)
+        if item is None:
+            return
+        if item.channel:
+            item.channel.pause()
+            self.releaseItem(item)
+        del self.items[itemID]
+        self.save()
+        self.schedule()
+
+    def clearFinished(self):
+        for itemID in [i.id for i in self.items.values() if i.state == 'finished']:
+            del self.items[itemID]
+        self.save()
+
+    def queued(self):
+        return sorted([i for i in self.items.values() if i.state == 'queued'], key=lambda i: i.sortKey)
+
+    def active(self):
+        return [i for i in self.items.values() if i.state == 'downloading']
+
+    def hostConnections(self, host):
+        return sum(i.usedConnections for i in self.active() if i.host == host)
+
+    def schedule(self):
+        """ Start the most important queued items the global and per host limits allow """
+        for item in self.queued():
+            if len(self.active()) >= self.maxActive:
+                break
+
+            free                            = self.perHostLimit - self.hostConnections(item.host)
+            if free < 1:
+                # this host is busy, a less important item on another host may still start
+                continue
+
+            self.startItem(item, min(item.connections, free))
+
+    def startItem(self, item, connections):
+        channel                             = ChunkedDownloadChannel(item.url, self.networkManager, item.filePath,
+                                                                     connections, item.checksum)
+        channel.downloadProgress.connect(lambda loaded, total: self.progressed(item, loaded, total))
+        channel.downloadFinished.connect(lambda filePath: self.finished(item, filePath))
+        channel.downloadFailed.connect(lambda message: self.failed(item, message))
+
+        item.channel                        = channel
+        item.usedConnections                = connections
+        item.state                          = 'downloading'
+        item.samples.clear()
+        self.save()
+        self.itemChanged.emit(item.id)
+        channel.start()
+
+    def releaseItem(self, item):
+        if item.channel:
+            item.channel.deleteLater()
+        item.channel                        = None
+        item.usedConnections                = 0
+
+    def progressed(self, item, loaded, total):
+        item.loaded                         = loaded
+        item.total                          = total
+        item.addSample(loaded)
+
+    def finished(self, item, filePath):
+        item.state                          = 'finished'
+        item.loaded                         = item.total
+        self.releaseItem(item)
+        self.save()
+        self.itemFinished.emit(item.id, filePath)
+        self.schedule()
+
+    def failed(self, item, message):
+        item.state                          = 'failed'
+        item.error                          = message
+        self.releaseItem(item)
+        self.save()
+        self.itemFailed.emit(item.id, message)
+        self.schedule()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Bandwidth """
+
+    def setBandwidthLimit(self, rate, interactiveShare=None):
+        """
+        Cap the throughput of queued downloads.
+        :param rate: total bytes per second available, 0 for unlimited.
+        :param interactiveShare: part of 'rate' kept free for interactive requests (0 - 1).
+        """
+        if interactiveShare is not None:
+            self.interactiveShare           = min(max(interactiveShare, 0.0), 0.9)
+
+        self._bandwidthLimit                = max(0, int(rate or 0))
+        ChunkedDownloadChannel.setBandwidthLimit(int(self._bandwidthLimit * (1.0 - self.interactiveShare)))
+
+    def setLimits(self, maxActive=None, perHostLimit=None, maxConnections=None):
+        if maxActive is not None:
+            self.maxActive                  = max(1, int(maxActive))
+        if perHostLimit is not None:
+            self.perHostLimit               = max(1, int(perHostLimit))
+        if maxConnections is not None:
+            ChunkedDownloadChannel.setMaxConnections(maxConnections)
+        self.schedule()
+
+    @property
+    def bandwidthLimit(self):
+        return self._bandwidthLimit
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Statistics """
+
+    def throughput(self):
+        return sum(i.throughput for i in self.active())
+
+    def eta(self):
+        """ seconds until every queued and active item is done at the current speed """
+        speed                               = self.throughput()
+        remaining                           = sum(max(0, i.total - i.loaded) for i in self.items.values()
+                                                  if i.state in ['queued', 'downloading'])
+        if speed <= 0:
+            return None
+        return remaining / speed
+
+    def updateStats(self):
+        speed                               = self.throughput()
+        self._peakThroughput                = max(self._peakThroughput, speed)
+        if self.active():
+            self.statsChanged.emit(speed)
+
+    @property
+    def peakThroughput(self):
+        return self._peakThroughput
+
+    def stats(self):
+        return [dict(item.toDict(), throughput=item.throughput, eta=item.eta, error=item.error)
+                for item in sorted(self.items.values(), key=lambda i: i.sortKey)]
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Persistence """
+
+    def save(self):
+        folder = os.path.dirname(self.queueFile)
+        if not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        tmp                                 = '{0}.tmp'.format(self.queueFile)
+        with open(tmp, 'w') as f:
+            json.dump([i.toDict() for i in self.items.values()], f, indent=4)
+        os.replace(tmp, self.queueFile)
+
+    def load(self):
+        if not os.path.exists(self.queueFile):
+            return
+
+        try:
+            with open(self.queueFile, 'r') as f:
+                data = json.load(f)
+        except (ValueError, OSError):
+            return
+
+        for d in data:
+            item                            = DownloadItem.fromDict(d)
+            if item.state == 'downloading':
+                # interrupted by the last shutdown, the chunk manifest lets it resume
+                item.state                  = 'queued'
+            self.items[item.id]             = item
+
+        if self.items:
+            DownloadItem._ids               = itertools.count(max(self.items) + 1)
+
+    def shutdown(self):
+        """ Pause everything but keep the items queued so they restart next time """
+        for item in self.active():
+            item.channel.pause()
+            self.releaseItem(item)
+            item.state                      = 'queued'
+        self.save()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 11:40 AM
+# © 2017 - 2020 DAMGteam. All rights reserved
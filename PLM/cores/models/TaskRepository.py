@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: TaskRepository.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    The tasks of the task folder (.task files), read once and shared by every task view. A file is only read
+    again when it changed on disk. DeadlineClock is the one timer of the task views: it ticks every second and
+    the views compute their countdowns from it, instead of a timer per task.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, json, datetime
+
+# PLM
+from PLM                                    import TASK_DIR
+from pyPLM.damg                             import DAMG
+from pyPLM.Core                             import Signal, Timer
+
+
+TASK_EXT                                    = '.task'
+DATE_FORMATS                                = ['%d/%m/%y', '%d/%m/%Y']
+URGENT                                      = 24 * 3600
+
+STATUS_OVERDUE                              = 'Overdued'
+STATUS_URGENT                               = 'Urgent'
+
+
+def parse_deadline(enddate, endtime):
+    """ 'dd/MM/yy' (or yyyy) and 'hh:mm:ss' of a .task file, :return: datetime """
+    for format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime('{0} {1}'.format(enddate, endtime), format + ' %H:%M:%S')
+        except ValueError:
+            continue
+    raise ValueError('Can not read the deadline: {0} {1}'.format(enddate, endtime))
+
+
+def task_status(remaining):
+    """ Same labels as Task.get_status, from the seconds left """
+    if remaining <= 0:
+        return STATUS_OVERDUE
+    if remaining < URGENT:
+        return STATUS_URGENT
+    days                                    = int(remaining // URGENT)
+    if days <= 2:
+        return 'Tomorrow'
+    if days == 7:
+        return '1 Week'
+    return '{0} days'.format(days)
+
+
+def countdown_text(remaining):
+    """ 'h:mm:ss', hours over a day are kept as hours like the task countdown, '-' when overdue """
+    sign                                    = '-' if remaining < 0 else ''
+    seconds                                 = int(abs(remaining))
+    return '{0}{1}:{2:02d}:{3:02d}'.format(sign, seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+class TaskRecord(object):
+
+    """ Data of a .task file, the deadline parsed once """
+
+    __slots__                               = ['id', 'name', 'mode', 'type', 'teamID', 'projectID',
+                                               'organisationID', 'deadline', 'details', 'path', 'mtime']
+
+    def __init__(self, data, path=None, mtime=None):
+        self.id                             = data['id']
+        self.name                           = data.get('name')
+        self.mode                           = data.get('mode')
+        self.type                           = data.get('type')
+        self.teamID                         = data.get('teamID')
+        self.projectID                      = data.get('projectID')
+        self.organisationID                 = data.get('organisationID')
+        self.details                        = data.get('details', {})
+        self.deadline                       = parse_deadline(data['enddate'], data['endtime'])
+        self.path                           = path
+        self.mtime                          = mtime
+
+    def remaining(self, now):
+        return (self.deadline - now).total_seconds()
+
+    def status(self, now):
+        return task_status(self.remaining(now))
+
+    def countdown(self, now):
+        return countdown_text(self.remaining(now))
+
+
+class TaskRepository(DAMG):
+
+    key                                     = 'TaskRepository'
+
+    changed                                 = Signal()
+
+    def __init__(self, folder=TASK_DIR, parent=None):
+        super(TaskRepository, self).__init__(parent)
+
+        self.folder                         = folder
+        self.tasks                          = []
+        self.errors                         = dict()
+        self._byPath                        = dict()
+        self._currentUser                   = None
+        self.reload()
+
+    def reload(self):
+        """ Read the new and modified .task files, forget the removed ones. :return: True if anything changed """
+        found                               = dict()
+        try:
+            entries                         = list(os.scandir(self.folder))
+        except OSError:
+            entries                         = []
+        for entry in entries:
+            if entry.name.endswith(TASK_EXT) and entry.is_file():
+                found[entry.path.replace('\\', '/')] = entry.stat().st_mtime
+
+        changed                             = set(self._byPath) != set(found)
+        for path, mtime in found.items():
+            record                          = self._byPath.get(path)
+            if record is not None and record.mtime == mtime:
+                continue
+            try:
+                with open(path, 'r') as f:
+                    self._byPath[path]      = TaskRecord(json.load(f), path, mtime)
+                self.errors.pop(path, None)
+            except (IOError, OSError, ValueError, KeyError) as err:
+                self._byPath.pop(path, None)
+                self.errors[path]           = str(err)
+            changed                         = True
+
+        for path in set(self._byPath) - set(found):
+            del self._byPath[path]
+
+        if changed:
+            self.tasks                      = sorted(self._byPath.values(), key=lambda t: (t.deadline, t.id))
+            self.changed.emit()
+        return changed
+
+    def task(self, id):
+        for record in self.tasks:
+            if record.id == id:
+                return record
+        return None
+
+    @property
+    def currentUser(self):
+        """ Queried once for all the task views """
+        if self._currentUser is None:
+            from PLM.cores.data import sqlUtils
+            try:
+                self._currentUser           = sqlUtils().query_table('curUser')[0]
+            except (ValueError, IndexError):
+                self._currentUser           = ''
+        return self._currentUser
+
+
+class DeadlineClock(DAMG):
+
+    """ One timer for every countdown: tick is emitted every second with the current datetime """
+
+    key                                     = 'DeadlineClock'
+
+    tick                                    = Signal(object)
+
+    def __init__(self, interval=1000, parent=None):
+        super(DeadlineClock, self).__init__(parent)
+
+        self.timer                          = Timer()
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.emitTick)
+        self._users                         = 0
+
+    def now(self):
+        return datetime.datetime.now()
+
+    def emitTick(self):
+        self.tick.emit(self.now())
+
+    def acquire(self):
+        """ Runs while at least one view uses it """
+        self._users                         += 1
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def release(self):
+        self._users                         = max(0, self._users - 1)
+        if not self._users:
+            self.timer.stop()
+
+
+_repository                                 = None
+_clock                                      = None
+
+
+def taskRepository():
+    global _repository
+    if _repository is None:
+        _repository                         = TaskRepository()
+    return _repository
+
+
+def deadlineClock():
+    global _clock
+    if _clock is None:
+        _clock                              = DeadlineClock()
+    return _clock
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 7:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
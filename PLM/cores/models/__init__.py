@@ -11,10 +11,13 @@ Description:
 # -------------------------------------------------------------------------------------------------------------
 
 
+from .ChunkedDownloadChannel import ChunkedDownloadChannel, DownloadManifest
 from .DownloadChannel   import DownloadChannel
+from .DownloadQueue     import DownloadQueue, DownloadItem
 from .Organisation      import Organisation
 from .Project           import Project
 from .Task              import Task
+from .TaskRepository    import TaskRepository, TaskRecord, DeadlineClock, taskRepository, deadlineClock
 from .Team              import Team
 from .Temporary         import Temporary
 from .Threads           import PcMonitor, ConnectMonitor, SplashMonitor
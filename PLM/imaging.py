@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: imaging.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Image helpers which only need the standard library and PIL. The thumbnail service and the library index run
+    them in worker processes, keep Qt out of this module. A worker also imports the PLM package (no Qt either) and,
+    when processes are spawned (Windows, macOS), the main script again: app.py keeps its imports inside main().
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, struct, hashlib
+
+
+SIZE_CLASSES                            = { 'small'     : 64,
+                                            'medium'    : 128,
+                                            'large'     : 256,
+                                            'xlarge'    : 512, }
+
+THUMBNAIL_EXT                           = '.png'
+
+IMAGE_EXTS                              = ['.bmp', '.exr', '.gif', '.hdr', '.jpeg', '.jpg', '.png', '.psd', '.tga',
+                                           '.tif', '.tiff', '.webp']
+
+# bits per channel of the PIL modes
+MODE_DEPTHS                             = { '1': 1, 'I;16': 16, 'I;16B': 16, 'I;16L': 16, 'I': 32, 'F': 32, }
+# bits per channel of the EXR pixel types: uint, half, float
+EXR_DEPTHS                              = { 0: 32, 1: 16, 2: 32, }
+EXR_MAGIC                               = 20000630
+HASH_CHUNK                              = 1024 * 1024
+
+
+def thumbnail_key(path, mtime, fileSize, sizeClass):
+    """ Cache key of a thumbnail: the source path, its modification time and size, the size class """
+    path                                = os.path.normcase(os.path.abspath(path)).replace('\\', '/')
+    data                                = '{0}|{1}|{2}|{3}'.format(path, mtime, fileSize, sizeClass)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def thumbnail_path(cacheDir, key, sizeClass):
+    """ <cacheDir>/<sizeClass>/<2 first characters of the key>/<key>.png """
+    return os.path.join(cacheDir, sizeClass, key[:2], key + THUMBNAIL_EXT).replace('\\', '/')
+
+
+def make_thumbnail(src, dst, size):
+    """
+    Write a thumbnail of src which fits in a size x size square, keeping its aspect ratio.
+    :return: dst
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(src) as image:
+        # jpeg can decode at a reduced scale, much faster for big photos and textures
+        image.draft('RGB', (size, size))
+        image                           = ImageOps.exif_transpose(image)
+        if image.mode not in ['RGB', 'RGBA']:
+            hasAlpha                    = 'A' in image.getbands() or 'transparency' in image.info
+            image                       = image.convert('RGBA' if hasAlpha else 'RGB')
+        image.thumbnail((size, size), Image.LANCZOS)
+
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        # written aside then renamed, a reader never sees half a file
+        tmp                             = '{0}.{1}.tmp'.format(dst, os.getpid())
+        image.save(tmp, 'PNG')
+        os.replace(tmp, dst)
+
+    return dst
+
+
+def file_hash(path):
+    """ sha1 of the content of a file, read by chunks """
+    digest                              = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def exr_info(path):
+    """ Size and channels of an OpenEXR file, read from its header only: :return: (width, height, channels, bits) """
+    with open(path, 'rb') as f:
+        magic, version                  = struct.unpack('<ii', f.read(8))
+        if magic != EXR_MAGIC:
+            raise ValueError('Not an OpenEXR file: {0}'.format(path))
+
+        width = height                  = None
+        channels, depth                 = 0, 0
+        while True:
+            name                        = _read_cstring(f)
+            if not name:
+                break
+            kind                        = _read_cstring(f)
+            size                        = struct.unpack('<i', f.read(4))[0]
+            value                       = f.read(size)
+            if name == 'dataWindow' and kind == 'box2i':
+                xMin, yMin, xMax, yMax  = struct.unpack('<iiii', value)
+                width, height           = xMax - xMin + 1, yMax - yMin + 1
+            elif name == 'channels' and kind == 'chlist':
+                # name \0, pixel type (int), pLinear + reserved (4 bytes), x/y sampling (2 ints), ends with \0
+                pos                     = 0
+                while value[pos:pos + 1] not in [b'\x00', b'']:
+                    end                 = value.index(b'\x00', pos)
+                    pixelType           = struct.unpack('<i', value[end + 1:end + 5])[0]
+                    depth               = max(depth, EXR_DEPTHS.get(pixelType, 32))
+                    channels            += 1
+                    pos                 = end + 17
+
+    if width is None:
+        raise ValueError('No data window in {0}'.format(path))
+    return width, height, channels, depth
+
+
+def hdr_info(path):
+    """ Size of a Radiance HDR file, read from its header: :return: (width, height, channels, bits) """
+    with open(path, 'rb') as f:
+        if not f.readline().startswith(b'#?'):
+            raise ValueError('Not a Radiance HDR file: {0}'.format(path))
+        # header lines until an empty one, then the resolution: '-Y <height> +X <width>'
+        for line in f:
+            if not line.strip():
+                break
+        parts                           = f.readline().split()
+    if len(parts) != 4:
+        raise ValueError('No resolution in {0}'.format(path))
+    sizes                               = {parts[0][1:2]: int(parts[1]), parts[2][1:2]: int(parts[3])}
+    return sizes[b'X'], sizes[b'Y'], 3, 32
+
+
+def image_info(path):
+    """
+    Metadata of an image for the library index. Only the header is read, except for the hash.
+    :return: dict of width, height, channels, bitDepth, fileSize, mtime, hash and error (None, or why the header
+             could not be read, the file is still listed). None if the file can not be read at all.
+    """
+    try:
+        stat                            = os.stat(path)
+    except OSError:
+        return None
+    info                                = dict(path=path, fileSize=stat.st_size, mtime=stat.st_mtime, width=None,
+                                               height=None, channels=None, bitDepth=None, hash=None, error=None)
+    ext                                 = os.path.splitext(path)[1].lower()
+    try:
+        if ext == '.exr':
+            size                        = exr_info(path)
+        elif ext == '.hdr':
+            size                        = hdr_info(path)
+        else:
+            from PIL import Image
+            with Image.open(path) as image:
+                size                    = (image.width, image.height, len(image.getbands()),
+                                           MODE_DEPTHS.get(image.mode, 8))
+        info['width'], info['height'], info['channels'], info['bitDepth'] = size
+    except Exception as err:
+        info['error']                   = '{0}: {1}'.format(err.__class__.__name__, err)
+
+    try:
+        info['hash']                    = file_hash(path)
+    except OSError:
+        return None
+    return info
+
+
+def _read_cstring(f):
+    chars                               = bytearray()
+    while True:
+        char                            = f.read(1)
+        if char in [b'\x00', b'']:
+            return chars.decode('latin-1')
+        chars                           += char
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 5:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -293,6 +293,8 @@ KEY_CTRL                    = Qt.Key_Control
 KEY_BACKSPACE               = Qt.Key_Backspace
 KEY_ENTER                   = Qt.Key_Enter
 KEY_RETURN                  = Qt.Key_Return
+KEY_UP                      = Qt.Key_Up
+KEY_DOWN                    = Qt.Key_Down
 KEY_F                       = Qt.Key_F
 KEY_S                       = Qt.Key_S
 ALT_MODIFIER                = Qt.AltModifier
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: __init__.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Platform services: the backend of the running OS is imported the first time platformServices() is called.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import sys, importlib
+
+from .base                              import PlatformServices
+
+
+BACKENDS                                = { 'win32'     : ('windows', 'WindowsServices'),
+                                            'linux'     : ('linux', 'LinuxServices'),
+                                            'darwin'    : ('linux', 'LinuxServices'), }
+
+_services                               = None
+
+
+def platformServices():
+    global _services
+    if _services is None:
+        backend                         = BACKENDS.get(sys.platform)
+        if backend is None:
+            _services                   = PlatformServices()
+        else:
+            module                      = importlib.import_module('.{0}'.format(backend[0]), __name__)
+            _services                   = getattr(module, backend[1])()
+    return _services
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 4:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: base.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Everything PLM needs from the operating system, one backend per platform. The backends import their OS
+    modules (winshell, win32api, Qt) inside the methods, so loading them costs nothing until a service is used.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os
+
+
+DEFAULT_RESOLUTION                      = (1920, 1080)
+
+_logger                                 = None
+
+
+def logger():
+    """ Made on first use: PLM imports the platforms before its log file is known """
+    global _logger
+    if _logger is None:
+        from PLM import APP_LOG
+        from pyPLM.loggers import DamgLogger
+        _logger                         = DamgLogger(__name__, filepth=APP_LOG)
+    return _logger
+
+
+class PlatformServices(object):
+
+    key                                 = 'PlatformServices'
+    name                                = 'generic'
+
+    def __init__(self):
+        super(PlatformServices, self).__init__()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Directories """
+
+    def appDataDir(self):
+        """ Per user application data, PLM keeps its database, settings and logs in there """
+        return os.path.expanduser('~').replace('\\', '/')
+
+    def desktopDir(self):
+        return os.path.join(os.path.expanduser('~'), 'Desktop').replace('\\', '/')
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Environment """
+
+    def setUserEnv(self, key, value):
+        """
+        Keep the variable for the next sessions of the user, like SetX the running process is not changed.
+        :return: True when the platform could store it.
+        """
+        return False
+
+    def removeUserEnv(self, key):
+        return False
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Shell """
+
+    def programShortcuts(self):
+        """ :return: dict of installed programs, name: executable path """
+        shortcuts                       = dict()
+        for folder in self.shortcutDirs():
+            shortcuts.update(self.folderShortcuts(folder))
+        return shortcuts
+
+    def shortcutDirs(self):
+        """ Folders of the program shortcuts, a program of a later folder wins """
+        return []
+
+    def folderShortcuts(self, folder):
+        """ :return: dict of the programs of one folder, name: executable path """
+        return dict()
+
+    def knownPrograms(self):
+        """ :return: dict of programs without a shortcut which PLM looks for at fixed places, name: executable path """
+        return dict()
+
+    def createShortcut(self, target, icon, shortcut, description):
+        """ :return: the shortcut made, False when the platform can not make one """
+        logger().warning('{0} can not create shortcuts: {1}'.format(self.name, shortcut))
+        return False
+
+    def openPath(self, path):
+        """ Open a folder or a file with the program the desktop uses for it, :return: True when it was handed over """
+        try:
+            from PySide2.QtCore import QUrl
+            from PySide2.QtGui import QDesktopServices
+        except ImportError:
+            return False
+        return QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Display """
+
+    def screenResolution(self):
+        """ Primary screen size, from Qt when an application is running """
+        try:
+            from PySide2.QtGui import QGuiApplication
+        except ImportError:
+            return DEFAULT_RESOLUTION
+
+        if QGuiApplication.instance() is None or QGuiApplication.primaryScreen() is None:
+            return DEFAULT_RESOLUTION
+
+        size                            = QGuiApplication.primaryScreen().size()
+        return size.width(), size.height()
+
+    def taskbarSize(self):
+        """ Size of the system bar, the difference between the screen and its available geometry """
+        resW, resH                      = self.screenResolution()
+        try:
+            from PySide2.QtGui import QGuiApplication
+        except ImportError:
+            return resW, 0
+
+        screen                          = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+        if screen is None:
+            return resW, 0
+        return resW, resH - screen.availableGeometry().height()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 4:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: linux.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Linux (and other posix) backend: XDG folders, freedesktop .desktop entries for the installed programs and the
+    shortcuts. Environment variables only live in the process, there is no user registry to write them to.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sys, shlex, subprocess
+from configparser                       import ConfigParser, Error
+
+# PLM
+from .base                              import PlatformServices
+
+
+DESKTOP_ENTRY                           = 'Desktop Entry'
+
+
+def read_desktop_entry(filePth):
+    """ :return: (name, executable) of a .desktop file, None if it is not an application """
+    parser                              = ConfigParser(interpolation=None, strict=False)
+    try:
+        parser.read(filePth, encoding='utf-8')
+    except (Error, UnicodeDecodeError):
+        return None
+
+    if not parser.has_section(DESKTOP_ENTRY):
+        return None
+    entry                               = parser[DESKTOP_ENTRY]
+    if entry.get('Type') != 'Application' or entry.get('NoDisplay', 'false') == 'true' or not entry.get('Exec'):
+        return None
+
+    try:
+        command                         = [a for a in shlex.split(entry['Exec']) if not a.startswith('%')]
+    except ValueError:
+        return None
+    return (entry.get('Name'), command[0]) if command and entry.get('Name') else None
+
+
+class LinuxServices(PlatformServices):
+
+    key                                 = 'LinuxServices'
+    name                                = 'linux'
+
+    def appDataDir(self):
+        return (os.getenv('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')).replace('\\', '/')
+
+    def applicationDirs(self):
+        dataDirs                        = (os.getenv('XDG_DATA_DIRS') or '/usr/local/share:/usr/share').split(':')
+        return [os.path.join(d, 'applications') for d in dataDirs + [self.appDataDir()] if d]
+
+    def shortcutDirs(self):
+        """ Later folders win, the user's own entries are read last """
+        return [folder for folder in self.applicationDirs() if os.path.isdir(folder)]
+
+    def folderShortcuts(self, folder):
+        shortcuts                       = dict()
+        if not os.path.isdir(folder):
+            return shortcuts
+        for name in sorted(os.listdir(folder)):
+            if not name.endswith('.desktop'):
+                continue
+            entry                       = read_desktop_entry(os.path.join(folder, name))
+            if entry:
+                shortcuts[entry[0]]     = entry[1]
+        return shortcuts
+
+    def openPath(self, path):
+        """ xdg-open, 'open' on macOS """
+        opener                          = 'open' if sys.platform == 'darwin' else 'xdg-open'
+        try:
+            subprocess.Popen([opener, path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                             start_new_session=True)
+        except OSError:
+            return super(LinuxServices, self).openPath(path)
+        return True
+
+    def createShortcut(self, target, icon, shortcut, description):
+        name, _                         = os.path.splitext(shortcut)
+        filePth                         = os.path.join(self.desktopDir(), '{0}.desktop'.format(name))
+        os.makedirs(os.path.dirname(filePth), exist_ok=True)
+        with open(filePth, 'w') as f:
+            f.write('[{0}]\nType=Application\nName={1}\nComment={2}\nExec={3}\nIcon={4}\n'.format(
+                     DESKTOP_ENTRY, name, description, shlex.quote(target), icon))
+        os.chmod(filePth, 0o755)
+        return filePth
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 4:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
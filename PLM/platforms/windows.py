@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: windows.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Windows backend: LOCALAPPDATA, SetX/registry for persistent variables, winshell for the start menu and the
+    desktop shortcuts, win32api for the screen.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, subprocess
+
+# PLM
+from .base                              import PlatformServices
+
+
+class WindowsServices(PlatformServices):
+
+    key                                 = 'WindowsServices'
+    name                                = 'windows'
+
+    def appDataDir(self):
+        return (os.getenv('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')).replace('\\', '/')
+
+    def desktopDir(self):
+        import winshell
+        return winshell.desktop().replace('\\', '/')
+
+    def setUserEnv(self, key, value):
+        subprocess.Popen('SetX {0} "{1}"'.format(key, value), stdout=subprocess.PIPE, shell=True).communicate()
+        return True
+
+    def removeUserEnv(self, key):
+        subprocess.Popen('REG delete HKCU\\Environment /F /V {0}'.format(key), shell=True).wait()
+        return True
+
+    def shortcutDirs(self):
+        """ The start menu programs and their sub folders, in the order of their relative paths """
+        import winshell
+        programs                        = winshell.programs(common=1)
+        return sorted((path for path, dirs, names in os.walk(programs)), key=lambda p: p[len(programs) + 1:])
+
+    def folderShortcuts(self, folder):
+        import winshell
+        shortcuts                       = dict()
+        if not os.path.isdir(folder):
+            return shortcuts
+        for name in os.listdir(folder):
+            path                        = os.path.join(folder, name)
+            if os.path.isfile(path):
+                lnk                     = winshell.shortcut(path)
+                shortcuts[str(os.path.splitext(name)[0])] = lnk.path
+        return shortcuts
+
+    def knownPrograms(self):
+        programs                        = dict()
+        programData                     = os.getenv('PROGRAMDATA')
+        programFiles                    = os.getenv('PROGRAMFILES')
+        if programData:
+            programs['QtDesigner']      = os.path.join(programData, 'Anaconda3', 'Library', 'bin', 'designer.exe')
+        if programFiles:
+            programs['Davinci Resolve'] = os.path.join(programFiles, 'Blackmagic Design', 'DaVinci Resolve',
+                                                       'resolve.exe')
+        return programs
+
+    def openPath(self, path):
+        try:
+            os.startfile(path)
+        except OSError:
+            return False
+        return True
+
+    def createShortcut(self, target, icon, shortcut, description):
+        import winshell
+        filePth                         = os.path.join(winshell.desktop(), shortcut)
+        winshell.CreateShortcut(Path=filePth, Target=target, Icon=(icon, 0), Description=description)
+        return filePth
+
+    def screenResolution(self):
+        import win32api
+        return win32api.GetSystemMetrics(0), win32api.GetSystemMetrics(1)
+
+    def taskbarSize(self):
+        import win32api
+        resW, resH                      = self.screenResolution()
+        monitors                        = win32api.EnumDisplayMonitors()
+        display1                        = win32api.GetMonitorInfo(monitors[0][0])
+        return resW, resH - display1['Work'][3]
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 4:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
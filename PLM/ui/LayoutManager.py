@@ -17,7 +17,7 @@ from pyPLM.damg import DAMG, DAMGLIST
 
 from PLM.cores                          import EventManager
 
-from PLM.ui.base                        import BaseManager, ImageAvatar, PixAvatar
+from PLM.ui.base                        import BaseManager
 from PLM.ui.layouts                     import (ForgotPassword, SignUp, SignIn, InfoWidget, VFXProject, SettingUI,
                                                 UserSetting, Preferences, Configurations)
 from PLM.ui.models                      import ActionManager, ButtonManager, RegistryLayout, CommandUI
@@ -26,7 +26,7 @@ from .SysTray                           import SysTray
 
 
 from PLM.ui.tools                       import (Calendar, Calculator, EnglishDictionary, FindFiles, ImageViewer,
-                                                NoteReminder, ScreenShot, TextEditor)
+                                                JobsPanel, LogViewer, NoteReminder, ScreenShot, TextEditor)
 
 
 class LayoutManager(DAMG):
@@ -174,6 +174,8 @@ class LayoutManager(DAMG):
         self.engDict                        = EnglishDictionary()
         self.findFile                       = FindFiles()
         self.imageViewer                    = ImageViewer()
+        self.jobsPanel                      = JobsPanel()
+        self.logViewer                      = LogViewer()
         self.noteReminder                   = NoteReminder()
         self.preferences                    = Preferences()
         self.screenShot                     = ScreenShot()
@@ -185,7 +187,7 @@ class LayoutManager(DAMG):
         self.teamManager                    = BaseManager('TeamManager')
 
         layouts     = [self.calculator, self.calendar, self.configuration, self.engDict, self.findFile,
-                       self.imageViewer, self.noteReminder, self.preferences, self.screenShot,
+                       self.imageViewer, self.jobsPanel, self.logViewer, self.noteReminder, self.preferences, self.screenShot,
                        self.textEditor, self.taskManager, self.orgManager, self.prjManager, self.teamManager]
 
         for layout in layouts:
@@ -253,20 +255,8 @@ class LayoutManager(DAMG):
                 layout.setUsesScrollButtons(True)
 
     def updateAvatar(self, pth):
-
-        self.mainUI.midTabDock.tabs.tab2.avatarGrp.avatar.imageAvatar = ImageAvatar(pth)
-        self.mainUI.midTabDock.tabs.tab2.avatarGrp.avatar.pixAvatar = PixAvatar()
-        image = self.mainUI.midTabDock.tabs.tab2.avatarGrp.avatar.imageAvatar
-        pixmap = self.mainUI.midTabDock.tabs.tab2.avatarGrp.avatar.pixAvatar
-        self.mainUI.midTabDock.tabs.tab2.avatarGrp.avatar.setPixmap(pixmap.fromImage(image))
-        self.mainUI.midTabDock.tabs.tab2.avatarGrp.avatar.update()
-
-        self.userSetting.avatarGrp.avatar.imageAvatar = ImageAvatar(pth)
-        self.userSetting.avatarGrp.avatar.pixAvatar = PixAvatar()
-        image = self.userSetting.avatarGrp.avatar.imageAvatar
-        pixmap = self.userSetting.avatarGrp.avatar.pixAvatar
-        self.userSetting.avatarGrp.avatar.setPixmap(pixmap.fromImage(image))
-        self.userSetting.avatarGrp.avatar.update()
+        self.mainUI.midTabDock.tabs.tab2.avatarGrp.avatar.loadAvatar(pth)
+        self.userSetting.avatarGrp.avatar.loadAvatar(pth)
 
     @property
     def buildAll(self):
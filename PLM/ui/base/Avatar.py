@@ -18,8 +18,9 @@ from PySide2.QtWidgets            import QFileDialog
 from pyPLM.Core import Size
 from pyPLM.Gui import Image, Pixmap
 from pyPLM.Widgets import Label, GroupBox, Button, VBoxLayout
-from PLM.options import AUTO_COLOR, center, ASPEC_RATIO
+from PLM.options import center, ASPEC_RATIO
 from PLM.cores.data import sqlUtils
+from PLM.cores import thumbnailService
 from pyPLM.configs import get_avatar_image
 from PLM.configs import USER_LOCAL_DATA
 
@@ -62,13 +63,25 @@ class AvatarLabel(Label):
     def __init__(self, parent=None):
         super(AvatarLabel, self).__init__()
         self.parent             = parent
-        self.pixAvatar          = PixAvatar()
-        self.imageAvatar        = ImageAvatar(get_avatar_image(username))
-        self.setPixmap(self.pixAvatar.fromImage(self.imageAvatar, AUTO_COLOR))
+        self.avatarPath         = None
         self.setScaledContents(True)
         self.setAlignment(center)
+        self.loadAvatar(get_avatar_image(username))
+
+    def loadAvatar(self, path):
+        """ Decoded by the thumbnail service, a placeholder is shown until it is ready """
+        if not path or not os.path.exists(path):
+            path                = get_avatar_image('default')
+        self.avatarPath         = path
+        self.setPixmap(thumbnailService.request(path, 'large', lambda pixmap: self.avatarReady(path, pixmap)))
         self.update()
 
+    def avatarReady(self, path, pixmap):
+        # an older avatar finishing late is not shown
+        if path == self.avatarPath:
+            self.setPixmap(pixmap)
+            self.update()
+
     def resizeEvent(self, event):
         size                    = Size(1, 1)
         size.scale(100, 100, ASPEC_RATIO)
@@ -123,10 +136,7 @@ class Avatar(GroupBox):
             if self.app:
                 self.app.updateAvatar(a)
             else:
-                self.avatar.imageAvatar = ImageAvatar(a)
-                self.avatar.pixAvatar = PixAvatar()
-                self.avatar.setPixmap(self.avatar.pixAvatar.fromImage(self.avatar.imageAvatar, AUTO_COLOR))
-                self.avatar.update()
+                self.avatar.loadAvatar(a)
         else:
             pass
 
@@ -143,15 +153,20 @@ class InfoPicLabel(Label):
         super(InfoPicLabel, self).__init__()
 
         self.parent = parent
+        self.picturePath = None
 
     def updatePicture(self, image):
-        pix                         = PixAvatar()
-        img                         = ImageAvatar(image)
-        self.setPixmap(pix.fromImage(img, AUTO_COLOR))
+        self.picturePath            = image
+        self.setPixmap(thumbnailService.request(image, 'xlarge', lambda pixmap: self.pictureReady(image, pixmap)))
         self.setScaledContents(True)
         self.setAlignment(center)
         self.update()
 
+    def pictureReady(self, image, pixmap):
+        if image == self.picturePath:
+            self.setPixmap(pixmap)
+            self.update()
+
     def resizeEvent(self, event):
         size                        = Size(1, 1)
         size.scale(self.size(), ASPEC_RATIO)
@@ -16,14 +16,41 @@ from functools                          import partial
 # PLM
 from PLM.cores.base.BaseStorage import BaseStorage
 from pyPLM.Widgets import Action, Button
+from pyPLM.Gui                          import AppIcon
 from PLM.utils                          import is_string, is_action, is_button
 from PLM.cores.Errors                   import ActionKeyConfigError, ActionRegisterError, ButtonRegisterError
-from PLM.configs                        import ConfigPipeline, ConfigUiKeys
+from PLM.configs                        import configPipeline, configContext, ConfigUiKeys
+from PLM.cores                          import catalogueService
 
 
-plmInfo                                 = ConfigPipeline()
+plmInfo                                 = configPipeline()
 uiKey                                   = ConfigUiKeys()
 
+# every command key, looked up once: 'k in pipelineKeys' instead of scanning the pipeline keys for each k
+pipelineKeys                            = frozenset(plmInfo.keys())
+
+
+def refresh_keys():
+    """ The pipeline commands changed: programs were installed or removed, or the pipeline was built again """
+    global plmInfo, pipelineKeys
+    plmInfo                             = configPipeline()
+    pipelineKeys                        = frozenset(plmInfo.keys())
+    BaseKeys.checkedKeys                = pipelineKeys
+
+
+def config_reloaded(names):
+    """ ReConfig: configContext.reload() made a new pipeline, the keys of the old one are stale """
+    if 'pipeline' in names:
+        refresh_keys()
+
+
+configContext.onReload(config_reloaded)
+
+
+def available(keys, exclude=()):
+    """ keys of a ConfigUiKeys list which the pipeline has (apps installed...), in their order """
+    return [k for k in keys if k in pipelineKeys and k not in exclude]
+
 
 class BaseKeys(BaseStorage):
 
@@ -35,10 +62,10 @@ class BaseKeys(BaseStorage):
     editActions                         = uiKey.SHORTCUT_KEYS
     viewActions                         = ['ShowAll']
     stylesheetActions                   = uiKey.STYLESHEET_KEYS
-    officeActions                       = ['TextEditor', 'NoteReminder'] + [k for k in uiKey.CONFIG_OFFICE if k in plmInfo.keys()]
+    officeActions                       = ['TextEditor', 'NoteReminder'] + available(uiKey.CONFIG_OFFICE)
 
-    devActions                          = [k for k in uiKey.CONFIG_DEV if k in tuple(plmInfo.keys()) and not k in ['QtDesigner']]
-    toolsActions                        = [k for k in uiKey.CONFIG_TOOLS if k in tuple(plmInfo.keys())] + ['CleanPyc', 'ReConfig', 'Debug', ] + devActions
+    devActions                          = available(uiKey.CONFIG_DEV, exclude=['QtDesigner'])
+    toolsActions                        = available(uiKey.CONFIG_TOOLS) + ['CleanPyc', 'ReConfig', 'Debug', ] + devActions
 
     pluginActions                       = uiKey.PLUGIN_UI_KEY
     formActions                         = uiKey.FORM_KEY
@@ -47,13 +74,13 @@ class BaseKeys(BaseStorage):
     helpActions                         = ['PLM wiki', 'About', 'CodeOfConduct', 'Contributing', 'Credit', 'References',
                                            'Version', 'FeedBack', ] + formActions
 
-    artActions                          = [k for k in uiKey.CONFIG_ART if k in plmInfo.keys()]
-    tdActions                           = [k for k in uiKey.CONFIG_TDS if k in plmInfo.keys()]
-    vfxActions                          = [k for k in uiKey.CONFIG_VFX if k in plmInfo.keys()]
-    texActions                          = [k for k in uiKey.CONFIG_TEX if k in plmInfo.keys()]
-    postActions                         = [k for k in uiKey.CONFIG_POST if k in plmInfo.keys()]
-    preActions                          = [k for k in uiKey.CONFIG_PRE if k in plmInfo.keys()]
-    extraActions                        = [k for k in uiKey.CONFIG_EXTRA if k in tuple(plmInfo.keys())]
+    artActions                          = available(uiKey.CONFIG_ART)
+    tdActions                           = available(uiKey.CONFIG_TDS)
+    vfxActions                          = available(uiKey.CONFIG_VFX)
+    texActions                          = available(uiKey.CONFIG_TEX)
+    postActions                         = available(uiKey.CONFIG_POST)
+    preActions                          = available(uiKey.CONFIG_PRE)
+    extraActions                        = available(uiKey.CONFIG_EXTRA)
 
     sysTrayActions                      = ['Minimize', 'Restore', 'Maximize', 'Snipping Tool', 'ScreenShot', 'Exit', 'SignIn']
 
@@ -63,12 +90,23 @@ class BaseKeys(BaseStorage):
     managerButtons                      = ['Organisation', 'Project', 'Team', 'Task']
     userButtons                         = ['UserSetting', 'LogIn', 'SwitchAccount', 'LogOut']
 
-    checkedKeys                         = [k for k in plmInfo.keys()]
+    checkedKeys                         = pipelineKeys
+    openUrlKeys                         = frozenset(uiKey.OPEN_URL_KEYS)
+
+    # toolbar: the config keys it shows, a program installed later goes to its toolbar
+    toolBarKeys                         = {'TD': uiKey.CONFIG_TDS, 'PRE': uiKey.CONFIG_PRE, 'VFX': uiKey.CONFIG_VFX,
+                                           'ART': uiKey.CONFIG_ART, 'TEX': uiKey.CONFIG_TEX, 'POST': uiKey.CONFIG_POST,
+                                           'MCO': uiKey.CONFIG_OFFICE, 'DEV': uiKey.CONFIG_DEV,
+                                           'TOOL': uiKey.CONFIG_TOOLS, 'EXTRA': uiKey.CONFIG_EXTRA, }
 
     def __init__(self, parent=None):
         super(BaseKeys, self).__init__()
         self.parent                     = parent
 
+        # command key: the widgets made for it
+        self.commandWidgets             = dict()
+        catalogueService().commandsChanged.connect(self.commandsChanged)
+
     def keyConfigError(self, key):
         return ActionKeyConfigError('Key is not in plmInfo: {0}'.format(key))
 
@@ -81,37 +119,35 @@ class BaseKeys(BaseStorage):
     def createActions(self, keys, parent):
         actions = []
         for key in keys:
-            if key in self.checkedKeys:
-                if is_string(key):
-                    action = self.createAction(key, parent)
-                    actions.append(action)
-                elif is_action(key):
-                    action = key
-                    action.setParent(parent)
-                    self.register(action)
-                    actions.append(action)
+            if is_string(key):
+                if key in self.checkedKeys:
+                    actions.append(self.createAction(key, parent))
                 else:
-                    self.actionRegisterError(key)
+                    self.keyConfigError(key)
+            elif is_action(key):
+                action = key
+                action.setParent(parent)
+                self.register(action)
+                actions.append(action)
             else:
-                self.keyConfigError(key)
+                self.actionRegisterError(key)
         return actions
 
     def createButtons(self, keys, parent):
         buttons = []
         for key in keys:
-            if key in self.checkedKeys:
-                if is_string(key):
-                    button = self.createButton(key, parent)
-                    buttons.append(button)
-                elif is_button(key):
-                    button = key
-                    button.setParent(parent)
-                    self.register(Button)
-                    buttons.append(Button)
+            if is_string(key):
+                if key in self.checkedKeys:
+                    buttons.append(self.createButton(key, parent))
                 else:
-                    self.actionRegisterError(key)
+                    self.keyConfigError(key)
+            elif is_button(key):
+                button = key
+                button.setParent(parent)
+                self.register(button)
+                buttons.append(button)
             else:
-                self.keyConfigError(key)
+                self.buttonRegisterError(key)
         return buttons
 
     def createAction(self, key, parent):
@@ -120,41 +156,51 @@ class BaseKeys(BaseStorage):
         return self.action(key, parent)
 
     def createButton(self, key, parent):
-        if key in uiKey.OPEN_URL_KEYS:
+        if key in self.openUrlKeys:
             return self.openUrlButton(key, parent)
         else:
             return self.button(key, parent)
 
+    def cached(self, parent, key, kind):
+        """ The widget made before for this (parent, command key), widgets are only built the first time """
+        return self.get('{0}_{1}_{2}'.format(parent.key, key, kind))
+
     def action(self, key, parent):
+        action = self.cached(parent, key, 'Action')
+        if action is not None:
+            return action
+
         action = Action({'icon': plmInfo[key]['icon'],
                          'txt': '&{0}'.format(key),
                          'stt': plmInfo[key]['statustip'],
                          'tt': plmInfo[key]['tooltip'],
                          'trg': partial(parent.command, key), }, parent)
         action.key = '{0}_{1}_Action'.format(parent.key, key)
-        action._name = action.key
-        if action.key in self.checkedKeys:
-            return self[action.key]
-        else:
-            action._name = '{0} Action'.format(key)
-            self.register(action)
-            return action
+        action._name = '{0} Action'.format(key)
+        self.register(action)
+        self.commandWidgets.setdefault(key, []).append(action)
+        return action
 
     def button(self, key, parent):
+        button = self.cached(parent, key, 'Button')
+        if button is not None:
+            return button
+
         button = Button({'txt': '&{0}'.format(key),
                          'stt': plmInfo[key]['statustip'],
                          'tt': plmInfo[key]['tooltip'],
                          'cl': partial(self.parent.command, key), })
         button.key = '{0}_{1}_Button'.format(parent.key, key)
-        button._name = button.key
-        if button.key in self.checkedKeys:
-            return self[button.key]
-        else:
-            button._name = '{0} Button'.format(key)
-            self.register(button)
-            return button
+        button._name = '{0} Button'.format(key)
+        self.register(button)
+        self.commandWidgets.setdefault(key, []).append(button)
+        return button
 
     def openUrlButton(self, key, parent):
+        button = self.cached(parent, key, 'Button')
+        if button is not None:
+            return button
+
         from PLM.options import BTNTAGSIZE, TAGBTNSIZE
         button = Button({'icon': plmInfo[key]['icon'],
                          'stt': plmInfo[key]['statustip'],
@@ -163,14 +209,34 @@ class BaseKeys(BaseStorage):
                          'ics': TAGBTNSIZE,
                          'cl': partial(self.parent.command, key)})
         button.key = '{0}_{1}_Button'.format(parent.key, key)
-        button._name = button.key
-        if button.key in self.checkedKeys:
-            return self[button.key]
-        else:
-            button._name = '{0} Button'.format(key)
-            button.Type = 'DAMGOpenBrowserButton'
-            self.register(button)
-            return button
+        button._name = '{0} Button'.format(key)
+        button.Type = 'DAMGOpenBrowserButton'
+        self.register(button)
+        self.commandWidgets.setdefault(key, []).append(button)
+        return button
+
+    def commandsChanged(self, added, removed, changed):
+        """ Programs or icons changed on disk: only the widgets of these commands are updated """
+        refresh_keys()
+        for key in added + changed:
+            for widget in self.commandWidgets.get(key, []):
+                self.updateWidget(widget, key)
+                widget.setVisible(True)
+        for key in removed:
+            for widget in self.commandWidgets.get(key, []):
+                widget.setVisible(False)
+
+    def updateWidget(self, widget, key):
+        cmd = plmInfo[key]
+        if is_action(widget) or widget.Type == 'DAMGOpenBrowserButton':
+            widget.setIcon(AppIcon(32, cmd['icon']))
+        widget.setStatusTip(cmd['statustip'])
+        widget.setToolTip(cmd['tooltip'])
+
+    def addedActions(self, title, keys, parent):
+        """ Actions of the added commands which belong to the toolbar 'title' """
+        refresh_keys()
+        return self.createActions([k for k in keys if k in self.toolBarKeys.get(title, ())], parent)
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by panda on 7/12/2019 - 4:35 PM
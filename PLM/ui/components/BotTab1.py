@@ -21,8 +21,12 @@ from PySide2.QtGui                        import QTextCursor
 # PLM
 from pyPLM.damg import DAMGLIST
 from PLM.options import SCROLLBAROFF, NO_WRAP, MOVE_ANCHOR, MOVE_OPERATION
-from pyPLM.Widgets import Widget, PlainTextEdit, ShortCut, VBoxLayout, StatusBar
-from pyPLM.Core import Process
+from pyPLM.Widgets import Widget, PlainTextEdit, ShortCut, VBoxLayout, StatusBar, TabWidget
+from PLM.cores.ProcessRunner import ProcessRunner, JOB_RUNNING
+
+
+# lines kept by a console pane, the oldest ones are dropped past it
+CONSOLE_LINE_CAP                        = 5000
 
 
 class BotTab1(Widget):
@@ -33,6 +37,7 @@ class BotTab1(Widget):
     commands                            = DAMGLIST()
     shotcuts                            = DAMGLIST()
     tracker                             = 0
+    lineCap                             = CONSOLE_LINE_CAP
     _cwd                                = os.getcwd().replace('\\', '/')
     _user                               = getpass.getuser()
     _host                               = socket.gethostname()
@@ -49,9 +54,15 @@ class BotTab1(Widget):
         # self.stylesheet                 = StyleSheet(self).changeStyleSheet('cmd')
 
     def buildUI(self):
-        self.process                    = Process(self.dataReady, self.onError, self.onOutput, self.isFinished, self)
+        self.runner                     = ProcessRunner(parent=self)
+        self.runner.jobAdded.connect(self.addJobPane)
         self.cmdField                   = PlainTextEdit({'lwm': NO_WRAP, 'sfh': 25, 'vsbp': SCROLLBAROFF, 'adr': True})
-        self.textWindow                 = PlainTextEdit({'rol': True}, self)
+        self.textWindow                 = PlainTextEdit({'rol': True, 'mbc': self.lineCap}, self)
+        self.panes                      = TabWidget(self)
+        self.panes.setTabsClosable(True)
+        self.panes.tabCloseRequested.connect(self.closeJobPane)
+        self.panes.addTab(self.textWindow, 'Console')
+        self.panes.tabBar().setTabButton(0, self.panes.tabBar().RightSide, None)
         self.cursor                     = self.cmdField.textCursor()
         self.copySelectedTextAction     = ShortCut('Copy', 'Copy', 'Shift+Ctrl+c', self.copyText, self)
         self.cancelAction               = ShortCut('Cancel', 'Cancel', 'Ctrl+c', self.killProcess, self)
@@ -71,7 +82,7 @@ class BotTab1(Widget):
                                                                                             )
         self.statusBar = StatusBar(self)
         self.statusBar.showMessage(myMachine, 0)
-        self.layout.addWidget(self.textWindow)
+        self.layout.addWidget(self.panes)
         self.layout.addWidget(self.cmdField)
         self.layout.addWidget(self.statusBar)
 
@@ -164,11 +175,49 @@ class BotTab1(Widget):
         self.cmdField.paste()
 
     def killProcess(self):
-        # print("cancelled")
-        self.process.kill()
-        self.textWindow.appendPlainText("cancelled")
+        """ Kill the job of the current pane, from the console the last job started """
+        job = getattr(self.panes.currentWidget(), 'job', None)
+        if job is None:
+            running = [j for j in self.runner.jobs if j.status == JOB_RUNNING]
+            job = running[-1] if running else None
+        if job is not None:
+            self.runner.kill(job)
+            self.textWindow.appendPlainText("cancelled: {0}".format(job.title))
         self.cursorEnd()
 
+    def setLineCap(self, lineCap):
+        self.lineCap = lineCap
+        for i in range(self.panes.count()):
+            self.panes.widget(i).setMaximumBlockCount(lineCap)
+
+    def addJobPane(self, job):
+        pane = PlainTextEdit({'rol': True, 'mbc': self.lineCap}, self)
+        pane.job = job
+        job.output.connect(pane.appendPlainText)
+        job.done.connect(lambda code, status, elapsed: self.onJobDone(job, pane, code, status, elapsed))
+        index = self.panes.addTab(pane, '#{0} {1}'.format(job.id, job.title[:24]))
+        self.panes.setTabToolTip(index, job.title)
+        self.textWindow.appendPlainText("[#{0}] {1}".format(job.id, job.title))
+
+    def onJobDone(self, job, pane, code, status, elapsed):
+        report = "{0}: exit code {1} in {2:.2f}s".format(status, code, elapsed)
+        pane.appendPlainText(report)
+        self.textWindow.appendPlainText("[#{0}] {1}".format(job.id, report))
+        index = self.panes.indexOf(pane)
+        if index != -1:
+            self.panes.setTabText(index, '#{0} {1} ({2})'.format(job.id, job.title[:24], status))
+        self.statusBar.showMessage("#{0} {1} - {2}".format(job.id, job.title, report), 0)
+
+    def closeJobPane(self, index):
+        pane = self.panes.widget(index)
+        job = getattr(pane, 'job', None)
+        if job is None:
+            return
+        self.runner.kill(job)
+        self.panes.removeTab(index)
+        self.runner.remove(job)
+        pane.deleteLater()
+
     def setDropEvent(self, event):
         self.cmdField.setFocus()
         if event.mimeData().hasUrls():
@@ -193,7 +242,13 @@ class BotTab1(Widget):
 
         self.textWindow.setFocus()
         self.textWindow.appendPlainText(self.cmdField.toPlainText())
-        cli = shlex.split(self.cmdField.toPlainText().replace(self.getUsername(), '').replace("'", '"'), posix=False)
+        try:
+            cli = shlex.split(self.cmdField.toPlainText().replace(self.getUsername(), '').replace("'", '"'), posix=False)
+        except ValueError:
+            # unbalanced quotes, the runner reports it in the job pane
+            return self.submitLine()
+        if not cli:
+            return
         cmd = str(cli[0])  ### is the executable
 
         if cmd == "exit":
@@ -261,49 +316,19 @@ class BotTab1(Widget):
             self.updateWorkingDirectory(self._cwd)
         else:
             if (QStandardPaths.findExecutable(cmd)):
-                self.commands.append(self.cmdField.toPlainText().replace(self.getUsername(), ""))
-                # print("command", cmd, "found")
-                t = " ".join(cli)
-                if self.process.state() != 2:
-                    self.process.waitForStarted()
-                    self.process.waitForFinished()
-                    if "|" in t or ">" in t or "<" in t:
-                        # print("special characters")
-                        self.process.start('sh -c "' + cmd + ' ' + t + '"')
-                        # print("running", ('sh -c "' + cmd + ' ' + t + '"'))
-                    else:
-                        self.process.start(cmd + " " + t)
-                        # print("running", (cmd + " " + t))
+                self.submitLine()
             else:
                 self.command_not_found(cmd)
 
-    def command_not_found(self, cmd):
-        self.textWindow.appendPlainText("command not found: {0}".format(cmd))
+    def submitLine(self):
+        line = self.cmdField.toPlainText().replace(self.getUsername(), "").strip()
+        self.commands.append(line)
+        # started by the event loop, the prompt is free for the next command at once
+        self.runner.submitLine(line, cwd=self._cwd)
         self.cursorEnd()
 
-    def dataReady(self):
-        try:
-            out = str(self.process.readAll(), encoding='utf8').rstrip()
-        except TypeError:
-            out = str(self.process.readAll()).rstrip()
-            self.textWindow.moveCursor(self.cursor.Start)  ### changed
-        self.textWindow.appendPlainText(out)
-
-    def onError(self):
-        self.error = self.process.readAllStandardError().data().decode()
-        self.textWindow.appendPlainText(self.error.strip('\n'))
-        self.cursorEnd()
-
-    def onOutput(self):
-        self.result = self.process.readAllStandardOutput().data().decode()
-        self.textWindow.appendPlainText(self.result.strip('\n'))
-        self.cursorEnd()
-        self.state = self.process.state()
-        # print(self.state)
-
-    def isFinished(self):
-        # print("finished")
-        self.cmdField.setPlainText(self.getUsername())
+    def command_not_found(self, cmd):
+        self.textWindow.appendPlainText("command not found: {0}".format(cmd))
         self.cursorEnd()
 
     def updateWorkingDirectory(self, pth=os.getcwd()):
@@ -311,7 +336,6 @@ class BotTab1(Widget):
         fixName = os.path.basename(pth)
         fixPath = os.path.dirname(pth)
         self._cwd = os.path.join(fixPath, fixName).replace('\\', '/')
-        self.process.setWorkingDirectory(self._cwd)
         self.cursorEnd()
 
 
@@ -30,6 +30,7 @@ p = configPropText()
 from pyPLM.Widgets                      import GroupHBox, MessageBox, Widget, HBoxLayout
 from pyPLM.damg                         import DAMGLIST
 from PLM.cores.models                   import ConnectMonitor
+from PLM.cores.base                     import httpClient
 from PLM.ui.base                        import Conection
 
 # -------------------------------------------------------------------------------------------------------------
@@ -71,8 +72,8 @@ class ConnectStatus(Widget):
         stt = 'Server Connection Status'
 
         try:
-            r = requests.get(__localServer__)
-        except requests.exceptions.ConnectionError:
+            r = httpClient.get(__localServer__, cache=False)
+        except requests.exceptions.RequestException:
             if not glbSettings.allowLocalMode:
                 MessageBox(None, 'Connection Failed', 'critical', p['SERVER_CONNECT_FAIL'], 'close')
                 sys.exit()
@@ -90,8 +91,8 @@ class ConnectStatus(Widget):
     def internet_status(self):
 
         try:
-            r = requests.get("http://www.google.com")
-        except requests.ConnectionError:
+            r = httpClient.head("http://www.google.com")
+        except requests.exceptions.RequestException:
             # self.parent.sysTray.notifier('Offline', 'Can not connect to Internet', 'crit', 500)
             self.internetIcon           = Conection('InternetOff', 'Internet Connection Status', self)
             self._connectInternet       = False
@@ -105,7 +106,7 @@ class ConnectStatus(Widget):
     def getServer(self):
         """ Now only have local server """
         try:
-            r                       = requests.get(__localServer__)
+            r                       = httpClient.get(__localServer__, cache=False)
         except Exception:
             if not glbSettings.allowLocalMode:
                 MessageBox(None, 'Connection Failed', 'critical', p['SERVER_CONNECT_FAIL'], 'close')
@@ -17,6 +17,7 @@ from pyPLM.Widgets import MainWindow, ToolBar, GroupHBox
 from pyPLM.Core import Size
 from PLM.utils import str2bool, bool2str
 from PLM.cores.Errors import ToolbarNameError
+from PLM.cores import catalogueService
 
 # -------------------------------------------------------------------------------------------------------------
 """ ToolBar """
@@ -59,6 +60,8 @@ class MainToolBar(MainWindow):
                    self.systrayToolBar, self.compToolBar, self.preToolBar]:
             tb.setVisible(False)
 
+        catalogueService().commandsChanged.connect(self.commandsChanged)
+
         self.updateWidth()
 
     def build_toolBar(self, name=''):
@@ -108,6 +111,13 @@ class MainToolBar(MainWindow):
 
         return actions
 
+    def commandsChanged(self, added, removed, changed):
+        """ Installed programs are added to their toolbar, removed or changed ones are handled by the actionManager """
+        for name, toolBar in self.toolBars.items():
+            for action in self.actionManager.addedActions(name, added, self.parent):
+                if action not in toolBar.actions:
+                    toolBar.add_action(action)
+
     def show_toolBar(self, toolbar, mode):
         if toolbar in self.toolBars.keys():
             tb = self.toolBars[toolbar]
@@ -12,6 +12,7 @@ import requests
 
 # PLM
 from PLM import __localServer__
+from PLM.cores.base import httpClient
 from pyPLM.damg import DAMGLIST
 from pyPLM.Widgets import TabWidget, VBoxLayout
 from pyPLM.Gui import AppIcon
@@ -56,8 +57,8 @@ class MidTab(TabWidget):
     def test_connectServer(self):
 
         try:
-            requests.get(__localServer__)
-        except requests.exceptions.ConnectionError:
+            httpClient.get(__localServer__, cache=False)
+        except requests.exceptions.RequestException:
             self.logger.info('Cannot connect to server')
             return False
         else:
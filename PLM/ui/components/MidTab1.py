@@ -12,12 +12,18 @@ Description:
 """ Import """
 
 
+# Python
+import os
+
+# PySide2
+from PySide2.QtWidgets                          import QListView
+
 # PLM
 from pyPLM.Widgets                              import GroupBox, GridLayout, Widget, GroupGrid
-from PLM.ui.base                                import TaskInfo, TaskFilter
-from PLM.utils                                  import get_file_path
-from PLM.configs                                import TASK_DIR
-from pyPLM.damg                                 import DAMGLIST
+from PLM.ui.base                                import TaskFilter
+from PLM.ui.models.TaskDashboard                import TaskDashboardModel, TaskStatusProxy, TaskDelegate, GROUP_OTHERS
+from PLM.cores.models.TaskRepository            import STATUS_OVERDUE, STATUS_URGENT
+from PLM                                        import SOUND_DIR
 
 # -------------------------------------------------------------------------------------------------------------
 """ TopTab1 """
@@ -25,7 +31,6 @@ from pyPLM.damg                                 import DAMGLIST
 class MidTab1(Widget):
 
     key                                         = 'TopTab1'
-    tasks                                       = DAMGLIST()
 
     def __init__(self, buttonManager, parent=None):
         super(MidTab1, self).__init__(parent)
@@ -41,14 +46,31 @@ class MidTab1(Widget):
 
         self.taskButtons                        = self.buttonManager.managerButtonGroupBox(self.parent)
         self.taskGrp                            = GroupBox("Manager", self.taskButtons, "BtnGrid")
-        self.update_tasks()
+
+        self.taskModel                          = TaskDashboardModel(parent=self)
+        self.taskModel.deadlineReached.connect(self.alarm)
+        self.taskProxy                          = TaskStatusProxy(self)
+        self.taskProxy.setSourceModel(self.taskModel)
+
+        self.taskView                           = QListView(self)
+        self.taskView.setViewMode(QListView.IconMode)
+        self.taskView.setResizeMode(QListView.Adjust)
+        self.taskView.setMovement(QListView.Static)
+        self.taskView.setUniformItemSizes(True)
+        self.taskView.setSpacing(2)
+        self.taskView.setItemDelegate(TaskDelegate(self.taskView))
+        self.taskView.setModel(self.taskProxy)
 
         self.taskFilter                         = TaskFilter()
         self.taskFilter.overduedCB.stateChanged.connect(self.overdue)
         self.taskFilter.urgentCB.stateChanged.connect(self.urgent)
         self.taskFilter.safetyCB.stateChanged.connect(self.safety)
+        self.overdue(self.taskFilter.overduedCB.isChecked())
+        self.urgent(self.taskFilter.urgentCB.isChecked())
+        self.safety(self.taskFilter.safetyCB.isChecked())
 
         self.taskTracker                        = GroupGrid('Tasks', self)
+        self.taskTracker.layout.addWidget(self.taskView, 0, 0, 1, 1)
 
         self.taskGrp.setMaximumWidth(110)
         self.taskFilter.setMaximumWidth(110)
@@ -59,37 +81,25 @@ class MidTab1(Widget):
         self.layout.addWidget(self.taskTracker, 0, 1, 2, 2)
 
     def update_tasks(self):
-
-        tasks = get_file_path(TASK_DIR)
-
-        i = 0
-        a = 0
-        h = 1
-        w = 1
-        for t in tasks:
-            if i > 4:
-                i = 1
-                a = a + h
-
-            task = TaskInfo(t)
-            self.taskTracker.layout.addWidget(task, a, i, h ,w)
-            self.tasks.append(task)
-            i += 1
+        """ Read the task files changed since last time, the model follows the repository """
+        return self.taskModel.repository.reload()
 
     def overdue(self, bool):
-        for task in self.tasks:
-            if task.task_status == 'Overdued':
-                task.setVisible(bool)
+        self.taskProxy.setGroupVisible(STATUS_OVERDUE, bool)
 
     def urgent(self, bool):
-        for task in self.tasks:
-            if task.task._status == 'Urgent':
-                task.setVisible(bool)
+        self.taskProxy.setGroupVisible(STATUS_URGENT, bool)
 
     def safety(self, bool):
-        for task in self.tasks:
-            if task.task._status not in ['Overdued, Urgent']:
-                task.setVisible(bool)
+        self.taskProxy.setGroupVisible(GROUP_OTHERS, bool)
+
+    def alarm(self, taskID):
+        from playsound import playsound
+        playsound(os.path.join(SOUND_DIR, 'bell.wav'), False)
+
+    def showEvent(self, event):
+        self.update_tasks()
+        super(MidTab1, self).showEvent(event)
 
     # def keyPressEvent(self, event):
     #     if event.key() == KEY_DEL:
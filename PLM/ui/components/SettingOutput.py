@@ -11,11 +11,21 @@ Description:
 
 from PySide2.QtWidgets import QTreeWidget, QHeaderView, QStyle, QAbstractItemView, QTreeWidgetItem
 from PySide2.QtGui import QIcon
-from PySide2.QtCore import QTimer, QSize, QEvent, Qt
+from PySide2.QtCore import QSize, QEvent, Qt
+from pyPLM.settings import settingsNotifier
+from pyPLM.settings.notifier import norm_path
 from .ValiantDelegate import VariantDelegate
 
+GroupRole = Qt.UserRole + 1
+
 class SettingOutput(QTreeWidget):
 
+    """
+    Tree of a settings object. With auto refresh on, the tree follows the change events of the settings (writes
+    in PLM, the INI file changed on disk) and only the items of the changed keys are updated: nothing is read
+    while the settings do not change.
+    """
+
     key = "SettingOutput"
 
     def __init__(self, settings, parent=None):
@@ -28,9 +38,12 @@ class SettingOutput(QTreeWidget):
         self.header().setSectionResizeMode(2, QHeaderView.Stretch)
 
         self.settings = settings
-        self.refreshTimer = QTimer()
-        self.refreshTimer.setInterval(2000)
         self.autoRefresh = False
+        self.watchedFile = None
+        self.fileWatched = False
+        self.values = dict()
+        self.pending = set()
+        self.updating = False
 
         self.groupIcon = QIcon()
         self.groupIcon.addPixmap(self.style().standardPixmap(QStyle.SP_DirClosedIcon), QIcon.Normal, QIcon.Off)
@@ -38,19 +51,19 @@ class SettingOutput(QTreeWidget):
         self.keyIcon = QIcon()
         self.keyIcon.addPixmap(self.style().standardPixmap(QStyle.SP_FileIcon))
 
-        self.refreshTimer.timeout.connect(self.maybeRefresh)
+        self.itemChanged.connect(self.updateSetting)
 
     def setSettingsObject(self, settings):
+        self.stopListening()
         self.settings = settings
         self.clear()
+        self.values = dict()
 
         if self.settings is not None:
             self.settings.setParent(self)
             self.refresh()
             if self.autoRefresh:
-                self.refreshTimer.start()
-        else:
-            self.refreshTimer.stop()
+                self.startListening()
 
     def sizeHint(self):
         return QSize(800, 600)
@@ -61,9 +74,28 @@ class SettingOutput(QTreeWidget):
         if self.settings is not None:
             if self.autoRefresh:
                 self.maybeRefresh()
-                self.refreshTimer.start()
+                self.startListening()
             else:
-                self.refreshTimer.stop()
+                self.stopListening()
+
+    def startListening(self):
+        if self.watchedFile is not None:
+            return
+        notifier = settingsNotifier()
+        notifier.changed.connect(self.onSettingChanged)
+        self.watchedFile = norm_path(self.settings.fileName())
+        self.fileWatched = notifier.watch(self.watchedFile)
+
+    def stopListening(self):
+        if self.watchedFile is None:
+            return
+        notifier = settingsNotifier()
+        notifier.changed.disconnect(self.onSettingChanged)
+        if self.fileWatched:
+            notifier.unwatch(self.watchedFile)
+        self.watchedFile = None
+        self.fileWatched = False
+        self.pending = set()
 
     def setFallbacksEnabled(self, enabled):
         if self.settings is not None:
@@ -75,28 +107,110 @@ class SettingOutput(QTreeWidget):
             self.refresh()
 
     def refresh(self):
+        """ Build the whole tree again, only for the refresh action and a new settings object """
         if self.settings is None:
             return
 
-        # The signal_cpu might not be connected.
+        self.updating = True
         try:
-            self.itemChanged.disconnect(self.updateSetting)
-        except:
-            pass
-
-        self.settings.sync()
-        self.updateChildItems(None)
-
-        self.itemChanged.connect(self.updateSetting)
+            self.settings.sync()
+            self.updateChildItems(None)
+            self.values = self.snapshot()
+        finally:
+            self.updating = False
 
     def event(self, event):
+        # registry and native settings have no file to watch, their changes are looked for when the window is active
         if event.type() == QEvent.WindowActivate:
-            if self.isActiveWindow() and self.autoRefresh:
-                self.maybeRefresh()
+            if self.isActiveWindow() and self.autoRefresh and not self.fileWatched:
+                self.onSettingChanged(self.watchedFile, '')
 
         return super(SettingOutput, self).event(event)
 
+    def snapshot(self):
+        return {key: self.settings.value(key) for key in self.settings.allKeys()}
+
+    def onSettingChanged(self, fileName, key):
+        if fileName != self.watchedFile:
+            return
+        self.pending.add(key)
+        # the item being edited keeps its editor, the changes are applied when it is closed
+        if self.state() != QAbstractItemView.EditingState:
+            self.applyPending()
+
+    def closeEditor(self, editor, hint):
+        super(SettingOutput, self).closeEditor(editor, hint)
+        if self.pending:
+            self.applyPending()
+
+    def applyPending(self):
+        keys, self.pending = self.pending, set()
+        if self.settings is None:
+            return
+
+        self.settings.sync()
+        if '' in keys:
+            # the file changed on disk: compare it with what is shown
+            values = self.snapshot()
+            keys = {k for k in set(values) | set(self.values) if values.get(k) != self.values.get(k)
+                    or (k in values) != (k in self.values)}
+        for key in sorted(keys):
+            self.applyKey(key)
+
+    def applyKey(self, key):
+        """ Update, add or remove the item of one key, its group items are made or removed with it """
+        exists = self.settings.contains(key)
+        value = self.settings.value(key) if exists else None
+
+        self.updating = True
+        try:
+            if exists:
+                item = self.itemOfKey(key, create=True)
+                self.setItemValue(item, value)
+                self.values[key] = value
+            else:
+                item = self.itemOfKey(key, create=False)
+                self.values.pop(key, None)
+                while item is not None:
+                    parent = item.parent()
+                    if item.childCount():
+                        break
+                    self.deleteItem(parent, self.indexOf(parent, item))
+                    item = parent
+        finally:
+            self.updating = False
+
+    def itemOfKey(self, key, create=False):
+        parent = None
+        parts = key.split('/')
+        for depth, name in enumerate(parts):
+            isGroup = depth < len(parts) - 1
+            index = self.findChild(parent, name, 0)
+            if index == -1:
+                if not create:
+                    return None
+                # groups are listed before the keys
+                groups = sum(1 for i in range(self.childCount(parent)) if self.childAt(parent, i).data(0, GroupRole))
+                child = self.createItem(name, parent, groups if isGroup else self.childCount(parent))
+                child.setIcon(0, self.groupIcon if isGroup else self.keyIcon)
+                child.setData(0, GroupRole, isGroup)
+            else:
+                child = self.childAt(parent, index)
+            parent = child
+        return parent
+
+    def setItemValue(self, item, value):
+        if value is None:
+            item.setText(1, 'Invalid')
+        else:
+            item.setText(1, value.__class__.__name__)
+        item.setText(2, VariantDelegate.displayText(value))
+        item.setData(2, Qt.UserRole, value)
+
     def updateSetting(self, item):
+        if self.updating or item.data(0, GroupRole):
+            return
+
         key = item.text(0)
         ancestor = item.parent()
 
@@ -104,11 +218,13 @@ class SettingOutput(QTreeWidget):
             key = ancestor.text(0) + '/' + key
             ancestor = ancestor.parent()
 
-        d = item.data(2, Qt.UserRole)
-        self.settings.updateProgress(key, item.data(2, Qt.UserRole))
-
-        if self.autoRefresh:
-            self.refresh()
+        value = item.data(2, Qt.UserRole)
+        if self.values.get(key) == value:
+            return
+        # the write is reported by the settings, this item is updated by onSettingChanged
+        self.settings.setValue(key, value)
+        if not self.autoRefresh:
+            self.values[key] = value
 
     def updateChildItems(self, parent):
         dividerIndex = 0
@@ -125,6 +241,7 @@ class SettingOutput(QTreeWidget):
                 child = self.createItem(group, parent, dividerIndex)
 
             child.setIcon(0, self.groupIcon)
+            child.setData(0, GroupRole, True)
             dividerIndex += 1
 
             self.settings.beginGroup(group)
@@ -142,17 +259,12 @@ class SettingOutput(QTreeWidget):
                 else:
                     child = self.createItem(key, parent, dividerIndex)
                 child.setIcon(0, self.keyIcon)
+                child.setData(0, GroupRole, False)
                 dividerIndex += 1
             else:
                 child = self.childAt(parent, childIndex)
 
-            value = self.settings.value(key)
-            if value is None:
-                child.setText(1, 'Invalid')
-            else:
-                child.setText(1, value.__class__.__name__)
-            child.setText(2, VariantDelegate.displayText(value))
-            child.setData(2, Qt.UserRole, value)
+            self.setItemValue(child, self.settings.value(key))
 
         while dividerIndex < self.childCount(parent):
             self.deleteItem(parent, dividerIndex)
@@ -191,6 +303,12 @@ class SettingOutput(QTreeWidget):
         else:
             return self.topLevelItemCount()
 
+    def indexOf(self, parent, item):
+        if parent is not None:
+            return parent.indexOfChild(item)
+        else:
+            return self.indexOfTopLevelItem(item)
+
     def findChild(self, parent, text, startIndex):
         for i in range(self.childCount(parent)):
             if self.childAt(parent, i).text(0) == text:
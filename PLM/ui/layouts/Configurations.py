@@ -24,6 +24,7 @@ from PySide2.QtWidgets            import (QCheckBox, QDateTimeEdit, QGridLayout,
 from PLM                           import __localServer__
 from pyPLM.Widgets import (GroupBox, Label, HBoxLayout, ComboBox, VBoxLayout, LineEdit, Button,
                            Widget, CheckBox, )
+from PLM.ui.rcs.ResourceLoader import registerResource
 
 # -------------------------------------------------------------------------------------------------------------
 """ Server """
@@ -165,6 +166,9 @@ class Configurations(Widget):
     def __init__(self, parent=None):
         super(Configurations, self).__init__(parent)
 
+        # the :/images icons of createIcons
+        registerResource(self.key)
+
         self.setWindowTitle("Configuration")
 
         self.contentsWidget = QListWidget()
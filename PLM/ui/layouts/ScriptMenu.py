@@ -141,7 +141,9 @@ class ScriptsMenu(Menu):
     searchbar                   = None
     update_action               = None
     _script_actions             = []
+    _search_index               = None
     _callbacks                  = defaultdict(list)
+    _changed_callbacks          = []
 
     def __init__(self, *args, **kwargs):
         Menu.__init__(self, *args, **kwargs)
@@ -165,6 +167,17 @@ class ScriptsMenu(Menu):
     def registered_callbacks(self):
         return self._callbacks.copy()
 
+    @classmethod
+    def script_actions(cls):
+        """ Script actions of every scripts menu, for the command palette """
+        return list(cls._script_actions)
+
+    @classmethod
+    def on_scripts_changed(cls, callback):
+        """ callback() is called when a script is added to any scripts menu, ie: the palette indexes again """
+        if callback not in cls._changed_callbacks:
+            cls._changed_callbacks.append(callback)
+
     def create_default_items(self):
         searchbar                   = LineEdit()
         searchbar.setFixedWidth(120)
@@ -235,6 +248,9 @@ class ScriptsMenu(Menu):
         parent.addAction(script_action)
 
         self._script_actions.append(script_action)          # Add to our searchable actions
+        ScriptsMenu._search_index   = None                  # index again on next search
+        for callback in list(ScriptsMenu._changed_callbacks):
+            callback()
         return script_action
 
     def build_from_configuration(self, parent, configuration):
@@ -266,14 +282,22 @@ class ScriptsMenu(Menu):
     def register_callback(self, modifiers, callback):
         self._callbacks[modifiers].append(callback)
 
+    def search_index(self):
+        if ScriptsMenu._search_index is None:
+            from PLM.ui.models.CommandIndex import CommandIndex
+            index                   = CommandIndex(usageFile=None)
+            index.addScripts(self._script_actions)
+            ScriptsMenu._search_index = index
+        return ScriptsMenu._search_index
+
     def _update_search(self, search):
-        if not search:
-            for action in self._script_actions:
-                action.setVisible(True)
-        else:
-            for action in self._script_actions:
-                if not action.has_tag(search.lower()):
-                    action.setVisible(False)
+        # matches come from the index (title and tags, fuzzy), an action hidden by a longer search shows again
+        from PLM.ui.models.CommandIndex import script_key
+        if search:
+            matches                 = self.search_index().search(search, limit=len(self._script_actions))
+            keys                    = set(entry.key for entry in matches)
+        for action in self._script_actions:
+            action.setVisible(not search or script_key(action) in keys)
 
         # Set visibility for all submenus
         for action in self.actions():
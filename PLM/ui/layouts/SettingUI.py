@@ -59,6 +59,7 @@ class SettingUI(Widget):
         self.setLayout(self.layout)
 
         self.autoRefreshAct.setChecked(True)
+        self.regValue.setAutoRefresh(True)
         # self.fallbacksAct.setChecked(True)
 
         self.setSettingsObject(self.settings)
@@ -146,7 +147,7 @@ class SettingUI(Widget):
         settings.setFallbacksEnabled(self.fallbacksAct.isChecked())
         self.regValue.setSettingsObject(settings)
 
-        self.refreshAct.setEnabled(True)
+        self.refreshAct.setEnabled(not self.autoRefreshAct.isChecked())
         self.autoRefreshAct.setEnabled(True)
 
         niceName = settings.fileName()
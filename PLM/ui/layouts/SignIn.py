@@ -14,7 +14,7 @@ Description:
 """ Import """
 
 # Python
-import sys, requests
+import sys
 from functools                  import partial
 
 # PLM
@@ -22,6 +22,7 @@ from PLM import __localServerAutho__, APP_LOG
 from PLM.configs import configPropText
 p = configPropText()
 from PLM.cores import sqlUtils
+from PLM.cores.base import httpClient
 from pyPLM.loggers import DamgLogger
 from pyPLM.Widgets import (Widget, GridLayout, LineEdit, CheckBox, Button, user_pass_label, Label, MessageBox, GroupGrid, )
 from pyPLM.Gui import AppIcon
@@ -106,7 +107,7 @@ class SignIn(Widget):
 
         password = str(pass_word)
         self.logger.info('send request to server to check account')
-        r = requests.post(__localServerAutho__, verify=False, data={'user': username, 'pwd': password})
+        r = httpClient.post(__localServerAutho__, verify=False, data={'user': username, 'pwd': password})
 
         if r.status_code == 200:
             for i in r.headers['set-cookie'].split(";"):
@@ -14,13 +14,15 @@ Description:
 """ Import """
 
 # Python
+import os
 from functools import partial
 
 # PyQt5
 from PySide2.QtWidgets            import (QGroupBox, QInputDialog, QComboBox, QFileDialog, QListWidget, QListWidgetItem)
 
 # PLM
-from pyPLM.Widgets import Widget, Label, HBoxLayout, Button, GridLayout, LineEdit, VBoxLayout
+from pyPLM.Widgets import Widget, Label, HBoxLayout, Button, GridLayout, LineEdit, VBoxLayout, MessageBox
+from ToolHub.ProjectTemplate import ProjectTemplate
 
 # -------------------------------------------------------------------------------------------------------------
 """ Sub class """
@@ -135,7 +137,7 @@ class VFXProject(Widget):
 
         prjLstBtn               = Button({'txt': "Project List", 'stt': "Project List"})
         crewLstBtn              = Button({'txt': "Crews List", 'stt': "Crews List"})
-        newPrjBtn               = Button({'txt': "Create Project", 'stt': "Create New Project"})
+        newPrjBtn               = Button({'txt': "Create Project", 'stt': "Create New Project", 'cl': self.createProject})
         cancelBtn               = Button({'txt': "Cancel", 'stt': "Cancel"})
 
         btnGrid.addWidget(prjLstBtn, 0, 0)
@@ -228,201 +230,29 @@ class VFXProject(Widget):
             lst.addItem(item)
             lst.setItemWidget(item, itemWidget)
 
-    # def setPth(self, *args):
-    #     pth = cmds.fileDialog2(cap="set production path", fn=3, okc="Set")
-    #     dir = self.getDirFromUnicode(pth[0])
-    #     cmds.textField(self.setPath, edit=True, tx=dir)
-    #
-    # def createProject(self, *args):
-    #     prjName = cmds.textField(self.prodName, q=True, tx=True)
-    #     setPth = cmds.textField(self.setPath, q=True, tx=True)
-    #     self.rootPth = os.path.join(setPth, prjName)
-    #
-    #     if os.path.exists(self.rootPth):
-    #         cmds.confirmDialog(t="Opps",
-    #                            m="The path: %s\nis NOT EMPTY or:\nthis NAME has been USED for another project\n"
-    #                              "please choose another name" % self.rootPth, b="Ok")
-    #         sys.exit()
-    #
-    #     self.shortName = cmds.textField(self.prodShort, q=True, tx=True)
-    #
-    #     self.modeSetting = cmds.optionMenu(self.setMode, q=True, v=True)
-    #
-    #     self.numSeq = cmds.intField(self.numShot, q=True, v=True)
-    #     self.numOfChar = cmds.intField(self.numChar, q=True, v=True)
-    #     self.numOfEnv = cmds.intField(self.numEnv, q=True, v=True)
-    #     self.numOfProps = cmds.intField(self.numProps, q=True, v=True)
-    #
-    #     # Create content by set fn
-    #     if self.modeSetting == "Studio Mode":
-    #         self.prjStudioMode()
-    #     elif self.modeSetting == "Group Mode":
-    #         self.prjGroupMode()
-    #
-    # def prjStudioMode(self, *args):
-    #     # Create master folder
-    #     os.mkdir(self.rootPth)
-    #     # Create content of master Folder
-    #     master = ["assets", "sequences", "deliverables", "docs", "editorial", "sound", "rcs", "RnD"]
-    #     steps = ["publish", "review", "work"]
-    #     mayaFolders = ["scenes", "sourceimages", "images", "movie", "alembic", "reference"]
-    #
-    #     for f in master:
-    #         contentMasterPth = os.path.join(self.rootPth, f)
-    #         os.mkdir(contentMasterPth)
-    #
-    #     # Assets content
-    #     assetsTasks = ["art", "plt_model", "surfacing", "rigging"]
-    #     assetsSections = ["characters", "environment", "props"]
-    #
-    #     assetsPth = os.path.join(self.rootPth, "assets")
-    #     for section in assetsSections:
-    #         assetsSectionsPth = os.path.join(assetsPth, section)
-    #         os.mkdir(assetsSectionsPth)
-    #         if section == "characters":
-    #             for i in range(self.numOfChar):
-    #                 charName = "char" + str(i + 1)
-    #                 folCharName = cmds.textField(charName, q=True, tx=True)
-    #                 if folCharName == "" or folCharName == None:
-    #                     folCharName = "character_" + str(i + 1)
-    #                 folCharPth = os.path.join(assetsSectionsPth, folCharName)
-    #                 os.mkdir(folCharPth)
-    #                 for task in assetsTasks:
-    #                     assetsTaskPth = os.path.join(folCharPth, task)
-    #                     os.mkdir(assetsTaskPth)
-    #                     for step in steps:
-    #                         assetsTaskStepPth = os.path.join(assetsTaskPth, step)
-    #                         os.mkdir(assetsTaskStepPth)
-    #                     assetsWorkTaskPth = os.path.join(assetsTaskPth, "work")
-    #                     if task == "art":
-    #                         apps = ["photoshop", "maya"]
-    #                     elif task == "plt_model":
-    #                         apps = ["zbrush", "maya", "mudbox", "houdini"]
-    #                     elif task == "surfacing":
-    #                         apps = ["mari", "maya", "substance", "photoshop"]
-    #                     elif task == "rigging":
-    #                         apps = ["maya"]
-    #
-    #                     for app in apps:
-    #                         appPth = os.path.join(assetsWorkTaskPth, app)
-    #                         os.mkdir(appPth)
-    #                         if app == "maya":
-    #                             for f in mayaFolders:
-    #                                 mayaPth = os.path.join(appPth, f)
-    #                                 os.mkdir(mayaPth)
-    #                 i += 1
-    #         elif section == "environment":
-    #             for i in range(self.numOfEnv):
-    #                 envName = "env" + str(i + 1)
-    #                 folEnvName = cmds.textField(envName, q=True, tx=True)
-    #                 if folEnvName == "" or folEnvName == None:
-    #                     folEnvName = "env_" + str(i + 1)
-    #                 folEnvPth = os.path.join(assetsSectionsPth, folEnvName)
-    #                 os.mkdir(folEnvPth)
-    #                 for task in assetsTasks:
-    #                     assetsTaskPth = os.path.join(folEnvPth, task)
-    #                     os.mkdir(assetsTaskPth)
-    #                     for step in steps:
-    #                         assetsTaskStepPth = os.path.join(assetsTaskPth, step)
-    #                         os.mkdir(assetsTaskStepPth)
-    #                     assetsWorkTaskPth = os.path.join(assetsTaskPth, "work")
-    #                     if task == "art":
-    #                         apps = ["photoshop", "maya"]
-    #                     elif task == "plt_model":
-    #                         apps = ["zbrush", "maya", "mudbox", "houdini"]
-    #                     elif task == "surfacing":
-    #                         apps = ["mari", "maya", "substance", "photoshop"]
-    #                     elif task == "rigging":
-    #                         apps = ["maya"]
-    #
-    #                     for app in apps:
-    #                         appPth = os.path.join(assetsWorkTaskPth, app)
-    #                         os.mkdir(appPth)
-    #                         if app == "maya":
-    #                             for f in mayaFolders:
-    #                                 mayaPth = os.path.join(appPth, f)
-    #                                 os.mkdir(mayaPth)
-    #                 i += 1
-    #         elif section == "props":
-    #             for i in range(self.numOfProps):
-    #                 propsName = "props" + str(i + 1)
-    #                 folPropsName = cmds.textField(propsName, q=True, tx=True)
-    #                 print type(folPropsName)
-    #
-    #                 if folPropsName == "" or folPropsName == None:
-    #                     folPropsName = "props_" + str(i + 1)
-    #
-    #                 folPropsPth = os.path.join(assetsSectionsPth, folPropsName)
-    #
-    #                 print folPropsPth + " 4"
-    #
-    #                 os.mkdir(folPropsPth)
-    #                 for task in assetsTasks:
-    #                     assetsTaskPth = os.path.join(folPropsPth, task)
-    #                     os.mkdir(assetsTaskPth)
-    #                     for step in steps:
-    #                         assetsTaskStepPth = os.path.join(assetsTaskPth, step)
-    #                         os.mkdir(assetsTaskStepPth)
-    #                     assetsWorkTaskPth = os.path.join(assetsTaskPth, "work")
-    #                     if task == "art":
-    #                         apps = ["photoshop", "maya"]
-    #                     elif task == "plt_model":
-    #                         apps = ["zbrush", "maya", "mudbox", "houdini"]
-    #                     elif task == "surfacing":
-    #                         apps = ["mari", "maya", "substance", "photoshop"]
-    #                     elif task == "rigging":
-    #                         apps = ["maya"]
-    #
-    #                     for app in apps:
-    #                         appPth = os.path.join(assetsWorkTaskPth, app)
-    #                         os.mkdir(appPth)
-    #                         if app == "maya":
-    #                             for f in mayaFolders:
-    #                                 mayaPth = os.path.join(appPth, f)
-    #                                 os.mkdir(mayaPth)
-    #                 i += 1
-    #
-    #     # Sequences content
-    #
-    #     seqTask = ["anim", "comp", "fx", "layout", "lighting"]
-    #
-    #     sequencesPth = os.path.join(self.rootPth, "sequences")
-    #     for i in range(self.numSeq):
-    #         folName = self.shortName + "_" + "shot_" + str(i + 1)
-    #         seqPth = os.path.join(sequencesPth, folName)
-    #         os.mkdir(seqPth)
-    #         for task in seqTask:
-    #             seqTaskPth = os.path.join(seqPth, task)
-    #             os.mkdir(seqTaskPth)
-    #             for step in steps:
-    #                 seqTaskStepPth = os.path.join(seqTaskPth, step)
-    #                 os.mkdir(seqTaskStepPth)
-    #             seqTaskWorkPth = os.path.join(seqTaskPth, "work")
-    #             if task == "anim":
-    #                 apps = ["maya", "after effect", "houdini"]
-    #             elif task == "comp":
-    #                 apps = ["nuke", "after effect", "photoshop"]
-    #             elif task == "fx":
-    #                 apps = ["maya", "houdini"]
-    #             elif task == "layout":
-    #                 apps = ["maya"]
-    #             elif task == "lighting":
-    #                 apps = ["maya"]
-    #
-    #             for app in apps:
-    #                 appPth = os.path.join(seqTaskWorkPth, app)
-    #                 os.mkdir(appPth)
-    #                 if app == "maya":
-    #                     for f in mayaFolders:
-    #                         mayaPth = os.path.join(appPth, f)
-    #                         os.mkdir(mayaPth)
-    #         i += 1
-    #
-    # def prjGroupMode(self, *args):
-    #     pass
-    #
-    # def getDirFromUnicode(self, path, *args):
-    #     for dirpath, dirnames, filenames in os.walk(path):
-    #         return dirpath
+    def itemNames(self, lst):
+        return [lst.itemWidget(lst.item(i)).item.text() for i in range(lst.count())]
+
+    def createProject(self):
+        if self.prjMode.currentText() != "Studio Mode":
+            return
+
+        rootPth                 = os.path.join(self.prjPth.text(), self.prjLong.text()).replace('\\', '/')
+        template                = ProjectTemplate.load('studio')
+        variables               = dict(character=self.itemNames(self.charLst),
+                                       environment=self.itemNames(self.envLst),
+                                       prop=self.itemNames(self.propLst),
+                                       shot=self.itemNames(self.seqLst))
+
+        preview                 = template.diff(rootPth, **variables)
+        if preview.conflicts:
+            return MessageBox(self, 'Create Project', 'critical',
+                              'Files are in the way of {0} folders:\n{1}'.format(len(preview.conflicts),
+                                                                                preview.conflicts[0]))
+
+        result                  = template.create(rootPth, **variables)
+        MessageBox(self, 'Create Project', 'information',
+                   '{0} folders created, {1} already exist.'.format(len(result.missing), len(result.existing)))
+
 
 
@@ -20,22 +20,24 @@ __localServerCheck__    = "{0}/check".format(__localServer__)
 __localServerAutho__    = "{0}/auth".format(__localServer__)
 
 # Python
-import os, sys, requests
+import sys, requests
 
 # PLM
 
 from PLM                                import __version__, __appName__, __organization__, __organizationDomain__, APP_LOG
 
-from PLM.configs                        import configPropText, ConfigPipeline
+from PLM.configs                        import configPropText, configPipeline, configContext
 p = configPropText()
 from pyPLM.Core import Slot
 from pyPLM.loggers import DamgLogger
-from PLM.cores                          import sqlUtils, StyleSheet, ThreadManager
+from PLM.cores                          import (sqlUtils, StyleSheet, ThreadManager, thumbnailService, jobQueue,
+                                                catalogueService)
+from PLM.cores.base                     import httpClient
 from pyPLM.Widgets import Application, MessageBox
 from pyPLM.Gui import LogoIcon
 from pyPLM.settings import AppSettings
-from PLM.utils                          import clean_file_ext
 from PLM.ui.tools                       import Browser
+from .CommandDispatcher                 import CommandDispatcher
 
 
 class AppModel(Application):
@@ -52,7 +54,7 @@ class AppModel(Application):
     eventManager                        = None
     layoutManager                       = None
 
-    plmInfo                             = ConfigPipeline()
+    plmInfo                             = configPipeline()
     layouts                             = None
 
     token                               = None
@@ -76,6 +78,18 @@ class AppModel(Application):
         self.settings._settingEnable    = True
 
         self.database                   = sqlUtils()
+        self.aboutToQuit.connect(thumbnailService.shutdown)
+        self.jobQueue                   = jobQueue()
+        self.aboutToQuit.connect(self.jobQueue.killAll)
+
+        self.commands                   = CommandDispatcher(self)
+        self.commands.compile(self.plmInfo)
+        configContext.onReload(self.configReloaded)
+
+        self.catalogue                  = catalogueService()
+        self.catalogue.commandsChanged.connect(self.commandsChanged)
+        self.catalogue.start()
+        self.aboutToQuit.connect(self.catalogue.stop)
 
         self.setCursorFlashTime(1000)
         self.setQuitOnLastWindowClosed(False)
@@ -135,8 +149,8 @@ class AppModel(Application):
 
     def checkConnectServer(self):
         try:
-            requests.get(self._server)
-        except requests.exceptions.ConnectionError:
+            httpClient.get(self._server, cache=False)
+        except requests.exceptions.RequestException:
             self.logger.info('Cannot connect to server')
             return False
         else:
@@ -144,7 +158,8 @@ class AppModel(Application):
 
     def serverAuthorization(self):
         try:
-            r = requests.get(self._server, verify=self.verify, headers=self.getHeaders(), cookies=self.getCookies())
+            r = httpClient.get(self._server, verify=self.verify, headers=self.getHeaders(), cookies=self.getCookies(),
+                               cache=False)
         except Exception:
             self.sys_message(self, 'Offline', p['SERVER_CONNECT_FAIL'], 'crit', 500)
             sys.exit()
@@ -164,60 +179,41 @@ class AppModel(Application):
         return {'connect.sid': self.cookie}
 
     def command(self, key):
-
-        try:
-            cmdData = self.plmInfo[key]
-        except KeyError:
-            return print('There is no key: {0}'.format(key))
-
-        if cmdData.code == 'os.startfile':
-            func = os.startfile
-            arg = cmdData.value or cmdData['value']
-        elif cmdData.code == 'os.system':
-            func = os.system
-            arg = cmdData.value or cmdData['value']
-        elif cmdData.code == 'showUI':
-            func = self.showUI
-            arg = cmdData.key or cmdData['value']
-        elif cmdData.code == 'openURL':
-            func = self.openURL
-            arg = cmdData.value or cmdData['value']
-        elif cmdData.code == 'shortcut':
-            func = self.shortcut
-            arg = cmdData.value or cmdData['value']
-        elif cmdData.code == 'appEvent':
-            func = self.appEvent
-            arg = cmdData.key or cmdData['value']
-        elif cmdData.code == 'stylesheet':
-            func = self.changeStyleSheet
-            arg = cmdData.value or cmdData['value']
-        else:
-            if cmdData.value == 'CleanPyc':
-                func = clean_file_ext
-                arg = 'py'
-            elif cmdData.value == 'Debug':
-                func = self.mainUI.botTabUI.botTab2.test
-                arg = None
-            elif cmdData.value == 'Restore':
-                func = self.mainUI.showNormal
-                arg = None
-            elif cmdData.value == 'Maximize':
-                func = self.mainUI.showMaximized
-                arg = None
-            elif cmdData.value == 'Minimize':
-                func = self.mainUI.showMinimized
-                arg = None
-            elif cmdData.value in ['Organisation', 'Project', 'Team', 'Task']:
-                func = self.showUI
-                arg = '{0}Manager'.format(cmdData.value)
-            else:
-                func = print
-                arg = key
-
-        if arg is None:
-            return func()
+        return self.commands.dispatch(key)
+
+    def registerCommand(self, key, func, *args, **kwargs):
+        """ Let plugins add commands to the dispatch table """
+        return self.commands.register(key, func, *args, **kwargs)
+
+    def configReloaded(self, names):
+        """ ReConfig: the commands are compiled again from the new pipeline, plugin commands are kept """
+        if 'pipeline' in names:
+            self.plmInfo                = configPipeline()
+            self.commands.compile(self.plmInfo)
+
+    def commandsChanged(self, added, removed, changed):
+        """ Programs or icons changed on disk: only these commands are compiled again """
+        for key in removed:
+            self.commands.unregister(key)
+        self.commands.compile({key: self.plmInfo[key] for key in added + changed})
+
+    def showCommandLatency(self):
+        report                          = self.commands.latencyReport(30)
+        lines                           = ['{0:<30}{1:>8}{2:>12}{3:>12}'.format('Command', 'Calls', 'Avg (ms)', 'Max (ms)')]
+        for key, count, avg, peak, total in report:
+            lines.append('{0:<30}{1:>8}{2:>12.2f}{3:>12.2f}'.format(key, count, avg, peak))
+
+        # MessageBox keeps its title and message without showing them
+        messBox                         = self.sys_message(None, 'Command Latency', 'information', '\n'.join(lines),
+                                                           'ok', None)
+        messBox.setWindowTitle(messBox.title)
+        messBox.setIcon(messBox.icon)
+        if report:
+            messBox.setText('Slowest commands of this session, {0} of {1}.'.format(len(report), len(self.commands.stats)))
+            messBox.setDetailedText(messBox._message)
         else:
-            return func(arg)
+            messBox.setText('No command has been run yet.')
+        return messBox.exec_()
 
     def showUI(self, key):
         try:
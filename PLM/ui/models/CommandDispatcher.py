@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: CommandDispatcher.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    The ConfigPipeline command table compiled into direct callables. Every Cmds entry is turned into a callable once
+    at load time, running a command is then a single dict lookup. Plugins add their own commands through register().
+    Applications are launched through the JobQueue, which keeps their history.
+
+    Each call is counted and timed, latencyReport() lists which actions are slow.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import time
+from functools                          import partial
+
+# PLM
+from pyPLM.damg                         import DAMG
+from pyPLM.Core                         import Signal
+from PLM.utils                          import clean_file_ext
+from PLM.configs                        import configContext, CMD_VALUE_TYPE
+from PLM.platforms                      import platformServices
+from PLM.cores.JobQueue                 import jobQueue
+
+
+class CommandDispatcher(DAMG):
+
+    key                                 = 'CommandDispatcher'
+
+    commandExecuted                     = Signal(str, float, name='commandExecuted')
+
+    def __init__(self, app=None):
+        super(CommandDispatcher, self).__init__(app)
+
+        self.app                        = app
+        self.commands                   = dict()
+        self.stats                      = dict()
+
+        # Cmds.code: builder(cmdData) -> callable
+        self.builders                   = { 'os.startfile'  : self.buildStartFile,
+                                            'os.system'     : lambda cmd: partial(jobQueue().launchLine, cmd.value,
+                                                                              cmd.key),
+                                            'showUI'        : lambda cmd: partial(self.app.showUI, cmd.key),
+                                            'openURL'       : lambda cmd: self.lateBound('openURL', cmd.value),
+                                            'shortcut'      : lambda cmd: self.lateBound('shortcut', cmd.value),
+                                            'appEvent'      : lambda cmd: partial(self.app.appEvent, cmd.key),
+                                            'stylesheet'    : lambda cmd: partial(self.app.changeStyleSheet, cmd.value),
+                                            'function'      : self.buildFunction, }
+
+    def lateBound(self, methodName, arg):
+        """ For handlers the application only provides once its layouts are built """
+        return lambda: getattr(self.app, methodName)(arg)
+
+    def buildStartFile(self, cmd):
+        """ Folders are shown by the file browser, applications are launched as jobs of the JobQueue """
+        if cmd.valueType == CMD_VALUE_TYPE['dir']:
+            return partial(platformServices().openPath, cmd.value)
+        return partial(jobQueue().launchFile, cmd.value, cmd.key)
+
+    def buildFunction(self, cmd):
+        """ 'function' commands, the main layout does not exist yet at load time so it is looked up on call """
+        if cmd.value == 'CleanPyc':
+            return partial(clean_file_ext, 'py')
+        elif cmd.value == 'ReConfig':
+            return configContext.reload
+        elif cmd.value == 'Debug':
+            return lambda: self.app.mainUI.botTabUI.botTab2.test()
+        elif cmd.value == 'Restore':
+            return lambda: self.app.mainUI.showNormal()
+        elif cmd.value == 'Maximize':
+            return lambda: self.app.mainUI.showMaximized()
+        elif cmd.value == 'Minimize':
+            return lambda: self.app.mainUI.showMinimized()
+        elif cmd.value == 'CommandLatency':
+            return self.app.showCommandLatency
+        elif cmd.value in ['Organisation', 'Project', 'Team', 'Task']:
+            return partial(self.app.showUI, '{0}Manager'.format(cmd.value))
+        else:
+            return partial(print, cmd.key)
+
+    def compile(self, cmdTable):
+        """ Build a callable for every command of the ConfigPipeline """
+        for key, cmd in cmdTable.items():
+            builder                     = self.builders.get(cmd.code, self.buildFunction)
+            self.commands[key]          = builder(cmd)
+        return self.commands
+
+    def register(self, key, func, *args, **kwargs):
+        """
+        Add or replace a command, ie: from a plugin.
+        :param key: command key used by actions, buttons and the command line.
+        :param func: callable, args and kwargs are bound to it.
+        """
+        self.commands[key]              = partial(func, *args, **kwargs) if (args or kwargs) else func
+
+    def unregister(self, key):
+        self.stats.pop(key, None)
+        return self.commands.pop(key, None) is not None
+
+    def hasCommand(self, key):
+        return key in self.commands
+
+    def dispatch(self, key):
+        try:
+            func                        = self.commands[key]
+        except KeyError:
+            return print('There is no key: {0}'.format(key))
+
+        start                           = time.perf_counter()
+        try:
+            return func()
+        finally:
+            duration                    = time.perf_counter() - start
+            stat                        = self.stats.get(key)
+            if stat is None:
+                self.stats[key]         = [1, duration, duration]
+            else:
+                stat[0]                += 1
+                stat[1]                += duration
+                stat[2]                 = max(stat[2], duration)
+            self.commandExecuted.emit(key, duration)
+
+    def latencyReport(self, limit=None):
+        """ :return: list of (key, count, average ms, max ms, total ms), slowest average first """
+        report                          = [(key, count, total / count * 1000, peak * 1000, total * 1000)
+                                           for key, (count, total, peak) in self.stats.items()]
+        report.sort(key=lambda r: r[2], reverse=True)
+        return report[:limit] if limit else report
+
+    def resetStats(self):
+        self.stats.clear()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 2:05 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
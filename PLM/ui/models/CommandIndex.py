@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: CommandIndex.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Search engine of the command palette (CommandUI): every ConfigPipeline command, layout, launchable app and
+    script menu entry, matched while typing.
+
+    The index keeps, for every character, the entries which contain it: a new query only scores the entries
+    having all its characters. Typing one more character only re-scores the results of the previous query, a
+    fuzzy match of 'abc' is always a match of 'ab'. Scores favour exact names, prefixes and word starts
+    ('txe' -> TextEditor), then the commands used often and lately.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, re, json, math, time
+
+# PySide2
+from PySide2.QtCore                     import Qt, QAbstractListModel, QModelIndex
+
+# PLM
+from PLM                                import CACHE_DIR
+
+
+USAGE_FILE                              = os.path.join(CACHE_DIR, 'commandUsage.json')
+MAX_RESULTS                             = 50
+RECENT_HALF_LIFE                        = 24 * 3600
+
+KIND_COMMAND                            = 'command'
+KIND_LAYOUT                             = 'layout'
+KIND_APP                                = 'app'
+KIND_SCRIPT                             = 'script'
+
+WORD_SPLIT                              = re.compile(r'[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])|[^\W_]+')
+
+EntryRole                               = Qt.UserRole + 1
+
+
+class CommandEntry(object):
+
+    """ One line of the palette. 'run' is called when it is chosen, None runs the command key on the app """
+
+    __slots__                           = ['key', 'title', 'kind', 'tags', 'toolTip', 'run', 'text', 'words',
+                                           'starts']
+
+    def __init__(self, key, title=None, kind=KIND_COMMAND, tags=None, toolTip=None, run=None):
+        self.key                        = key
+        self.title                      = title or key
+        self.kind                       = kind
+        self.tags                       = [t.lower() for t in (tags or [])]
+        self.toolTip                    = toolTip
+        self.run                        = run
+
+        self.text                       = self.title.lower()
+        words                           = WORD_SPLIT.findall(self.title)
+        self.words                      = [w.lower() for w in words]
+        # positions in text where a word starts: a matched character there is worth more
+        self.starts                     = set()
+        position                        = 0
+        for word in words:
+            position                    = self.title.find(word, position)
+            self.starts.add(position)
+            position                    += len(word)
+
+
+def fuzzy_score(query, entry):
+    """ :return: score of query (lower case) against the entry title, 0 when it does not match """
+    text                                = entry.text
+    if query == text or query == entry.key.lower():
+        return 1000
+    if text.startswith(query):
+        return 600 - len(text)
+
+    found                               = text.find(query)
+    if found >= 0:
+        return (400 if found in entry.starts else 250) - found - len(text) // 4
+
+    initials                            = ''.join(w[0] for w in entry.words)
+    if initials.startswith(query):
+        return 350 - len(initials)
+
+    # characters in order, word starts and runs of characters are rewarded, gaps cost
+    score, last                         = 0, -1
+    for char in query:
+        position                        = text.find(char, last + 1)
+        if position < 0:
+            return 0
+        if position in entry.starts:
+            score                       += 12
+        elif position == last + 1:
+            score                       += 8
+        else:
+            score                       += 2 - min(5, position - last - 1)
+        last                            = position
+    return max(1, 100 + score - len(text) // 4)
+
+
+def tag_score(query, entry):
+    for tag in entry.tags:
+        if tag.startswith(query):
+            return 200
+        if query in tag:
+            return 120
+    return 0
+
+
+def script_key(action):
+    """ 'script:<menu>/<title>', two menus can have an entry of the same title """
+    menu                                = action.parent()
+    return 'script:{0}/{1}'.format(menu.title() if menu is not None else '', action.text())
+
+
+class CommandIndex(object):
+
+    key                                 = 'CommandIndex'
+
+    def __init__(self, usageFile=USAGE_FILE):
+        """ :param usageFile: json of the use counts, None to not rank by use """
+        super(CommandIndex, self).__init__()
+
+        self.usageFile                  = usageFile
+        self.entries                    = []
+        self._byKey                     = dict()
+        self._chars                     = dict()
+        # last query and its matching entries, the start of the next one
+        self._lastQuery                 = None
+        self._lastMatches               = None
+        self.usage                      = self.loadUsage()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Build """
+
+    def clear(self):
+        self.entries                    = []
+        self._byKey                     = dict()
+        self._chars                     = dict()
+        self._lastQuery                 = None
+        self._lastMatches               = None
+
+    def add(self, entry):
+        old                             = self._byKey.get(entry.key)
+        if old is not None:
+            self.remove(entry.key)
+        number                          = len(self.entries)
+        self.entries.append(entry)
+        self._byKey[entry.key]          = number
+        for char in set(entry.text) | set(''.join(entry.tags)):
+            self._chars.setdefault(char, set()).add(number)
+        self._lastQuery                 = None
+        return entry
+
+    def __contains__(self, key):
+        return key in self._byKey
+
+    def remove(self, key):
+        number                          = self._byKey.pop(key, None)
+        if number is None:
+            return False
+        self.entries[number]            = None
+        for numbers in self._chars.values():
+            numbers.discard(number)
+        self._lastQuery                 = None
+        return True
+
+    def addPipeline(self, cmdTable):
+        """ Commands of the ConfigPipeline: apps to launch, layouts to show, functions, urls... """
+        for key, cmd in cmdTable.items():
+            code                        = cmd.code
+            kind                        = KIND_APP if code in ['os.startfile', 'os.system'] else \
+                                          KIND_LAYOUT if code == 'showUI' else KIND_COMMAND
+            self.add(CommandEntry(key, kind=kind, tags=[kind], toolTip=cmd.statusTip))
+
+    def addLayouts(self, keys):
+        for key in keys:
+            if key not in self._byKey:
+                self.add(CommandEntry(key, kind=KIND_LAYOUT, tags=[KIND_LAYOUT], toolTip='Show: {0}'.format(key)))
+
+    def addScripts(self, scriptActions):
+        """ Entries of the script menus, chosen by triggering their action """
+        for action in scriptActions:
+            self.add(CommandEntry(script_key(action), action.text(), KIND_SCRIPT,
+                                  [KIND_SCRIPT] + list(action.tags), action.statusTip(), action.trigger))
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Search """
+
+    def candidates(self, query):
+        """ Entries which can match: from the last results when the query grows, else from the character index """
+        if self._lastQuery and self._lastMatches is not None and query.startswith(self._lastQuery):
+            return self._lastMatches
+
+        numbers                         = None
+        for char in set(query):
+            found                       = self._chars.get(char)
+            if not found:
+                return []
+            numbers                     = set(found) if numbers is None else numbers & found
+        return [self.entries[n] for n in numbers or []]
+
+    def search(self, text, limit=MAX_RESULTS):
+        """ :return: the best entries for text, the most used ones first when text is empty """
+        query                           = text.strip().lower()
+        if not query:
+            self._lastQuery             = None
+            ranked                      = sorted((e for e in self.entries if e is not None),
+                                                 key=lambda e: (-self.boost(e.key), e.text))
+            return ranked[:limit]
+
+        scored                          = []
+        matches                         = []
+        now                             = time.time()
+        for entry in self.candidates(query):
+            score                       = max(fuzzy_score(query, entry), tag_score(query, entry))
+            if score:
+                matches.append(entry)
+                scored.append((score + self.boost(entry.key, now), entry))
+
+        self._lastQuery                 = query
+        self._lastMatches               = matches
+        scored.sort(key=lambda s: (-s[0], s[1].text))
+        return [entry for score, entry in scored[:limit]]
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Usage """
+
+    def boost(self, key, now=None):
+        """ Used often and lately: up to ~100 points for a daily command """
+        used                            = self.usage.get(key)
+        if not used:
+            return 0
+        count, last                     = used
+        age                             = (now or time.time()) - last
+        return 20 * math.log1p(count) + 40 * 0.5 ** (age / RECENT_HALF_LIFE)
+
+    def record(self, key):
+        count, last                     = self.usage.get(key, (0, 0))
+        self.usage[key]                 = (count + 1, time.time())
+        self.saveUsage()
+
+    def loadUsage(self):
+        if not self.usageFile:
+            return dict()
+        try:
+            with open(self.usageFile) as f:
+                return {k: tuple(v) for k, v in json.load(f).items()}
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def saveUsage(self):
+        if not self.usageFile:
+            return
+        try:
+            with open(self.usageFile, 'w') as f:
+                json.dump(self.usage, f)
+        except (IOError, OSError):
+            pass
+
+
+class CommandResultModel(QAbstractListModel):
+
+    """ Results of the last search, the view only shows this short list """
+
+    key                                 = 'CommandResultModel'
+
+    def __init__(self, parent=None):
+        super(CommandResultModel, self).__init__(parent)
+
+        self.results                    = []
+
+    def setResults(self, results):
+        self.beginResetModel()
+        self.results                    = list(results)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry                           = self.results[index.row()]
+        if role == Qt.DisplayRole:
+            return '{0}    [{1}]'.format(entry.title, entry.kind)
+        if role == Qt.ToolTipRole:
+            return entry.toolTip
+        if role == EntryRole:
+            return entry
+        return None
+
+    def entry(self, row):
+        return self.results[row] if 0 <= row < len(self.results) else None
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 7:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -6,13 +6,24 @@ Author: Do Trinh/Jimmy - 3D artist.
 
 Description:
 
+    Command palette: results are searched in the CommandIndex while typing, Up/Down to choose, Return to run.
+    A key typed exactly still runs when nothing is chosen.
+
 """
 # -------------------------------------------------------------------------------------------------------------
 
+from PySide2.QtCore import Qt
+from PySide2.QtWidgets import QListView, QAbstractItemView
+
 from pyPLM.Widgets import LineEdit, ShortCut
-from PLM.options import FRAMELESS, KEY_RETURN
+from PLM.options import FRAMELESS, KEY_RETURN, KEY_ENTER, KEY_UP, KEY_DOWN
 from pyPLM.loggers import DamgLogger
 from PLM import APP_LOG
+from PLM.configs import configContext
+from PLM.cores import catalogueService
+from .CommandIndex import CommandIndex, CommandResultModel
+
+VISIBLE_RESULTS = 12
 
 class CommandUI(LineEdit):
 
@@ -26,21 +37,90 @@ class CommandUI(LineEdit):
         self.logger             = DamgLogger(self, filepth=APP_LOG)
 
         self.setWindowFlags(FRAMELESS)
+        self.setPlaceholderText('Command...')
         self.addAction(ShortCut(shortcut='Esc', trigger=self.hide, parent=self))
 
-    def keyReleaseEvent(self, event):
-        if event.key() == KEY_RETURN:
-            self.run()
+        self.index              = CommandIndex()
+        self._indexed           = False
+        configContext.onReload(self.invalidate)
+        catalogueService().commandsChanged.connect(lambda *keys: self.invalidate())
+
+        self.model              = CommandResultModel(self)
+        self.resultView         = QListView()
+        self.resultView.setModel(self.model)
+        self.resultView.setWindowFlags(Qt.ToolTip | FRAMELESS)
+        self.resultView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.resultView.setFocusPolicy(Qt.NoFocus)
+        self.resultView.clicked.connect(lambda index: self.run(self.model.entry(index.row())))
+
+        self.textEdited.connect(self.search)
+
+    def invalidate(self, names=None):
+        """ The commands changed (ReConfig, new script menus): index again on next use """
+        self._indexed           = False
 
-    def run(self):
-        key                     = self.text()
+    def buildIndex(self):
+        # the layouts import the models, the script menus are only looked up when the palette is used
+        from PLM.ui.layouts.ScriptMenu import ScriptsMenu
+        # registered on first use: the scripts added before are read below
+        ScriptsMenu.on_scripts_changed(self.invalidate)
+        self.index.clear()
+        self.index.addPipeline(self.parent.plmInfo)
+        if self.parent.layouts:
+            self.index.addLayouts(self.parent.layouts.keys())
+        self.index.addScripts(ScriptsMenu.script_actions())
+        self._indexed           = True
+
+    def search(self, text):
+        if not self._indexed:
+            self.buildIndex()
+        self.model.setResults(self.index.search(text))
+        if self.model.rowCount():
+            self.resultView.setCurrentIndex(self.model.index(0, 0))
+            self.showResults()
+        else:
+            self.resultView.hide()
+
+    def showResults(self):
+        rowHeight               = max(self.resultView.sizeHintForRow(0), 1)
+        self.resultView.setGeometry(self.x(), self.y() + self.height(), self.width(),
+                                    rowHeight * min(VISIBLE_RESULTS, self.model.rowCount()) + 4)
+        self.resultView.show()
+
+    def keyPressEvent(self, event):
+        if event.key() in [KEY_UP, KEY_DOWN] and self.resultView.isVisible():
+            row                 = self.resultView.currentIndex().row() + (1 if event.key() == KEY_DOWN else -1)
+            if 0 <= row < self.model.rowCount():
+                self.resultView.setCurrentIndex(self.model.index(row, 0))
+            return
+        if event.key() in [KEY_RETURN, KEY_ENTER]:
+            current             = self.resultView.currentIndex()
+            entry               = self.model.entry(current.row()) if self.resultView.isVisible() else None
+            return self.run(entry)
+        super(CommandUI, self).keyPressEvent(event)
+
+    def run(self, entry=None):
+        key                     = entry.key if entry is not None else self.text()
         self.setText('')
-        self.parent.command(key)
+        self.resultView.hide()
         self.close()
 
+        if entry is not None and entry.run is not None:
+            entry.run()
+        else:
+            self.parent.command(key)
+        if key in self.index:
+            self.index.record(key)
+
+    def showEvent(self, event):
+        super(CommandUI, self).showEvent(event)
+        self.search('')
 
+    def hideEvent(self, event):
+        self.resultView.hide()
+        super(CommandUI, self).hideEvent(event)
 
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by panda on 11/11/2019 - 5:30 PM
-# © 2017 - 2018 DAMGteam. All rights reserved
\ No newline at end of file
+# © 2017 - 2018 DAMGteam. All rights reserved
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: LibraryModel.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Item model of the library views (UserLibrary, HDRILibrary, TextureLibrary, AlphaLibrary), filled from the
+    LibraryIndex by pages when the view scrolls, with thumbnails from the thumbnail service. LibraryScanner
+    brings the index up to date in a thread, the views keep showing what is indexed while it runs.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# PySide2
+from PySide2.QtCore                     import Qt, QAbstractListModel, QModelIndex
+
+# PLM
+from pyPLM.Core                         import Thread, Signal
+from PLM.cores                          import thumbnailService
+from PLM.cores.data                     import LibraryIndex
+
+
+AssetRole                               = Qt.UserRole + 1
+PathRole                                = Qt.UserRole + 2
+
+
+class LibraryScanner(Thread):
+
+    key                                 = 'LibraryScanner'
+
+    progress                            = Signal(int, int)
+    done                                = Signal(dict)
+
+    def __init__(self, libraries=None, index=None):
+        super(LibraryScanner, self).__init__()
+
+        self.libraries                  = libraries
+        self.index                      = index or LibraryIndex.instance()
+
+    def start(self, *args):
+        # set here, not in run(): a stop_running() coming before the thread is scheduled must not be lost
+        self.start_running()
+        super(LibraryScanner, self).start(*args)
+
+    def run(self):
+        result                          = self.index.scan(self.libraries, progress=self.progress.emit,
+                                                          cancel=lambda: not self.running)
+        self.done.emit(result)
+
+
+class LibraryModel(QAbstractListModel):
+
+    key                                 = 'LibraryModel'
+
+    def __init__(self, library, sizeClass='medium', index=None, parent=None):
+        super(LibraryModel, self).__init__(parent)
+
+        self.library                    = library
+        self.sizeClass                  = sizeClass
+        self.libraryIndex               = index or LibraryIndex.instance()
+
+        self.assets                     = []
+        self.rows                       = dict()
+        self.pages                      = None
+        self.filters                    = dict()
+
+        thumbnailService.thumbnailReady.connect(self.thumbnailReady)
+
+    def setFilters(self, text=None, tags=None, exts=None, **attributes):
+        """ Filter with the index (see LibraryIndex.where), only the first page is read now """
+        self.filters                    = dict(text=text, tags=tags, exts=exts, **attributes)
+        self.refresh()
+
+    def refresh(self):
+        # only the thumbnails of this model, the other views keep theirs
+        thumbnailService.cancel(owner=self)
+        self.beginResetModel()
+        self.assets                     = []
+        self.rows                       = dict()
+        self.pages                      = self.libraryIndex.query(self.library, **self.filters)
+        self.endResetModel()
+        if self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.pages is not None
+
+    def fetchMore(self, parent):
+        if parent.isValid() or self.pages is None:
+            return
+        page                            = next(self.pages, None)
+        if not page:
+            self.pages                  = None
+            return
+        first                           = len(self.assets)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        for row, asset in enumerate(page, first):
+            self.rows[asset['path']]    = row
+        self.assets.extend(page)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.assets)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        asset                           = self.assets[index.row()]
+
+        if role == Qt.DisplayRole:
+            return asset['name']
+        if role == Qt.DecorationRole:
+            # a placeholder until the thumbnail is made, thumbnailReady updates the row
+            return thumbnailService.request(asset['path'], self.sizeClass, owner=self)
+        if role == Qt.ToolTipRole:
+            size                        = '{0} x {1}, {2} ch, {3} bit'.format(asset['width'], asset['height'],
+                                           asset['channels'], asset['bitDepth']) if asset['width'] else asset['error']
+            return '{0}\n{1}\n{2:,} KB'.format(asset['path'], size, asset['fileSize'] // 1024)
+        if role == AssetRole:
+            return asset
+        if role == PathRole:
+            return asset['path']
+        return None
+
+    def thumbnailReady(self, path, sizeClass, pixmap):
+        row                             = self.rows.get(path)
+        if row is not None and sizeClass == self.sizeClass:
+            index                       = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 6:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: TaskDashboard.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Task dashboard: one model over the shared TaskRepository, updated by the DeadlineClock, shown by a list view
+    with a delegate painting every task card. TaskStatusProxy filters by status (TaskFilter check boxes), no
+    widget is made or removed when the filter or the countdowns change.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# PySide2
+from PySide2.QtCore                         import (Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel,
+                                                    QRect, QSize)
+from PySide2.QtGui                          import QColor, QFont, QPen
+from PySide2.QtWidgets                      import QStyledItemDelegate, QStyle
+
+# PLM
+from pyPLM.Core                             import Signal
+from PLM.cores.models.TaskRepository        import (taskRepository, deadlineClock, STATUS_OVERDUE, STATUS_URGENT)
+
+
+TaskRole                                    = Qt.UserRole + 1
+StatusRole                                  = Qt.UserRole + 2
+CountdownRole                               = Qt.UserRole + 3
+
+GROUP_OTHERS                                = 'Others'
+STATUS_COLORS                               = {STATUS_OVERDUE: QColor('red'), STATUS_URGENT: QColor('orange')}
+OTHERS_COLOR                                = QColor('green')
+ALARM_SECONDS                               = 30
+CARD_SIZE                                   = QSize(100, 120)
+
+
+def status_group(status):
+    return status if status in [STATUS_OVERDUE, STATUS_URGENT] else GROUP_OTHERS
+
+
+class TaskDashboardModel(QAbstractListModel):
+
+    key                                     = 'TaskDashboardModel'
+
+    statusesChanged                         = Signal()
+    deadlineReached                         = Signal(str)
+
+    def __init__(self, repository=None, clock=None, parent=None):
+        super(TaskDashboardModel, self).__init__(parent)
+
+        self.repository                     = repository or taskRepository()
+        self.clock                          = clock or deadlineClock()
+        self.now                            = self.clock.now()
+        self.tasks                          = []
+        self.statuses                       = dict()
+        self.alarmed                        = set()
+
+        self.repository.changed.connect(self.refresh)
+        self.clock.tick.connect(self.onTick)
+        self.clock.acquire()
+        self.refresh()
+
+    def refresh(self):
+        self.beginResetModel()
+        self.tasks                          = list(self.repository.tasks)
+        self.statuses                       = {t.id: t.status(self.now) for t in self.tasks}
+        self.endResetModel()
+
+    def release(self):
+        """ Stop using the shared clock, ie: when the view is closed """
+        self.clock.tick.disconnect(self.onTick)
+        self.clock.release()
+
+    def onTick(self, now):
+        self.now                            = now
+        if not self.tasks:
+            return
+
+        statusChanged                       = False
+        for task in self.tasks:
+            remaining                       = task.remaining(now)
+            status                          = task.status(now)
+            if self.statuses.get(task.id) != status:
+                self.statuses[task.id]      = status
+                statusChanged               = True
+            if 0 < remaining <= ALARM_SECONDS and task.id not in self.alarmed:
+                self.alarmed.add(task.id)
+                self.deadlineReached.emit(task.id)
+
+        # the view only repaints the cards on screen
+        self.dataChanged.emit(self.index(0, 0), self.index(len(self.tasks) - 1, 0), [CountdownRole, StatusRole])
+        if statusChanged:
+            self.statusesChanged.emit()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.tasks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task                                = self.tasks[index.row()]
+
+        if role == Qt.DisplayRole:
+            return task.id
+        if role == StatusRole:
+            return self.statuses.get(task.id)
+        if role == CountdownRole:
+            return task.countdown(self.now)
+        if role == TaskRole:
+            return task
+        if role == Qt.ToolTipRole:
+            return '{0} - {1}\nDue {2:%d/%m/%y %H:%M:%S}'.format(task.id, task.name, task.deadline)
+        return None
+
+
+class TaskStatusProxy(QSortFilterProxyModel):
+
+    """ Shows the tasks of the checked status groups: Overdued, Urgent, Others """
+
+    key                                     = 'TaskStatusProxy'
+
+    def __init__(self, parent=None):
+        super(TaskStatusProxy, self).__init__(parent)
+
+        self.groups                         = {STATUS_OVERDUE: True, STATUS_URGENT: True, GROUP_OTHERS: True}
+
+    def setSourceModel(self, model):
+        super(TaskStatusProxy, self).setSourceModel(model)
+        model.statusesChanged.connect(self.invalidateFilter)
+
+    def setGroupVisible(self, group, visible):
+        visible                             = bool(visible)
+        if self.groups.get(group) != visible:
+            self.groups[group]              = visible
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, row, parent):
+        status                              = self.sourceModel().index(row, 0, parent).data(StatusRole)
+        return self.groups.get(status_group(status), True)
+
+
+class TaskDelegate(QStyledItemDelegate):
+
+    """ Paints a task card: id, status, due date, due time and countdown """
+
+    key                                     = 'TaskDelegate'
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def paint(self, painter, option, index):
+        task                                = index.data(TaskRole)
+        if task is None:
+            return super(TaskDelegate, self).paint(painter, option, index)
+
+        status                              = index.data(StatusRole)
+        rect                                = option.rect.adjusted(2, 2, -2, -2)
+        palette                             = option.palette
+
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, palette.highlight())
+        painter.setPen(QPen(palette.mid().color()))
+        painter.drawRect(rect)
+
+        lineHeight                          = option.fontMetrics.height() + 4
+        line                                = QRect(rect.left() + 6, rect.top() + 4, rect.width() - 12, lineHeight)
+
+        bold                                = QFont(option.font)
+        bold.setBold(True)
+        painter.setFont(bold)
+        painter.setPen(palette.text().color())
+        painter.drawText(line, Qt.AlignLeft | Qt.AlignVCenter, option.fontMetrics.elidedText(
+                         str(task.id), Qt.ElideRight, line.width()))
+
+        painter.setFont(option.font)
+        rows                                = [(status, STATUS_COLORS.get(status, OTHERS_COLOR)),
+                                               ('{0:%d/%m/%y}'.format(task.deadline), palette.text().color()),
+                                               ('{0:%H:%M:%S}'.format(task.deadline), palette.text().color()),
+                                               (index.data(CountdownRole), palette.text().color())]
+        for text, color in rows:
+            line.translate(0, lineHeight)
+            painter.setPen(color)
+            painter.drawText(line, Qt.AlignLeft | Qt.AlignVCenter, text or '')
+        painter.restore()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 7:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -14,6 +14,9 @@ from .ActionManager         import ActionManager
 from .AppModel              import AppModel
 from .ButtonManager         import ButtonManager
 from .CommandUI             import CommandUI
+from .CommandDispatcher     import CommandDispatcher
+from .LibraryModel          import LibraryModel, LibraryScanner
+from .TaskDashboard         import TaskDashboardModel, TaskStatusProxy, TaskDelegate
 from .RegistryLayout        import RegistryLayout
 
 # -------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: ResourceLoader.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Lazy resource backend. A bundle is registered to the Qt resource system the first time a tool or a theme asks
+    for it. The binary .rcc file is preferred (memory mapped by Qt, nothing is parsed by python), the generated
+    *_rc.py module is only imported as a fallback when the .rcc file is missing.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sys, time, importlib, subprocess
+
+# PySide2
+from PySide2.QtCore                     import QResource
+
+# PLM
+from PLM                                import APP_LOG
+from pyPLM.loggers                      import DamgLogger
+from .rccCompiler                       import RCS_DIR, rccPath, rcModulePath, listBundles
+
+
+# Theme/tool key to bundle name
+BUNDLES                                 = dict( dark            = 'darkstyle',
+                                                PyQt5           = 'pyqt5_style',
+                                                PySide2         = 'pyside2_style',
+                                                pyqtgraph       = 'pyqtgraph_style',
+                                                TextEditor      = 'TextEditor',
+                                                Browser         = 'PLMBrowser',
+                                                Configurations  = 'configurations', )
+
+_registered                             = dict()
+
+logger                                  = DamgLogger(__name__, filepth=APP_LOG)
+
+
+def bundleName(key):
+    return BUNDLES.get(key, key)
+
+
+def isRegistered(key):
+    return bundleName(key) in _registered
+
+
+def registerResource(key):
+    """
+    Register a resource bundle once per session.
+    :param key: theme/tool key (see BUNDLES) or bundle name
+    :return: 'rcc' or 'module' for the backend used, None if the bundle does not exist
+    """
+    name                                = bundleName(key)
+
+    if name in _registered:
+        return _registered[name]
+
+    if os.path.exists(rccPath(name)) and QResource.registerResource(rccPath(name)):
+        _registered[name]               = 'rcc'
+    elif os.path.exists(rcModulePath(name)):
+        importlib.import_module('PLM.ui.rcs.{0}_rc'.format(name))
+        _registered[name]               = 'module'
+    else:
+        logger.warning('There is no resource bundle: {0}'.format(name))
+        return None
+
+    return _registered[name]
+
+
+def unregisterResource(key):
+    name                                = bundleName(key)
+    backend                             = _registered.pop(name, None)
+
+    if backend == 'rcc':
+        return QResource.unregisterResource(rccPath(name))
+    elif backend == 'module':
+        return sys.modules['PLM.ui.rcs.{0}_rc'.format(name)].qCleanupResources()
+
+    return False
+
+
+# -------------------------------------------------------------------------------------------------------------
+""" Benchmark """
+
+# Both snippets load the bundle from this folder directly so the PLM package (and its environment setup) is not
+# imported. The module import goes through the normal import system so the .pyc cache is used after the first run.
+_moduleSnippet = """
+import sys, time, importlib
+sys.path.insert(0, {folder!r})
+start = time.perf_counter()
+importlib.import_module({module!r})
+print(time.perf_counter() - start)
+"""
+
+_rccSnippet = """
+import time
+from PySide2.QtCore import QResource
+start = time.perf_counter()
+assert QResource.registerResource({path!r})
+print(time.perf_counter() - start)
+"""
+
+
+def _timeSnippet(snippet, path):
+    code                                = snippet.format(path=path, folder=RCS_DIR,
+                                                         module=os.path.splitext(os.path.basename(path))[0])
+    try:
+        output                          = subprocess.check_output([sys.executable, '-c', code],
+                                                                  stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError:
+        return None
+    return float(output.decode('utf8').strip().splitlines()[-1])
+
+
+def benchmark(names=None, repeat=3):
+    """
+    Compare the cost of importing the generated module against registering the .rcc file. Every run happens in a
+    fresh interpreter, the best of 'repeat' runs is kept.
+    :return: dict of bundle name: dict(module=best seconds, rcc=best seconds, moduleSize=bytes, rccSize=bytes)
+    """
+    results                             = dict()
+
+    for name in names or listBundles():
+        result                          = dict(module=None, rcc=None, moduleSize=None, rccSize=None)
+
+        for backend, snippet, path in [('module', _moduleSnippet, rcModulePath(name)), ('rcc', _rccSnippet, rccPath(name))]:
+            if not os.path.exists(path):
+                continue
+            timings                     = [_timeSnippet(snippet, path) for _ in range(repeat)]
+            timings                     = [t for t in timings if t is not None]
+            result[backend]             = min(timings) if timings else None
+            result['{0}Size'.format(backend)] = os.path.getsize(path)
+
+        results[name]                   = result
+
+    return results
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    for name, result in benchmark().items():
+        logger.info('{0:<20} module: {1}s ({2} bytes)    rcc: {3}s ({4} bytes)'.format(name, result['module'],
+                                                                                     result['moduleSize'], result['rcc'],
+                                                                                     result['rccSize']))
+    logger.info('benchmark finished in {0:.2f}s'.format(time.perf_counter() - start))
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:12 AM
+# © 2017 - 2020 DAMGteam. All rights reserved
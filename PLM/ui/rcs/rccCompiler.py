@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: rccCompiler.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Convert the generated *_rc.py resource modules into binary .rcc files which can be registered at runtime with
+    QResource.registerResource (Qt memory maps the file instead of keeping a python bytes object alive).
+
+    The *_rc.py modules already hold the three sections of an rcc binary (data, names, tree struct), so the module is
+    parsed with ast and never imported: no Qt binding is needed to rebuild the .rcc files.
+
+    Usage:
+        python rccCompiler.py                   # rebuild every *_rc.py in this folder
+        python rccCompiler.py pyside2_style     # rebuild one bundle
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, ast, struct, sys
+
+RCS_DIR                                 = os.path.dirname(os.path.abspath(__file__)).replace('\\', '/')
+
+RCC_MAGIC                               = b'qres'
+RCC_HEADER_SIZE                         = 20
+
+
+def rcModulePath(name):
+    return os.path.join(RCS_DIR, '{0}_rc.py'.format(name)).replace('\\', '/')
+
+
+def rccPath(name):
+    return os.path.join(RCS_DIR, '{0}.rcc'.format(name)).replace('\\', '/')
+
+
+def listBundles():
+    """ Names of all the generated resource modules in this folder (without the '_rc.py' suffix) """
+    return sorted([f[:-len('_rc.py')] for f in os.listdir(RCS_DIR) if f.endswith('_rc.py')])
+
+
+def readSections(modulePath):
+    """
+    Read the byte literals out of a generated resource module without executing it.
+    :param modulePath: path to the *_rc.py file
+    :return: (version, struct, names, data)
+    """
+    with open(modulePath, 'rb') as f:
+        tree                            = ast.parse(f.read(), modulePath)
+
+    sections                            = dict()
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, bytes):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    sections[target.id] = node.value.value
+
+    # Modules generated by Qt >= 5.8 ship both tree layouts, the v2 one carries the last modified stamp.
+    if 'qt_resource_struct_v2' in sections:
+        version, struct_data            = 2, sections['qt_resource_struct_v2']
+    elif 'qt_resource_struct' in sections:
+        version, struct_data            = 1, sections['qt_resource_struct']
+    else:
+        raise ValueError('No resource struct found in: {0}'.format(modulePath))
+
+    return version, struct_data, sections['qt_resource_name'], sections['qt_resource_data']
+
+
+def buildRcc(version, struct_data, names, data):
+    """ Pack the three sections behind an rcc header (magic, version, tree offset, data offset, names offset) """
+    data_offset                         = RCC_HEADER_SIZE
+    names_offset                        = data_offset + len(data)
+    tree_offset                         = names_offset + len(names)
+    header                              = RCC_MAGIC + struct.pack('>iiii', version, tree_offset, data_offset, names_offset)
+    return header + data + names + struct_data
+
+
+def compileRcc(name, force=False):
+    """
+    Write <name>.rcc next to <name>_rc.py.
+    :param name: bundle name, ie: 'pyside2_style'
+    :param force: rebuild even if the .rcc file is newer than the module
+    :return: path to the .rcc file
+    """
+    src                                 = rcModulePath(name)
+    dst                                 = rccPath(name)
+
+    if not force and os.path.exists(dst) and os.path.getmtime(dst) >= os.path.getmtime(src):
+        return dst
+
+    with open(dst, 'wb') as f:
+        f.write(buildRcc(*readSections(src)))
+
+    return dst
+
+
+def compileAll(force=False):
+    return [compileRcc(name, force) for name in listBundles()]
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or listBundles()
+    for name in names:
+        print('compiled: {0}'.format(compileRcc(name, True)))
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:12 AM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -28,6 +28,7 @@ from PySide2.QtNetwork            import QNetworkProxyFactory, QNetworkRequest
 
 # PLM
 from pyPLM.Widgets import Widget, VBoxLayout
+from PLM.ui.rcs.ResourceLoader import registerResource
 
 # -------------------------------------------------------------------------------------------------------------
 """ Pipeline Web browser """
@@ -43,6 +44,7 @@ class WebBrowser(QMainWindow):
 
         self.progress = 0
 
+        registerResource('Browser')
         fd = QFile(":/jquery.min.js")
 
         if fd.open(QIODevice.ReadOnly | QFile.Text):
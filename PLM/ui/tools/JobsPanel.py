@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: JobsPanel.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Jobs of the JobQueue: launched applications and batch runs, newest first, with their status, times, exit code
+    and CPU time. Rows are updated one by one when a job changes. The log of the selected job is shown below it,
+    a running batch job streams its output there.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import datetime
+
+# PySide2
+from PySide2.QtCore                     import Qt, QAbstractTableModel, QModelIndex
+from PySide2.QtGui                      import QColor
+from PySide2.QtWidgets                  import (QAbstractItemView, QComboBox, QGridLayout, QHeaderView, QLabel,
+                                                QPushButton, QSpinBox, QTableView, QPlainTextEdit, QSplitter)
+
+# PLM
+from pyPLM.Widgets                      import Widget
+from pyPLM.Gui                          import AppIcon
+from PLM.cores.JobQueue                 import jobQueue, JOB_LAUNCHED, JOB_INTERRUPTED
+from PLM.cores.ProcessRunner            import JOB_QUEUED, JOB_RUNNING, JOB_FAILED, JOB_KILLED
+
+
+ALL                                     = 'All'
+STATUSES                                = [ALL, JOB_QUEUED, JOB_RUNNING, JOB_LAUNCHED, 'Done', JOB_FAILED, JOB_KILLED,
+                                           'Closed', JOB_INTERRUPTED]
+HEADERS                                 = [('ID', 'id'), ('Status', 'status'), ('Kind', 'kind'), ('Title', 'title'),
+                                           ('Started', 'started'), ('Duration', 'duration'), ('Exit', 'exitCode'),
+                                           ('CPU (s)', 'cpuTime')]
+STATUS_COLORS                           = {JOB_RUNNING: QColor(60, 150, 220), JOB_FAILED: QColor(210, 60, 60),
+                                           JOB_KILLED: QColor(200, 140, 0), JOB_INTERRUPTED: QColor(200, 140, 0)}
+LOG_LINE_CAP                            = 5000
+
+
+def duration_text(seconds):
+    if seconds is None:
+        return ''
+    seconds                             = int(seconds)
+    return '{0}:{1:02d}:{2:02d}'.format(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+class JobTableModel(QAbstractTableModel):
+
+    key                                 = 'JobTableModel'
+
+    def __init__(self, parent=None):
+        super(JobTableModel, self).__init__(parent)
+
+        self.jobs                       = []
+        self.pages                      = None
+
+    def setQuery(self, pages):
+        """ :param pages: generator of job pages, from JobStore.query """
+        self.beginResetModel()
+        self.jobs                       = []
+        self.pages                      = pages
+        self.endResetModel()
+        if self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.pages is not None
+
+    def fetchMore(self, parent):
+        if parent.isValid() or self.pages is None:
+            return
+        page                            = next(self.pages, None)
+        if not page:
+            self.pages                  = None
+            return
+        first                           = len(self.jobs)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self.jobs.extend(page)
+        self.endInsertRows()
+
+    def updateJob(self, record, insert=True):
+        """ Update the row of a job, a new job is added on top """
+        for row, job in enumerate(self.jobs):
+            if job['id'] == record['id']:
+                self.jobs[row]          = record
+                return self.dataChanged.emit(self.index(row, 0), self.index(row, len(HEADERS) - 1))
+        if insert and (not self.jobs or record['id'] > self.jobs[0]['id']):
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self.jobs.insert(0, record)
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job                             = self.jobs[index.row()]
+        field                           = HEADERS[index.column()][1]
+
+        if role == Qt.DisplayRole:
+            if field == 'started':
+                return datetime.datetime.fromtimestamp(job['started']).strftime('%Y.%m.%d %H:%M:%S') \
+                                                                                    if job['started'] else ''
+            if field == 'duration':
+                return duration_text(job['ended'] - job['started']) if job['started'] and job['ended'] else ''
+            if field == 'cpuTime':
+                return '{0:.1f}'.format(job['cpuTime']) if job['cpuTime'] is not None else ''
+            return job[field]
+        if role == Qt.ForegroundRole and field == 'status':
+            return STATUS_COLORS.get(job['status'])
+        if role == Qt.ToolTipRole and field == 'title':
+            return ' '.join([job['program']] + job['arguments'])
+        return None
+
+    def job(self, row):
+        return self.jobs[row]
+
+
+class JobsPanel(Widget):
+
+    key                                 = 'JobsPanel'
+
+    def __init__(self, queue=None, parent=None):
+        super(JobsPanel, self).__init__(parent)
+
+        self.setWindowIcon(AppIcon(32, 'TextEditor'))
+        self.setWindowTitle('Jobs')
+
+        self.queue                      = queue or jobQueue()
+        self.model                      = JobTableModel(self)
+        self.streaming                  = None
+
+        self.layout                     = QGridLayout(self)
+        self.buildUI()
+        self.queue.jobChanged.connect(self.onJobChanged)
+        self.search()
+
+    def buildUI(self):
+        self.statusCB                   = QComboBox(self)
+        self.statusCB.addItems(STATUSES)
+        self.statusCB.currentIndexChanged.connect(self.search)
+
+        self.concurrencySB              = QSpinBox(self)
+        self.concurrencySB.setRange(1, 64)
+        self.concurrencySB.setValue(self.queue.concurrency)
+        self.concurrencySB.valueChanged.connect(self.queue.setConcurrency)
+
+        killBtn                         = QPushButton('Kill', self)
+        killBtn.clicked.connect(self.killSelected)
+        refreshBtn                      = QPushButton('Refresh', self)
+        refreshBtn.clicked.connect(self.search)
+
+        self.table                      = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.selectionModel().currentRowChanged.connect(self.showJob)
+
+        self.logView                    = QPlainTextEdit(self)
+        self.logView.setReadOnly(True)
+        self.logView.setMaximumBlockCount(LOG_LINE_CAP)
+
+        splitter                        = QSplitter(Qt.Vertical, self)
+        splitter.addWidget(self.table)
+        splitter.addWidget(self.logView)
+        splitter.setStretchFactor(0, 3)
+
+        self.layout.addWidget(QLabel('Status'), 0, 0, 1, 1)
+        self.layout.addWidget(self.statusCB, 0, 1, 1, 1)
+        self.layout.addWidget(QLabel('Batch slots'), 0, 2, 1, 1)
+        self.layout.addWidget(self.concurrencySB, 0, 3, 1, 1)
+        self.layout.addWidget(killBtn, 0, 4, 1, 1)
+        self.layout.addWidget(refreshBtn, 0, 5, 1, 1)
+        self.layout.addWidget(splitter, 1, 0, 1, 6)
+
+    def search(self, *args):
+        status                          = self.statusCB.currentText()
+        self.model.setQuery(self.queue.store.query(statuses=[status] if status != ALL else None))
+        self.table.resizeColumnsToContents()
+
+    def onJobChanged(self, id):
+        record                          = self.queue.store.job(id)
+        status                          = self.statusCB.currentText()
+        if record is not None:
+            self.model.updateJob(record, insert=status in [ALL, record['status']])
+
+    def selectedJob(self):
+        index                           = self.table.currentIndex()
+        return self.model.job(index.row()) if index.isValid() else None
+
+    def killSelected(self):
+        record                          = self.selectedJob()
+        if record is not None:
+            self.queue.kill(record['id'])
+
+    def showJob(self, current, previous):
+        if self.streaming is not None:
+            try:
+                self.streaming.output.disconnect(self.logView.appendPlainText)
+            except RuntimeError:
+                # the job ended and was deleted
+                pass
+            self.streaming              = None
+        self.logView.clear()
+        if not current.isValid():
+            return
+
+        record                          = self.model.job(current.row())
+        self.logView.setPlainText(self.queue.logText(record['id']))
+        errors                          = self.queue.logText(record['id'], 'err')
+        if errors:
+            self.logView.appendPlainText('\n--- stderr ---\n{0}'.format(errors))
+
+        job                             = self.queue.job(record['id'])
+        if job is not None and job.isRunning():
+            # the log files have what ran so far, the rest is streamed
+            job.output.connect(self.logView.appendPlainText)
+            self.streaming              = job
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 9:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: LargeFileViewer.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Read only viewer for files too big for a QTextEdit. The file stays on disk (MappedText), the line index is
+    built in a thread and the view only decodes and paints the lines on screen. It can search the whole file
+    while typing and follow a growing file like 'tail -f'.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# PySide2
+from PySide2.QtCore                     import Qt, QTimer, QRect
+from PySide2.QtGui                      import QFontDatabase, QPainter, QPalette, QColor
+from PySide2.QtWidgets                  import (QAbstractScrollArea, QCheckBox, QLabel, QLineEdit, QToolBar,
+                                                QVBoxLayout)
+
+# PLM
+from pyPLM.Core                         import Thread, Signal
+from pyPLM.Widgets                      import Widget
+from PLM.cores.data                     import MappedText
+
+
+FOLLOW_INTERVAL                         = 500
+MATCH_COLOR                             = QColor(255, 200, 0, 110)
+
+
+class MappedTextIndexer(Thread):
+
+    key                                 = 'MappedTextIndexer'
+
+    progress                            = Signal(int)
+    done                                = Signal(bool)
+
+    def __init__(self, mappedText):
+        super(MappedTextIndexer, self).__init__()
+
+        self.mappedText                 = mappedText
+
+    def start(self, *args):
+        # set here, not in run(): a stop_running() coming before the thread is scheduled must not be lost
+        self.start_running()
+        super(MappedTextIndexer, self).start(*args)
+
+    def run(self):
+        finished                        = self.mappedText.build(progress=self.progress.emit,
+                                                                cancel=lambda: not self.running)
+        self.done.emit(finished)
+
+
+class LargeTextView(QAbstractScrollArea):
+
+    key                                 = 'LargeTextView'
+
+    def __init__(self, parent=None):
+        super(LargeTextView, self).__init__(parent)
+
+        self.mappedText                 = None
+        self.match                      = None
+        self.follow                     = False
+        self._maxColumns                = 0
+
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.setFocusPolicy(Qt.StrongFocus)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Model """
+
+    def setMappedText(self, mappedText):
+        self.mappedText                 = mappedText
+        self.match                      = None
+        self._maxColumns                = 0
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+        self.linesChanged()
+
+    def lineCount(self):
+        return self.mappedText.lineCount() if self.mappedText else 0
+
+    def lineHeight(self):
+        return self.fontMetrics().height()
+
+    def visibleLines(self):
+        return max(1, self.viewport().height() // self.lineHeight())
+
+    def gutterWidth(self):
+        return self.fontMetrics().horizontalAdvance('9' * (len(str(self.lineCount())) + 1))
+
+    def linesChanged(self):
+        """ The index has grown: update the scroll range, stay at the end when following the file """
+        visible                         = self.visibleLines()
+        bar                             = self.verticalScrollBar()
+        bar.setRange(0, max(0, self.lineCount() - visible + 1))
+        bar.setPageStep(visible)
+        if self.follow:
+            bar.setValue(bar.maximum())
+        self.viewport().update()
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Navigation """
+
+    def firstVisibleLine(self):
+        return self.verticalScrollBar().value()
+
+    def goToLine(self, line, match=None):
+        """ Center the line in the view, 'match' is the (line, column, length) to highlight """
+        self.match                      = match
+        self.verticalScrollBar().setValue(max(0, line - self.visibleLines() // 2))
+        if match is not None:
+            charWidth                   = self.fontMetrics().averageCharWidth()
+            column                      = match[1] * charWidth
+            bar                         = self.horizontalScrollBar()
+            if not bar.value() <= column <= bar.value() + self.viewport().width() - self.gutterWidth():
+                bar.setValue(max(0, column - self.viewport().width() // 2))
+        self.viewport().update()
+
+    def scrollToEnd(self):
+        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Paint """
+
+    def resizeEvent(self, event):
+        super(LargeTextView, self).resizeEvent(event)
+        self.linesChanged()
+
+    def paintEvent(self, event):
+        painter                         = QPainter(self.viewport())
+        palette                         = self.palette()
+        painter.fillRect(event.rect(), palette.color(QPalette.Base))
+        if not self.mappedText:
+            return
+
+        metrics                         = self.fontMetrics()
+        height                          = self.lineHeight()
+        charWidth                       = metrics.averageCharWidth()
+        gutter                          = self.gutterWidth()
+        offsetX                         = self.horizontalScrollBar().value()
+        first                           = self.firstVisibleLine()
+        lines                           = self.mappedText.lines(first, self.visibleLines() + 1)
+
+        painter.fillRect(QRect(0, 0, gutter, self.viewport().height()), palette.color(QPalette.AlternateBase))
+        painter.setClipRect(QRect(gutter, 0, self.viewport().width() - gutter, self.viewport().height()))
+
+        for row, text in enumerate(lines):
+            top                         = row * height
+            if self.match is not None and self.match[0] == first + row:
+                x                       = gutter + self.match[1] * charWidth - offsetX
+                painter.fillRect(QRect(x, top, max(1, self.match[2]) * charWidth, height), MATCH_COLOR)
+            painter.setPen(palette.color(QPalette.Text))
+            painter.drawText(gutter + 4 - offsetX, top + metrics.ascent(), text.expandtabs(4))
+            self._maxColumns            = max(self._maxColumns, len(text))
+
+        painter.setClipping(False)
+        painter.setPen(palette.color(QPalette.Mid))
+        for row in range(len(lines)):
+            painter.drawText(QRect(0, row * height, gutter - 4, height), Qt.AlignRight, str(first + row + 1))
+
+        # the widest line is only known for the lines already shown
+        hbar                            = self.horizontalScrollBar()
+        hbar.setRange(0, max(0, self._maxColumns * charWidth - self.viewport().width() + gutter + 8))
+        hbar.setPageStep(self.viewport().width())
+
+
+class LargeFileViewer(Widget):
+
+    key                                 = 'LargeFileViewer'
+
+    def __init__(self, filePath=None, follow=False, parent=None):
+        super(LargeFileViewer, self).__init__(parent)
+
+        self.mappedText                 = None
+        self.indexer                    = None
+        self.followTimer                = QTimer(self)
+        self.followTimer.setInterval(FOLLOW_INTERVAL)
+        self.followTimer.timeout.connect(self.refresh)
+
+        self.buildUI()
+        self.followCB.setChecked(follow)
+
+        if filePath:
+            self.load(filePath)
+
+    def buildUI(self):
+        layout                          = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        tb                              = QToolBar(self)
+        self.searchLE                   = QLineEdit(self)
+        self.searchLE.setPlaceholderText('Search')
+        self.searchLE.setClearButtonEnabled(True)
+        self.searchLE.textEdited.connect(self.searchIncremental)
+        self.searchLE.returnPressed.connect(self.findNext)
+        tb.addWidget(self.searchLE)
+        tb.addAction('Previous', self.findPrevious)
+        tb.addAction('Next', self.findNext)
+
+        self.caseCB                     = QCheckBox('Match case', self)
+        self.followCB                   = QCheckBox('Follow', self)
+        self.followCB.toggled.connect(self.setFollow)
+        tb.addWidget(self.caseCB)
+        tb.addWidget(self.followCB)
+
+        self.statusLB                   = QLabel(self)
+        tb.addSeparator()
+        tb.addWidget(self.statusLB)
+
+        self.view                       = LargeTextView(self)
+        layout.addWidget(tb)
+        layout.addWidget(self.view)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ File """
+
+    def load(self, filePath):
+        self.close_file()
+        try:
+            self.mappedText             = MappedText(filePath)
+        except (IOError, OSError, ValueError) as err:
+            self.statusLB.setText(str(err))
+            return False
+
+        self.view.setMappedText(self.mappedText)
+        self.indexer                    = MappedTextIndexer(self.mappedText)
+        self.indexer.progress.connect(self.indexProgress)
+        self.indexer.done.connect(self.indexDone)
+        self.indexer.start()
+        return True
+
+    def close_file(self):
+        self.followTimer.stop()
+        if self.indexer is not None:
+            self.indexer.stop_running()
+            self.indexer.wait()
+            self.indexer                = None
+        if self.mappedText is not None:
+            self.view.setMappedText(None)
+            self.mappedText.close()
+            self.mappedText             = None
+
+    def indexProgress(self, percent):
+        self.view.linesChanged()
+        self.statusLB.setText('Indexing {0}% - {1:,} lines'.format(percent, self.view.lineCount()))
+
+    def indexDone(self, finished):
+        self.view.linesChanged()
+        self.statusLB.setText('{0:,} lines'.format(self.view.lineCount()))
+        if finished and self.followCB.isChecked():
+            self.followTimer.start()
+
+    def setFollow(self, follow):
+        self.view.follow                = follow
+        if not follow:
+            self.followTimer.stop()
+        elif self.mappedText is not None and self.mappedText.indexed:
+            self.view.scrollToEnd()
+            self.followTimer.start()
+
+    def refresh(self):
+        if self.mappedText is None:
+            return
+        if self.mappedText.refresh():
+            self.view.linesChanged()
+            self.statusLB.setText('{0:,} lines'.format(self.view.lineCount()))
+
+    def closeEvent(self, event):
+        self.close_file()
+        super(LargeFileViewer, self).closeEvent(event)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Search """
+
+    def search(self, fromLine, backwards=False):
+        text                            = self.searchLE.text()
+        if not text or self.mappedText is None:
+            return None
+
+        match                           = self.mappedText.find(text, fromLine, backwards, self.caseCB.isChecked())
+        if match is None:
+            self.statusLB.setText('"{0}" not found'.format(text))
+        else:
+            self.view.goToLine(match[0], match)
+            self.statusLB.setText('Line {0:,} of {1:,}'.format(match[0] + 1, self.view.lineCount()))
+        return match
+
+    def searchIncremental(self, text):
+        """ While typing, look again from the current match so it only moves forward when needed """
+        start                           = self.view.match[0] if self.view.match else self.view.firstVisibleLine()
+        if not text:
+            self.view.match             = None
+            self.view.viewport().update()
+            return
+        self.search(start)
+
+    def findNext(self):
+        current                         = self.view.match[0] + 1 if self.view.match else self.view.firstVisibleLine()
+        if self.search(current) is None and current:
+            self.search(0)
+
+    def findPrevious(self):
+        current                         = self.view.match[0] if self.view.match else self.view.firstVisibleLine()
+        if self.search(current, backwards=True) is None:
+            self.search(self.view.lineCount(), backwards=True)
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 4:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
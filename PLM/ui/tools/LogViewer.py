@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: LogViewer.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Filter the logs of PLM (LogStore, logs.db in the log folder) by time range, level, logger and log file.
+    Results are read by pages from the index: the table shows the first page at once and asks for the next one
+    when it is scrolled to the end, so a query over millions of records stays instant.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import datetime, logging
+
+# PySide2
+from PySide2.QtCore                     import Qt, QAbstractTableModel, QModelIndex, QDateTime
+from PySide2.QtGui                      import QColor
+from PySide2.QtWidgets                  import (QAbstractItemView, QComboBox, QDateTimeEdit, QGridLayout, QHeaderView,
+                                                QLabel, QLineEdit, QPushButton, QTableView, QPlainTextEdit, QSplitter)
+
+# PLM
+from PLM                                import LOG_DIR
+from pyPLM.Widgets                      import Widget
+from pyPLM.Gui                          import AppIcon
+from pyPLM.loggers                      import LogStore
+from pyPLM.loggers.store                import STORE_NAME
+
+
+ALL                                     = 'All'
+LEVELS                                  = [(ALL, 0), ('Debug', logging.DEBUG), ('Info', logging.INFO),
+                                           ('Warning', logging.WARNING), ('Error', logging.ERROR),
+                                           ('Critical', logging.CRITICAL)]
+HEADERS                                 = [('Time', 'created'), ('Level', 'levelName'), ('Logger', 'logger'),
+                                           ('File', 'logFile'), ('Message', 'message')]
+LEVEL_COLORS                            = {logging.WARNING: QColor(200, 140, 0), logging.ERROR: QColor(210, 60, 60),
+                                           logging.CRITICAL: QColor(230, 0, 80)}
+
+
+class LogRecordModel(QAbstractTableModel):
+
+    key                                 = 'LogRecordModel'
+
+    def __init__(self, parent=None):
+        super(LogRecordModel, self).__init__(parent)
+
+        self.records                    = []
+        self.pages                      = None
+
+    def setQuery(self, pages):
+        """ :param pages: generator of record pages, from LogStore.query """
+        self.beginResetModel()
+        self.records                    = []
+        self.pages                      = pages
+        self.endResetModel()
+        if self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.pages is not None
+
+    def fetchMore(self, parent):
+        if parent.isValid() or self.pages is None:
+            return
+        page                            = next(self.pages, None)
+        if not page:
+            self.pages                  = None
+            return
+        first                           = len(self.records)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self.records.extend(page)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record                          = self.records[index.row()]
+        field                           = HEADERS[index.column()][1]
+
+        if role == Qt.DisplayRole:
+            value                       = record[field]
+            if field == 'created':
+                return datetime.datetime.fromtimestamp(value).strftime('%Y.%m.%d %H:%M:%S.%f')[:-3]
+            if field == 'message':
+                return value.split('\n', 1)[0] if value else ''
+            return value
+        if role == Qt.ForegroundRole:
+            return LEVEL_COLORS.get(record['level'])
+        if role == Qt.ToolTipRole and field == 'message':
+            return record['message']
+        return None
+
+    def record(self, row):
+        return self.records[row]
+
+
+class LogViewer(Widget):
+
+    key                                 = 'LogViewer'
+
+    def __init__(self, dbPath=None, parent=None):
+        super(LogViewer, self).__init__(parent)
+
+        self.setWindowIcon(AppIcon(32, 'TextEditor'))
+        self.setWindowTitle('Log Viewer')
+
+        self.store                      = LogStore.instance(dbPath or '{0}/{1}'.format(LOG_DIR, STORE_NAME))
+        self.model                      = LogRecordModel(self)
+
+        self.layout                     = QGridLayout(self)
+        self.buildUI()
+        self.reset()
+
+    def buildUI(self):
+        self.startDT                    = QDateTimeEdit(self, calendarPopup=True)
+        self.endDT                      = QDateTimeEdit(self, calendarPopup=True)
+        for dt in [self.startDT, self.endDT]:
+            dt.setDisplayFormat('yyyy.MM.dd HH:mm')
+
+        self.levelCB                    = QComboBox(self)
+        for name, level in LEVELS:
+            self.levelCB.addItem(name, level)
+        self.loggerCB                   = QComboBox(self)
+        self.fileCB                     = QComboBox(self)
+        self.textLE                     = QLineEdit(self)
+        self.textLE.setPlaceholderText('Message contains')
+        self.textLE.returnPressed.connect(self.search)
+
+        searchBtn                       = QPushButton('Search', self)
+        searchBtn.clicked.connect(self.search)
+        resetBtn                        = QPushButton('Reset', self)
+        resetBtn.clicked.connect(self.reset)
+
+        self.table                      = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.selectionModel().currentRowChanged.connect(self.showRecord)
+        self.model.rowsInserted.connect(self.updateStatus)
+        self.model.modelReset.connect(self.updateStatus)
+
+        self.detail                     = QPlainTextEdit(self)
+        self.detail.setReadOnly(True)
+
+        splitter                        = QSplitter(Qt.Vertical, self)
+        splitter.addWidget(self.table)
+        splitter.addWidget(self.detail)
+        splitter.setStretchFactor(0, 4)
+
+        self.statusLB                   = QLabel(self)
+
+        self.layout.addWidget(QLabel('From'), 0, 0, 1, 1)
+        self.layout.addWidget(self.startDT, 0, 1, 1, 1)
+        self.layout.addWidget(QLabel('To'), 0, 2, 1, 1)
+        self.layout.addWidget(self.endDT, 0, 3, 1, 1)
+        self.layout.addWidget(QLabel('Level'), 0, 4, 1, 1)
+        self.layout.addWidget(self.levelCB, 0, 5, 1, 1)
+        self.layout.addWidget(QLabel('Logger'), 1, 0, 1, 1)
+        self.layout.addWidget(self.loggerCB, 1, 1, 1, 1)
+        self.layout.addWidget(QLabel('File'), 1, 2, 1, 1)
+        self.layout.addWidget(self.fileCB, 1, 3, 1, 1)
+        self.layout.addWidget(self.textLE, 1, 4, 1, 1)
+        self.layout.addWidget(searchBtn, 1, 5, 1, 1)
+        self.layout.addWidget(resetBtn, 1, 6, 1, 1)
+        self.layout.addWidget(splitter, 2, 0, 1, 7)
+        self.layout.addWidget(self.statusLB, 3, 0, 1, 7)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Filters """
+
+    def reset(self):
+        """ Fill the filters from the store: whole time range, every logger and log file """
+        first, last                     = self.store.timeRange()
+        now                             = QDateTime.currentDateTime()
+        self.startDT.setDateTime(QDateTime.fromMSecsSinceEpoch(int(first * 1000)) if first else now.addDays(-7))
+        self.endDT.setDateTime(QDateTime.fromMSecsSinceEpoch(int(last * 1000)).addSecs(60) if last else now)
+
+        for combo, column in [(self.loggerCB, 'logger'), (self.fileCB, 'logFile')]:
+            combo.clear()
+            combo.addItem(ALL)
+            combo.addItems(self.store.distinct(column))
+
+        self.levelCB.setCurrentIndex(0)
+        self.textLE.clear()
+        self.search()
+
+    def filters(self):
+        logger                          = self.loggerCB.currentText()
+        logFile                         = self.fileCB.currentText()
+        return dict(start               = self.startDT.dateTime().toMSecsSinceEpoch() / 1000.0,
+                    end                 = self.endDT.dateTime().toMSecsSinceEpoch() / 1000.0,
+                    minLevel            = self.levelCB.currentData(),
+                    loggers             = [logger] if logger and logger != ALL else None,
+                    logFiles            = [logFile] if logFile and logFile != ALL else None,
+                    text                = self.textLE.text().strip() or None)
+
+    def search(self):
+        self.detail.clear()
+        self.model.setQuery(self.store.query(**self.filters()))
+        # the columns are fitted to the first page only, not to every record fetched later
+        self.table.resizeColumnsToContents()
+
+    def updateStatus(self, *args):
+        """ Counting every match would read them all, only what has been loaded is shown """
+        more                            = ', scroll down for more' if self.model.pages is not None else ''
+        self.statusLB.setText('{0:,} records{1}'.format(self.model.rowCount(), more))
+
+    def showRecord(self, current, previous):
+        if not current.isValid():
+            return self.detail.clear()
+        record                          = self.model.record(current.row())
+        self.detail.setPlainText('{0} - {1} - {2} ({3}:{4})\n\n{5}'.format(
+                                  self.model.index(current.row(), 0).data(), record['levelName'], record['logger'],
+                                  record['module'], record['lineno'], record['message']))
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 5:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
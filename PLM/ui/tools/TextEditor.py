@@ -20,17 +20,23 @@ from PySide2.QtGui                import (QFont, QFontDatabase, QFontInfo, QIcon
                                          QTextCharFormat, QTextCursor, QTextDocumentWriter, QTextListFormat)
 from PySide2.QtPrintSupport       import QPrintDialog, QPrinter, QPrintPreviewDialog
 from PySide2.QtWidgets            import (QAction, QActionGroup, QApplication, QColorDialog, QComboBox, QFileDialog,
-                                        QFontComboBox, QMenu, QMessageBox, QTextEdit, QToolBar, QHBoxLayout)
+                                        QFontComboBox, QMenu, QMessageBox, QTextEdit, QToolBar, QHBoxLayout,
+                                        QStackedWidget)
 
 # PLM
 from pyPLM.Widgets import Widget, MainWindow
 from pyPLM.Gui import AppIcon
+from PLM.ui.rcs.ResourceLoader import registerResource
+from .LargeFileViewer import LargeFileViewer
 
 if sys.platform.startswith('darwin'):
     rsrcPath = ":/images/mac"
 else:
     rsrcPath = ":/images/win"
 
+# files from this size are opened read only in the large file viewer
+LARGE_FILE_SIZE = 32 * 1024 * 1024
+
 # -------------------------------------------------------------------------------------------------------------
 """ Main class """
 
@@ -41,6 +47,9 @@ class TextEdit(MainWindow):
     def __init__(self, fileName=None, parent=None):
         super(TextEdit, self).__init__(parent)
 
+        # the :/images icons of the actions below
+        registerResource(self.key)
+
         self.setToolButtonStyle(Qt.ToolButtonFollowStyle)
         self.setupFileActions()
         self.setupEditActions()
@@ -52,7 +61,11 @@ class TextEdit(MainWindow):
         self.textEdit = QTextEdit(self)
         self.textEdit.currentCharFormatChanged.connect(self.currentCharFormatChanged)
         self.textEdit.cursorPositionChanged.connect(self.cursorPositionChanged)
-        self.setCentralWidget(self.textEdit)
+        self.largeViewer = LargeFileViewer(parent=self)
+        self.stack = QStackedWidget(self)
+        self.stack.addWidget(self.textEdit)
+        self.stack.addWidget(self.largeViewer)
+        self.setCentralWidget(self.stack)
         self.textEdit.setFocus()
         self.setCurrentFileName()
         self.fontChanged(self.textEdit.font())
@@ -85,6 +98,7 @@ class TextEdit(MainWindow):
 
     def closeEvent(self, e):
         if self.maybeSave():
+            self.largeViewer.close_file()
             e.accept()
         else:
             e.ignore()
@@ -106,6 +120,10 @@ class TextEdit(MainWindow):
                                   shortcut=QKeySequence.Open, triggered=self.fileOpen)
         tb.addAction(self.actionOpen)
         menu.addAction(self.actionOpen)
+
+        self.actionOpenLarge = QAction("Open &Read Only...", self, priority=QAction.LowPriority,
+                                       triggered=self.fileOpenLarge)
+        menu.addAction(self.actionOpenLarge)
         menu.addSeparator()
 
         self.actionSave = QAction(QIcon.fromTheme('document-save', QIcon(rsrcPath + '/filesave.png')), "&Save", self,
@@ -286,9 +304,12 @@ class TextEdit(MainWindow):
                 "%s" % (QApplication.font().pointSize())))
 
     def load(self, f):
-        if not QFile.exists(f):
+        if not f or not QFile.exists(f):
             return False
 
+        if QFileInfo(f).size() >= LARGE_FILE_SIZE:
+            return self.loadLarge(f)
+
         fh = QFile(f)
         if not fh.open(QFile.ReadOnly):
             return False
@@ -302,9 +323,39 @@ class TextEdit(MainWindow):
         else:
             self.textEdit.setPlainText(unistr)
 
+        self.setLargeMode(False)
         self.setCurrentFileName(f)
         return True
 
+    def loadLarge(self, f, follow=False):
+        """ Big files and logs are not loaded, they are mapped and shown by the read only viewer """
+        if not self.maybeSave():
+            return False
+
+        self.largeViewer.followCB.setChecked(follow)
+        if not self.largeViewer.load(f):
+            return False
+
+        self.textEdit.clear()
+        self.setLargeMode(True)
+        self.setCurrentFileName(f)
+        return True
+
+    def setLargeMode(self, large):
+        if not large:
+            self.largeViewer.close_file()
+        self.stack.setCurrentWidget(self.largeViewer if large else self.textEdit)
+
+        document = self.textEdit.document()
+        for action in [self.actionSaveAs, self.actionPrint, self.actionPrintPreview, self.actionPrintPdf]:
+            action.setEnabled(not large)
+        self.actionSave.setEnabled(not large and document.isModified())
+        self.actionUndo.setEnabled(not large and document.isUndoAvailable())
+        self.actionRedo.setEnabled(not large and document.isRedoAvailable())
+        self.actionCut.setEnabled(False)
+        self.actionCopy.setEnabled(False)
+        self.actionPaste.setEnabled(not large and len(QApplication.clipboard().text()) != 0)
+
     def maybeSave(self):
         if not self.textEdit.document().isModified():
             return True
@@ -340,6 +391,7 @@ class TextEdit(MainWindow):
     def fileNew(self):
         if self.maybeSave():
             self.textEdit.clear()
+            self.setLargeMode(False)
             self.setCurrentFileName()
 
     def fileOpen(self):
@@ -349,6 +401,13 @@ class TextEdit(MainWindow):
         if fn:
             self.load(fn)
 
+    def fileOpenLarge(self):
+        fn, _ = QFileDialog.getOpenFileName(self, "Open Read Only...", None,
+                                            "Logs (*.log *.txt);;Scenes (*.ma *.edl);;All Files (*)")
+
+        if fn:
+            self.loadLarge(fn, follow=fn.lower().endswith('.log'))
+
     def fileSave(self):
         if not self.fileName:
             return self.fileSaveAs()
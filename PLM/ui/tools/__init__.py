@@ -15,6 +15,9 @@ from .Calculator                import Calculator
 from .EnglishDictionary         import EnglishDictionary
 from .FindFiles                 import FindFiles
 from .ImageViewer               import ImageViewer
+from .JobsPanel                 import JobsPanel
+from .LargeFileViewer           import LargeFileViewer
+from .LogViewer                 import LogViewer
 from .NoteReminder              import NoteReminder
 from .ScreenShot                import ScreenShot
 from .TextEditor                import TextEditor
@@ -10,7 +10,7 @@ Description:
 """
 # -------------------------------------------------------------------------------------------------------------
 
-import os, sys, platform, sysconfig, win32api, time, datetime, uuid, pkg_resources
+import os, sys, platform, sysconfig, time, datetime, uuid, pkg_resources
 from time                       import gmtime, strftime
 
 # from pyPLM.Core                 import Size, Rect, RectF
@@ -95,17 +95,12 @@ def get_file_path(directory):
 
 
 def get_screen_resolution():
-    resW = win32api.GetSystemMetrics(0)
-    resH = win32api.GetSystemMetrics(1)
-    return resW, resH
+    from PLM.platforms import platformServices
+    return platformServices().screenResolution()
 
 def get_window_taskbar_size():
-    resW, resH = get_screen_resolution()
-    monitors = win32api.EnumDisplayMonitors()
-    display1 = win32api.GetMonitorInfo(monitors[0][0])
-    tbH = resH - display1['Work'][3]
-    tbW = resW
-    return tbW, tbH
+    from PLM.platforms import platformServices
+    return platformServices().taskbarSize()
 
 
 def get_layout_size(layout):
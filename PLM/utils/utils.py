@@ -11,7 +11,7 @@ Description:
 """ Import """
 
 # Python
-import os, winshell, yaml, json, re, contextlib, tempfile
+import os, yaml, json, re, contextlib, tempfile
 
 from shutil             import rmtree
 from PIL                import Image
@@ -23,6 +23,7 @@ from PySide2.QtCore     import Signal, Slot
 from PLM                import __envKey__
 from pyPLM.Core         import EventLoop, Timer
 from PLM.cores.Errors   import EnsureValueError
+from PLM.platforms      import platformServices
 
 from .paths             import get_file_path
 
@@ -102,8 +103,7 @@ def wait(msec):
     loop.exec_()
 
 def create_shotcut(target, icon, shortcut, description):
-    winshell.CreateShortcut( Path=os.path.join(winshell.desktop(), shortcut), Target=target, Icon=(icon, 0),
-                             Description=description )
+    return platformServices().createShortcut(target, icon, shortcut, description)
 
 def create_folder(pth, mode=0o770):
 
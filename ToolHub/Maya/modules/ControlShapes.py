@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: ControlShapes.py
+Author: Do Trinh/Jimmy - TD artist
+
+Description:
+    Library of control curve shapes used by ToolBoxII. The shapes are data (controlShapes.json): every shape is a
+    list of curves (points, degree, knots, periodic). The file is read the first time a shape is asked and compiled
+    once into ready-to-use cmds.curve arguments, which stay in memory for the session (reloading ToolBoxIIfuncs
+    does not reload this module).
+
+    A shape made of several curves is built as one transform holding all the curve shapes. createMany builds a batch
+    of controls with one delete and one select for the whole batch.
+
+    cmds can be given to the library, which lets it run without Maya (ie: with a stub module).
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+import json
+import os
+
+try:
+    from maya import cmds
+except ImportError:
+    cmds = None
+
+SHAPE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'controlShapes.json')
+
+
+class ShapeLibrary(object):
+
+    def __init__(self, shapeFile=SHAPE_FILE, mayaCmds=None):
+        self.shapeFile = shapeFile
+        self.cmds = mayaCmds or cmds
+        self._shapes = None
+        self._labels = None
+
+    # ---------------------------------------------------------------------------------------------------------
+    # LOAD
+
+    @property
+    def shapes(self):
+        if self._shapes is None:
+            self.load()
+        return self._shapes
+
+    def load(self):
+        self._shapes, self._labels = self.compile()
+
+    def compile(self):
+        """ Turn the json data into cmds.curve keyword arguments """
+        with open(self.shapeFile, 'r') as f:
+            data = json.load(f)
+
+        shapes = dict()
+        labels = dict()
+        for name, shape in data['shapes'].items():
+            shapes[name] = tuple(dict(p=tuple(tuple(p) for p in c['p']), d=c['d'], k=tuple(c['k']), per=c['per'])
+                                 for c in shape['curves'])
+            if shape.get('label'):
+                labels[shape['label']] = name
+        return shapes, labels
+
+    # ---------------------------------------------------------------------------------------------------------
+    # QUERY
+
+    def names(self):
+        return sorted(self.shapes)
+
+    def labels(self):
+        if self._labels is None:
+            self.load()
+        return dict(self._labels)
+
+    def resolve(self, nameOrLabel):
+        """ Accept the shape name (crossControl) or the label shown in ToolBoxII (Cross Control) """
+        if nameOrLabel in self.shapes:
+            return nameOrLabel
+        return self.labels().get(nameOrLabel)
+
+    def curves(self, nameOrLabel):
+        name = self.resolve(nameOrLabel)
+        if name is None:
+            raise KeyError('There is no control shape: %s' % nameOrLabel)
+        return self.shapes[name]
+
+    # ---------------------------------------------------------------------------------------------------------
+    # BUILD
+
+    def create(self, nameOrLabel, select=True):
+        return self.createMany([nameOrLabel], select=select)[0]
+
+    def createMany(self, names, select=True):
+        """
+        Build one control per name. cmds.curve makes one shape per call, so a control of several curves is still
+        one call per curve, its shapes parented under the first transform. The batch saves the rest: one delete
+        of the emptied transforms and one select for all the controls.
+        :return: list of the transforms, in the same order.
+        """
+        curve = self.cmds.curve
+        created = []
+        leftovers = []
+
+        for name in names:
+            curves = self.curves(name)
+            root = curve(**curves[0])
+            if len(curves) > 1:
+                others = [curve(**kwargs) for kwargs in curves[1:]]
+                shapes = self.cmds.listRelatives(others, shapes=True, fullPath=True)
+                self.cmds.parent(shapes, root, relative=True, shape=True)
+                leftovers.extend(others)
+            created.append(root)
+
+        if leftovers:
+            self.cmds.delete(leftovers)
+        if select and created:
+            self.cmds.select(created)
+        return created
+
+
+shapeLibrary = ShapeLibrary()
+
+# ----------------------------------------------------------------------------------------------------------- #
+"""                                               END OF CODE                                               """
+# ----------------------------------------------------------------------------------------------------------- #
@@ -29,6 +29,8 @@ import maya.OpenMaya as om
 import maya.OpenMayaUI as omui
 from maya import cmds
 
+from ToolHub.VersionResolver import versionResolver, version_name
+
 # -------------------------------------------------------------------------------------------------------------
 # MAKE MAYA UNDERSTAND QT UI AS MAYA WINDOW,  FIX PLM_VERSION CONVENTION
 # -------------------------------------------------------------------------------------------------------------
@@ -89,46 +91,26 @@ class DataHandle(object):
         self.assetName = (self.curPth.split("work")[0]).split("/")[(numOfSectInPth - 3)]
         self.taskName = (self.curPth.split("work")[0]).split("/")[(numOfSectInPth - 2)]
         self.baseFileName = self.assetName + "_" + self.taskName
-        # get file save
-        saveFilesList = [f.split('.ma')[0] for f in os.listdir(self.workPth) if self.baseFileName in f]
-        if (len(saveFilesList) == 0):
-            cmds.file(rename=self.baseFileName + "_v001")
+        # versions and revisions come from the cached directory indexes
+        workIndex = versionResolver.index(self.workPth)
+        maxVer = workIndex.latestVersion(self.baseFileName)
+        if maxVer == 0:
+            maxVer = 1
+            cmds.file(rename=version_name(self.baseFileName, maxVer, ext=''))
             cmds.file(save=True, type='mayaAscii')
-        else:
-            for file in saveFilesList:
-                num = file.split("_v")[-1]
-                if "." in num or "-" in num or "_" in num:
-                    saveFilesList.remove(file)
-
-        fileVersion = [f.split(self.baseFileName + '_v')[-1] for f in saveFilesList]
-
-        if fileVersion == []:
-            self.maxVer = '001'
-        else:
-            self.maxVer = (str(max([int(f) for f in fileVersion]))).zfill(3)
-
-        self.verFileName = self.baseFileName + '_v' + self.maxVer + '.ma'
-
-        ssFilesList = [f for f in os.listdir(self.snapShotPth) if
-                       f.endswith('.ma') and self.verFileName.split('.ma')[0] in f]
-
-        if (len(ssFilesList) == 0):
-            reversion = ["001"]
-        elif (len(ssFilesList) == 1):
-            reversion = ["002"]
-        else:
-            reversion = [((f.split('_v')[-1]).split('_r')[-1]).split('.ma')[0] for f in ssFilesList]
 
-        self.maxRever = (str(max([int(f) for f in reversion]) + 1)).zfill(3)
+        self.maxVer = str(maxVer).zfill(3)
+        self.verFileName = version_name(self.baseFileName, maxVer)
 
-        self.reverFileName = self.verFileName.split('.ma')[0] + "_r" + self.maxRever + '.ma'
+        maxRever = versionResolver.nextRevision(self.snapShotPth, self.baseFileName, maxVer)
+        self.maxRever = str(maxRever).zfill(3)
+        self.reverFileName = version_name(self.baseFileName, maxVer, maxRever)
 
-        self.publishNameFile = self.verFileName.split("_v")[0] + "_v" + str(
-            int((self.verFileName.split(".")[0]).split("_v")[-1]) + 1).zfill(3) + ".ma"
+        self.publishNameFile = version_name(self.baseFileName, maxVer + 1)
 
         self.filePublishPth = os.path.join(self.publishPth, self.verFileName)
 
-        self.publishRevName = self.publishNameFile.split('.ma')[0] + "_r001.ma"
+        self.publishRevName = version_name(self.baseFileName, maxVer + 1, 1)
 
         publishImageName = self.publishRevName.split('.ma')[0] + ".jpg"
 
@@ -245,8 +227,9 @@ class DataHandle(object):
     def loaderUI(self):
         title = "Loader"
 
-        self.save_ssExt = [f for f in os.listdir(self.snapShotPth) if f.endswith('.ma')]
-        self.save_ssImg = [f for f in os.listdir(self.snapShotPth) if f.endswith('.jpg')]
+        snapShotIndex = versionResolver.index(self.snapShotPth)
+        self.save_ssExt = snapShotIndex.files('.ma')
+        self.save_ssImg = snapShotIndex.files('.jpg')
 
         if cmds.window('loaderUI', q=True, exists=True):
             cmds.deleteUI('loaderUI')
@@ -23,6 +23,8 @@ from functools import partial
 # -------------------------------------------------------------------------------------------------------------
 from maya import cmds
 
+from ToolHub.ProjectTemplate import ProjectTemplate, numbered
+
 # -------------------------------------------------------------------------------------------------------------
 # VARIABLES
 # -------------------------------------------------------------------------------------------------------------
@@ -337,160 +339,24 @@ class ProdFolder(object):
             self.prjGroupMode()
 
     def prjStudioMode(self, *args):
-        # Create master folder
-        os.mkdir(self.rootPth)
-        # Create content of master Folder
-        master = ['_assets', 'sequences', 'deliverables', 'docs', 'editorial', 'sound', 'rcs', 'RnD']
-        steps = ['publish', 'review', 'work']
-        mayaFolders = ['scenes', 'sourceimages', 'images', 'movie', 'alembic', 'reference']
-
-        for f in master:
-            contentMasterPth = os.path.join(self.rootPth, f)
-            os.mkdir(contentMasterPth)
-
-        # Assets content
-        assetsTasks = ['art', 'plt_model', 'surfacing', 'rigging']
-        assetsSections = ['characters', 'environment', 'props']
-
-        assetsPth = os.path.join(self.rootPth, '_assets')
-        for section in assetsSections:
-            assetsSectionsPth = os.path.join(assetsPth, section)
-            os.mkdir(assetsSectionsPth)
-            if section == 'characters':
-                for i in range(self.numOfChar):
-                    charName = 'char' + str(i + 1)
-                    folCharName = cmds.textField(charName, q=True, tx=True)
-                    if folCharName == "" or folCharName == None:
-                        folCharName = 'character_' + str(i + 1)
-                    folCharPth = os.path.join(assetsSectionsPth, folCharName)
-                    os.mkdir(folCharPth)
-                    for task in assetsTasks:
-                        assetsTaskPth = os.path.join(folCharPth, task)
-                        os.mkdir(assetsTaskPth)
-                        for step in steps:
-                            assetsTaskStepPth = os.path.join(assetsTaskPth, step)
-                            os.mkdir(assetsTaskStepPth)
-                        assetsWorkTaskPth = os.path.join(assetsTaskPth, 'work')
-                        if task == 'art':
-                            apps = ['photoshop', 'maya']
-                        elif task == 'plt_model':
-                            apps = ['zbrush', 'maya', 'mudbox', 'houdini']
-                        elif task == 'surfacing':
-                            apps = ['mari', 'maya', 'substance', 'photoshop']
-                        elif task == 'rigging':
-                            apps = ['maya']
-
-                        for app in apps:
-                            appPth = os.path.join(assetsWorkTaskPth, app)
-                            os.mkdir(appPth)
-                            if app == 'maya':
-                                for f in mayaFolders:
-                                    mayaPth = os.path.join(appPth, f)
-                                    os.mkdir(mayaPth)
-                    i += 1
-            elif section == 'environment':
-                for i in range(self.numOfEnv):
-                    envName = 'env' + str(i + 1)
-                    folEnvName = cmds.textField(envName, q=True, tx=True)
-                    if folEnvName == "" or folEnvName == None:
-                        folEnvName = 'env_' + str(i + 1)
-                    folEnvPth = os.path.join(assetsSectionsPth, folEnvName)
-                    os.mkdir(folEnvPth)
-                    for task in assetsTasks:
-                        assetsTaskPth = os.path.join(folEnvPth, task)
-                        os.mkdir(assetsTaskPth)
-                        for step in steps:
-                            assetsTaskStepPth = os.path.join(assetsTaskPth, step)
-                            os.mkdir(assetsTaskStepPth)
-                        assetsWorkTaskPth = os.path.join(assetsTaskPth, 'work')
-                        if task == 'art':
-                            apps = ['photoshop', 'maya']
-                        elif task == 'plt_model':
-                            apps = ['zbrush', 'maya', 'mudbox', 'houdini']
-                        elif task == 'surfacing':
-                            apps = ['mari', 'maya', 'substance', 'photoshop']
-                        elif task == 'rigging':
-                            apps = ['maya']
-
-                        for app in apps:
-                            appPth = os.path.join(assetsWorkTaskPth, app)
-                            os.mkdir(appPth)
-                            if app == 'maya':
-                                for f in mayaFolders:
-                                    mayaPth = os.path.join(appPth, f)
-                                    os.mkdir(mayaPth)
-                    i += 1
-            elif section == 'props':
-                for i in range(self.numOfProps):
-                    propsName = 'props' + str(i + 1)
-                    folPropsName = cmds.textField(propsName, q=True, tx=True)
-
-                    if folPropsName == "" or folPropsName == None:
-                        folPropsName = 'props_' + str(i + 1)
-
-                    folPropsPth = os.path.join(assetsSectionsPth, folPropsName)
-
-                    os.mkdir(folPropsPth)
-                    for task in assetsTasks:
-                        assetsTaskPth = os.path.join(folPropsPth, task)
-                        os.mkdir(assetsTaskPth)
-                        for step in steps:
-                            assetsTaskStepPth = os.path.join(assetsTaskPth, step)
-                            os.mkdir(assetsTaskStepPth)
-                        assetsWorkTaskPth = os.path.join(assetsTaskPth, 'work')
-                        if task == 'art':
-                            apps = ['photoshop', 'maya']
-                        elif task == 'plt_model':
-                            apps = ['zbrush', 'maya', 'mudbox', 'houdini']
-                        elif task == 'surfacing':
-                            apps = ['mari', 'maya', 'substance', 'photoshop']
-                        elif task == 'rigging':
-                            apps = ['maya']
-
-                        for app in apps:
-                            appPth = os.path.join(assetsWorkTaskPth, app)
-                            os.mkdir(appPth)
-                            if app == 'maya':
-                                for f in mayaFolders:
-                                    mayaPth = os.path.join(appPth, f)
-                                    os.mkdir(mayaPth)
-                    i += 1
-
-        # Sequences content
-
-        seqTask = ['anim', 'comp', 'fx', 'layout', 'lighting']
-
-        sequencesPth = os.path.join(self.rootPth, 'sequences')
-        for i in range(self.numSeq):
-            folName = self.shortName + "_" + "shot_" + str(i + 1)
-            seqPth = os.path.join(sequencesPth, folName)
-            os.mkdir(seqPth)
-            for task in seqTask:
-                seqTaskPth = os.path.join(seqPth, task)
-                os.mkdir(seqTaskPth)
-                for step in steps:
-                    seqTaskStepPth = os.path.join(seqTaskPth, step)
-                    os.mkdir(seqTaskStepPth)
-                seqTaskWorkPth = os.path.join(seqTaskPth, 'work')
-                if task == 'anim':
-                    apps = ['maya', 'after effect', 'houdini']
-                elif task == 'comp':
-                    apps = ['nuke', 'after effect', 'photoshop']
-                elif task == 'fx':
-                    apps = ['maya', 'houdini']
-                elif task == 'layout':
-                    apps = ['maya']
-                elif task == 'lighting':
-                    apps = ['maya']
-
-                for app in apps:
-                    appPth = os.path.join(seqTaskWorkPth, app)
-                    os.mkdir(appPth)
-                    if app == 'maya':
-                        for f in mayaFolders:
-                            mayaPth = os.path.join(appPth, f)
-                            os.mkdir(mayaPth)
-            i += 1
+        # the folder tree is described by the 'studio' template in ToolHub/projectTemplates.json
+        template = ProjectTemplate.load('studio')
+        result = template.create(self.rootPth,
+                                 character=self.assetNames('char', self.numOfChar, 'character_'),
+                                 environment=self.assetNames('env', self.numOfEnv, 'env_'),
+                                 prop=self.assetNames('props', self.numOfProps, 'props_'),
+                                 shot=numbered(self.shortName + '_shot', self.numSeq, padding=1))
+
+        logger.info('%s folders created in %s' % (len(result.missing), self.rootPth))
+
+    def assetNames(self, field, count, default):
+        names = []
+        for i in range(count):
+            name = cmds.textField(field + str(i + 1), q=True, tx=True)
+            if name == "" or name == None:
+                name = default + str(i + 1)
+            names.append(name)
+        return names
 
     def prjGroupMode(self, *args):
         pass
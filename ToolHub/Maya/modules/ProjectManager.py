@@ -15,6 +15,8 @@ import logging
 
 from maya import cmds
 
+from ToolHub.ProjectTemplate import ProjectTemplate, numbered
+
 # -------------------------------------------------------------------------------------------------------------
 # MAKE MAYA UNDERSTAND QT UI AS MAYA WINDOW,  FIX PLM_VERSION CONVENTION
 # -------------------------------------------------------------------------------------------------------------
@@ -165,233 +167,27 @@ class projectManager(object):
         curProjName = cmds.textField("prjFullName", text=True, query=True)
         # get current project path:
         curProjPath = cmds.textField('projectPth', query=True, text=True)
-        stage_Ls = ['_assets', 'deliverables', 'docs', 'editorial', 'reference', 'RnD', 'sequences', 'rcs']
-        assets_Ls = ['character', 'enviroment', 'props']
-        task_Ls = ['art', 'plt_model', 'rigging', 'surfacing', 'lighting', 'FX', 'anim', 'comp', 'layout']
-        documents_Ls = ['template', 'moodboard', 'schedule', 'script', 'sound', 'storyboard', 'title', 'tools']
-        editorial_Ls = ['animatic', 'edit', 'poster']
-        resources_Ls = ['lighting', 'camera rig']
-        art_task = ['pts & illus', 'maya', 'zbrush', 'reference']
-        modeling_task = ['zbrush', 'maya', 'mudbox', 'houdini']
-        rigging_task = ['maya']
-        surfacing_task = ['maya', 'mari', 'substance', 'photoshop']
-        shotTask_apps = ['maya', 'houdini', 'nuke', 'AE']
-        work_Ls = ['publish', 'review', 'work']
 
         shots = cmds.intField('numOfShots', v=True, query=True)
-        chars = cmds.intField('numOfChars', v=True, query=True)
         shortName = cmds.textField('prjShortName', text=True, query=True)
 
-        charName_Ls = []
         numChars = cmds.intField('numOfChars', v=True, query=True)
-        i = 0
-        for i in range(int(numChars)):
-            number = i + 1
-            getCharName = cmds.textField(str('charName' + str(number)), text=True, query=True)
-            charName_Ls.append(getCharName)
-            i = i + 1
+        charName_Ls = [cmds.textField('charName' + str(i + 1), text=True, query=True) for i in range(int(numChars))]
 
-        envObj_Ls = []
         numEnvObj = cmds.intField('numOfenvObj', v=True, query=True)
-        i = 0
-        for i in range(int(numEnvObj)):
-            number = i + 1
-            getEnvObjName = cmds.textField(str('envObj' + str(number)), text=True, query=True)
-            envObj_Ls.append(getEnvObjName)
-            i = i + 1
+        envObj_Ls = [cmds.textField('envObj' + str(i + 1), text=True, query=True) for i in range(int(numEnvObj))]
 
-        props_Ls = []
         numProps = cmds.intField('numOfProps', v=True, query=True)
-        i = 0
-        for i in range(int(numProps)):
-            number = i + 1
-            getPropName = cmds.textField(str('prop' + str(number)), text=True, query=True)
-            props_Ls.append(getPropName)
-
-        p = curProjPath + "/" + curProjName
-
-        # master folder (name of project)
-        cmds.sysFile(curProjPath + "/" + curProjName, md=True)
-
-        # folder for stages of product
-        i = 0
-        for i in range(len(stage_Ls)):
-            cmds.sysFile(p + "/" + stage_Ls[i], md=True)
-            i = i + 1
-
-        # folder structure inside stages folder:
-        path = p + "/" + stage_Ls[0]
-        i = 0
-        for i in range(len(assets_Ls)):
-            cmds.sysFile(path + "/" + assets_Ls[i], md=True)
-            i = i + 1
-
-        # character folder
-        path = path + "/" + assets_Ls[0]
-        i = 0
-        for i in range(len(charName_Ls)):
-            cmds.sysFile(path + "/" + charName_Ls[i], md=True)
-            path1 = path + "/" + charName_Ls[i]
-            item = 0
-            for item in range(len(task_Ls[:4])):
-                cmds.sysFile(path1 + "/" + task_Ls[item], md=True)
-                path2 = path1 + "/" + task_Ls[item]
-                obj = 0
-                for obj in range(len(work_Ls)):
-                    cmds.sysFile(path2 + "/" + work_Ls[obj], md=True)
-                    obj = obj + 1
-                item = item + 1
-            path3 = path1 + "/" + task_Ls[0] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(art_task)):
-                cmds.sysFile(path3 + "/" + art_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[1] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(modeling_task)):
-                cmds.sysFile(path3 + "/" + modeling_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[2] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(rigging_task)):
-                cmds.sysFile(path3 + "/" + rigging_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[3] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(surfacing_task)):
-                cmds.sysFile(path3 + "/" + surfacing_task[a], md=True)
-                a = a + 1
-            i = i + 1
-
-        # environment folder
-        path = path = p + "/" + stage_Ls[0] + "/" + assets_Ls[1]
-        i = 0
-        for i in range(len(envObj_Ls)):
-            cmds.sysFile(path + "/" + envObj_Ls[i], md=True)
-            path1 = path + "/" + envObj_Ls[i]
-            item = 0
-            for item in range(len(task_Ls[:4])):
-                cmds.sysFile(path1 + "/" + task_Ls[item], md=True)
-                path2 = path1 + "/" + task_Ls[item]
-                obj = 0
-                for obj in range(len(work_Ls)):
-                    cmds.sysFile(path2 + "/" + work_Ls[obj], md=True)
-                    obj = obj + 1
-                item = item + 1
-            path3 = path1 + "/" + task_Ls[0] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(art_task)):
-                cmds.sysFile(path3 + "/" + art_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[1] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(modeling_task)):
-                cmds.sysFile(path3 + "/" + modeling_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[2] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(rigging_task)):
-                cmds.sysFile(path3 + "/" + rigging_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[3] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(surfacing_task)):
-                cmds.sysFile(path3 + "/" + surfacing_task[a], md=True)
-                a = a + 1
-            i = i + 1
-
-        # props folder
-        path = p + "/" + stage_Ls[0] + "/" + assets_Ls[2]
-        i = 0
-        for i in range(len(props_Ls)):
-            cmds.sysFile(path + "/" + props_Ls[i], md=True)
-            path1 = path + "/" + props_Ls[i]
-            item = 0
-            for item in range(len(task_Ls[:4])):
-                cmds.sysFile(path1 + "/" + task_Ls[item], md=True)
-                path2 = path1 + "/" + task_Ls[item]
-                obj = 0
-                for obj in range(len(work_Ls)):
-                    cmds.sysFile(path2 + "/" + work_Ls[obj], md=True)
-                    obj = obj + 1
-                item = item + 1
-            path3 = path1 + "/" + task_Ls[0] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(art_task)):
-                cmds.sysFile(path3 + "/" + art_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[1] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(modeling_task)):
-                cmds.sysFile(path3 + "/" + modeling_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[2] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(rigging_task)):
-                cmds.sysFile(path3 + "/" + rigging_task[a], md=True)
-                a = a + 1
-            path3 = path1 + "/" + task_Ls[3] + "/" + work_Ls[2]
-            a = 0
-            for a in range(len(surfacing_task)):
-                cmds.sysFile(path3 + "/" + surfacing_task[a], md=True)
-                a = a + 1
-            i = i + 1
-
-        # document folder:
-        path = p + "/" + stage_Ls[2]
-        i = 0
-        for i in range(len(documents_Ls)):
-            cmds.sysFile(path + "/" + documents_Ls[i], md=True)
-            i = i + 1
-
-        # editorial folder:
-        path = p + "/" + stage_Ls[3]
-        i = 0
-        for i in range(len(editorial_Ls)):
-            cmds.sysFile(path + "/" + editorial_Ls[i], md=True)
-            i = i + 1
+        props_Ls = [cmds.textField('prop' + str(i + 1), text=True, query=True) for i in range(int(numProps))]
 
-        # sequences folder:
-        sequence_Ls = []
-        i = 0
+        # the folder tree is described by the 'production' template in ToolHub/projectTemplates.json
+        template = ProjectTemplate.load('production')
+        result = template.create(curProjPath + "/" + curProjName, character=charName_Ls, environment=envObj_Ls,
+                                 prop=props_Ls, shot=numbered(shortName, int(shots), padding=2))
 
-        for i in range(int(shots)):
-            shotNum = i + 1
-            if shotNum <= 9:
-                shotName = shortName + "_" + "0" + str(shotNum)
-                sequence_Ls.append(shotName)
-            if shotNum > 9:
-                shotName = shortName + "_" + str(shotNum)
-                sequence_Ls.append(shotName)
-            i = i + 1
-        sequence_task = task_Ls[4:]
-        path = p + "/" + stage_Ls[6]
-        i = 0
-        for i in range(len(sequence_Ls)):
-            cmds.sysFile(path + "/" + sequence_Ls[i], md=True)
-            nextPth = path + "/" + sequence_Ls[i]
-            item = 0
-            for item in range(len(sequence_task)):
-                cmds.sysFile(nextPth + "/" + sequence_task[item], md=True)
-                next_Pth = nextPth + "/" + sequence_task[item]
-                a = 0
-                for obj in range(len(work_Ls)):
-                    cmds.sysFile(next_Pth + "/" + work_Ls[a], md=True)
-                    a = a + 1
-                Pth = next_Pth + "/" + work_Ls[2]
-                a = 0
-                for a in range(len(shotTask_apps)):
-                    cmds.sysFile(Pth + "/" + shotTask_apps[a], md=True)
-                    a = a + 1
-                item = item + 1
-            i = i + 1
-
-        # rcs folder
-        path = p + "/" + stage_Ls[7]
-        i = 0
-        for i in range(len(resources_Ls)):
-            cmds.sysFile(path + "/" + resources_Ls[i], md=True)
-            i = i + 1
+        logger.info('%s folders created, %s already exist' % (len(result.missing), len(result.existing)))
+        for conflict in result.conflicts:
+            logger.warning('A file is in the way of the folder: %s' % conflict)
 
     def setProj(self, *args):
         import maya.mel as mel
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: ProjectTemplate.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Declarative project folder structure. A template is a tree of folder names (json, or yaml when PyYAML is
+    installed) which is expanded with the project variables (characters, props, shots...) into a flat plan of
+    relative paths. It only uses the standard library so the Maya tools and PLM share the same templates.
+
+    Template file:
+
+        {
+            "blocks"    : { "steps": ["publish", "review", "work"],
+                            "maya" : ["scenes", "sourceimages"] },
+            "templates" : { "studio": { "_assets": { "characters": { "{character}": "@steps" } },
+                                        "sequences": { "{shot}": { "anim": ["@steps", {"work": ["maya"]}] } } } }
+        }
+
+    - a node is a dict (name: children), a list (names, dicts or blocks), a single name or null for a leaf
+    - "@name" inserts the block "name" at this place
+    - "{var}" in a folder name is repeated for every value of the variable 'var' when it is a list, or replaced
+      by its value when it is a string. Inside the repeated folder '{var}' is bound to the current value.
+
+    Folders are created level by level, every level in parallel on a thread pool, only the missing ones are made.
+    Running it again on an existing project only adds what is new, dryRun returns the same diff without touching
+    the disk.
+
+    Needs Python 3.6 or later (concurrent.futures, os.scandir as a context manager, FileExistsError), so Maya 2022
+    or later inside Maya. Maya 2020 and older run Python 2.7 and can not import it.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, re, json, itertools
+from collections                        import namedtuple
+from concurrent.futures                 import ThreadPoolExecutor
+
+try:
+    import yaml
+except ImportError:
+    yaml                                = None
+
+
+TEMPLATE_FILE                           = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                       'projectTemplates.json').replace('\\', '/')
+DEFAULT_WORKERS                         = 16
+
+VARIABLE_PATTERN                        = re.compile(r'{(\w+)}')
+
+TemplateDiff                            = namedtuple('TemplateDiff', ['missing', 'existing', 'conflicts'])
+
+
+def numbered(prefix, count, padding=None, start=1):
+    """
+    Default names for counted items, ie: numbered('shot', 12) -> ['shot_01', ..., 'shot_12']
+    :param padding: number of digits, enough for 'count' by default.
+    """
+    padding                             = padding or len(str(count + start - 1))
+    return ['{0}_{1}'.format(prefix, str(i).zfill(padding)) for i in range(start, count + start)]
+
+
+def load_templates(filePath=TEMPLATE_FILE):
+    """ :return: dict of the raw data in a template file (json or yaml) """
+    with open(filePath, 'r') as f:
+        if os.path.splitext(filePath)[1].lower() in ['.yaml', '.yml']:
+            if yaml is None:
+                raise ImportError('PyYAML is needed to read {0}'.format(filePath))
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+class ProjectTemplate(object):
+
+    key                                 = 'ProjectTemplate'
+
+    def __init__(self, tree, blocks=None, name=''):
+        super(ProjectTemplate, self).__init__()
+
+        self.name                       = name
+        self.tree                       = tree
+        self.blocks                     = blocks or dict()
+
+    @classmethod
+    def load(cls, name, filePath=TEMPLATE_FILE):
+        data                            = load_templates(filePath)
+        templates                       = data.get('templates', dict())
+        if name not in templates:
+            raise KeyError('There is no template "{0}" in {1}'.format(name, filePath))
+        return cls(templates[name], data.get('blocks'), name)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Expand """
+
+    def plan(self, **variables):
+        """
+        :param variables: values for the {var} folder names, a list repeats the folder, a string replaces it.
+        :return: list of relative paths, every parent comes before its children.
+        """
+        paths                           = dict()
+        self.expand(self.tree, '', variables, paths, [])
+        return list(paths)
+
+    def expand(self, node, base, variables, paths, stack):
+        if node is None:
+            return
+        elif isinstance(node, str):
+            if node.startswith('@'):
+                self.expandBlock(node[1:], base, variables, paths, stack)
+            else:
+                self.expand({node: None}, base, variables, paths, stack)
+        elif isinstance(node, (list, tuple)):
+            for child in node:
+                self.expand(child, base, variables, paths, stack)
+        elif isinstance(node, dict):
+            for name, children in node.items():
+                if name.startswith('@'):
+                    self.expandBlock(name[1:], base, variables, paths, stack)
+                    continue
+                for folder, bound in self.resolve(name, variables):
+                    path                = '{0}/{1}'.format(base, folder) if base else folder
+                    paths[path]         = None
+                    self.expand(children, path, bound, paths, stack)
+        else:
+            raise TypeError('Invalid template node: {0!r}'.format(node))
+
+    def expandBlock(self, blockName, base, variables, paths, stack):
+        if blockName not in self.blocks:
+            raise KeyError('There is no block "{0}" in template "{1}"'.format(blockName, self.name))
+        if blockName in stack:
+            raise ValueError('Block "{0}" includes itself'.format(blockName))
+        self.expand(self.blocks[blockName], base, variables, paths, stack + [blockName])
+
+    @staticmethod
+    def resolve(name, variables):
+        """ :return: list of (folder name, variables bound for its children) """
+        keys                            = VARIABLE_PATTERN.findall(name)
+        if not keys:
+            return [(name, variables)]
+
+        values                          = []
+        for key in keys:
+            if key not in variables:
+                raise KeyError('Missing template variable "{0}" in "{1}"'.format(key, name))
+            value                       = variables[key]
+            values.append([value] if isinstance(value, str) else [str(v) for v in value if v])
+
+        folders                         = []
+        for combination in itertools.product(*values):
+            bound                       = dict(variables, **dict(zip(keys, combination)))
+            folders.append((name.format(**bound), bound))
+        return folders
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Disk """
+
+    @staticmethod
+    def levels(paths):
+        """ Group relative paths by depth, a level only depends on the ones above it """
+        grouped                         = dict()
+        for path in paths:
+            grouped.setdefault(path.count('/'), []).append(path)
+        return [grouped[depth] for depth in sorted(grouped)]
+
+    def diff(self, root, workers=DEFAULT_WORKERS, **variables):
+        """
+        Compare the plan with the disk. Each existing folder is listed once instead of checking every path.
+        :return: TemplateDiff of absolute paths (missing, existing, conflicts: a file is in the way of a folder)
+        """
+        root                            = root.replace('\\', '/').rstrip('/')
+        missing, existing, conflicts    = [], [], []
+        absent, blocked                 = set(), set()
+        listings                        = dict()
+
+        def listing(folder):
+            try:
+                with os.scandir(folder) as it:
+                    return folder, dict((e.name, e.is_dir()) for e in it)
+            except OSError:
+                return folder, None
+
+        rootState                       = listing(root)[1]
+        listings[root]                  = rootState
+        if rootState is None:
+            absent.add(root)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for level in self.levels(self.plan(**variables)):
+                toList                  = []
+                for rel in level:
+                    path                = '{0}/{1}'.format(root, rel)
+                    parent, name        = path.rsplit('/', 1)
+                    if parent in blocked:
+                        conflicts.append(path)
+                        blocked.add(path)
+                        continue
+                    if parent in absent:
+                        missing.append(path)
+                        absent.add(path)
+                        continue
+
+                    state               = listings[parent].get(name)
+                    if state is None:
+                        missing.append(path)
+                        absent.add(path)
+                    elif state:
+                        existing.append(path)
+                        toList.append(path)
+                    else:
+                        conflicts.append(path)
+                        blocked.add(path)
+
+                listings.update(pool.map(listing, toList))
+
+        return TemplateDiff(missing, existing, conflicts)
+
+    def create(self, root, dryRun=False, workers=DEFAULT_WORKERS, **variables):
+        """
+        Create the missing folders of the plan under root, level by level in parallel.
+        :return: TemplateDiff computed before creating, 'missing' is what has been (or would be) created.
+        """
+        result                          = self.diff(root, workers, **variables)
+        if dryRun or not result.missing:
+            return result
+
+        root                            = root.replace('\\', '/').rstrip('/')
+        if not os.path.isdir(root):
+            os.makedirs(root, exist_ok=True)
+
+        def mkdir(path):
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for level in self.levels([p[len(root) + 1:] for p in result.missing]):
+                list(pool.map(mkdir, ['{0}/{1}'.format(root, rel) for rel in level]))
+
+        return result
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 2:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: VersionResolver.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Work/publish file versions. File names follow the convention:
+
+        <asset>_<task>_v<version>[_r<revision>]<ext>        ie: hero_rigging_v003.ma, hero_rigging_v003_r012.ma
+
+    Every directory is listed once and parsed into VersionRecords grouped by (base name, extension) and version.
+    The index is kept until the modification time of the directory changes, so asking again only costs one stat.
+    The latest version/revision are kept while indexing, the revisions of one version are sorted, so 'latest',
+    'next' and 'revisions of vN' are answered without going through the files again.
+
+    Only the standard library is used, the Maya tools reload their modules but the cache lives here.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, re, bisect, threading
+from collections                        import namedtuple
+
+
+VERSION_PATTERN                         = re.compile(r'^(?P<base>.+?)_v(?P<version>\d+)(?:_r(?P<revision>\d+))?'
+                                                     r'(?P<ext>\.[^.]+)$')
+PADDING                                 = 3
+
+VersionRecord                           = namedtuple('VersionRecord', ['name', 'base', 'version', 'revision', 'ext'])
+
+
+def parse_version(fileName):
+    """
+    :return: VersionRecord, revision is 0 for a version file, or None if the name does not follow the convention.
+    """
+    match                               = VERSION_PATTERN.match(fileName)
+    if match is None:
+        return None
+    return VersionRecord(fileName, match.group('base'), int(match.group('version')),
+                         int(match.group('revision') or 0), match.group('ext').lower())
+
+
+def version_name(base, version, revision=None, ext='.ma', padding=PADDING):
+    """ Inverse of parse_version: version_name('hero_rig', 3, 12) -> 'hero_rig_v003_r012.ma' """
+    name                                = '{0}_v{1}'.format(base, str(version).zfill(padding))
+    if revision:
+        name                            = '{0}_r{1}'.format(name, str(revision).zfill(padding))
+    return name + ext
+
+
+def split_base(base, task=None):
+    """ 'hero_plt_model' -> ('hero', 'plt_model') when the task is known, the last part is the task otherwise """
+    if task and base.endswith('_' + task):
+        return base[:-len(task) - 1], task
+    asset, _, task                      = base.rpartition('_')
+    return asset, task
+
+
+class VersionIndex(object):
+
+    key                                 = 'VersionIndex'
+
+    def __init__(self, names=()):
+        super(VersionIndex, self).__init__()
+
+        # (base, ext): {version: sorted list of revision numbers}
+        self._versions                  = dict()
+        # (base, ext): [latest version, latest revision of the latest version]
+        self._latest                    = dict()
+        # (base, ext, version, revision): VersionRecord
+        self._records                   = dict()
+        # every file name of the directory, versioned or not
+        self._files                     = []
+
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        self._files.append(name)
+        record                          = parse_version(name)
+        if record is None:
+            return None
+
+        key                             = (record.base, record.ext)
+        revisions                       = self._versions.setdefault(key, dict()).setdefault(record.version, [])
+        bisect.insort(revisions, record.revision)
+        self._records[key + (record.version, record.revision)] = record
+
+        latest                          = self._latest.get(key)
+        if latest is None or (record.version, record.revision) > tuple(latest):
+            self._latest[key]           = [record.version, record.revision]
+        return record
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Query """
+
+    def versions(self, base, ext='.ma'):
+        return sorted(self._versions.get((base, ext), dict()))
+
+    def latestVersion(self, base, ext='.ma'):
+        """ :return: highest version number, 0 if there is none """
+        latest                          = self._latest.get((base, ext))
+        return latest[0] if latest else 0
+
+    def nextVersion(self, base, ext='.ma'):
+        return self.latestVersion(base, ext) + 1
+
+    def revisions(self, base, version, ext='.ma'):
+        """ :return: VersionRecords of every revision of 'version' (the version file itself is revision 0) """
+        key                             = (base, ext)
+        return [self._records[key + (version, r)] for r in self._versions.get(key, dict()).get(version, [])]
+
+    def latestRevision(self, base, version, ext='.ma'):
+        """ :return: highest revision number of 'version', 0 if there is none """
+        revisions                       = self._versions.get((base, ext), dict()).get(version)
+        return revisions[-1] if revisions else 0
+
+    def nextRevision(self, base, version, ext='.ma'):
+        return self.latestRevision(base, version, ext) + 1
+
+    def latest(self, base, ext='.ma'):
+        """ :return: VersionRecord of the latest version and revision, None if there is none """
+        latest                          = self._latest.get((base, ext))
+        if not latest:
+            return None
+        return self._records[(base, ext) + tuple(latest)]
+
+    def record(self, base, version, revision=0, ext='.ma'):
+        return self._records.get((base, ext, version, revision))
+
+    def bases(self, ext=None):
+        return sorted(set(base for base, e in self._versions if ext is None or e == ext))
+
+    def records(self):
+        return list(self._records.values())
+
+    def files(self, ext=None):
+        """ :return: sorted file names of the directory, only the ones ending with 'ext' if given """
+        return sorted(f for f in self._files if ext is None or f.lower().endswith(ext))
+
+
+class VersionResolver(object):
+
+    """ VersionIndex per directory, rebuilt only when the directory has changed """
+
+    key                                 = 'VersionResolver'
+
+    def __init__(self):
+        super(VersionResolver, self).__init__()
+
+        self._lock                      = threading.Lock()
+        self._indexes                   = dict()
+
+    @staticmethod
+    def normPath(directory):
+        return os.path.normcase(os.path.abspath(directory))
+
+    def index(self, directory):
+        """ :return: VersionIndex of the directory, empty if it does not exist """
+        path                            = self.normPath(directory)
+        try:
+            stamp                       = os.stat(path).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._indexes.pop(path, None)
+            return VersionIndex()
+
+        with self._lock:
+            cached                      = self._indexes.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        with os.scandir(path) as it:
+            index                       = VersionIndex(e.name for e in it if e.is_file())
+
+        with self._lock:
+            self._indexes[path]         = (stamp, index)
+        return index
+
+    def invalidate(self, directory=None):
+        """
+        Drop a cached index (all of them without directory). Only needed when a file is added within the
+        resolution of the directory timestamp, ie: right after saving into it.
+        """
+        with self._lock:
+            if directory is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(self.normPath(directory), None)
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Shortcuts """
+
+    def latest(self, directory, base, ext='.ma'):
+        return self.index(directory).latest(base, ext)
+
+    def latestVersion(self, directory, base, ext='.ma'):
+        return self.index(directory).latestVersion(base, ext)
+
+    def nextVersion(self, directory, base, ext='.ma'):
+        return self.index(directory).nextVersion(base, ext)
+
+    def revisions(self, directory, base, version, ext='.ma'):
+        return self.index(directory).revisions(base, version, ext)
+
+    def nextRevision(self, directory, base, version, ext='.ma'):
+        return self.index(directory).nextRevision(base, version, ext)
+
+
+versionResolver = VersionResolver()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 3:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
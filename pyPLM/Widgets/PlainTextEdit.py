@@ -62,6 +62,8 @@ class PlainTextEdit(QPlainTextEdit):
                 self.setAcceptDrops(value)
             elif key == 'rol': # setReadOnly
                 self.setReadOnly(value)
+            elif key == 'mbc': # setMaximumBlockCount, oldest lines are dropped past it
+                self.setMaximumBlockCount(value)
 
 
 class Detector(PlainTextEdit):
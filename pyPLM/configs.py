@@ -12,6 +12,8 @@ Description:
 """ Import """
 import os
 
+from PLM.platforms import platformServices
+
 BIN_ROOT = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)), 'bin')
 
 BIN_DATA                        = os.path.join(BIN_ROOT, 'data')
@@ -27,7 +29,7 @@ WEB_ICON_DIR                    = os.path.join(ICON_DIR, 'web')
 
 TAG_ICON_DIR                    = os.path.join(ICON_DIR, 'tags')
 
-USER_LOCAL_DATA                 = os.path.join(os.getenv('LOCALAPPDATA'), 'DAMGTEAM', 'PLM', '.configs')
+USER_LOCAL_DATA                 = os.path.join(platformServices().appDataDir(), 'DAMGTEAM', 'PLM', '.configs')
 
 
 IGNORE_ICONS                    = [ 'Widget', 'bright', 'dark', 'charcoal', 'nuker', 'TopTab1', 'TopTab2',
@@ -13,6 +13,7 @@ Description:
 import logging, sys
 from .formatter 				import DamgFormatter, StreamHandler
 from .handler 					import DamgHandler
+from .store 					import LogStore, DamgStoreHandler
 from .options 					import logColorOpts, LogLevel
 
 
@@ -28,7 +29,7 @@ class DamgLogger(logging.Logger):
 				LogLevel.Critical: logging.CRITICAL, }
 
 
-	def __init__(self, name=None, level='DEBUG', filepth=None):
+	def __init__(self, name=None, level='DEBUG', filepth=None, store=True):
 
 		if not name:
 			self.name 		= __file__
@@ -54,6 +55,13 @@ class DamgLogger(logging.Logger):
 
 		self.addHandler(self.streamHandler)
 		self.addHandler(self.fileHandler)
+
+		# structured copy of the records for the log viewer, next to the text file
+		self.storeHandler 	= None
+		if store and self.file:
+			loggerKey 		= getattr(name, 'key', None) or str(name or 'DamgLogger')
+			self.storeHandler = DamgStoreHandler(LogStore.forLogFile(self.file), loggerKey, self.file)
+			self.addHandler(self.storeHandler)
 		self.setLevel(self.level)
 
 		sys.excepthook = self.exception_handler
@@ -12,6 +12,7 @@ Description:
 """ Import """
 
 from .Loggers import DamgLogger
+from .store import LogStore, DamgStoreHandler
 
 
 
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: store.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Structured copy of the logs, next to the text files (logs.db in the log folder). Every record is a row of a
+    SQLite table indexed by time, level and logger, so a week of logs can be filtered without reading it all.
+
+    Records are written by batches: the buffer is flushed every FLUSH_SIZE records, every FLUSH_INTERVAL seconds,
+    at once for errors and when the application exits. Queries are read by pages ordered by time, a viewer only
+    asks for the next page when it needs it.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+import os, time, atexit, sqlite3, threading
+from logging                    import Handler
+
+
+STORE_NAME                      = 'logs.db'
+FLUSH_SIZE                      = 200
+FLUSH_INTERVAL                  = 1.0
+PAGE_SIZE                       = 500
+
+SCHEMA                          = ("CREATE TABLE IF NOT EXISTS records (id INTEGER PRIMARY KEY, created REAL NOT NULL, "
+                                   "level INTEGER NOT NULL, levelName TEXT, logger TEXT, logFile TEXT, module TEXT, "
+                                   "lineno INTEGER, message TEXT)",
+                                   "CREATE INDEX IF NOT EXISTS records_created ON records (created)",
+                                   "CREATE INDEX IF NOT EXISTS records_level ON records (level, created)",
+                                   "CREATE INDEX IF NOT EXISTS records_logger ON records (logger, created)",
+                                   "CREATE INDEX IF NOT EXISTS records_logFile ON records (logFile, created)", )
+
+COLUMNS                         = ['id', 'created', 'level', 'levelName', 'logger', 'logFile', 'module', 'lineno',
+                                   'message']
+
+
+class LogStore(object):
+
+    key                         = 'LogStore'
+
+    _stores                     = dict()
+    _storesLock                 = threading.Lock()
+
+    def __init__(self, dbPath):
+        super(LogStore, self).__init__()
+
+        self.dbPath             = dbPath
+        self._lock              = threading.RLock()
+        self._buffer            = []
+        self._lastFlush         = time.time()
+
+        folder                  = os.path.dirname(dbPath)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        self.conn               = sqlite3.connect(dbPath, check_same_thread=False, timeout=10)
+        # several PLM processes can write the same store, WAL lets the viewer read while they write
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+
+        atexit.register(self.flush)
+
+    @classmethod
+    def instance(cls, dbPath):
+        """ One store per database file, shared by every logger writing to it """
+        dbPath                  = os.path.abspath(dbPath)
+        with cls._storesLock:
+            store               = cls._stores.get(dbPath)
+            if store is None:
+                store           = cls._stores[dbPath] = cls(dbPath)
+        return store
+
+    @classmethod
+    def forLogFile(cls, logFile):
+        return cls.instance(os.path.join(os.path.dirname(os.path.abspath(logFile)), STORE_NAME))
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Write """
+
+    def append(self, row, urgent=False):
+        with self._lock:
+            self._buffer.append(row)
+            if urgent or len(self._buffer) >= FLUSH_SIZE or time.time() - self._lastFlush >= FLUSH_INTERVAL:
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            self._lastFlush     = time.time()
+            if not self._buffer:
+                return
+            rows, self._buffer  = self._buffer, []
+            try:
+                with self.conn:
+                    self.conn.executemany("INSERT INTO records (created, level, levelName, logger, logFile, module, "
+                                          "lineno, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            except sqlite3.Error:
+                # a log which can not be stored must not break the application, the text files still have it
+                pass
+
+    def prune(self, before):
+        """ Remove the records older than 'before' (timestamp) """
+        self.flush()
+        with self._lock, self.conn:
+            return self.conn.execute("DELETE FROM records WHERE created < ?", (before, )).rowcount
+
+    # -----------------------------------------------------------------------------------------------------------
+    """ Read """
+
+    @staticmethod
+    def where(start=None, end=None, minLevel=None, loggers=None, logFiles=None, text=None):
+        clauses, params         = [], []
+        if start is not None:
+            clauses.append('created >= ?')
+            params.append(start)
+        if end is not None:
+            clauses.append('created <= ?')
+            params.append(end)
+        if minLevel:
+            clauses.append('level >= ?')
+            params.append(minLevel)
+        for column, values in [('logger', loggers), ('logFile', logFiles)]:
+            if values:
+                clauses.append('{0} IN ({1})'.format(column, ', '.join('?' * len(values))))
+                params.extend(values)
+        if text:
+            clauses.append("message LIKE ? ESCAPE '\\'")
+            params.append('%{0}%'.format(text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')))
+        return clauses, params
+
+    def query(self, start=None, end=None, minLevel=None, loggers=None, logFiles=None, text=None,
+              newestFirst=True, pageSize=PAGE_SIZE):
+        """
+        Generator of pages (lists of dicts) matching the filters, ordered by time. Each page continues after the
+        last row of the previous one, so a page costs the same at the end of the table as at the start.
+        """
+        self.flush()
+        clauses, params         = self.where(start, end, minLevel, loggers, logFiles, text)
+        order                   = 'DESC' if newestFirst else 'ASC'
+        compare                 = '<' if newestFirst else '>'
+        last                    = None
+
+        while True:
+            pageClauses         = list(clauses)
+            pageParams          = list(params)
+            if last is not None:
+                pageClauses.append('(created, id) {0} (?, ?)'.format(compare))
+                pageParams.extend([last[1], last[0]])
+
+            sql                 = 'SELECT {0} FROM records'.format(', '.join(COLUMNS))
+            if pageClauses:
+                sql             += ' WHERE ' + ' AND '.join(pageClauses)
+            sql                 += ' ORDER BY created {0}, id {0} LIMIT {1}'.format(order, int(pageSize))
+
+            with self._lock:
+                rows            = self.conn.execute(sql, pageParams).fetchall()
+            if not rows:
+                return
+            yield [dict(zip(COLUMNS, row)) for row in rows]
+            if len(rows) < pageSize:
+                return
+            last                = rows[-1]
+
+    def count(self, start=None, end=None, minLevel=None, loggers=None, logFiles=None, text=None):
+        self.flush()
+        clauses, params         = self.where(start, end, minLevel, loggers, logFiles, text)
+        sql                     = 'SELECT COUNT(*) FROM records'
+        if clauses:
+            sql                 += ' WHERE ' + ' AND '.join(clauses)
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()[0]
+
+    def distinct(self, column):
+        """ Values of 'logger' or 'logFile', read from their index """
+        if column not in ['logger', 'logFile', 'levelName']:
+            raise ValueError('Can not list the values of {0}'.format(column))
+        self.flush()
+        with self._lock:
+            rows                = self.conn.execute('SELECT DISTINCT {0} FROM records ORDER BY {0}'.format(column))
+            return [r[0] for r in rows if r[0] is not None]
+
+    def timeRange(self):
+        """ :return: (first, last) timestamps, (None, None) when the store is empty """
+        self.flush()
+        with self._lock:
+            return tuple(self.conn.execute('SELECT MIN(created), MAX(created) FROM records').fetchone())
+
+
+class DamgStoreHandler(Handler):
+
+    """ Logging handler writing the records into a LogStore, tagged with the logger key and the text log file """
+
+    key                         = 'DamgStoreHandler'
+
+    def __init__(self, store, logger=None, logFile=None, urgentLevel=40):
+        super(DamgStoreHandler, self).__init__()
+
+        self.store              = store
+        self.logger             = logger
+        self.logFile            = os.path.basename(logFile) if logFile else None
+        self.urgentLevel        = urgentLevel
+
+    def emit(self, record):
+        try:
+            message             = record.getMessage()
+            if record.exc_info:
+                message         = '{0}\n{1}'.format(message, self.formatException(record.exc_info))
+            row                 = (record.created, record.levelno, record.levelname, self.logger or record.name,
+                                   self.logFile, record.module, record.lineno, message)
+            self.store.append(row, urgent=record.levelno >= self.urgentLevel)
+        except Exception:
+            self.handleError(record)
+
+    @staticmethod
+    def formatException(excInfo):
+        import traceback
+        return ''.join(traceback.format_exception(*excInfo)).rstrip()
+
+    def flush(self):
+        self.store.flush()
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 5:10 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
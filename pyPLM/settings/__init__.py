@@ -14,6 +14,7 @@ Description:
 from .appSettings                       import AppSettings
 from .regSettings                       import RegSettings
 from .globalSettings                    import GlobalSettings
+from .notifier                          import SettingsNotifier, settingsNotifier
 
 # -------------------------------------------------------------------------------------------------------------
 # Created by Trinh Do on 5/6/2020 - 3:13 AM
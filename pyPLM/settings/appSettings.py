@@ -15,6 +15,7 @@ import os
 
 # PLM
 from pyPLM.Core import Settings
+from .notifier import notify_change
 
 
 INI                                     = Settings.IniFormat
@@ -56,6 +57,14 @@ class AppSettings(Settings):
             if len(key.split('/')) > 2:
                 self.remove(key)
 
+    def setValue(self, key, value):
+        super(AppSettings, self).setValue(key, value)
+        notify_change(self, key)
+
+    def remove(self, key):
+        super(AppSettings, self).remove(key)
+        notify_change(self, None)
+
     def update(self):
 
         self._data['key'] = self.key
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: notifier.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Change events of the settings files. AppSettings and RegSettings report their own writes here, a file watcher
+    reports the writes of other processes (or of a text editor) to the watched INI files. Views listen to
+    'changed' instead of reading the settings again on a timer.
+
+    changed(fileName, key): key is the full key ('group/key') of an in-process write, '' when the file changed on
+    disk and anything in it can be different.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os
+
+# PySide2
+from PySide2.QtCore                     import QObject, QFileSystemWatcher
+
+# PLM
+from pyPLM.Core                         import Signal, Timer
+
+
+# editors and QSettings.sync() can write a file in several steps, one event is sent for all of them
+SETTLE_TIME                             = 200
+
+
+def norm_path(fileName):
+    return os.path.abspath(fileName).replace('\\', '/') if fileName else ''
+
+
+class SettingsNotifier(QObject):
+
+    key                                 = 'SettingsNotifier'
+
+    changed                             = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super(SettingsNotifier, self).__init__(parent)
+
+        self.watcher                    = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.onFileChanged)
+        self._watched                   = dict()
+        self._dirty                     = set()
+
+        self.settleTimer                = Timer(self)
+        self.settleTimer.setSingleShot(True)
+        self.settleTimer.setInterval(SETTLE_TIME)
+        self.settleTimer.timeout.connect(self.emitFileChanges)
+
+    def watch(self, fileName):
+        """ Watch a settings file while at least one view needs it. Registry paths are not files, they are skipped """
+        path                            = norm_path(fileName)
+        if not os.path.isfile(path):
+            return False
+        self._watched[path]             = self._watched.get(path, 0) + 1
+        if path not in self.watcher.files():
+            self.watcher.addPath(path)
+        return True
+
+    def unwatch(self, fileName):
+        path                            = norm_path(fileName)
+        count                           = self._watched.get(path, 0) - 1
+        if count > 0:
+            self._watched[path]         = count
+            return
+        self._watched.pop(path, None)
+        if path in self.watcher.files():
+            self.watcher.removePath(path)
+
+    def notify(self, fileName, key):
+        self.changed.emit(norm_path(fileName), key)
+
+    def onFileChanged(self, path):
+        self._dirty.add(path)
+        self.settleTimer.start()
+
+    def emitFileChanges(self):
+        paths, self._dirty              = self._dirty, set()
+        for path in paths:
+            # a file saved by rename is not watched anymore
+            if path in self._watched and os.path.isfile(path) and path not in self.watcher.files():
+                self.watcher.addPath(path)
+            self.changed.emit(path, '')
+
+
+_notifier                               = None
+
+
+def settingsNotifier():
+    global _notifier
+    if _notifier is None:
+        _notifier                       = SettingsNotifier()
+    return _notifier
+
+
+def notify_change(settings, key):
+    """ Report a write of settings, nothing is done while no view listens. No key: anything can have changed """
+    if _notifier is None:
+        return
+    group                               = settings.group()
+    _notifier.notify(settings.fileName(), '{0}/{1}'.format(group, key) if group and key else key or '')
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 8:05 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
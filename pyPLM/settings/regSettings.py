@@ -12,6 +12,7 @@ Description:
 """ Import """
 
 from pyPLM.Core import Settings
+from .notifier import notify_change
 
 
 class RegSettings(Settings):
@@ -26,6 +27,14 @@ class RegSettings(Settings):
 
         self.parent                     = parent
 
+    def setValue(self, key, value):
+        super(RegSettings, self).setValue(key, value)
+        notify_change(self, key)
+
+    def remove(self, key):
+        super(RegSettings, self).remove(key)
+        notify_change(self, None)
+
     def update(self):
 
         self._data['key'] = self.key
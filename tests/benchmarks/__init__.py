@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: __init__.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Performance benchmarks of the PLM core subsystems, see conftest.py to run them and compare two runs.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 3:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
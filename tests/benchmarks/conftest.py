@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: conftest.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Benchmark suite of the PLM core subsystems (pytest-benchmark). Everything runs headless: the Qt platform is
+    'offscreen', LOCALAPPDATA points to a temporary folder so the local database, settings and logs of the machine
+    are not touched, and a stub HTTP server answers the local server checks.
+
+    The results are saved as json in tests/benchmarks/baseline (one folder per machine/python). No baseline is
+    committed and no CI job runs the suite, the timings only mean something on the machine which made them. Save a
+    run before a change, then compare the run after it, the comparison fails when something became slower:
+
+        pytest tests/benchmarks --benchmark-save=baseline
+        pytest tests/benchmarks --benchmark-compare --benchmark-compare-fail=mean:20%
+
+    The suite is skipped when pytest-benchmark or PySide2 are not installed.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sys, shutil, tempfile, threading
+from http.server                        import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+BENCHMARK_DIR                           = os.path.dirname(os.path.abspath(__file__)).replace('\\', '/')
+BASELINE_DIR                            = os.path.join(BENCHMARK_DIR, 'baseline').replace('\\', '/')
+ROOT_APP                                = os.path.dirname(os.path.dirname(BENCHMARK_DIR))
+
+DEFAULT_STORAGE                         = 'file://./.benchmarks'
+
+try:
+    import pytest_benchmark, PySide2
+except ImportError:
+    collect_ignore_glob                 = ['test_*.py']
+    HEADLESS                            = False
+else:
+    HEADLESS                            = True
+
+
+def setup_headless():
+    """ Must run before PLM is imported, the application data folder is resolved at import time """
+    appData                             = tempfile.mkdtemp(prefix='plm_bench_')
+    os.makedirs(os.path.join(appData, 'DAMGTEAM', 'Pipeline Manager (PLM)'), exist_ok=True)
+
+    # LOCALAPPDATA on Windows, XDG_DATA_HOME on Linux
+    os.environ['LOCALAPPDATA']          = appData
+    os.environ['XDG_DATA_HOME']         = appData
+    os.environ['QT_QPA_PLATFORM']       = 'offscreen'
+
+    if ROOT_APP not in sys.path:
+        sys.path.insert(0, ROOT_APP)
+
+    from PLM import bootstrap
+    bootstrap(persistEnv=False)
+    return appData
+
+
+APPDATA                                 = setup_headless() if HEADLESS else None
+
+
+def pytest_configure(config):
+    if HEADLESS and config.getoption('benchmark_storage') == DEFAULT_STORAGE:
+        config.option.benchmark_storage = 'file://{0}'.format(BASELINE_DIR)
+
+
+def pytest_unconfigure(config):
+    if APPDATA:
+        shutil.rmtree(APPDATA, ignore_errors=True)
+
+
+# -------------------------------------------------------------------------------------------------------------
+""" Fixtures """
+
+class StubServerHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body                            = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST                             = do_GET
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='session')
+def stubServer():
+    """ Local server answering every request with 200, on the port PLM expects """
+    from PLM import __localPort__, __localHost__
+
+    server                              = ThreadingHTTPServer(('127.0.0.1', int(__localPort__)), StubServerHandler)
+    thread                              = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield '{0}{1}'.format(__localHost__, __localPort__)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    from PySide2.QtWidgets import QApplication
+    app                                 = QApplication.instance() or QApplication(['plm-benchmark'])
+    yield app
+
+
+@pytest.fixture(scope='session')
+def syntheticTree(tmp_path_factory):
+    """ 40 folders x 50 files over 2 levels, one file in ten contains the word 'needle' """
+    root                                = tmp_path_factory.mktemp('tree')
+    for d in range(40):
+        folder                          = root / 'shot_{0:03d}'.format(d) / ('work' if d % 2 else 'publish')
+        folder.mkdir(parents=True)
+        for f in range(50):
+            text                        = 'needle\n' if f % 10 == 0 else 'hay\n'
+            ext                         = '.ma' if f % 3 else '.txt'
+            (folder / 'file_{0:03d}{1}'.format(f, ext)).write_text(text * 20)
+    return str(root).replace('\\', '/')
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 3:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
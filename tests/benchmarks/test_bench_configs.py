@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_bench_configs.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Startup cost of the configurations: ConfigPipeline (apps, icons, keys, folders) and the object registry.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+
+def test_config_pipeline_build(benchmark):
+    from PLM.configs import ConfigPipeline
+    cfg = benchmark.pedantic(ConfigPipeline, rounds=5, iterations=1, warmup_rounds=1)
+    assert len(cfg) > 0
+
+
+def test_cmds_records(benchmark):
+    from PLM.configs.baseConfigs import Cmds
+
+    def build():
+        return [Cmds('App {0}'.format(i), 'icon.png', 'Launch', 'Launch: app.exe', 'app.exe', 'path', 'app.exe',
+                     'os.startfile') for i in range(1000)]
+
+    records = benchmark(build)
+    assert records[0]['statustip'] == records[0].statusTip
+
+
+def test_config_prop_text(benchmark):
+    from PLM.configs import loadPropText
+    prop = benchmark(loadPropText)
+    assert prop
+
+
+def test_config_context_shared(benchmark):
+    from PLM.configs import configContext, configPropText
+    configContext.reload('propText')
+    benchmark(lambda: configPropText()['WAIT_LAYOUT_COMPLETE'])
+    assert configContext.loaded('propText')
+
+
+def test_registry_register(benchmark, qapp):
+    from pyPLM.damg import DAMG
+    from pyPLM.damg.models import objRegistry
+
+    def setup():
+        return (DAMG(),), {}
+
+    obj = benchmark.pedantic(objRegistry.register, setup=setup, rounds=200, iterations=1)
+    assert obj._name in objRegistry
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 3:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_bench_data.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Local database, settings files and version handling.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+import itertools
+
+import pytest
+
+
+ROWS                                    = 200
+
+
+@pytest.fixture(scope='module')
+def database():
+    from PLM.cores.data import sqlUtils
+    db = sqlUtils()
+    db.cur.execute("CREATE TABLE IF NOT EXISTS benchLog (id INT, username TEXT, action TEXT, date TEXT)")
+    db.conn.commit()
+    yield db
+    db.cur.execute("DROP TABLE IF EXISTS benchLog")
+    db.conn.commit()
+
+
+def test_sql_insert(benchmark, database):
+    counter = itertools.count()
+
+    def insert():
+        i = next(counter)
+        database.update_table('benchLog', [i, "'user{0}'".format(i), "'login'", "'2020.10.19'"])
+
+    benchmark(insert)
+
+
+def test_sql_query(benchmark, database):
+    for i in range(ROWS):
+        database.update_table('benchLog', [i, "'user{0}'".format(i), "'login'", "'2020.10.19'"])
+
+    row = benchmark(database.query_table, 'benchLog')
+    assert len(row) == 4
+
+
+def test_sql_table_list(benchmark, database):
+    tables = benchmark(database.tableList)
+    assert 'benchLog' in tables
+
+
+@pytest.fixture
+def settings(tmp_path, qapp):
+    from pyPLM.settings import AppSettings
+    appSettings = AppSettings(filename=str(tmp_path / 'bench.ini'))
+    appSettings._settingEnable = True
+    yield appSettings
+    appSettings.sync()
+
+
+def test_settings_write(benchmark, settings):
+    counter = itertools.count()
+    benchmark(lambda: settings.initSetValue('key{0}'.format(next(counter) % 50), 'value', 'bench'))
+
+
+def test_settings_read(benchmark, settings):
+    for i in range(50):
+        settings.initSetValue('key{0}'.format(i), 'value{0}'.format(i), 'bench')
+    settings.sync()
+
+    value = benchmark(settings.initValue, 'key25', 'bench')
+    assert value == 'value25'
+
+
+VERSIONS                                = ['1.0.0', '1.2.3-alpha.1', '1.2.3', '2.0.0-rc.1+build.5', '13.0.0', '0.0.1']
+
+
+def test_version_parse(benchmark):
+    from PLM.version import Version
+    versions = benchmark(lambda: [Version(v) for v in VERSIONS])
+    assert str(versions[2]) == '1.2.3'
+
+
+def test_version_compare(benchmark):
+    from PLM.version import Version
+    versions = [Version(v) for v in VERSIONS]
+    ordered = benchmark(sorted, versions)
+    assert str(ordered[-1]) == '13.0.0'
+
+
+def test_version_spec_match(benchmark):
+    from PLM.version import Version, SimpleSpec
+    spec = SimpleSpec('>=1.2.0,<3.0.0')
+    versions = [Version(v) for v in VERSIONS]
+    matches = benchmark(lambda: [v for v in versions if spec.match(v)])
+    assert [str(v) for v in matches] == ['1.2.3', '2.0.0-rc.1+build.5']
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 3:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
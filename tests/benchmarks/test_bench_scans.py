@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_bench_scans.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Folder scans over a synthetic tree: the walk used by the path helpers and the FindFiles search (list a folder
+    with a name filter, then look for a text inside the files).
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+import os
+
+
+def find_files(directory, nameFilter, text):
+    """ Same steps as FindFiles.find/findFiles, without the dialogs """
+    from PySide2.QtCore import QDir, QFile, QIODevice, QTextStream
+
+    found = []
+    for folder, dirs, files in os.walk(directory):
+        currentDir = QDir(folder)
+        for fn in currentDir.entryList([nameFilter], QDir.Files | QDir.NoSymLinks):
+            inFile = QFile(currentDir.absoluteFilePath(fn))
+            if inFile.open(QIODevice.ReadOnly):
+                stream = QTextStream(inFile)
+                while not stream.atEnd():
+                    if text in stream.readLine():
+                        found.append(fn)
+                        break
+                inFile.close()
+    return found
+
+
+def test_walk_tree(benchmark, syntheticTree):
+    from PLM.utils import get_all_path_from_dir
+    files, folders = benchmark(get_all_path_from_dir, syntheticTree)
+    assert len(files) == 2000
+
+
+def test_find_files_by_name(benchmark, qapp, syntheticTree):
+    found = benchmark(find_files, syntheticTree, '*.txt', '')
+    assert len(found) == 40 * 17
+
+
+def test_find_files_by_text(benchmark, qapp, syntheticTree):
+    found = benchmark(find_files, syntheticTree, '*', 'needle')
+    assert len(found) == 40 * 5
+
+
+def test_project_template_diff(benchmark, syntheticTree):
+    from ToolHub.ProjectTemplate import ProjectTemplate, numbered
+    template = ProjectTemplate.load('studio')
+    result = benchmark(template.diff, syntheticTree, character=numbered('char', 5), environment=numbered('env', 3),
+                       prop=numbered('prop', 10), shot=numbered('shot', 100))
+    assert result.missing
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 3:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
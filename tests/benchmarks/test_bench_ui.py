@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_bench_ui.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Stylesheets and layouts, built on the offscreen Qt platform.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+import pytest
+
+
+@pytest.mark.parametrize('style', ['dark', 'PySide2', 'pyqtgraph'])
+def test_stylesheet(benchmark, qapp, style):
+    from PLM.cores import StyleSheet
+    styleSheet = StyleSheet(qapp)
+    data = benchmark(styleSheet.getStyleSheet, style)
+    assert data is not None
+
+
+def test_build_layouts(benchmark, qapp, stubServer):
+    from PLM.cores import ThreadManager
+    from PLM.ui.LayoutManager import LayoutManager
+
+    def setup():
+        return (LayoutManager(ThreadManager(qapp), qapp),), {}
+
+    layouts = benchmark.pedantic(LayoutManager.buildLayouts, setup=setup, rounds=3, iterations=1)
+    assert layouts
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 3:40 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: __init__.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Unit tests of the PLM core subsystems, see conftest.py for the fixtures (local http servers, headless Qt).
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: conftest.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Unit tests run headless: the Qt platform is 'offscreen' and LOCALAPPDATA points to a temporary folder so the
+    local database, settings and logs of the machine are not touched. Tests which need PLM and Qt use the 'plm' or
+    'qapp' fixtures and are skipped when PySide2 is not installed, the others (ie: the Maya tools against a stub
+    maya.cmds) always run.
+
+        pytest tests/unit
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, sys, shutil, tempfile, threading
+from http.server                        import ThreadingHTTPServer
+
+import pytest
+
+
+UNIT_DIR                                = os.path.dirname(os.path.abspath(__file__)).replace('\\', '/')
+ROOT_APP                                = os.path.dirname(os.path.dirname(UNIT_DIR))
+SIGNAL_TIMEOUT                          = 10000
+
+
+def setup_headless():
+    """ Must run before PLM is imported, the application data folder is resolved at import time """
+    appData                             = tempfile.mkdtemp(prefix='plm_test_')
+    os.makedirs(os.path.join(appData, 'DAMGTEAM', 'Pipeline Manager (PLM)'), exist_ok=True)
+
+    # LOCALAPPDATA on Windows, XDG_DATA_HOME on Linux
+    os.environ['LOCALAPPDATA']          = appData
+    os.environ['XDG_DATA_HOME']         = appData
+    os.environ['QT_QPA_PLATFORM']       = 'offscreen'
+
+    if ROOT_APP not in sys.path:
+        sys.path.insert(0, ROOT_APP)
+    return appData
+
+
+APPDATA                                 = setup_headless()
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(APPDATA, ignore_errors=True)
+
+
+# -------------------------------------------------------------------------------------------------------------
+""" Fixtures """
+
+@pytest.fixture(scope='session')
+def plm():
+    """ PLM with its dependencies, skipped when they are not installed """
+    for module in ['PySide2', 'termcolor']:
+        pytest.importorskip(module)
+    from PLM import bootstrap
+    bootstrap(persistEnv=False)
+
+
+@pytest.fixture(scope='session')
+def qapp(plm):
+    from PySide2.QtWidgets import QApplication
+    app                                 = QApplication.instance() or QApplication(['plm-test'])
+    yield app
+
+
+@pytest.fixture
+def httpServer():
+    """ serve(handlerClass) starts a local server on a free port and returns its url, it is stopped after the test """
+    servers                             = []
+
+    def serve(handler):
+        server                          = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return 'http://127.0.0.1:{0}'.format(server.server_port)
+
+    yield serve
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def waitSignal(qapp):
+    """ waitSignal(*signals) runs the event loop until one of the signals is emitted, :return: its arguments """
+    from PySide2.QtCore import QEventLoop, QTimer
+
+    def wait(*signals, timeout=SIGNAL_TIMEOUT):
+        loop                            = QEventLoop()
+        received                        = []
+
+        def stop(*args):
+            received.append(args)
+            loop.quit()
+
+        for signal in signals:
+            signal.connect(stop)
+        QTimer.singleShot(timeout, loop.quit)
+        loop.exec_()
+        for signal in signals:
+            signal.disconnect(stop)
+
+        assert received, 'no signal within {0} ms'.format(timeout)
+        return received[0]
+
+    return wait
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
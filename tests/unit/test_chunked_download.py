@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_chunked_download.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    ChunkedDownloadChannel against local http servers: one which answers Range requests with 206, one which
+    advertises ranges but always sends the whole file with 200 (the download must restart once, not loop).
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os, re
+from http.server                        import BaseHTTPRequestHandler
+
+import pytest
+
+
+PAYLOAD                                 = bytes(range(256)) * 1024          # 256 KB
+CHUNK_SIZE                              = 64 * 1024
+
+
+def make_handler(rangeSupport):
+    """ :return: handler class serving PAYLOAD, its 'requests' list keeps the Range header of every GET """
+
+    class Handler(BaseHTTPRequestHandler):
+
+        requests                        = []
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(PAYLOAD)))
+            # the server without range support still advertises it, like a misconfigured proxy
+            self.send_header('Accept-Ranges', 'bytes')
+            self.end_headers()
+
+        def do_GET(self):
+            header                      = self.headers.get('Range')
+            self.requests.append(header)
+            match                       = re.match(r'bytes=(\d+)-(\d*)', header or '')
+
+            if rangeSupport and match:
+                start                   = int(match.group(1))
+                end                     = int(match.group(2)) if match.group(2) else len(PAYLOAD) - 1
+                body                    = PAYLOAD[start:end + 1]
+                self.send_response(206)
+                self.send_header('Content-Range', 'bytes {0}-{1}/{2}'.format(start, end, len(PAYLOAD)))
+            else:
+                body                    = PAYLOAD
+                self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def manager(qapp):
+    from PySide2.QtNetwork import QNetworkAccessManager
+    return QNetworkAccessManager()
+
+
+def download(url, manager, filePath, waitSignal, connections=4):
+    from PLM.cores.models.ChunkedDownloadChannel import ChunkedDownloadChannel
+
+    channel                             = ChunkedDownloadChannel(url, manager, filePath, connections=connections,
+                                                                 chunkSize=CHUNK_SIZE)
+    channel.start()
+    waitSignal(channel.downloadFinished, channel.downloadFailed)
+    return channel
+
+
+def write_partial(filePath, url, written):
+    """ A download stopped after 'written' bytes of its first chunk """
+    from PLM.cores.models.ChunkedDownloadChannel import DownloadManifest
+
+    with open(filePath, 'wb') as f:
+        f.write(PAYLOAD[:written] + bytes(len(PAYLOAD) - written))
+    manifest                            = DownloadManifest(filePath, url, len(PAYLOAD))
+    manifest.split(len(PAYLOAD))
+    manifest.chunks[0][2]               = written
+    manifest.save()
+
+
+def test_range_server(httpServer, manager, waitSignal, tmp_path):
+    handler                             = make_handler(rangeSupport=True)
+    url                                 = '{0}/file.bin'.format(httpServer(handler))
+    filePath                            = str(tmp_path / 'file.bin')
+
+    channel                             = download(url, manager, filePath, waitSignal)
+
+    assert channel.state == 'finished'
+    assert open(filePath, 'rb').read() == PAYLOAD
+    assert not os.path.exists(filePath + '.part.json')
+    assert len(handler.requests) == len(PAYLOAD) // CHUNK_SIZE
+    assert all(r.startswith('bytes=') for r in handler.requests)
+
+
+def test_range_server_resume(httpServer, manager, waitSignal, tmp_path):
+    handler                             = make_handler(rangeSupport=True)
+    url                                 = '{0}/file.bin'.format(httpServer(handler))
+    filePath                            = str(tmp_path / 'file.bin')
+    write_partial(filePath, url, 1000)
+
+    channel                             = download(url, manager, filePath, waitSignal)
+
+    assert channel.state == 'finished'
+    assert open(filePath, 'rb').read() == PAYLOAD
+    assert handler.requests == ['bytes=1000-{0}'.format(len(PAYLOAD) - 1)]
+
+
+def test_server_without_ranges(httpServer, manager, waitSignal, tmp_path):
+    handler                             = make_handler(rangeSupport=False)
+    url                                 = '{0}/file.bin'.format(httpServer(handler))
+    filePath                            = str(tmp_path / 'file.bin')
+
+    channel                             = download(url, manager, filePath, waitSignal)
+
+    assert channel.state == 'finished'
+    assert open(filePath, 'rb').read() == PAYLOAD
+    # the first 200 reply, chunk 0 included, restarts the download once as a single one, it does not loop
+    assert not os.path.exists(filePath + '.part.json')
+    assert len(handler.requests) <= 4
+
+
+def test_server_without_ranges_single_chunk(httpServer, manager, waitSignal, tmp_path):
+    handler                             = make_handler(rangeSupport=False)
+    url                                 = '{0}/file.bin'.format(httpServer(handler))
+    filePath                            = str(tmp_path / 'file.bin')
+    write_partial(filePath, url, 1000)
+
+    channel                             = download(url, manager, filePath, waitSignal, connections=1)
+
+    assert channel.state == 'finished'
+    assert open(filePath, 'rb').read() == PAYLOAD
+    assert not os.path.exists(filePath + '.part.json')
+    # the resumed range is answered with the whole file, it is written from offset 0 without a new request
+    assert len(handler.requests) == 1
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
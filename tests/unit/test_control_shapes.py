@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_control_shapes.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    The control shape library of ToolBoxII without Maya: a stub maya.cmds records the calls, the tests check the
+    curves compiled from controlShapes.json and the cmds calls building one control or a batch of them.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import sys, types
+
+import pytest
+
+
+class FakeCmds(types.ModuleType):
+
+    """ maya.cmds recording every call, curve() returns a new transform name """
+
+    def __init__(self):
+        super(FakeCmds, self).__init__('maya.cmds')
+        self.calls                      = []
+        self.count                      = 0
+
+    def record(self, name, args, kwargs):
+        self.calls.append((name, args, kwargs))
+
+    def named(self, name):
+        return [call for call in self.calls if call[0] == name]
+
+    def curve(self, *args, **kwargs):
+        self.record('curve', args, kwargs)
+        self.count                      += 1
+        return 'curve{0}'.format(self.count)
+
+    def listRelatives(self, *args, **kwargs):
+        self.record('listRelatives', args, kwargs)
+        return ['|{0}|{0}Shape'.format(node) for node in args[0]]
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.record(name, args, kwargs)
+
+
+# curves of a few shapes as ToolBoxIIfuncs.py built them before the shapes moved to controlShapes.json:
+# shape: [(degree, points)]
+ORIGINAL_CURVES                         = {
+    'arrowCurve'    : [(1, [(-1.0, 0.0, 0.0), (-1.0, 0.0, 2.0), (1.0, 0.0, 2.0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0),
+                            (0.0, 0.0, -2.0), (-2.0, 0.0, 0.0), (-1.0, 0.0, 0.0)])],
+    'pointMark'     : [(1, [(0, 0, 0), (-2.761013168273541e-31, 5.6, -1.2434497875801752e-15),
+                            (-0.7, 5.6, -1.0880185641326533e-15), (-0.7, 7, -1.3988810110276972e-15),
+                            (0.7, 7, -1.7097434579227411e-15), (0.7, 5.6, -1.3988810110276972e-15),
+                            (-2.761013168273541e-31, 5.6, -1.2434497875801752e-15)])],
+    'twoDirections' : [(1, [(-4, 0, 0), (-2, 0, -2), (-2, 0, -1), (2, 0, -1), (2, 0, -2), (4, 0, 0), (2, 0, 2),
+                            (2, 0, 1), (-2, 0, 1), (-2, 0, 2), (-4, 0, 0)])],
+    # the first two of its four curves
+    'sliderControl' : [(1, [(2.0, 0.0, 0.0), (2.0, 1.0, 0.0), (-2.0, 1.0, 0.0), (-2.0, 0.0, 0.0), (2.0, 0.0, 0.0)]),
+                       (1, [(0.3506450885056627, -1.0, 0.0), (0.3506450885056627, 0.0, 0.0),
+                            (0.17532254425283136, 0.0, 0.0), (0.0, 1.0, 0.0), (-0.17532254425283136, 0.0, 0.0),
+                            (-0.3506450885056627, 0.0, 0.0), (-0.3506450885056627, -1.0, 0.0),
+                            (0.3506450885056627, -1.0, 0.0)])],
+}
+
+
+@pytest.fixture
+def fakeCmds(monkeypatch):
+    """ maya and maya.cmds in sys.modules, the modules of the library are imported again against them """
+    cmds                                = FakeCmds()
+    maya                                = types.ModuleType('maya')
+    maya.cmds                           = cmds
+    monkeypatch.setitem(sys.modules, 'maya', maya)
+    monkeypatch.setitem(sys.modules, 'maya.cmds', cmds)
+    for name in ['ToolHub.Maya.modules.ControlShapes', 'ToolHub.Maya.modules.ToolBoxIIfuncs']:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    return cmds
+
+
+@pytest.fixture
+def library(fakeCmds):
+    from ToolHub.Maya.modules.ControlShapes import shapeLibrary
+    assert shapeLibrary.cmds is fakeCmds
+    return shapeLibrary
+
+
+def test_shapes_compile(library):
+    assert len(library.names()) > 50
+    for name in library.names():
+        curves                          = library.curves(name)
+        assert curves, name
+        for curve in curves:
+            assert set(curve) == {'p', 'd', 'k', 'per'}
+            assert curve['d'] in (1, 2, 3)
+            assert all(len(point) == 3 for point in curve['p'])
+            # maya wants number of spans + 2 * degree - 1 knots, which is points + degree - 1
+            assert len(curve['k']) == len(curve['p']) + curve['d'] - 1, name
+
+
+@pytest.mark.parametrize('name', sorted(ORIGINAL_CURVES))
+def test_shapes_match_original(library, name):
+    curves                              = library.curves(name)
+    for (degree, points), curve in zip(ORIGINAL_CURVES[name], curves):
+        assert curve['d'] == degree
+        assert curve['p'] == tuple(points)
+
+
+def test_resolve_labels(library):
+    assert library.resolve('crossControl') == 'crossControl'
+    assert library.resolve('Cross Control') == 'crossControl'
+    assert library.resolve('Not A Shape') is None
+    with pytest.raises(KeyError):
+        library.curves('Not A Shape')
+
+
+def test_create_single_curve(library, fakeCmds):
+    control                             = library.create('Arrow Curve')
+    expected                            = library.curves('arrowCurve')[0]
+
+    assert control == 'curve1'
+    assert fakeCmds.named('curve') == [('curve', (), expected)]
+    assert fakeCmds.named('parent') == []
+    assert fakeCmds.named('delete') == []
+    assert fakeCmds.named('select') == [('select', (['curve1'],), {})]
+
+
+def test_create_several_curves(library, fakeCmds):
+    curves                              = library.curves('sphereControl')
+    control                             = library.create('sphereControl', select=False)
+
+    assert len(curves) == 3
+    assert control == 'curve1'
+    assert [call[2] for call in fakeCmds.named('curve')] == list(curves)
+    # the shapes of the other curves go under the first transform, which is the control
+    others                              = ['curve2', 'curve3']
+    assert fakeCmds.named('listRelatives') == [('listRelatives', (others,), dict(shapes=True, fullPath=True))]
+    assert fakeCmds.named('parent') == [('parent', (['|curve2|curve2Shape', '|curve3|curve3Shape'], 'curve1'),
+                                         dict(relative=True, shape=True))]
+    assert fakeCmds.named('delete') == [('delete', (others,), {})]
+    assert fakeCmds.named('select') == []
+
+
+def test_create_many(library, fakeCmds):
+    controls                            = library.createMany(['Arrow Curve', 'sphereControl', 'Slider Control'])
+
+    assert controls == ['curve1', 'curve2', 'curve5']
+    assert len(fakeCmds.named('curve')) == 1 + 3 + 4
+    # one delete and one select for the whole batch
+    assert fakeCmds.named('delete') == [('delete', (['curve3', 'curve4', 'curve6', 'curve7', 'curve8'],), {})]
+    assert fakeCmds.named('select') == [('select', (controls,), {})]
+
+
+def test_toolbox_funcs(fakeCmds):
+    from ToolHub.Maya.modules.ToolBoxIIfuncs import ToolBoxIIfuncs
+
+    ToolBoxIIfuncs('Circle Nurbs')
+    assert fakeCmds.named('CreateNURBSCircle')
+    assert fakeCmds.named('curve') == []
+
+    ToolBoxIIfuncs('Cube Nurbs')
+    assert len(fakeCmds.named('curve')) == 1
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
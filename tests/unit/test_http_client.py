@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_http_client.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    HttpClient against a local http server: keep-alive connections, conditional GET served from the cache on 304,
+    identical GETs in flight coalesced into one request, latency per host.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import time, threading
+from http.server                        import BaseHTTPRequestHandler
+
+import pytest
+
+
+ETAG                                    = '"v1"'
+SLOW_TIME                               = 0.3
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    # keep-alive, the client must reuse its connection
+    protocol_version                    = 'HTTP/1.1'
+
+    # path: number of GET which reached the server
+    hits                                = dict()
+    ports                               = []
+
+    def do_GET(self):
+        self.hits[self.path]            = self.hits.get(self.path, 0) + 1
+        self.ports.append(self.client_address[1])
+
+        if self.path == '/slow':
+            time.sleep(SLOW_TIME)
+        if self.path == '/etag' and self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body                            = '{0} {1}'.format(self.path, self.hits[self.path]).encode('ascii')
+        self.send_response(200)
+        if self.path == '/etag':
+            self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(httpServer):
+    Handler.hits                        = dict()
+    Handler.ports                       = []
+    return httpServer(Handler)
+
+
+@pytest.fixture
+def client(plm):
+    from PLM.cores.base import HttpClient
+    client                              = HttpClient(timeout=5, retries=0)
+    yield client
+    client.close()
+
+
+def test_keep_alive(server, client):
+    client.get(server + '/a', cache=False)
+    client.get(server + '/b', cache=False)
+    client.get(server + '/a', cache=False)
+
+    assert Handler.hits == {'/a': 2, '/b': 1}
+    assert len(set(Handler.ports)) == 1
+
+
+def test_conditional_get(server, client):
+    first                               = client.get(server + '/etag')
+    assert first.fromCache is False
+
+    second                              = client.get(server + '/etag')
+    assert Handler.hits['/etag'] == 2
+    assert second.fromCache is True
+    assert second.text == '/etag 1'
+
+    fresh                               = client.get(server + '/etag', cache=False)
+    assert fresh.fromCache is False
+    assert fresh.text == '/etag 3'
+
+
+def test_coalesced_get(server, client):
+    results                             = []
+
+    def fetch():
+        results.append(client.get(server + '/slow', cache=False).text)
+
+    threads                             = [threading.Thread(target=fetch) for i in range(4)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join()
+
+    assert Handler.hits['/slow'] == 1
+    assert results == ['/slow 1'] * 4
+
+
+def test_latency_metrics(server, client):
+    client.get(server + '/a', cache=False)
+    client.get(server + '/slow', cache=False)
+
+    report                              = client.metrics.report()[server.split('//')[1]]
+    assert report['count'] == 2
+    assert report['errors'] == 0
+    assert report['max'] >= SLOW_TIME
+
+
+def test_unreachable(client):
+    assert client.isReachable('http://127.0.0.1:1', timeout=1) is False
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
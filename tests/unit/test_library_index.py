@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_library_index.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Listing of the library folders: a folder which can not be listed is reported, its files are not taken as gone.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'wb').close()
+
+
+def test_list_images(plm, tmp_path):
+    from PLM.cores.data.LibraryIndex import list_images
+
+    root                                = str(tmp_path).replace('\\', '/')
+    touch(root + '/a.png')
+    touch(root + '/notes.txt')
+    touch(root + '/sub/b.JPG')
+
+    found, unreadable                   = list_images(root)
+
+    assert sorted(found) == [root + '/a.png', root + '/sub/b.JPG']
+    assert unreadable == []
+
+
+def test_list_images_unreadable(plm, tmp_path, monkeypatch):
+    from PLM.cores.data import LibraryIndex as module
+
+    root                                = str(tmp_path).replace('\\', '/')
+    touch(root + '/a.png')
+    touch(root + '/locked/b.png')
+    scandir                             = os.scandir
+
+    def lockedScandir(path):
+        if path.replace('\\', '/').endswith('/locked'):
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(module.os, 'scandir', lockedScandir)
+    found, unreadable                   = module.list_images(root)
+
+    assert list(found) == [root + '/a.png']
+    assert unreadable == [root + '/locked']
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
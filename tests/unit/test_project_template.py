@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_project_template.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Project folder templates in a temporary folder: the plan expanded from blocks and variables, the diff with
+    what is on disk (missing, existing, a file in the way of a folder), the dry run and the creation.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os
+
+import pytest
+
+from ToolHub.ProjectTemplate            import ProjectTemplate, numbered
+
+
+BLOCKS                                  = {'steps': ['publish', 'work'],
+                                           'loop' : ['@loop']}
+TREE                                    = {'assets'    : {'{character}': '@steps'},
+                                           'sequences' : {'{shot}': {'anim': ['@steps', {'work': ['maya']}]}},
+                                           'docs'      : None}
+VARIABLES                               = dict(character=['hero', 'villain'], shot=numbered('shot', 2))
+
+
+@pytest.fixture
+def template():
+    return ProjectTemplate(TREE, BLOCKS, 'test')
+
+
+def listdirs(root):
+    """ :return: sorted relative paths of the folders under root """
+    found                               = []
+    for path, dirs, files in os.walk(root):
+        found.extend(os.path.relpath(os.path.join(path, d), root).replace('\\', '/') for d in dirs)
+    return sorted(found)
+
+
+def test_numbered():
+    assert numbered('shot', 3) == ['shot_1', 'shot_2', 'shot_3']
+    assert numbered('shot', 12)[0] == 'shot_01'
+    assert numbered('shot', 2, padding=3, start=10) == ['shot_010', 'shot_011']
+
+
+def test_plan(template):
+    plan                                = template.plan(**VARIABLES)
+
+    assert sorted(plan) == ['assets', 'assets/hero', 'assets/hero/publish', 'assets/hero/work', 'assets/villain',
+                            'assets/villain/publish', 'assets/villain/work', 'docs', 'sequences',
+                            'sequences/shot_1', 'sequences/shot_1/anim', 'sequences/shot_1/anim/publish',
+                            'sequences/shot_1/anim/work', 'sequences/shot_1/anim/work/maya', 'sequences/shot_2',
+                            'sequences/shot_2/anim', 'sequences/shot_2/anim/publish', 'sequences/shot_2/anim/work',
+                            'sequences/shot_2/anim/work/maya']
+    # every parent comes before its children
+    assert all(plan.index(p.rsplit('/', 1)[0]) < plan.index(p) for p in plan if '/' in p)
+
+
+def test_plan_string_variable(template):
+    plan                                = template.plan(character='hero', shot=[])
+
+    assert 'assets/hero/work' in plan
+    assert 'sequences' in plan
+    assert not [p for p in plan if p.startswith('sequences/')]
+
+
+def test_plan_errors(template):
+    with pytest.raises(KeyError):
+        template.plan(character=['hero'])
+    with pytest.raises(KeyError):
+        ProjectTemplate({'a': '@unknown'}).plan()
+    with pytest.raises(ValueError):
+        ProjectTemplate({'a': '@loop'}, BLOCKS).plan()
+
+
+def test_diff(template, tmp_path):
+    root                                = str(tmp_path).replace('\\', '/')
+    os.makedirs(os.path.join(root, 'assets', 'hero', 'work'))
+    # a file where the template wants the 'docs' folder
+    open(os.path.join(root, 'docs'), 'w').close()
+
+    result                              = template.diff(root, **VARIABLES)
+
+    assert sorted(result.existing) == [root + '/assets', root + '/assets/hero', root + '/assets/hero/work']
+    assert result.conflicts == [root + '/docs']
+    assert root + '/assets/hero/publish' in result.missing
+    assert root + '/sequences/shot_2/anim/work/maya' in result.missing
+    assert len(result.missing) + len(result.existing) + len(result.conflicts) == len(template.plan(**VARIABLES))
+
+
+def test_dry_run(template, tmp_path):
+    root                                = str(tmp_path / 'project').replace('\\', '/')
+
+    result                              = template.create(root, dryRun=True, **VARIABLES)
+
+    assert not os.path.exists(root)
+    assert sorted(result.missing) == sorted(root + '/' + p for p in template.plan(**VARIABLES))
+    assert result.existing == [] and result.conflicts == []
+
+
+def test_create(template, tmp_path):
+    root                                = str(tmp_path / 'project').replace('\\', '/')
+
+    result                              = template.create(root, workers=4, **VARIABLES)
+
+    assert listdirs(root) == sorted(template.plan(**VARIABLES))
+    assert sorted(result.missing) == sorted(root + '/' + p for p in template.plan(**VARIABLES))
+
+    # a new shot only adds its folders
+    again                               = template.create(root, character=['hero', 'villain'],
+                                                          shot=numbered('shot', 3))
+    assert sorted(again.missing) == [root + '/sequences/shot_3', root + '/sequences/shot_3/anim',
+                                     root + '/sequences/shot_3/anim/publish', root + '/sequences/shot_3/anim/work',
+                                     root + '/sequences/shot_3/anim/work/maya']
+    assert os.path.isdir(root + '/sequences/shot_3/anim/work/maya')
+
+
+def test_load():
+    template                            = ProjectTemplate.load('studio')
+
+    assert template.name == 'studio'
+    with pytest.raises(KeyError):
+        ProjectTemplate.load('not a template')
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved
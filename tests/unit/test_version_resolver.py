@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+
+Script Name: test_version_resolver.py
+Author: Do Trinh/Jimmy - 3D artist.
+
+Description:
+
+    Versions of work files in a temporary folder: parsing of the names, latest and next version/revision, the
+    revisions of a version, and the index rebuilt only when the modification time of the folder changes.
+
+"""
+# -------------------------------------------------------------------------------------------------------------
+""" Import """
+
+# Python
+import os
+
+import pytest
+
+from ToolHub.VersionResolver            import VersionResolver, VersionRecord, parse_version, version_name
+
+
+FILES                                   = ['hero_rigging_v001.ma', 'hero_rigging_v002.ma', 'hero_rigging_v002_r001.ma',
+                                           'hero_rigging_v002_r010.ma', 'hero_rigging_v002_r002.ma',
+                                           'hero_rigging_v001.mb', 'notes.txt']
+
+
+def touch(folder, *names):
+    for name in names:
+        open(os.path.join(folder, name), 'w').close()
+
+
+def bump_mtime(folder):
+    """ A new modification time whatever the resolution of the file system """
+    stat                                = os.stat(folder)
+    os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def folder(tmp_path):
+    touch(str(tmp_path), *FILES)
+    return str(tmp_path)
+
+
+@pytest.fixture
+def resolver():
+    return VersionResolver()
+
+
+def test_parse_version():
+    assert parse_version('hero_rigging_v003.ma') == VersionRecord('hero_rigging_v003.ma', 'hero_rigging', 3, 0, '.ma')
+    assert parse_version('hero_rigging_v003_r012.MA') == VersionRecord('hero_rigging_v003_r012.MA', 'hero_rigging',
+                                                                       3, 12, '.ma')
+    assert parse_version('hero_v1_final_v004.mb').base == 'hero_v1_final'
+    assert parse_version('notes.txt') is None
+    assert parse_version('hero_rigging_v003') is None
+    assert version_name('hero_rigging', 3, 12) == 'hero_rigging_v003_r012.ma'
+    assert parse_version(version_name('hero_rigging', 7, ext='.mb')).version == 7
+
+
+def test_latest_version(folder, resolver):
+    assert resolver.latestVersion(folder, 'hero_rigging') == 2
+    assert resolver.nextVersion(folder, 'hero_rigging') == 3
+    assert resolver.latestVersion(folder, 'hero_rigging', '.mb') == 1
+    assert resolver.latestVersion(folder, 'villain_rigging') == 0
+    assert resolver.latest(folder, 'hero_rigging').name == 'hero_rigging_v002_r010.ma'
+
+
+def test_revisions(folder, resolver):
+    revisions                           = resolver.revisions(folder, 'hero_rigging', 2)
+
+    assert [r.revision for r in revisions] == [0, 1, 2, 10]
+    assert revisions[0].name == 'hero_rigging_v002.ma'
+    assert resolver.revisions(folder, 'hero_rigging', 5) == []
+    assert resolver.nextRevision(folder, 'hero_rigging', 2) == 11
+    assert resolver.nextRevision(folder, 'hero_rigging', 1) == 1
+
+
+def test_missing_folder(tmp_path, resolver):
+    missing                             = str(tmp_path / 'missing')
+
+    assert resolver.latestVersion(missing, 'hero_rigging') == 0
+    assert resolver.index(missing).files() == []
+
+
+def test_cache_invalidation(folder, resolver):
+    index                               = resolver.index(folder)
+    stat                                = os.stat(folder)
+    assert resolver.index(folder) is index
+
+    # a file added without changing the modification time of the folder is not seen, the cache is answered
+    touch(folder, 'hero_rigging_v003.ma')
+    os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert resolver.index(folder) is index
+    assert resolver.latestVersion(folder, 'hero_rigging') == 2
+
+    bump_mtime(folder)
+    assert resolver.index(folder) is not index
+    assert resolver.latestVersion(folder, 'hero_rigging') == 3
+
+    index                               = resolver.index(folder)
+    resolver.invalidate(folder)
+    assert resolver.index(folder) is not index
+
+# -------------------------------------------------------------------------------------------------------------
+# Created by Trinh Do on 10/19/2020 - 10:30 PM
+# © 2017 - 2020 DAMGteam. All rights reserved